@@ -8,6 +8,7 @@ Proje Yapısı:
 - backend/app.py: Ana Flask uygulaması (bu dosya)
 - backend/metric_runner.py: Snyk Code tarama runner'ı
 - backend/deepsource_runner.py: DeepSource tarama runner'ı
+- backend/tool_registry.py: Araç registry'si (runner'lar ilk kullanımda import edilir)
 - backend/metrics/: Metrik hesaplama modülleri
 - backend/tests/: Test script'leri
 - results/: Tarama sonuçları (JSON formatında)
@@ -18,6 +19,15 @@ Ana Özellikler:
 - Standart metrik formatı (critical, high, medium, low)
 - JSON formatında sonuç kaydetme
 - RESTful API endpoint'leri
+- Asenkron tarama job kuyruğu (/jobs)
+- Paralel çoklu proje/araç taraması (/scan/*/all, /scan/all; NDJSON veya SSE ile akış halinde)
+- Registry'den üretilen araç endpoint'leri (/scan/<tool>, /scan/<tool>/all, /tools)
+- İçerik adresli tarama sonucu cache'i (/cache/stats)
+- SQLite tabanlı sonuç index'i (/results, /results/latest, /results/top-projects)
+- Araç/proje bazında tarama süresi yüzdelikleri (/stats/latency)
+- Eşzamanlı özdeş taramaların birleştirilmesi ve araç bazında eşzamanlılık sınırı (/stats/concurrency)
+- Prometheus formatında operasyonel metrikler (/metrics)
+- İstek veya process bazında opt-in profil ve flamegraph çıktısı (?profile=)
 
 Kullanım:
     cd backend
@@ -26,19 +36,252 @@ Kullanım:
 API adresi: http://localhost:5001
 """
 
-from flask import Flask, jsonify, send_file, request
+from flask import Flask, Response, jsonify, request
+from werkzeug.security import safe_join
+import json
 import os
-from pathlib import Path
-from snyk_runner import run_and_return, REPORT_DIR
-from metric_runner import run_code_scan_and_save
-from deepsource_runner import run_deepsource_scan_and_save
+from datetime import datetime
+from functools import partial
+from scan_jobs import ScanJobQueue, QueueFullError
+from scan_fanout import (
+    ScanTask, iter_parallel_scans, run_parallel_scans, SCAN_FANOUT_CONCURRENCY, SCAN_TIMEOUT_SECONDS
+)
+from scan_cache import scan_cache
+from results_index import results_index
+from metrics.latency_stats import latency_registry
+from tool_registry import tool_registry
+from project_catalog import project_catalog
+from single_flight import scan_flights, tool_limiter
+from http_cache import send_cached_file
+from result_store import list_scan_results
+from profiling import resolve_mode as resolve_profile_mode, run_profiled
+from telemetry import telemetry, instrument_app, CONTENT_TYPE as METRICS_CONTENT_TYPE, TELEMETRY_ENABLED
 
 # Flask uygulamasını başlat
-app = Flask(__name__)
+# Her isteğin süresi route bazında /metrics'e eklenir
+app = instrument_app(Flask(__name__))
 
-# Mevcut test projeleri listesi
-# Bu projeler test_projects/ klasöründe bulunmalıdır
-AVAILABLE_PROJECTS = ["flask_demo", "nodejs-goof"]
+# Tarama job kuyruğu
+# /scan/code ve /scan/deepsource taramaları bu kuyruk üzerinden çalışır
+job_queue = ScanJobQueue()
+
+
+def _is_truthy(value) -> bool:
+    """Query/body parametresini bool'a çevirir ("1", "true", "yes", True)"""
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in ("1", "true", "yes")
+
+
+def _get_param(name: str, default=None):
+    """Parametreyi önce JSON body'den, sonra query string'den okur"""
+    if request.is_json and request.json and name in request.json:
+        return request.json.get(name)
+    return request.args.get(name, default)
+
+
+def _wants_wait() -> bool:
+    """
+    İstemci senkron tarama mı istiyor?
+
+    Body'de "wait": true veya ?wait=true verilirse tarama request thread'inde
+    çalışır ve sonuç doğrudan döner (eski davranış).
+    """
+    return _is_truthy(_get_param("wait", "false"))
+
+
+def _wants_force() -> bool:
+    """
+    İstemci cache'i atlamak mı istiyor?
+
+    Body'de "force": true veya ?force=true verilirse proje değişmemiş olsa
+    bile tarama yeniden yapılır.
+    """
+    return _is_truthy(_get_param("force", "false"))
+
+
+def _stream_option():
+    """
+    İstemci Snyk çıktısının akış halinde işlenmesini mi istiyor?
+
+    Body'de "stream" veya ?stream= verilmezse None döner ve runner'ın
+    varsayılanı (SNYK_STREAM_OUTPUT) kullanılır.
+    """
+    value = _get_param("stream")
+    return None if value is None else _is_truthy(value)
+
+
+def _profile_option():
+    """
+    İstemci taramanın profillenmesini mi istiyor?
+
+    Body'de "profile" veya ?profile= ile 1 (PROFILING_DEFAULT_MODE), cprofile
+    veya sample verilebilir (bkz. profiling).
+
+    Returns:
+        Profil modu veya None
+
+    Raises:
+        ValueError: Mod tanınmıyorsa
+    """
+    return resolve_profile_mode(_get_param("profile"))
+
+
+def _profiled(tool: str, profile_mode, runner):
+    """Profil istendiyse runner'ı profil oturumunda çalıştıran runner döner"""
+    if not profile_mode:
+        return runner
+    return partial(run_profiled, tool, profile_mode, runner)
+
+
+def _fanout_options():
+    """
+    Paralel tarama parametrelerini okur ve doğrular
+
+    Parametreler (body veya query):
+        max_concurrency: Aynı anda çalışacak tarama sayısı
+        timeout: Tarama başına zaman aşımı (saniye)
+
+    Returns:
+        (max_concurrency, timeout) tuple
+
+    Raises:
+        ValueError: Parametreler pozitif sayı değilse
+    """
+    try:
+        max_concurrency = int(_get_param("max_concurrency", SCAN_FANOUT_CONCURRENCY))
+        timeout = float(_get_param("timeout", SCAN_TIMEOUT_SECONDS))
+    except (TypeError, ValueError):
+        raise ValueError("max_concurrency and timeout must be numbers")
+
+    if max_concurrency <= 0 or timeout <= 0:
+        raise ValueError("max_concurrency and timeout must be positive")
+
+    return max_concurrency, timeout
+
+
+# Akış formatları: format parametresi -> response mimetype
+STREAM_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream"
+}
+
+
+def _stream_format():
+    """
+    /all endpoint'lerinin sonuçları akış halinde isteyip istemediği
+
+    ?format=ndjson / ?format=sse (veya body'de "format") ya da Accept header'ı
+    (application/x-ndjson, text/event-stream) ile seçilir. "stream" parametresi
+    Snyk Code'un CLI çıktısı seçeneği olduğu için burada kullanılmaz.
+
+    Returns:
+        "ndjson", "sse" veya None (tek JSON response)
+
+    Raises:
+        ValueError: format geçersizse
+    """
+    value = _get_param("format")
+    if value is not None:
+        value = str(value).lower()
+        if value == "json":
+            return None
+        if value not in STREAM_FORMATS:
+            raise ValueError(f"format must be one of {['json'] + sorted(STREAM_FORMATS)}")
+        return value
+
+    # Sadece açıkça istenen tipler sayılır ("*/*" tek JSON response demektir)
+    accepted = dict(request.accept_mimetypes)
+    for name, mimetype in STREAM_FORMATS.items():
+        quality = accepted.get(mimetype, 0)
+        if quality > 0 and quality >= accepted.get("application/json", 0):
+            return name
+    return None
+
+
+def _encode_event(event: dict, stream_format: str) -> str:
+    """Olayı NDJSON satırı veya SSE mesajı olarak yazar"""
+    data = json.dumps(event, ensure_ascii=False, separators=(",", ":"))
+    if stream_format == "sse":
+        return f"event: {event['event']}\ndata: {data}\n\n"
+    return data + "\n"
+
+
+def _stream_fanout(tasks, message_prefix: str, max_concurrency: int, timeout: float, stream_format: str):
+    """
+    Tarama olaylarını oluştukça gönderen response
+
+    Her proje bittiğinde "result", hiçbiri bitmezken belirli aralıklarla
+    "progress" olayı gönderilir; son olay "done" olayıdır ve toplu
+    response'taki message ile timing alanlarını içerir.
+    """
+    def generate():
+        for event in iter_parallel_scans(tasks, max_concurrency=max_concurrency, timeout=timeout):
+            if event["event"] == "done":
+                event["message"] = f"{message_prefix} {event['succeeded']}/{event['total']} projects"
+            yield _encode_event(event, stream_format)
+
+    return Response(generate(), mimetype=STREAM_FORMATS[stream_format], headers={
+        "Cache-Control": "no-cache",
+        # nginx gibi proxy'ler olayları biriktirmesin
+        "X-Accel-Buffering": "no"
+    })
+
+
+def _run_fanout(tasks, message_prefix: str):
+    """
+    Görevleri paralel çalıştırır ve /all endpoint'lerinin response'unu üretir
+
+    Akış formatı istendiyse (bkz. _stream_format) sonuçlar bitme sırasıyla,
+    oluştukça gönderilir; aksi halde tümü bitince tek JSON döner.
+
+    Args:
+        tasks: ScanTask listesi
+        message_prefix: Response mesajının başı (örn: "Scanned", "DeepSource scanned")
+    """
+    try:
+        max_concurrency, timeout = _fanout_options()
+        stream_format = _stream_format()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    if stream_format is not None:
+        return _stream_fanout(tasks, message_prefix, max_concurrency, timeout, stream_format)
+
+    summary = run_parallel_scans(tasks, max_concurrency=max_concurrency, timeout=timeout)
+    results = summary["results"]
+    success_count = sum(1 for r in results if r["success"])
+
+    return jsonify({
+        "message": f"{message_prefix} {success_count}/{len(results)} projects",
+        "results": results,
+        "timing": summary["timing"]
+    }), 200 if success_count > 0 else 500
+
+
+def _enqueue_scan(tool: str, project: str, runner, message: str, **runner_kwargs):
+    """
+    Taramayı job kuyruğuna ekler ve 202 response döner
+
+    Args:
+        tool: Araç adı ("snyk_code", "deepsource")
+        project: Proje adı
+        runner: Kuyrukta çalıştırılacak runner fonksiyonu
+        message: Response mesajı
+        **runner_kwargs: Runner'a iletilecek ek argümanlar (örn: force)
+    """
+    try:
+        job = job_queue.submit(tool, project, runner, **runner_kwargs)
+    except QueueFullError as e:
+        return jsonify({"error": str(e), "project": project}), 503
+
+    return jsonify({
+        "message": message,
+        "job_id": job.job_id,
+        "status": job.status,
+        "project": project,
+        "status_url": f"/jobs/{job.job_id}"
+    }), 202
 
 @app.route("/scan", methods=["POST"])
 def scan():
@@ -51,6 +294,9 @@ def scan():
     Returns:
         JSON response with scan summary and report file path
     """
+    # Container taraması runner'ı sadece bu eski endpoint'ler kullanıldığında yüklenir
+    from snyk_runner import run_and_return
+
     summary, file_path = run_and_return()
     if not summary:
         return jsonify({"error": "scan failed"}), 500
@@ -62,29 +308,97 @@ def scan():
     })
 
 
-@app.route("/scan/code", methods=["POST"])
-def scan_code():
+@app.route("/tools", methods=["GET"])
+def list_tools():
     """
-    Snyk Code taraması endpoint'i
+    Kayıtlı tarama araçlarını listeler
     
-    Bu endpoint, belirtilen test projesi için Snyk Code taraması yapar,
-    sonuçları normalize eder ve results/ klasörüne kaydeder.
+    Returns:
+        JSON response with:
+        - tools: Her araç için name, display_name, route, options ve
+          loaded (runner'ı bu process'te import edildi mi)
+    """
+    return jsonify({"tools": [adapter.to_dict() for adapter in tool_registry.all()]})
+
+
+def _get_tool(tool: str):
+    """
+    URL'deki araç adını registry'den bulur
+
+    Returns:
+        (adapter, None) veya araç yoksa (None, 404 response)
+    """
+    adapter = tool_registry.get(tool)
+    if adapter is None:
+        return None, (jsonify({
+            "error": f"Unknown tool '{tool}'. Available tools: {[a.route for a in tool_registry.all()]}",
+            "available_tools": [a.route for a in tool_registry.all()]
+        }), 404)
+    return adapter, None
+
+
+def _runner_options(adapter) -> dict:
+    """
+    Runner'a iletilecek parametreler
+
+    force her araç için okunur; aracın options listesindeki parametreler
+    (örn. incremental, stream) sadece body/query'de verilmişse iletilir,
+    verilmezse runner'ın varsayılanı kullanılır.
+    """
+    options = {"force": _wants_force()}
+    for option in adapter.options:
+        value = _get_param(option)
+        if value is not None:
+            options[option] = _is_truthy(value)
+    return options
+
+
+@app.route("/scan/<tool>", methods=["POST"])
+def scan_tool(tool):
+    """
+    Tek proje taraması endpoint'i (her kayıtlı araç için)
+    
+    Araçlar tool_registry'den gelir: /scan/code (Snyk Code),
+    /scan/deepsource (DeepSource) ve config/entry point ile eklenenler.
+    
+    Bu endpoint, belirtilen test projesi için taramayı job kuyruğuna ekler
+    ve hemen job id döner. Tarama arka planda yapılır, sonuçlar normalize
+    edilip results/ klasörüne kaydedilir. Durum GET /jobs/<job_id> ile sorgulanır.
     
     Request body (JSON):
     {
-        "project": "flask_demo" veya "nodejs-goof" (opsiyonel, default: flask_demo)
+        "project": "flask_demo" veya "nodejs-goof" (opsiyonel, default: flask_demo),
+        "wait": true (opsiyonel, taramayı senkron çalıştırır),
+        "force": true (opsiyonel, cache'i atlar ve taramayı yeniden yapar),
+        "incremental": true (opsiyonel, Snyk Code: sadece son taramadan beri değişen dosyaları tarar),
+        "stream": false (opsiyonel, Snyk Code: CLI çıktısını akış halinde işlemeyi kapatır),
+        "profile": 1 (opsiyonel, taramayı profiller: 1, cprofile veya sample)
     }
     
     veya query parameter:
-    ?project=flask_demo
+    ?project=flask_demo&wait=true&force=true&incremental=true&stream=false&profile=1
     
     Returns:
-        JSON response with:
+        202 JSON response with:
+        - message: İşlem durumu
+        - job_id: Oluşturulan job kimliği
+        - status: Job durumu (queued)
+        - status_url: Job durumunu sorgulama adresi
+        
+        wait=true ise 200 JSON response with:
         - message: İşlem durumu
         - project: Taranan proje adı
         - file_path: Kaydedilen sonuç dosyası yolu
-        - metrics: Normalize edilmiş metrik sonuçları
+        - metrics: Normalize edilmiş metrik sonuçları (timings: taramanın faz bazında süre dökümü)
+        - coalesced: Süren özdeş bir taramanın sonucu paylaşıldıysa true
+        - profile: profile verildiyse profil özeti ve flamegraph çıktılarının yolları
+        
+        Araç kayıtlı değilse 404
     """
+    adapter, error = _get_tool(tool)
+    if error:
+        return error
+    
     # Proje adını al (body'den veya query'den)
     project = None
     
@@ -94,15 +408,32 @@ def scan_code():
     if not project:
         project = request.args.get("project", "flask_demo")
     
-    # Proje geçerli mi kontrol et
-    if project not in AVAILABLE_PROJECTS:
+    # Proje geçerli mi kontrol et (PROJECTS_ROOT altında keşfedilen projeler)
+    if project_catalog.get(project) is None:
+        available_projects = project_catalog.names()
         return jsonify({
-            "error": f"Invalid project. Available projects: {AVAILABLE_PROJECTS}",
-            "available_projects": AVAILABLE_PROJECTS
+            "error": f"Invalid project. Available projects: {available_projects}",
+            "available_projects": available_projects
         }), 400
     
-    # Tarama yap
-    result = run_code_scan_and_save(project)
+    options = _runner_options(adapter)
+    
+    try:
+        profile_mode = _profile_option()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    # Profil istendiyse runner profil oturumunda çalışır (job kuyruğunda da)
+    runner = _profiled(adapter.name, profile_mode, adapter.runner)
+    
+    # Asenkron mod: job kuyruğuna ekle
+    if not _wants_wait():
+        return _enqueue_scan(
+            adapter.name, project, runner, f"{adapter.route} scan queued", **options
+        )
+    
+    # Senkron mod: tarama yap
+    result = runner(project, **options)
     
     if not result["success"]:
         return jsonify({
@@ -111,186 +442,541 @@ def scan_code():
         }), 500
     
     return jsonify({
-        "message": "code scan completed",
+        "message": f"{adapter.route} scan completed",
         "project": result["project"],
         "file_path": result["file_path"],
-        "metrics": result["metric_result"]
+        "metrics": result["metric_result"],
+        "cached": result.get("cached", False),
+        "coalesced": result.get("coalesced", False),
+        "resource_usage": result.get("resource_usage"),
+        "profile": result.get("profile")
     }), 200
 
 
-@app.route("/scan/code/all", methods=["POST"])
-def scan_code_all():
+@app.route("/scan/<tool>/all", methods=["POST"])
+def scan_tool_all(tool):
     """
-    Tüm test projeleri için Snyk Code taraması yapar
+    Tüm test projeleri için bir aracın taramasını yapar
     
-    AVAILABLE_PROJECTS listesindeki tüm projeleri sırayla tarar
-    ve her biri için sonuçları döner.
+    Proje kataloğundaki tüm projeleri paralel tarar
+    ve her biri için sonuçları döner (örn. /scan/code/all, /scan/deepsource/all).
+    
+    Parametreler (body veya query, opsiyonel):
+        max_concurrency: Aynı anda çalışacak tarama sayısı (default: 4)
+        timeout: Tarama başına zaman aşımı, saniye (default: 300)
+        force: true ise cache atlanır
+        incremental, stream: Snyk Code için (bkz. scan_tool)
+        profile: 1, cprofile veya sample ise her tarama ayrı profillenir (bkz. scan_tool)
+        format: "ndjson" veya "sse" ise sonuçlar akış halinde gönderilir
+            (Accept: application/x-ndjson / text/event-stream ile de seçilir)
     
     Returns:
         JSON response with:
         - message: Başarılı tarama sayısı
-        - results: Her proje için tarama sonuçları listesi
+        - results: Her proje için tarama sonuçları listesi (profile verildiyse
+          her sonuçta profil özeti)
+        - timing: wall-clock süre, taramaların toplam süresi ve hızlanma
+        
+        format=ndjson/sse ise olay akışı: start, result (her proje bittiğinde),
+        progress (bekleme sırasında), done (message ve timing ile)
     """
-    results = []
+    adapter, error = _get_tool(tool)
+    if error:
+        return error
+    
+    try:
+        profile_mode = _profile_option()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    runner = _profiled(adapter.name, profile_mode, partial(adapter.runner, **_runner_options(adapter)))
+    tasks = [ScanTask(adapter.name, project, runner) for project in project_catalog.names()]
+    return _run_fanout(tasks, f"{adapter.display_name} scanned")
+
+
+@app.route("/scan/all", methods=["POST"])
+def scan_all():
+    """
+    Tüm araçlar × tüm test projeleri için paralel tarama yapar
     
-    for project in AVAILABLE_PROJECTS:
-        result = run_code_scan_and_save(project)
-        results.append(result)
+    Her (araç, proje) çifti ayrı bir tarama olarak çalışır. Sonuçlarda
+    "tool" alanı taramanın hangi araçla yapıldığını gösterir. Araçlar
+    tool_registry'deki tüm kayıtlı araçlardır.
     
-    success_count = sum(1 for r in results if r["success"])
+    Parametreler (body veya query, opsiyonel):
+        max_concurrency: Aynı anda çalışacak tarama sayısı (default: 4)
+        timeout: Tarama başına zaman aşımı, saniye (default: 300)
+        force: true ise cache atlanır
+        profile: 1, cprofile veya sample ise her tarama ayrı profillenir (bkz. scan_tool)
+        format: "ndjson" veya "sse" ise sonuçlar akış halinde gönderilir (bkz. scan_tool_all)
     
-    return jsonify({
-        "message": f"Scanned {success_count}/{len(AVAILABLE_PROJECTS)} projects",
-        "results": results
-    }), 200 if success_count > 0 else 500
+    Returns:
+        JSON response with:
+        - message: Başarılı tarama sayısı
+        - results: Her (araç, proje) için tarama sonuçları listesi
+        - timing: wall-clock süre, taramaların toplam süresi ve hızlanma
+    """
+    force = _wants_force()
+    try:
+        profile_mode = _profile_option()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    tasks = [
+        ScanTask(
+            adapter.name, project,
+            _profiled(adapter.name, profile_mode, partial(adapter.runner, force=force))
+        )
+        for adapter in tool_registry.all()
+        for project in project_catalog.names()
+    ]
+    return _run_fanout(tasks, "Scanned")
 
 
 @app.route("/projects", methods=["GET"])
 def list_projects():
     """
-    Mevcut test projelerini listeler
+    Proje kataloğunu listeler (bellekten, sayfalanmış)
+    
+    Projeler PROJECTS_ROOT altından keşfedilir; katalog artımlı olarak
+    yenilenir (bkz. project_catalog.py).
+    
+    Query parameters:
+        language: Sadece bu dili içeren projeler (örn: Python)
+        q: Adında bu metin geçen projeler
+        sort: name (default), files veya lines
+        offset: Atlanacak proje sayısı (default: 0)
+        limit: En fazla dönecek proje sayısı (default: 50, en fazla 1000)
+        refresh: true ise katalog beklenmeden yenilenir
     
     Returns:
         JSON response with:
-        - available_projects: Proje adları listesi
-        - projects: Her proje için detaylı bilgi (name, exists, path)
+        - total: Filtreye uyan proje sayısı
+        - offset, limit: Sayfa bilgisi
+        - available_projects: Sayfadaki proje adları
+        - projects: Her proje için metadata (dil dağılımı, dosya sayısı,
+          satır sayısı, ağaç hash'i)
     """
-    projects_info = []
-    
-    for project in AVAILABLE_PROJECTS:
-        project_path = Path(f"../test_projects/{project}")
-        exists = project_path.exists()
-        
-        projects_info.append({
-            "name": project,
-            "exists": exists,
-            "path": str(project_path)
-        })
+    try:
+        limit = _parse_limit(50)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    try:
+        offset = int(request.args.get("offset", 0))
+    except ValueError:
+        return jsonify({"error": "offset must be an integer"}), 400
+    if offset < 0:
+        return jsonify({"error": "offset must not be negative"}), 400
+    
+    if _is_truthy(request.args.get("refresh", "false")):
+        project_catalog.refresh()
+    
+    try:
+        total, projects = project_catalog.query(
+            language=request.args.get("language"),
+            search=request.args.get("q"),
+            sort=request.args.get("sort", "name"),
+            offset=offset,
+            limit=limit
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     
     return jsonify({
-        "available_projects": AVAILABLE_PROJECTS,
-        "projects": projects_info
+        "total": total,
+        "offset": offset,
+        "limit": limit,
+        "available_projects": [info.name for info in projects],
+        "projects": [info.to_dict() for info in projects]
     })
 
 
+# Runner'ların tarama sonuçlarını kaydettiği klasör (metric_runner.RESULTS_DIR)
+RESULTS_DIR = "../results"
+
+# Son görülen (klasör, mtime) ve o anki en son sonuç dosyası
+_latest_report = {"key": None, "path": None}
+
+
+def _latest_report_path():
+    """
+    RESULTS_DIR'deki en son tarama sonucu dosyasının yolunu döner
+
+    Klasör listesi sadece klasörün mtime'ı değiştiğinde (dosya eklenip
+    silindiğinde) yeniden okunur. Sadece tarama sonucu dosyaları sayılır
+    (bkz. result_store.list_scan_results); sıkıştırılmış kopyalar (.gz, .br),
+    geçici dosyalar ve alt klasörler sayılmaz.
+    """
+    try:
+        key = (RESULTS_DIR, os.stat(RESULTS_DIR).st_mtime_ns)
+    except FileNotFoundError:
+        return None
+    if _latest_report["key"] != key:
+        results = list_scan_results(RESULTS_DIR)
+        _latest_report["path"] = results[0]["path"] if results else None
+        _latest_report["key"] = key
+    return _latest_report["path"]
+
+
 @app.route("/scan/latest", methods=["GET"])
 def latest():
     """
-    En son container tarama raporunu döner (eski endpoint)
+    En son tarama sonucu dosyasını döner
+    
+    Metrikleriyle birlikte index kaydı için GET /results/latest kullanın.
+    Dosya ETag, 304, gzip/br ve Range desteğiyle gönderilir (bkz. http_cache).
     
     Returns:
-        En son rapor dosyası
+        En son sonuç dosyası (değişmediyse 304) veya sonuç yoksa 404
     """
-    files = os.listdir(REPORT_DIR)
-    if not files:
-        return jsonify({"error": "no reports found"}), 404
+    path = _latest_report_path()
+    if path is None or not os.path.isfile(path):
+        return jsonify({"error": "no scan results found"}), 404
 
-    latest = sorted(files)[-1]
-    return send_file(os.path.join(REPORT_DIR, latest))
+    return send_cached_file(path)
 
 
 @app.route("/scan/file/<name>", methods=["GET"])
 def file(name):
     """
-    Belirtilen rapor dosyasını döner (eski endpoint)
+    Belirtilen tarama sonucu dosyasını döner
+    
+    Dosya ETag, 304, gzip/br ve Range desteğiyle gönderilir (bkz. http_cache).
     
     Args:
-        name: Rapor dosyası adı
+        name: results/ klasöründeki dosya adı
     
     Returns:
-        Rapor dosyası
+        Sonuç dosyası (değişmediyse 304) veya dosya yoksa 404
     """
-    return send_file(os.path.join(REPORT_DIR, name))
+    # RESULTS_DIR dışına çıkan adlar (örn. ../) kabul edilmez
+    path = safe_join(RESULTS_DIR, name)
+    if path is None or not os.path.isfile(path):
+        return jsonify({"error": f"Result file '{name}' not found"}), 404
+
+    return send_cached_file(path)
 
 
 # ============================================
-# DEEPSOURCE ENDPOINT'LERİ
+# CACHE ENDPOINT'LERİ
 # ============================================
 
-@app.route("/scan/deepsource", methods=["POST"])
-def scan_deepsource():
+@app.route("/cache/stats", methods=["GET"])
+def cache_stats():
     """
-    DeepSource code taraması endpoint'i
+    Tarama sonucu cache'inin istatistiklerini döner
     
-    Bu endpoint, belirtilen test projesi için DeepSource taraması yapar,
-    sonuçları normalize eder ve results/ klasörüne kaydeder.
-    
-    DeepSource GraphQL API kullanarak repository issues'larını alır
-    ve standart metrik formatına dönüştürür.
+    Returns:
+        JSON response with:
+        - hits, misses, hit_ratio: Cache sayaçları
+        - evictions: Silinen girdi sayısı
+        - entries, total_bytes: Mevcut girdi sayısı ve toplam boyut
+    """
+    return jsonify(scan_cache.stats())
+
+
+@app.route("/cache", methods=["DELETE"])
+def cache_clear():
+    """
+    Tarama sonucu cache'ini temizler
     
-    Request body (JSON):
-    {
-        "project": "flask_demo" veya "nodejs-goof" (opsiyonel, default: flask_demo)
-    }
+    Returns:
+        JSON response with message
+    """
+    scan_cache.clear()
+    return jsonify({"message": "scan cache cleared"})
+
+
+# ============================================
+# SONUÇ INDEX ENDPOINT'LERİ
+# ============================================
+
+def _parse_time_param(name: str):
+    """
+    ISO formatındaki zaman parametresini okur (örn: 2026-01-02 veya 2026-01-02T15:30:00)
+
+    Raises:
+        ValueError: Format geçersizse
+    """
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an ISO date/time (e.g. 2026-01-02T15:30:00)")
+
+
+def _parse_limit(default: int, maximum: int = 1000) -> int:
+    """
+    limit parametresini okur ve doğrular
+
+    Raises:
+        ValueError: limit pozitif bir tam sayı değilse
+    """
+    try:
+        limit = int(request.args.get("limit", default))
+    except ValueError:
+        raise ValueError("limit must be an integer")
+    if limit < 1:
+        raise ValueError("limit must be positive")
+    return min(limit, maximum)
+
+
+@app.route("/results", methods=["GET"])
+def list_results():
+    """
+    Index'teki taramaları en yeniden eskiye listeler
     
-    veya query parameter:
-    ?project=flask_demo
+    Query parameters:
+        start: Bu zamandan sonraki (dahil) taramalar, ISO format (opsiyonel)
+        end: Bu zamandan önceki (hariç) taramalar, ISO format (opsiyonel)
+        tool: Sadece bu aracın taramaları (opsiyonel)
+        project: Sadece bu projenin taramaları (opsiyonel)
+        limit: En fazla dönecek kayıt sayısı (default: 100, en fazla 1000)
     
     Returns:
         JSON response with:
-        - message: İşlem durumu
-        - project: Taranan proje adı
-        - file_path: Kaydedilen sonuç dosyası yolu
-        - metrics: Normalize edilmiş metrik sonuçları
+        - results: Tarama kayıtları (tool, project, created_at, file_path, metrics)
+        - count: Dönen kayıt sayısı
     """
-    # Proje adını al (body'den veya query'den)
-    project = None
+    try:
+        start = _parse_time_param("start")
+        end = _parse_time_param("end")
+        limit = _parse_limit(100)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    results = results_index.runs_in_range(
+        start=start, end=end,
+        tool=request.args.get("tool"), project=request.args.get("project"),
+        limit=limit
+    )
+    return jsonify({"results": results, "count": len(results)})
+
+
+@app.route("/results/latest", methods=["GET"])
+def latest_result():
+    """
+    En son taramayı index'ten döner (dosya sistemine dokunmaz)
     
-    if request.is_json and request.json:
-        project = request.json.get("project")
+    Query parameters:
+        tool: Sadece bu aracın taramaları (opsiyonel, örn: snyk_code)
+        project: Sadece bu projenin taramaları (opsiyonel)
     
-    if not project:
-        project = request.args.get("project", "flask_demo")
+    Returns:
+        JSON response with tool, project, created_at, file_path, metrics
+        veya kayıt yoksa 404
+    """
+    tool = request.args.get("tool")
+    project = request.args.get("project")
     
-    # Proje geçerli mi kontrol et
-    if project not in AVAILABLE_PROJECTS:
+    result = results_index.latest(tool=tool, project=project)
+    if result is None:
         return jsonify({
-            "error": f"Invalid project. Available projects: {AVAILABLE_PROJECTS}",
-            "available_projects": AVAILABLE_PROJECTS
-        }), 400
+            "error": "no indexed scan results found",
+            "tool": tool,
+            "project": project
+        }), 404
     
-    # Tarama yap
-    result = run_deepsource_scan_and_save(project)
+    return jsonify(result)
+
+
+@app.route("/results/top-projects", methods=["GET"])
+def top_projects():
+    """
+    Son taramalarındaki critical sayısına göre en riskli projeleri döner
     
-    if not result["success"]:
-        return jsonify({
-            "error": result.get("error", "Scan failed"),
-            "project": project
-        }), 500
+    Query parameters:
+        tool: Sadece bu aracın taramaları (opsiyonel)
+        limit: En fazla dönecek proje sayısı (default: 10)
+    
+    Returns:
+        JSON response with:
+        - projects: Her (araç, proje) için son tarama kaydı, critical sayısına göre azalan
+    """
+    try:
+        limit = _parse_limit(10)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     
     return jsonify({
-        "message": "deepsource scan completed",
-        "project": result["project"],
-        "file_path": result["file_path"],
-        "metrics": result["metric_result"]
-    }), 200
+        "projects": results_index.top_projects_by_critical(tool=request.args.get("tool"), limit=limit)
+    })
 
 
-@app.route("/scan/deepsource/all", methods=["POST"])
-def scan_deepsource_all():
+# ============================================
+# İSTATİSTİK ENDPOINT'LERİ
+# ============================================
+
+@app.route("/stats/latency", methods=["GET"])
+def latency_stats():
     """
-    Tüm test projeleri için DeepSource taraması yapar
+    Tarama süresi istatistiklerini (araç, proje) bazında döner
+    
+    Tüm worker'ların ve önceki çalıştırmaların kayıtlı özetleri birleştirilir.
+    Cache'ten dönen taramalar sayılmaz.
     
-    AVAILABLE_PROJECTS listesindeki tüm projeleri sırayla tarar
-    ve her biri için sonuçları döner.
+    Query parameters:
+        tool: Sadece bu aracın taramaları (opsiyonel)
+        project: Sadece bu projenin taramaları (opsiyonel)
     
     Returns:
         JSON response with:
-        - message: Başarılı tarama sayısı
-        - results: Her proje için tarama sonuçları listesi
+        - overall: Filtreye uyan tüm taramaların özeti
+          (count, mean, stddev, min, max, p50, p90, p99; saniye)
+        - entries: Her (araç, proje) için aynı özet
     """
-    results = []
+    tool = request.args.get("tool")
+    project = request.args.get("project")
     
-    for project in AVAILABLE_PROJECTS:
-        result = run_deepsource_scan_and_save(project)
-        results.append(result)
+    entries = latency_registry.entries(tool=tool, project=project)
+    overall = latency_registry.stats(tool=tool, project=project)
     
-    success_count = sum(1 for r in results if r["success"])
+    return jsonify({
+        "tool": tool,
+        "project": project,
+        "overall": overall.summary(),
+        "entries": [
+            {"tool": entry_tool, "project": entry_project, **stats.summary()}
+            for (entry_tool, entry_project), stats in sorted(entries.items())
+        ]
+    })
+
+
+@app.route("/stats/concurrency", methods=["GET"])
+def concurrency_stats():
+    """
+    Tarama birleştirme (single-flight) ve araç eşzamanlılık sınırı durumunu döner
     
+    Returns:
+        JSON response with:
+        - flights: Süren tarama sayısı (in_flight), onları bekleyen istekler (waiting),
+          toplam çalıştırma (executions) ve başka taramanın sonucunu alan istek (shared) sayıları
+        - tools: Araç bazında sınır (limit, 0 = sınırsız), çalışan (active) ve
+          sıra bekleyen (waiting) tarama sayıları
+    """
     return jsonify({
-        "message": f"DeepSource scanned {success_count}/{len(AVAILABLE_PROJECTS)} projects",
-        "results": results
-    }), 200 if success_count > 0 else 500
+        "flights": scan_flights.stats(),
+        "tools": tool_limiter.stats()
+    })
+
+
+# ============================================
+# TELEMETRİ
+# ============================================
+
+def _register_telemetry_callbacks():
+    """Kuyruk, cache ve eşzamanlılık durumunu scrape anında okunan metrikler olarak ekler"""
+    telemetry.callback(
+        "scan_jobs", "Durumlara göre tarama job sayısı", ("status",),
+        lambda: [((status,), count) for status, count in job_queue.stats().items()]
+    )
+    telemetry.callback(
+        "scan_cache_hits", "Tarama cache'i hit sayısı", (),
+        lambda: [((), scan_cache.hits)], type_name="counter"
+    )
+    telemetry.callback(
+        "scan_cache_misses", "Tarama cache'i miss sayısı", (),
+        lambda: [((), scan_cache.misses)], type_name="counter"
+    )
+    telemetry.callback(
+        "scan_cache_hit_ratio", "Tarama cache'i hit oranı (process başlangıcından beri)", (),
+        lambda: [((), scan_cache.hits / max(scan_cache.hits + scan_cache.misses, 1))]
+    )
+    telemetry.callback(
+        "scans_in_flight", "Süren (birleştirilmiş) tarama sayısı", (),
+        lambda: [((), scan_flights.in_flight())]
+    )
+    telemetry.callback(
+        "scan_flight_waiters", "Süren özdeş bir taramanın sonucunu bekleyen istek sayısı", (),
+        lambda: [((), scan_flights.stats()["waiting"])]
+    )
+    telemetry.callback(
+        "scan_tool_slots", "Araç bazında çalışan (active) ve sıra bekleyen (waiting) taramalar",
+        ("tool", "state"),
+        lambda: [
+            ((tool, state), stats[state])
+            for tool, stats in tool_limiter.stats().items()
+            for state in ("active", "waiting")
+        ]
+    )
+
+
+if TELEMETRY_ENABLED:
+    _register_telemetry_callbacks()
+
+
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    """
+    Operasyonel metrikleri Prometheus text exposition formatında döner
+    
+    İstek süreleri (route bazında), tarama ve faz süreleri, CLI CPU süresi,
+    JSON parse/serileştirme süresi, cache hit oranı, job kuyruğu ve süren
+    taramalar. TELEMETRY_ENABLED=0 ise 404.
+    
+    Returns:
+        200 text/plain (version=0.0.4)
+    """
+    if not TELEMETRY_ENABLED:
+        return jsonify({"error": "Telemetry is disabled"}), 404
+    return Response(telemetry.render(), content_type=METRICS_CONTENT_TYPE)
+
+
+# ============================================
+# JOB ENDPOINT'LERİ
+# ============================================
+
+@app.route("/jobs", methods=["GET"])
+def list_jobs():
+    """
+    Tarama job'larını en yeniden eskiye doğru listeler
+    
+    Query parameters:
+        status: Sadece bu durumdaki job'lar (queued, running, done, failed)
+        limit: En fazla dönecek job sayısı (default: 50, en fazla 1000)
+    
+    Returns:
+        JSON response with:
+        - jobs: Job listesi (durum, zamanlar, bittiyse metrikler)
+        - counts: Durumlara göre job sayıları
+    """
+    status = request.args.get("status")
+    try:
+        limit = _parse_limit(50)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    jobs = job_queue.list(status=status, limit=limit)
+    
+    return jsonify({
+        "jobs": [job.to_dict() for job in jobs],
+        "counts": job_queue.stats()
+    })
+
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    """
+    Tek bir tarama job'ının durumunu döner
+    
+    Args:
+        job_id: POST /scan/code veya /scan/deepsource'un döndürdüğü job id
+    
+    Returns:
+        JSON response with:
+        - job_id, tool, project, status
+        - timings: Oluşturma/başlama/bitiş zamanları ve süreleri
+        - metrics: Normalize edilmiş metrikler (status: done ise)
+        - error: Hata mesajı (status: failed ise)
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({"error": f"Job '{job_id}' not found"}), 404
+    
+    return jsonify(job.to_dict())
 
 
 if __name__ == "__main__":
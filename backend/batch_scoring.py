@@ -0,0 +1,483 @@
+"""
+Toplu Yeniden Puanlama (Batch Re-scoring) Modülü
+
+Severity eşikleri değiştiğinde geçmiş taramaları yeniden değerlendirmek için
+SnykMetrics / DeepSourceMetrics.calculate() her dosya için tek tek ve her
+issue için if/elif zinciriyle çağrılmak zorunda kalmasın diye, bu modül
+birçok sonuç dosyasındaki issue'ları tek seferde NumPy dizilerine yükler:
+
+- run_index: Issue'nun ait olduğu tarama (satır numarası)
+- priority_score: SARIF properties.priorityScore (yoksa 0)
+- level_code: SARIF level kodu (0: error, 1: warning, 2: diğer)
+- severity_code: Sabit severity'li issue'lar için severity_labels'daki
+  indeks (DeepSource ve eski Snyk formatı); SARIF result'ları için -1
+
+Puanlama tüm taramalar için vektörel yapılır: priority score'lar
+np.digitize ile eşik kovalarına, level'lar ve sabit severity'ler arama
+tablolarıyla kovalara yerleştirilir; tarama başına sayılar tek bir
+np.bincount çağrısıyla çıkar. Sonuçlar varsayılan eşiklerle
+SnykMetrics / DeepSourceMetrics.calculate() ile birebir aynıdır.
+
+Yüklenen diziler .npz olarak kaydedilebilir; böylece farklı eşiklerle tekrar
+tekrar puanlama yaparken sonuç dosyalarını yeniden okumak gerekmez.
+
+Proje Yapısı İçindeki Yeri:
+- backend/batch_scoring.py: Bu dosya
+- backend/result_store.py: Sonuç dosyalarını listeler ve okur
+- backend/metrics/snyk_metrics.py, backend/metrics/deepsource_metrics.py:
+  Varsayılan eşikler ve severity mapping'i
+
+Kullanım:
+    from batch_scoring import load_scan_arrays, score_scan_arrays
+    arrays = load_scan_arrays(list_scan_results("../results"))
+    table = score_scan_arrays(arrays, thresholds=(400, 650, 850))
+    for row in table.rows():
+        print(row["project"], row["critical"], row["high"])
+
+    # Komut satırından:
+    cd backend
+    python batch_scoring.py --thresholds 400,650,850 --tool snyk_code
+"""
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from metrics.deepsource_metrics import DEFAULT_SEVERITY, SEVERITY_MAPPING
+from metrics.result_model import MetricResult
+from metrics.snyk_metrics import SnykMetrics
+from result_store import (
+    KNOWN_TOOLS, ResultStoreReader, is_compact_result, list_scan_results, load_scan_result
+)
+
+# Kova sırası: np.digitize'ın eşikler (medium, high, critical) için döndüğü sıra
+SEVERITIES = ("low", "medium", "high", "critical")
+
+# Sadece total_issues'a sayılan issue'lar (eski Snyk formatında bilinmeyen severity)
+_UNCOUNTED_BUCKET = len(SEVERITIES)
+_BUCKET_COUNT = len(SEVERITIES) + 1
+
+# SARIF level kodları; listede olmayan level'lar "diğer" kodunu alır
+LEVEL_CODES = {"error": 0, "warning": 1}
+_OTHER_LEVEL_CODE = len(LEVEL_CODES)
+
+TOOL_NAMES = {"snyk_code": "Snyk Code", "deepsource": "DeepSource"}
+
+_SARIF_RESULTS = ("runs", 0, "results")
+_DEEPSOURCE_EDGES = ("data", "repository", "issues", "edges")
+
+
+def default_thresholds() -> tuple:
+    """SnykMetrics'in (medium, high, critical) priority score eşikleri"""
+    return (
+        SnykMetrics.MEDIUM_PRIORITY_SCORE,
+        SnykMetrics.HIGH_PRIORITY_SCORE,
+        SnykMetrics.CRITICAL_PRIORITY_SCORE
+    )
+
+
+# ============================================
+# DİZİLER
+# ============================================
+
+@dataclass
+class ScanArrays:
+    """
+    Birden fazla taramanın issue'ları, issue başına bir eleman olan dizilerde
+
+    Attributes:
+        runs: Tarama başına {"path", "tool", "project", "timestamp"}
+        scan_duration: Tarama başına scan_duration (eski Snyk formatında dolu)
+        run_index: Issue başına tarama indeksi (int32)
+        priority_score: Issue başına priority score (float64)
+        level_code: Issue başına SARIF level kodu (int8)
+        severity_code: Issue başına severity_labels indeksi, SARIF için -1 (int16)
+        severity_labels: "<kaynak>:<severity>" etiketleri
+            (örn. "deepsource:MAJOR", "snyk_legacy:high")
+    """
+    runs: List[dict] = field(default_factory=list)
+    scan_duration: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float64))
+    run_index: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int32))
+    priority_score: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float64))
+    level_code: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int8))
+    severity_code: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int16))
+    severity_labels: List[str] = field(default_factory=list)
+
+    @property
+    def run_count(self) -> int:
+        return len(self.runs)
+
+    @property
+    def issue_count(self) -> int:
+        return len(self.run_index)
+
+    def save(self, path: str) -> None:
+        """Dizileri sıkıştırılmış .npz dosyasına kaydeder"""
+        np.savez_compressed(
+            path,
+            runs=np.array(json.dumps(self.runs)),
+            severity_labels=np.array(json.dumps(self.severity_labels)),
+            scan_duration=self.scan_duration,
+            run_index=self.run_index,
+            priority_score=self.priority_score,
+            level_code=self.level_code,
+            severity_code=self.severity_code
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "ScanArrays":
+        """save() ile kaydedilmiş .npz dosyasını okur"""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                runs=json.loads(str(data["runs"])),
+                severity_labels=json.loads(str(data["severity_labels"])),
+                scan_duration=data["scan_duration"],
+                run_index=data["run_index"],
+                priority_score=data["priority_score"],
+                level_code=data["level_code"],
+                severity_code=data["severity_code"]
+            )
+
+
+class _ArrayBuilder:
+    """Issue'ları Python listelerinde biriktirip sonunda NumPy dizilerine çevirir"""
+
+    def __init__(self):
+        self.runs = []
+        self.scan_duration = []
+        self.run_index = []
+        self.priority_score = []
+        self.level_code = []
+        self.severity_code = []
+        self.labels = {}  # etiket -> kod
+
+    def add_run(self, run: dict, scan_duration: float) -> int:
+        self.runs.append(run)
+        self.scan_duration.append(scan_duration)
+        return len(self.runs) - 1
+
+    def add_sarif_result(self, run: int, result: dict):
+        level = result.get("level", "error").lower()
+        score = result.get("properties", {}).get("priorityScore", 0)
+        self.run_index.append(run)
+        self.priority_score.append(score if isinstance(score, (int, float)) else 0)
+        self.level_code.append(LEVEL_CODES.get(level, _OTHER_LEVEL_CODE))
+        self.severity_code.append(-1)
+
+    def add_fixed_severity(self, run: int, label: str):
+        code = self.labels.get(label)
+        if code is None:
+            code = self.labels[label] = len(self.labels)
+        self.run_index.append(run)
+        self.priority_score.append(0)
+        self.level_code.append(_OTHER_LEVEL_CODE)
+        self.severity_code.append(code)
+
+    def build(self) -> ScanArrays:
+        return ScanArrays(
+            runs=self.runs,
+            scan_duration=np.array(self.scan_duration, dtype=np.float64),
+            run_index=np.array(self.run_index, dtype=np.int32),
+            priority_score=np.array(self.priority_score, dtype=np.float64),
+            level_code=np.array(self.level_code, dtype=np.int8),
+            severity_code=np.array(self.severity_code, dtype=np.int16),
+            severity_labels=list(self.labels)
+        )
+
+
+def _tool_from_path(path: str) -> str:
+    """Dosya adındaki araç önekini döner (örn. snyk_code_flask_demo_... -> snyk_code)"""
+    name = str(path).replace("\\", "/").rsplit("/", 1)[-1]
+    for tool in KNOWN_TOOLS:
+        if name.startswith(tool + "_"):
+            return tool
+    raise ValueError(f"Unknown tool for result file: {path}")
+
+
+def _open_document(path: str):
+    """
+    (iskelet doküman, koleksiyon okuyucu) döner
+
+    .rstore dosyalarında issue'lar frame frame okunur; .json dosyaları tek
+    seferde yüklenir.
+    """
+    if is_compact_result(path):
+        reader = ResultStoreReader(path)
+
+        def items(collection):
+            return (item for _, item in reader.iter_items(collection))
+        return reader.index["document"], items, reader.close
+
+    document = load_scan_result(path)
+
+    def items(collection):
+        value = document
+        for key in collection:
+            try:
+                value = value[key]
+            except (KeyError, IndexError, TypeError):
+                return iter(())
+        return iter(value or ())
+    return document, items, lambda: None
+
+
+def _add_result_file(builder: _ArrayBuilder, entry: dict):
+    tool = entry["tool"]
+    document, items, close = _open_document(entry["path"])
+    try:
+        if tool == "snyk_code":
+            _add_snyk_document(builder, entry, document, items)
+        elif tool == "deepsource":
+            run = builder.add_run(entry, 0.0)
+            for edge in items(_DEEPSOURCE_EDGES):
+                if "node" in edge and "issue" in edge["node"]:
+                    severity = edge["node"]["issue"].get("severity", "").upper()
+                    builder.add_fixed_severity(run, f"deepsource:{severity}")
+        else:
+            raise ValueError(f"Unknown tool: {tool}")
+    finally:
+        close()
+
+
+def _add_snyk_document(builder: _ArrayBuilder, entry: dict, document: dict, items):
+    # SnykMetrics.calculate() ile aynı format algılama: SARIF ise sadece runs[0]
+    if "runs" in document and len(document.get("runs", [])) > 0:
+        run = builder.add_run(entry, 0.0)
+        for result in items(_SARIF_RESULTS):
+            builder.add_sarif_result(run, result)
+        return
+
+    run = builder.add_run(entry, document.get("scanDuration", 0.0))
+    for vulnerability in document.get("vulnerabilities", []):
+        builder.add_fixed_severity(run, f"snyk_legacy:{vulnerability.get('severity')}")
+
+
+def load_scan_arrays(entries: Iterable) -> ScanArrays:
+    """
+    Sonuç dosyalarını NumPy dizilerine yükler
+
+    Args:
+        entries: list_scan_results() kayıtları veya dosya yolları
+            (yollarda araç dosya adından çıkarılır)
+
+    Returns:
+        ScanArrays: Her dosya bir tarama (run) olur, sıra korunur
+    """
+    builder = _ArrayBuilder()
+    for entry in entries:
+        if not isinstance(entry, dict):
+            entry = {"path": str(entry), "tool": _tool_from_path(entry)}
+        run = {key: entry.get(key) for key in ("path", "tool", "project", "timestamp")}
+        _add_result_file(builder, run)
+    return builder.build()
+
+
+# ============================================
+# PUANLAMA
+# ============================================
+
+def _label_bucket(label: str, deepsource_mapping: Dict[str, str]) -> int:
+    """Sabit severity etiketinin kovası"""
+    source, _, severity = label.partition(":")
+    if source == "deepsource":
+        return SEVERITIES.index(deepsource_mapping.get(severity, DEFAULT_SEVERITY))
+    # Eski Snyk formatı: bilinmeyen severity'ler sadece toplamda sayılır
+    return SEVERITIES.index(severity) if severity in SEVERITIES else _UNCOUNTED_BUCKET
+
+
+def _level_buckets(level_severities: Dict[str, str]) -> np.ndarray:
+    """level_code -> kova arama tablosu"""
+    buckets = np.full(_OTHER_LEVEL_CODE + 1, SEVERITIES.index("low"), dtype=np.int64)
+    for level, code in LEVEL_CODES.items():
+        if level in level_severities:
+            buckets[code] = SEVERITIES.index(level_severities[level])
+    return buckets
+
+
+@dataclass
+class BatchScoreTable:
+    """
+    Tarama başına severity sayıları
+
+    Attributes:
+        runs: Tarama başına {"path", "tool", "project", "timestamp"}
+        counts: (tarama sayısı, 4) dizisi; sütunlar SEVERITIES sırasında
+        totals: Tarama başına total_issues
+        scan_duration: Tarama başına scan_duration
+    """
+    runs: List[dict]
+    counts: np.ndarray
+    totals: np.ndarray
+    scan_duration: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.runs)
+
+    def metric_results(self) -> List[MetricResult]:
+        """Her tarama için MetricResult (runs sırasında)"""
+        return [
+            MetricResult(
+                tool_name=TOOL_NAMES.get(run["tool"], run["tool"]),
+                critical=int(counts[3]),
+                high=int(counts[2]),
+                medium=int(counts[1]),
+                low=int(counts[0]),
+                total_issues=int(total),
+                scan_duration=float(duration)
+            )
+            for run, counts, total, duration in zip(self.runs, self.counts, self.totals, self.scan_duration)
+        ]
+
+    def rows(self) -> List[dict]:
+        """Tarama bilgisi ve sayıları içeren satırlar (JSON'a yazılabilir)"""
+        rows = []
+        for run, metric_result in zip(self.runs, self.metric_results()):
+            row = dict(run)
+            row.update(
+                critical=metric_result.critical,
+                high=metric_result.high,
+                medium=metric_result.medium,
+                low=metric_result.low,
+                total_issues=metric_result.total_issues,
+                scan_duration=metric_result.scan_duration
+            )
+            rows.append(row)
+        return rows
+
+
+def score_scan_arrays(
+    arrays: ScanArrays,
+    thresholds: Optional[Sequence[float]] = None,
+    level_severities: Optional[Dict[str, str]] = None,
+    deepsource_mapping: Optional[Dict[str, str]] = None
+) -> BatchScoreTable:
+    """
+    Tüm taramaları vektörel olarak puanlar
+
+    Args:
+        arrays: load_scan_arrays() veya ScanArrays.load() çıktısı
+        thresholds: (medium, high, critical) priority score eşikleri
+            (default: SnykMetrics eşikleri)
+        level_severities: Priority score'u olmayan SARIF result'ları için
+            level -> severity (default: SnykMetrics.LEVEL_SEVERITIES)
+        deepsource_mapping: DeepSource severity -> severity
+            (default: deepsource_metrics.SEVERITY_MAPPING)
+
+    Returns:
+        BatchScoreTable
+
+    Raises:
+        ValueError: Eşikler üç tane değilse veya artan sırada değilse
+    """
+    edges = np.asarray(default_thresholds() if thresholds is None else thresholds, dtype=np.float64)
+    if edges.shape != (3,) or np.any(np.diff(edges) <= 0):
+        raise ValueError("thresholds must be three increasing values (medium, high, critical)")
+
+    level_lookup = _level_buckets(
+        SnykMetrics.LEVEL_SEVERITIES if level_severities is None else level_severities
+    )
+    mapping = SEVERITY_MAPPING if deepsource_mapping is None else deepsource_mapping
+
+    # Priority score > 0 ise eşik kovası, değilse level kovası
+    scores = arrays.priority_score
+    buckets = np.where(
+        scores > 0,
+        np.digitize(scores, edges),
+        level_lookup[arrays.level_code]
+    )
+
+    # Sabit severity'li issue'lar etiket tablosundan
+    if arrays.severity_labels:
+        label_lookup = np.array(
+            [_label_bucket(label, mapping) for label in arrays.severity_labels], dtype=np.int64
+        )
+        fixed = arrays.severity_code >= 0
+        buckets[fixed] = label_lookup[arrays.severity_code[fixed]]
+
+    run_count = arrays.run_count
+    flat = np.bincount(
+        arrays.run_index.astype(np.int64) * _BUCKET_COUNT + buckets,
+        minlength=run_count * _BUCKET_COUNT
+    )
+    table = flat.reshape(run_count, _BUCKET_COUNT)
+    return BatchScoreTable(
+        runs=arrays.runs,
+        counts=table[:, :len(SEVERITIES)],
+        totals=table.sum(axis=1),
+        scan_duration=arrays.scan_duration
+    )
+
+
+def rescore_results(
+    results_dir: str = "../results",
+    tool: str = None,
+    project: str = None,
+    thresholds: Optional[Sequence[float]] = None
+) -> BatchScoreTable:
+    """
+    results/ klasöründeki taramaları yükleyip verilen eşiklerle puanlar
+
+    Args:
+        results_dir: Sonuç klasörü
+        tool: Sadece bu aracın sonuçları (opsiyonel)
+        project: Sadece bu projenin sonuçları (opsiyonel)
+        thresholds: (medium, high, critical) priority score eşikleri
+
+    Returns:
+        BatchScoreTable: En yeniden eskiye (list_scan_results sırası)
+    """
+    arrays = load_scan_arrays(list_scan_results(results_dir, tool=tool, project=project))
+    return score_scan_arrays(arrays, thresholds=thresholds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tarama sonuçlarını toplu olarak yeniden puanlar")
+    parser.add_argument("results_dir", nargs="?", default="../results", help="Sonuç klasörü")
+    parser.add_argument("--tool", choices=KNOWN_TOOLS, help="Sadece bu aracın sonuçları")
+    parser.add_argument("--project", help="Sadece bu projenin sonuçları")
+    parser.add_argument("--thresholds", help="medium,high,critical priority score eşikleri (örn. 400,650,850)")
+    parser.add_argument("--arrays", help=".npz dizi dosyası (varsa okunur, yoksa yüklenen diziler kaydedilir)")
+    parser.add_argument("--json", action="store_true", help="Satırları JSON olarak yazdır")
+    args = parser.parse_args()
+
+    thresholds = None
+    if args.thresholds:
+        try:
+            thresholds = [float(value) for value in args.thresholds.split(",")]
+        except ValueError:
+            parser.error("--thresholds must be comma separated numbers")
+
+    if args.arrays and os.path.exists(args.arrays):
+        arrays = ScanArrays.load(args.arrays)
+    else:
+        arrays = load_scan_arrays(list_scan_results(args.results_dir, tool=args.tool, project=args.project))
+        if args.arrays:
+            arrays.save(args.arrays)
+
+    try:
+        table = score_scan_arrays(arrays, thresholds=thresholds)
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    rows = table.rows()
+    if args.json:
+        print(json.dumps(rows, indent=2, ensure_ascii=False))
+        return
+
+    print(f"{len(rows)} tarama, {arrays.issue_count} issue")
+    for row in rows:
+        print(
+            f"{row['timestamp'] or '-':<20} {row['tool']:<11} {row['project'] or '-':<20} "
+            f"C:{row['critical']:<5} H:{row['high']:<5} M:{row['medium']:<5} L:{row['low']:<5} "
+            f"T:{row['total_issues']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""
+Benchmarks Package
+
+Bu paket, normalizasyon ve değerlendirme pipeline'ının performansını
+sentetik tarama çıktılarıyla ölçen benchmark'ları içerir. Ağ veya gerçek
+CLI gerekmez.
+
+Dosyalar:
+- payloads.py: Sentetik Snyk Code SARIF / DeepSource GraphQL çıktıları ve issue listeleri
+- pipeline_benchmark.py: Süre, throughput ve bellek ölçümü; baseline kaydı ve regresyon karşılaştırması
+"""
@@ -0,0 +1,152 @@
+"""
+Sentetik Tarama Çıktıları
+
+Benchmark'lar gerçek CLI veya ağ gerektirmesin diye Snyk Code SARIF ve
+DeepSource GraphQL çıktılarının aynı şekildeki sentetik hallerini üretir.
+Çıktılar seed ile belirlenir: aynı (boyut, seed) her makinede aynı
+payload'ı verir, böylece baseline karşılaştırmaları aynı girdiyle yapılır.
+
+Dağılımlar gerçek çıktılara yakındır:
+- SARIF: result'ların bir kısmında priorityScore yoktur (level'a düşer),
+  level'lar error/warning/note karışıktır; dosya yolları birkaç klasöre yayılır
+- DeepSource: severity'ler CRITICAL/MAJOR/MINOR/INFO ve az sayıda bilinmeyen
+  değerdir
+
+Kullanım:
+    from benchmarks.payloads import sarif_payload, deepsource_payload, issue_lists
+    raw_output = sarif_payload(10000)
+    detected, ground_truth = issue_lists(10000)
+"""
+
+import random
+from typing import List, Tuple
+
+DEFAULT_SEED = 1234
+
+SARIF_RULES = (
+    ("python/Sqli", "CWE-89"),
+    ("python/XSS", "CWE-79"),
+    ("python/PT", "CWE-23"),
+    ("python/HardcodedSecret", "CWE-798"),
+    ("javascript/NoSqli", "CWE-943"),
+    ("javascript/InsecureHash", "CWE-916")
+)
+SARIF_LEVELS = ("error", "warning", "note")
+
+DEEPSOURCE_ISSUES = (
+    ("PYL-W0612", "Unused variable found", "ANTI_PATTERN"),
+    ("BAN-B101", "Assert statement used outside of tests", "SECURITY"),
+    ("PTC-W0019", "Use of `len` to check emptiness", "PERFORMANCE"),
+    ("FLK-E501", "Line too long", "STYLE"),
+    ("PYL-R0201", "Method doesn't use the class instance", "ANTI_PATTERN")
+)
+DEEPSOURCE_SEVERITIES = ("CRITICAL", "MAJOR", "MINOR", "INFO")
+
+# Sentetik issue'ların dağıldığı dosyalar
+SOURCE_FILES = tuple(
+    f"{folder}/module_{index}.py"
+    for folder in ("app", "app/routes", "app/models", "lib", "tests")
+    for index in range(40)
+)
+
+
+def sarif_payload(issue_count: int, seed: int = DEFAULT_SEED) -> dict:
+    """
+    Snyk Code SARIF çıktısı (runs[0].results[] yapısında)
+
+    Args:
+        issue_count: Result sayısı
+        seed: Rastgelelik seed'i
+
+    Returns:
+        SnykMetrics.calculate'e verilebilecek ham çıktı
+    """
+    rng = random.Random(seed)
+    results = []
+    for index in range(issue_count):
+        rule_id, cwe = rng.choice(SARIF_RULES)
+        result = {
+            "ruleId": rule_id,
+            "ruleIndex": SARIF_RULES.index((rule_id, cwe)),
+            "level": rng.choice(SARIF_LEVELS),
+            "message": {"text": f"Unsanitized input flows into a sink ({index})"},
+            "locations": [{
+                "physicalLocation": {
+                    "artifactLocation": {"uri": rng.choice(SOURCE_FILES)},
+                    "region": {"startLine": rng.randint(1, 800), "startColumn": rng.randint(1, 80)}
+                }
+            }],
+            "fingerprints": {"0": f"{rng.getrandbits(64):016x}"}
+        }
+        # Gerçek çıktılarda priorityScore her result'ta yoktur
+        if rng.random() < 0.8:
+            result["properties"] = {"priorityScore": rng.randint(100, 1000), "cwe": [cwe]}
+        results.append(result)
+
+    return {
+        "$schema": "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {"driver": {
+                "name": "SnykCode",
+                "rules": [{"id": rule_id, "properties": {"cwe": [cwe]}} for rule_id, cwe in SARIF_RULES]
+            }},
+            "results": results
+        }]
+    }
+
+
+def deepsource_payload(issue_count: int, seed: int = DEFAULT_SEED) -> dict:
+    """
+    DeepSource GraphQL repository issues çıktısı (tek sayfa)
+
+    Args:
+        issue_count: Edge sayısı
+        seed: Rastgelelik seed'i
+
+    Returns:
+        DeepSourceMetrics.calculate'e verilebilecek ham çıktı
+    """
+    rng = random.Random(seed)
+    edges = []
+    for _ in range(issue_count):
+        shortcode, title, category = rng.choice(DEEPSOURCE_ISSUES)
+        # Az sayıda bilinmeyen severity (DEFAULT_SEVERITY'ye sayılır)
+        severity = rng.choice(DEEPSOURCE_SEVERITIES) if rng.random() < 0.98 else "BLOCKER"
+        edges.append({"node": {"issue": {
+            "shortcode": shortcode,
+            "title": title,
+            "severity": severity,
+            "category": category
+        }}})
+
+    return {"data": {"repository": {"name": "benchmark", "issues": {
+        "totalCount": issue_count,
+        "pageInfo": {"hasNextPage": False, "endCursor": None},
+        "edges": edges
+    }}}}
+
+
+def issue_lists(issue_count: int, seed: int = DEFAULT_SEED, overlap: float = 0.7) -> Tuple[List[dict], List[dict]]:
+    """
+    Hata tespit başarısı için bulunan issue'lar ve ground truth
+
+    Ground truth'un yaklaşık `overlap` oranı bulunan issue'larla aynı
+    (dosya, satır) konumundadır; geri kalanı eşleşmez.
+
+    Returns:
+        (detected_issues, ground_truth), her biri issue_count elemanlı
+    """
+    rng = random.Random(seed)
+    detected = [
+        {"file": rng.choice(SOURCE_FILES), "line": rng.randint(1, 800), "rule_id": rng.choice(SARIF_RULES)[0]}
+        for _ in range(issue_count)
+    ]
+    ground_truth = []
+    for issue in detected:
+        if rng.random() < overlap:
+            ground_truth.append({"location": {"file": issue["file"], "line": issue["line"]}})
+        else:
+            ground_truth.append({"location": {"file": rng.choice(SOURCE_FILES), "line": rng.randint(801, 1600)}})
+    rng.shuffle(ground_truth)
+    return detected, ground_truth
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+Normalizasyon ve Değerlendirme Pipeline'ı Benchmark'ı
+
+Sentetik Snyk Code SARIF ve DeepSource GraphQL çıktıları (bkz.
+benchmarks/payloads.py) üzerinde pipeline'ın sıcak fonksiyonlarını ölçer:
+
+- snyk_metrics.calculate: SnykMetrics.calculate
+- deepsource_metrics.calculate: DeepSourceMetrics.calculate
+- defect_detection_accuracy: AdvancedMetricsCalculator.calculate_defect_detection_accuracy
+  (varsayılan eşleştirici, hash index'li hızlı yol)
+- save_scan_result.compact / save_scan_result.json: result_store.save_scan_result
+  (geçici klasöre; json formatında sıkıştırılmış kopyalar dahil)
+
+Her (durum, boyut) için fonksiyon REPEATS kez çalıştırılır; en iyi ve medyan
+süre, saniyedeki issue sayısı (throughput) ve tracemalloc ile ayrı bir
+çalıştırmada ölçülen en yüksek ek bellek (girdi payload'ı hariç) kaydedilir.
+Ağ, gerçek CLI veya sonuç klasörü gerekmez.
+
+Karşılaştırma modu, kayıtlı baseline ile aynı (durum, boyut) çiftlerini
+karşılaştırır; süre veya bellek eşikten (default %20) fazla artmışsa
+regresyon olarak işaretler ve 1 ile çıkar. Çok kısa süren ölçümlerdeki
+gürültü regresyon sayılmaz (mutlak fark BENCHMARK_MIN_SECONDS / 1 MB altındaysa).
+Baseline makineye özeldir; karşılaştırma aynı makinede yapılmalıdır.
+
+Proje Yapısı İçindeki Yeri:
+- backend/benchmarks/pipeline_benchmark.py: Bu dosya
+- backend/benchmarks/payloads.py: Sentetik tarama çıktıları
+- backend/metrics/: Ölçülen metrik hesaplamaları
+- backend/result_store.py: Ölçülen sonuç kaydetme
+
+Kullanım:
+    cd backend
+
+    # Baseline kaydet (10^2 - 10^5 issue)
+    python benchmarks/pipeline_benchmark.py --output benchmarks/baseline.json
+
+    # 10^6 issue dahil
+    python benchmarks/pipeline_benchmark.py --full --output benchmarks/baseline.json
+
+    # Değişiklikten sonra karşılaştır (regresyon varsa çıkış kodu 1)
+    python benchmarks/pipeline_benchmark.py --compare benchmarks/baseline.json --threshold 0.15
+
+    # Sadece bazı durumlar
+    python benchmarks/pipeline_benchmark.py --cases snyk_metrics.calculate --sizes 1000,100000
+
+Environment Variables:
+    BENCHMARK_SIZES: Varsayılan issue sayıları (default: 100,1000,10000,100000)
+    BENCHMARK_REPEATS: Ölçüm tekrarı (default: 3)
+    BENCHMARK_THRESHOLD: Regresyon eşiği, oran (default: 0.2)
+    BENCHMARK_MIN_SECONDS: Regresyon sayılacak en küçük mutlak süre farkı (default: 0.002)
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Sequence
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.payloads import DEFAULT_SEED, deepsource_payload, issue_lists, sarif_payload
+from metrics.advanced_metrics import AdvancedMetricsCalculator
+from metrics.deepsource_metrics import DeepSourceMetrics
+from metrics.resource_sampler import ResourceSampler
+from metrics.snyk_metrics import SnykMetrics
+import result_store
+
+# ============================================
+# YAPILANDIRMA
+# ============================================
+BENCHMARK_SIZES = tuple(
+    int(value) for value in os.getenv("BENCHMARK_SIZES", "100,1000,10000,100000").split(",") if value.strip()
+)
+BENCHMARK_REPEATS = int(os.getenv("BENCHMARK_REPEATS", "3"))
+BENCHMARK_THRESHOLD = float(os.getenv("BENCHMARK_THRESHOLD", "0.2"))
+BENCHMARK_MIN_SECONDS = float(os.getenv("BENCHMARK_MIN_SECONDS", "0.002"))
+
+# --full ile eklenen boyut (SARIF payload'ı tek başına ~1.5 GB bellek kullanır)
+FULL_SIZE = 1_000_000
+
+# Bellek regresyonu için en küçük mutlak fark (MB)
+MIN_MEMORY_MB = 1.0
+
+BASELINE_VERSION = 1
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    Ölçülen bir fonksiyon
+
+    setup(issue_count, workdir) ölçüm dışında girdiyi hazırlar;
+    run(inputs) ölçülen çağrıdır.
+    """
+    name: str
+    setup: Callable[[int, str], object]
+    run: Callable[[object], object]
+
+
+@dataclass
+class BenchmarkRecord:
+    """Bir (durum, boyut) ölçümü"""
+    case: str
+    issues: int
+    repeats: int
+    best_seconds: float
+    median_seconds: float
+    throughput_per_second: float
+    peak_memory_mb: float
+
+
+def _save_case(file_format: str) -> BenchmarkCase:
+    def setup(issue_count, workdir):
+        return sarif_payload(issue_count), workdir
+
+    def run(inputs):
+        raw_output, workdir = inputs
+        result_store.save_scan_result(
+            raw_output, "snyk_code", "benchmark",
+            tool_version="benchmark", results_dir=workdir, file_format=file_format
+        )
+
+    return BenchmarkCase(f"save_scan_result.{file_format}", setup, run)
+
+
+def _accuracy_setup(issue_count, workdir):
+    # Örnekleyici ölçülen fonksiyonda kullanılmaz; başlatılmamış bir örnekleyici
+    # verilir ki paylaşılan örnekleyicinin arka plan thread'i ölçümü bozmasın
+    return AdvancedMetricsCalculator(sampler=ResourceSampler()), issue_lists(issue_count)
+
+
+BENCHMARK_CASES = {
+    case.name: case for case in (
+        BenchmarkCase(
+            "snyk_metrics.calculate",
+            lambda issue_count, workdir: sarif_payload(issue_count),
+            lambda raw_output: SnykMetrics().calculate(raw_output)
+        ),
+        BenchmarkCase(
+            "deepsource_metrics.calculate",
+            lambda issue_count, workdir: deepsource_payload(issue_count),
+            lambda raw_output: DeepSourceMetrics().calculate(raw_output)
+        ),
+        BenchmarkCase(
+            "defect_detection_accuracy",
+            _accuracy_setup,
+            lambda inputs: inputs[0].calculate_defect_detection_accuracy(*inputs[1])
+        ),
+        _save_case("compact"),
+        _save_case("json")
+    )
+}
+
+
+# ============================================
+# ÖLÇÜM
+# ============================================
+
+def measure(case: BenchmarkCase, issue_count: int, repeats: int = BENCHMARK_REPEATS) -> BenchmarkRecord:
+    """
+    Bir durumu verilen boyutta ölçer
+
+    Süreler GC kapalıyken ölçülür (önceki tekrarların çöpü sonraki ölçümü
+    bozmasın diye her tekrardan önce toplanır). Bellek, süreyi etkilemesin
+    diye ayrı bir çalıştırmada tracemalloc ile ölçülür.
+    """
+    workdir = tempfile.mkdtemp(prefix="benchmark_")
+    try:
+        inputs = case.setup(issue_count, workdir)
+
+        durations = []
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(max(1, repeats)):
+                gc.collect()
+                started = time.perf_counter()
+                case.run(inputs)
+                durations.append(time.perf_counter() - started)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            baseline_bytes, _ = tracemalloc.get_traced_memory()
+            case.run(inputs)
+            _, peak_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    best = min(durations)
+    return BenchmarkRecord(
+        case=case.name,
+        issues=issue_count,
+        repeats=len(durations),
+        best_seconds=round(best, 6),
+        median_seconds=round(statistics.median(durations), 6),
+        throughput_per_second=round(issue_count / best, 1) if best > 0 else 0.0,
+        peak_memory_mb=round((peak_bytes - baseline_bytes) / (1024 * 1024), 3)
+    )
+
+
+def run_benchmarks(
+    sizes: Sequence[int] = BENCHMARK_SIZES,
+    case_names: Sequence[str] = None,
+    repeats: int = BENCHMARK_REPEATS,
+    on_record: Callable[[BenchmarkRecord], None] = None
+) -> List[BenchmarkRecord]:
+    """
+    Seçilen durumları tüm boyutlarda ölçer
+
+    Args:
+        sizes: Issue sayıları
+        case_names: Ölçülecek durumlar (default: hepsi)
+        repeats: Ölçüm tekrarı
+        on_record: Her ölçüm bittiğinde çağrılır (ilerleme çıktısı için)
+
+    Returns:
+        BenchmarkRecord listesi (durum, boyut sırasıyla)
+    """
+    case_names = list(case_names or BENCHMARK_CASES)
+    unknown = [name for name in case_names if name not in BENCHMARK_CASES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark case(s): {', '.join(unknown)}")
+
+    records = []
+    for name in case_names:
+        for issue_count in sizes:
+            record = measure(BENCHMARK_CASES[name], issue_count, repeats)
+            records.append(record)
+            if on_record is not None:
+                on_record(record)
+    return records
+
+
+# ============================================
+# BASELINE VE KARŞILAŞTIRMA
+# ============================================
+
+def build_baseline(records: List[BenchmarkRecord], repeats: int = BENCHMARK_REPEATS) -> dict:
+    """Ölçümleri ortam bilgisiyle birlikte baseline dokümanına çevirir"""
+    return {
+        "version": BASELINE_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count()
+        },
+        "seed": DEFAULT_SEED,
+        "repeats": repeats,
+        "results": [asdict(record) for record in records]
+    }
+
+
+def save_baseline(path: str, baseline: dict) -> None:
+    """Baseline'ı JSON olarak yazar (klasörü oluşturur)"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, ensure_ascii=False)
+
+
+def load_baseline(path: str) -> dict:
+    """Baseline JSON dosyasını okur"""
+    with open(path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version: {baseline.get('version')}")
+    return baseline
+
+
+def compare_results(
+    baseline: dict,
+    records: List[BenchmarkRecord],
+    threshold: float = BENCHMARK_THRESHOLD,
+    min_seconds: float = BENCHMARK_MIN_SECONDS
+) -> List[dict]:
+    """
+    Ölçümleri baseline ile karşılaştırır
+
+    Süre için en iyi süreler karşılaştırılır (medyana göre daha az gürültülü).
+    Bir metrik, oran olarak eşikten fazla ve mutlak olarak en küçük farktan
+    (süre için min_seconds, bellek için MIN_MEMORY_MB) fazla artmışsa regresyondur.
+    Baseline'da olmayan (durum, boyut) çiftleri atlanır.
+
+    Returns:
+        Her eşleşen ölçüm için {"case", "issues", "seconds", "memory", "regression"};
+        "seconds" ve "memory" {"baseline", "current", "change", "regression"} içerir
+    """
+    previous = {(row["case"], row["issues"]): row for row in baseline.get("results", [])}
+
+    def compare(old: float, new: float, min_delta: float) -> dict:
+        change = (new - old) / old if old > 0 else 0.0
+        return {
+            "baseline": old,
+            "current": new,
+            "change": round(change, 4),
+            "regression": change > threshold and (new - old) > min_delta
+        }
+
+    comparisons = []
+    for record in records:
+        row = previous.get((record.case, record.issues))
+        if row is None:
+            continue
+        seconds = compare(row["best_seconds"], record.best_seconds, min_seconds)
+        memory = compare(row["peak_memory_mb"], record.peak_memory_mb, MIN_MEMORY_MB)
+        comparisons.append({
+            "case": record.case,
+            "issues": record.issues,
+            "seconds": seconds,
+            "memory": memory,
+            "regression": seconds["regression"] or memory["regression"]
+        })
+    return comparisons
+
+
+# ============================================
+# KOMUT SATIRI
+# ============================================
+
+def _format_record(record: BenchmarkRecord) -> str:
+    return (f"{record.case:<30} {record.issues:>9} issue  "
+            f"best {record.best_seconds * 1000:>10.2f} ms  "
+            f"median {record.median_seconds * 1000:>10.2f} ms  "
+            f"{record.throughput_per_second:>12.0f} issue/s  "
+            f"peak {record.peak_memory_mb:>9.2f} MB")
+
+
+def _format_comparison(row: dict) -> str:
+    marker = "REGRESSION" if row["regression"] else "ok"
+    return (f"{row['case']:<30} {row['issues']:>9} issue  "
+            f"time {row['seconds']['change'] * 100:>+7.1f}%  "
+            f"memory {row['memory']['change'] * 100:>+7.1f}%  {marker}")
+
+
+def _parse_sizes(value: str) -> List[int]:
+    try:
+        sizes = [int(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError("sizes must be comma separated integers")
+    if not sizes or any(size <= 0 for size in sizes):
+        raise argparse.ArgumentTypeError("sizes must be positive")
+    return sizes
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Normalizasyon ve değerlendirme pipeline'ı benchmark'ı")
+    parser.add_argument("--sizes", type=_parse_sizes, help="Issue sayıları (örn. 100,1000,10000)")
+    parser.add_argument("--full", action="store_true", help=f"Boyutlara {FULL_SIZE} issue'yu da ekle")
+    parser.add_argument("--cases", help=f"Virgülle ayrılmış durumlar ({', '.join(BENCHMARK_CASES)})")
+    parser.add_argument("--repeats", type=int, default=BENCHMARK_REPEATS, help="Ölçüm tekrarı")
+    parser.add_argument("--output", help="Ölçümlerin yazılacağı baseline JSON dosyası")
+    parser.add_argument("--compare", help="Karşılaştırılacak baseline JSON dosyası")
+    parser.add_argument("--threshold", type=float, default=BENCHMARK_THRESHOLD,
+                        help="Regresyon eşiği (oran, örn. 0.2 = %%20)")
+    args = parser.parse_args(argv)
+
+    sizes = list(args.sizes or BENCHMARK_SIZES)
+    if args.full and FULL_SIZE not in sizes:
+        sizes.append(FULL_SIZE)
+    case_names = [name.strip() for name in args.cases.split(",")] if args.cases else None
+
+    baseline = None
+    if args.compare:
+        try:
+            baseline = load_baseline(args.compare)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}")
+            return 2
+
+    try:
+        records = run_benchmarks(sizes, case_names, args.repeats,
+                                 on_record=lambda record: print(_format_record(record)))
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        return 2
+
+    if args.output:
+        save_baseline(args.output, build_baseline(records, args.repeats))
+        print(f"\nBaseline kaydedildi: {args.output}")
+
+    if baseline is not None:
+        comparisons = compare_results(baseline, records, threshold=args.threshold)
+        print(f"\nBaseline karşılaştırması ({args.compare}, eşik %{args.threshold * 100:.0f}):")
+        for row in comparisons:
+            print(_format_comparison(row))
+        regressions = [row for row in comparisons if row["regression"]]
+        if regressions:
+            print(f"\n{len(regressions)} regresyon bulundu")
+            return 1
+        print("\nRegresyon yok")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
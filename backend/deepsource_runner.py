@@ -14,8 +14,11 @@ bilgisi kullanılır.
 
 Ana Fonksiyonlar:
 - run_deepsource_scan(): DeepSource API ile tarama yapar
-- save_scan_result(): Sonuçları JSON formatında kaydeder
-- run_deepsource_scan_and_save(): Tam tarama ve kaydetme işlemi
+- iter_deepsource_issue_pages(): GraphQL issues'larını cursor ile sayfa sayfa getirir
+- stream_deepsource_issue_scan(): GraphQL sayfalarını birleştirmeden sayar ve diske yazar
+- get_deepsource_version(): Cache anahtarı için araç versiyonunu döner
+- save_scan_result(): Sonuçları result_store formatında (.rstore veya JSON) kaydeder
+- run_deepsource_scan_and_save(): Tam tarama ve kaydetme işlemi (cache ve tarama birleştirme destekli)
 
 Kullanım:
     cd backend
@@ -30,15 +33,38 @@ Environment Variables:
     DEEPSOURCE_REPO_OWNER: GitHub repository owner (default: elif1624)
     DEEPSOURCE_REPO_NAME: Repository name (default: kalite)
     DEEPSOURCE_VCS_PROVIDER: VCS provider (default: GITHUB)
+    DEEPSOURCE_PAGE_SIZE: GraphQL sayfa başına issue sayısı (default: 100)
+    DEEPSOURCE_POOL_SIZE: HTTP bağlantı havuzu boyutu (default: 10)
+    DEEPSOURCE_API_CACHE_SECONDS: GraphQL API modunda cache'teki sonucun geçerli
+        kalacağı süre (default: 300; 0 ise API modunda cache kullanılmaz)
 """
 
 import json
+import shutil
 import subprocess
 import os
+import tempfile
+import threading
 import requests
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterator
+from requests.adapters import HTTPAdapter
 from metrics.deepsource_metrics import DeepSourceMetrics
+from metrics.result_model import MetricResult
+from project_tree import compute_tree_hash
+from project_catalog import PROJECTS_ROOT
+from process_profiler import profiled_run
+from scan_fanout import remaining_scan_seconds
+import result_store
+from result_store import ResultStoreWriter, is_compact_result
+from scan_cache import scan_cache, make_cache_key
+from single_flight import scan_flights, tool_limiter
+from results_index import results_index
+from metrics.latency_stats import latency_registry
+from telemetry import record_scan
+from profiling import profiled_scan
+from scan_timing import ScanTimer, scan_phase, PHASE_TOOL, PHASE_PARSE, PHASE_NORMALIZE, PHASE_PERSIST
 
 # Sonuç dosyalarının kaydedileceği klasör
 RESULTS_DIR = "../results"
@@ -99,7 +125,153 @@ DEEPSOURCE_REPO_OWNER = os.getenv("DEEPSOURCE_REPO_OWNER", "elif1624")
 DEEPSOURCE_REPO_NAME = os.getenv("DEEPSOURCE_REPO_NAME", "kalite")
 DEEPSOURCE_VCS_PROVIDER = os.getenv("DEEPSOURCE_VCS_PROVIDER", "GITHUB")  # GITHUB, GITLAB, BITBUCKET
 
-def run_deepsource_scan(target_path: str) -> dict:
+# GraphQL sayfa boyutu ve HTTP bağlantı havuzu boyutu
+DEEPSOURCE_PAGE_SIZE = int(os.getenv("DEEPSOURCE_PAGE_SIZE", "100"))
+DEEPSOURCE_POOL_SIZE = int(os.getenv("DEEPSOURCE_POOL_SIZE", "10"))
+
+# GraphQL API modunda sonuç, uzak repository'nin son analizidir; yerel proje
+# ağacı değişmese de yeni analizler gelebileceği için cache girdisi kısa yaşar
+DEEPSOURCE_API_CACHE_SECONDS = float(os.getenv("DEEPSOURCE_API_CACHE_SECONDS", "300"))
+
+# Repository issues sorgusu (cursor tabanlı pagination)
+DEEPSOURCE_ISSUES_QUERY = """
+query($login: String!, $name: String!, $vcsProvider: VCSProvider!, $first: Int!, $after: String) {
+    repository(login: $login, name: $name, vcsProvider: $vcsProvider) {
+        name
+        issues(first: $first, after: $after) {
+            totalCount
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+            edges {
+                node {
+                    issue {
+                        shortcode
+                        title
+                        severity
+                        category
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+# Process genelinde paylaşılan HTTP session (keep-alive + bağlantı havuzu)
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_deepsource_session() -> requests.Session:
+    """
+    DeepSource API istekleri için paylaşılan requests.Session'ı döner
+    
+    Session ilk kullanımda oluşturulur. Aynı host'a yapılan istekler
+    keep-alive bağlantıları yeniden kullanır; havuz boyutu eşzamanlı
+    istek sayısı kadar bağlantıya izin verir.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=DEEPSOURCE_POOL_SIZE,
+                pool_maxsize=DEEPSOURCE_POOL_SIZE
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def iter_deepsource_issue_pages(
+    owner: str,
+    name: str,
+    vcs_provider: str = "GITHUB",
+    page_size: int = None
+) -> Iterator[dict]:
+    """
+    Repository issues'larını sayfa sayfa getirir
+    
+    pageInfo.hasNextPage false olana kadar endCursor ile sonraki sayfa
+    istenir. Her sayfa alındığı anda döner; tüm issue'lar bellekte
+    biriktirilmez. Tarama bir zaman aşımıyla çalışıyorsa (bkz.
+    scan_fanout.scan_deadline) her isteğin timeout'u kalan süreyle sınırlanır
+    ve süre dolduktan sonra yeni sayfa istenmez.
+    
+    Args:
+        owner: Repository sahibi (login)
+        name: Repository adı
+        vcs_provider: GITHUB, GITLAB veya BITBUCKET
+        page_size: Sayfa başına issue sayısı (default: DEEPSOURCE_PAGE_SIZE)
+    
+    Yields:
+        {
+            "name": str,        # Repository adı
+            "totalCount": int,  # Toplam issue sayısı
+            "edges": [...]      # Bu sayfadaki issue edge'leri
+        }
+    
+    Raises:
+        RuntimeError: API veya GraphQL hatası ya da zaman aşımı durumunda
+    """
+    session = get_deepsource_session()
+    headers = {
+        "Authorization": f"Bearer {DEEPSOURCE_API_TOKEN}",
+        "Content-Type": "application/json"
+    }
+    variables = {
+        "login": owner,
+        "name": name,
+        "vcsProvider": vcs_provider,
+        "first": page_size or DEEPSOURCE_PAGE_SIZE,
+        "after": None
+    }
+    
+    while True:
+        # 5 dakika timeout (tarama daha kısa bir zaman aşımıyla çalışıyorsa o geçerli)
+        remaining = remaining_scan_seconds()
+        if remaining is not None and remaining <= 0:
+            raise RuntimeError("DeepSource API scan timeout (scan deadline passed)")
+        try:
+            response = session.post(
+                DEEPSOURCE_API_URL,
+                headers=headers,
+                json={"query": DEEPSOURCE_ISSUES_QUERY, "variables": variables},
+                timeout=300 if remaining is None else min(300, remaining)
+            )
+        except requests.exceptions.RequestException as e:
+            raise RuntimeError(f"DeepSource API request failed: {str(e)}")
+        
+        if response.status_code != 200:
+            raise RuntimeError(f"DeepSource API error: {response.status_code} - {response.text}")
+        
+        with scan_phase(PHASE_PARSE):
+            result = response.json()
+        # GraphQL hata kontrolü
+        if "errors" in result:
+            raise RuntimeError(f"DeepSource GraphQL error: {result['errors']}")
+        
+        repository = (result.get("data") or {}).get("repository")
+        if repository is None:
+            raise RuntimeError(f"DeepSource repository not found: {owner}/{name}")
+        
+        issues = repository.get("issues") or {}
+        yield {
+            "name": repository.get("name", name),
+            "totalCount": issues.get("totalCount", 0),
+            "edges": issues.get("edges", [])
+        }
+        
+        page_info = issues.get("pageInfo") or {}
+        if not page_info.get("hasNextPage") or not page_info.get("endCursor"):
+            break
+        variables["after"] = page_info["endCursor"]
+
+
+def run_deepsource_scan(target_path: str, on_resource_usage=None) -> dict:
     """
     DeepSource taraması yapar ve JSON çıktısı döner.
     
@@ -107,11 +279,14 @@ def run_deepsource_scan(target_path: str) -> dict:
     GitHub repository bilgisi kullanılır. Üç yöntem denemesi yapılır:
     
     1. CLI yöntemi: DeepSource CLI kuruluysa kullanılır
-    2. GraphQL API: DeepSource GraphQL API ile repository issues alınır
+    2. GraphQL API: DeepSource GraphQL API ile repository issues'ları
+       sayfa sayfa alınır (bkz. iter_deepsource_issue_pages)
     3. Mock modu: Test için mock veri döner
     
     Args:
         target_path: Taranacak proje yolu (CLI için kullanılır, API için kullanılmaz)
+        on_resource_usage: CLI kullanılırsa, CLI process ağacının ResourceUsage
+            kaydı ile çağrılacak fonksiyon (bkz. process_profiler)
     
     Returns:
         dict: DeepSource'un JSON çıktısı (GraphQL response formatı)
@@ -123,21 +298,26 @@ def run_deepsource_scan(target_path: str) -> dict:
     # YÖNTEM 1: DeepSource CLI kullanımı
     # ============================================
     # Eğer DeepSource CLI kuruluysa, local path üzerinde analiz yapar
+    # 5 dakika timeout (tarama daha kısa bir zaman aşımıyla çalışıyorsa o geçerli,
+    # bkz. scan_fanout.scan_deadline)
+    remaining = remaining_scan_seconds()
+    timeout = 300 if remaining is None else min(300, remaining)
     try:
-        result = subprocess.run(
+        result, usage = profiled_run(
             [DEEPSOURCE_CLI_PATH, "analyze", target_path, "--format", "json"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            timeout=300  # 5 dakika timeout
+            timeout=timeout
         )
+        if on_resource_usage is not None and usage is not None:
+            on_resource_usage(usage)
         
         if result.returncode == 0 and result.stdout:
-            return json.loads(result.stdout)
+            with scan_phase(PHASE_PARSE):
+                return json.loads(result.stdout)
         elif result.stdout:
             # Bazı durumlarda hata olsa bile stdout'ta JSON olabilir
             try:
-                return json.loads(result.stdout)
+                with scan_phase(PHASE_PARSE):
+                    return json.loads(result.stdout)
             except json.JSONDecodeError:
                 raise RuntimeError(f"DeepSource CLI error: {result.stderr}")
         else:
@@ -147,64 +327,36 @@ def run_deepsource_scan(target_path: str) -> dict:
         # CLI bulunamadı, API kullanmayı dene
         pass
     except subprocess.TimeoutExpired:
-        raise RuntimeError("DeepSource scan timeout (exceeded 5 minutes)")
+        raise RuntimeError(f"DeepSource scan timeout (exceeded {timeout:g} seconds)")
     
     # ============================================
     # YÖNTEM 2: DeepSource GraphQL API kullanımı
     # ============================================
     # DeepSource repository-based çalışır, bu yüzden GitHub repository bilgisi kullanılır
     if DEEPSOURCE_API_TOKEN:
-        try:
-            # API isteği için header'ları hazırla
-            headers = {
-                "Authorization": f"Bearer {DEEPSOURCE_API_TOKEN}",
-                "Content-Type": "application/json"
-            }
-            
-            # GraphQL query: Repository issues'ları al
-            # first: 100 - İlk 100 issue'yu al (pagination için daha fazla gerekebilir)
-            query = {
-                "query": """
-                query {
-                    repository(login: "%s", name: "%s", vcsProvider: %s) {
-                        name
-                        issues(first: 100) {
-                            totalCount
-                            edges {
-                                node {
-                                    issue {
-                                        shortcode
-                                        title
-                                        severity
-                                        category
-                                    }
-                                }
-                            }
-                        }
+        # Tüm sayfaları sırayla al ve tek bir GraphQL response'u olarak birleştir
+        # (runner bu yolu kullanmaz, bkz. stream_deepsource_issue_scan)
+        repository_name = DEEPSOURCE_REPO_NAME
+        total_count = 0
+        edges = []
+        for page in iter_deepsource_issue_pages(
+            DEEPSOURCE_REPO_OWNER, DEEPSOURCE_REPO_NAME, DEEPSOURCE_VCS_PROVIDER
+        ):
+            repository_name = page["name"]
+            total_count = page["totalCount"]
+            edges.extend(page["edges"])
+        
+        return {
+            "data": {
+                "repository": {
+                    "name": repository_name,
+                    "issues": {
+                        "totalCount": total_count,
+                        "edges": edges
                     }
                 }
-                """ % (DEEPSOURCE_REPO_OWNER, DEEPSOURCE_REPO_NAME, DEEPSOURCE_VCS_PROVIDER)
             }
-            
-            # GraphQL API'ye POST isteği gönder
-            response = requests.post(
-                DEEPSOURCE_API_URL,
-                headers=headers,
-                json=query,
-                timeout=300  # 5 dakika timeout
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                # GraphQL hata kontrolü
-                if "errors" in result:
-                    raise RuntimeError(f"DeepSource GraphQL error: {result['errors']}")
-                return result
-            else:
-                raise RuntimeError(f"DeepSource API error: {response.status_code} - {response.text}")
-        
-        except requests.exceptions.RequestException as e:
-            raise RuntimeError(f"DeepSource API request failed: {str(e)}")
+        }
     
     # ============================================
     # YÖNTEM 3: Mock/Test verisi
@@ -214,73 +366,288 @@ def run_deepsource_scan(target_path: str) -> dict:
     return _get_mock_deepsource_output(target_path)
 
 
-def save_scan_result(raw_output: dict, tool_name: str, project_name: str) -> str:
+def stream_deepsource_issue_scan(output_path: str, pages: Iterator[dict] = None) -> MetricResult:
+    """
+    GraphQL API'nin issue sayfalarını tek bir response'ta birleştirmeden işler
+    
+    Her sayfa geldiği anda DeepSourceMetrics.calculate_from_pages ile sayılır
+    ve edge'leri sonuç dosyasına yazılır: kompakt formatta (.rstore) her edge
+    ResultStoreWriter'a eklenir, JSON formatında ise geçici dosyaya eklenip
+    sonunda atomik olarak yerine taşınır. Bellekte aynı anda sadece bir sayfa
+    tutulur. Dosyanın içeriği run_deepsource_scan'in API yolunun döndürdüğü
+    response ile aynıdır.
+    
+    Args:
+        output_path: Sonuç dosyası (uzantısı formatı belirler, atomik olarak oluşturulur)
+        pages: iter_deepsource_issue_pages formatında sayfalar
+            (verilmezse DEEPSOURCE_REPO_* ayarlarıyla API'den alınır)
+    
+    Returns:
+        MetricResult: Normalize edilmiş metrik sonucu
+    
+    Raises:
+        RuntimeError: API hatası durumunda (dosya oluşturulmaz)
+    """
+    if pages is None:
+        pages = iter_deepsource_issue_pages(
+            DEEPSOURCE_REPO_OWNER, DEEPSOURCE_REPO_NAME, DEEPSOURCE_VCS_PROVIDER
+        )
+    
+    collection = ("data", "repository", "issues", "edges")
+    repository = {"name": DEEPSOURCE_REPO_NAME, "totalCount": 0}
+    
+    def json_header() -> str:
+        return '{"data": {"repository": {"name": %s, "issues": {"totalCount": %d, "edges": [' % (
+            json.dumps(repository["name"], ensure_ascii=False), repository["totalCount"]
+        )
+    
+    writer = None
+    sink = None
+    tmp_path = None
+    try:
+        if is_compact_result(output_path):
+            writer = ResultStoreWriter(output_path, "deepsource", get_deepsource_version())
+            writer.ensure_collection(collection)
+        else:
+            output_dir = os.path.dirname(output_path) or "."
+            os.makedirs(output_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix=".tmp")
+            sink = os.fdopen(fd, "w", encoding="utf-8")
+        
+        def written_pages():
+            edge_count = 0
+            for page_index, page in enumerate(pages):
+                repository["name"] = page["name"]
+                repository["totalCount"] = page["totalCount"]
+                if sink is not None and page_index == 0:
+                    # Başlık ilk sayfanın bilgileriyle yazılır (her sayfada aynıdır)
+                    sink.write(json_header())
+                for edge in page["edges"]:
+                    if writer is not None:
+                        writer.add_item(collection, edge)
+                    else:
+                        sink.write((", " if edge_count else "") + json.dumps(edge, ensure_ascii=False))
+                    edge_count += 1
+                yield page
+        
+        metric_result = DeepSourceMetrics().calculate_from_pages(written_pages())
+        
+        with scan_phase(PHASE_PERSIST):
+            if writer is not None:
+                writer.commit({"data": {"repository": {
+                    "name": repository["name"],
+                    "issues": {"totalCount": repository["totalCount"], "edges": []}
+                }}})
+            else:
+                if sink.tell() == 0:
+                    sink.write(json_header())
+                sink.write("]}}}}")
+                sink.close()
+                os.replace(tmp_path, output_path)
+    except BaseException:
+        if writer is not None:
+            writer.abort()
+        if sink is not None:
+            sink.close()
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    
+    print(f"Tarama sonucu kaydedildi: {output_path}")
+    return metric_result
+
+
+def _streams_graphql_pages() -> bool:
+    """Tarama GraphQL API ile mi yapılacak (token var, CLI kurulu değil)"""
+    return bool(DEEPSOURCE_API_TOKEN) and shutil.which(DEEPSOURCE_CLI_PATH) is None
+
+
+@lru_cache(maxsize=1)
+def get_deepsource_version() -> str:
+    """
+    Cache anahtarı için DeepSource araç versiyonunu döner
+    
+    CLI kuruluysa CLI versiyonu, değilse GraphQL API kullanıldığını belirten
+    sabit bir değer döner. Sonuç process ömrü boyunca bellekte tutulur.
+    
+    Returns:
+        str: Versiyon (örn: "cli:0.8.6" veya "graphql-api")
+    """
+    try:
+        result = subprocess.run(
+            [DEEPSOURCE_CLI_PATH, "version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=30
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return f"cli:{result.stdout.strip()}"
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+    
+    return "graphql-api" if DEEPSOURCE_API_TOKEN else "mock"
+
+
+def save_scan_result(
+    raw_output: dict,
+    tool_name: str,
+    project_name: str,
+    metric_result: MetricResult = None
+) -> str:
     """
     Tarama sonucunu results/ klasörüne kaydeder.
     
+    Kayıt formatı result_store modülüne aittir (default: kompakt .rstore,
+    RESULT_STORE_FORMAT=json ise girintili JSON). Kayıt, metrikleriyle
+    birlikte results_index'e de eklenir.
+    
     Args:
         raw_output: DeepSource'ten gelen ham JSON çıktısı
         tool_name: Kullanılan araç adı (örn: "deepsource")
         project_name: Test projesi adı
+        metric_result: Normalize edilmiş metrik sonucu (verilmezse hesaplanır)
     
     Returns:
         Kaydedilen dosyanın yolu
     """
-    # results klasörünü oluştur
-    results_path = Path(RESULTS_DIR)
-    results_path.mkdir(parents=True, exist_ok=True)
-    
-    # Dosya adını oluştur: tool_project_timestamp.json
-    timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-    filename = f"{tool_name}_{project_name}_{timestamp}.json"
-    file_path = results_path / filename
+    file_path = result_store.save_scan_result(
+        raw_output, tool_name, project_name,
+        tool_version=get_deepsource_version(),
+        results_dir=RESULTS_DIR
+    )
     
-    # JSON'u kaydet
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(raw_output, f, indent=2, ensure_ascii=False)
+    if metric_result is None:
+        metric_result = DeepSourceMetrics().calculate(raw_output)
+    results_index.record(tool_name, project_name, file_path, metric_result, tool_version=get_deepsource_version())
     
     print(f"Tarama sonucu kaydedildi: {file_path}")
     return str(file_path)
 
 
-def run_deepsource_scan_and_save(project_name: str) -> dict:
+def _scan_and_record(target_path: str, project_name: str, cache_key: str, repository: str) -> tuple:
+    """
+    Taramayı aracın eşzamanlılık sınırı içinde yapar, sonucu kaydeder ve cache'e yazar
+    
+    Tarama fazları ölçülür (bkz. scan_timing); süre dökümü MetricResult.timings'e,
+    aracın çalışma süresi (CLI veya GraphQL istekleri) scan_duration'a yazılır.
+    
+    Returns:
+        (sonuç dosyası yolu, MetricResult, CLI ResourceUsage listesi)
+    """
+    resource_usages = []
+    
+    with tool_limiter.limit("deepsource"):
+        timer = ScanTimer()
+        
+        with timer.activate():
+            if _streams_graphql_pages():
+                # GraphQL sayfaları birleştirilmez; cache girdisi sonuç dosyasını gösterir
+                with result_store.reserve_result_path(RESULTS_DIR, "deepsource", project_name) as result_path:
+                    saved_path = str(result_path)
+                    with scan_phase(PHASE_TOOL):
+                        metric_result = stream_deepsource_issue_scan(saved_path)
+                if not metric_result.scan_duration:
+                    metric_result.scan_duration = round(timer.tool_seconds(), 6)
+                with scan_phase(PHASE_PERSIST):
+                    results_index.record(
+                        "deepsource", project_name, saved_path, metric_result,
+                        tool_version=get_deepsource_version()
+                    )
+                raw_output = None
+            else:
+                # Tarama yap (CLI veya mock)
+                with scan_phase(PHASE_TOOL):
+                    raw_output = run_deepsource_scan(target_path, on_resource_usage=resource_usages.append)
+                
+                # Metrik hesapla (DeepSource tarama süresi bildirmez)
+                with scan_phase(PHASE_NORMALIZE):
+                    metric = DeepSourceMetrics()
+                    metric_result = metric.calculate(raw_output)
+                if not metric_result.scan_duration:
+                    metric_result.scan_duration = round(timer.tool_seconds(), 6)
+                
+                # Sonucu kaydet (index'e metrikleriyle birlikte eklenir)
+                with scan_phase(PHASE_PERSIST):
+                    saved_path = save_scan_result(raw_output, "deepsource", project_name, metric_result)
+        
+        metric_result.timings = timer.to_dict()
+        scan_cache.put(cache_key, raw_output, metric_result, saved_path, meta={
+            "tool": "deepsource",
+            "tool_version": get_deepsource_version(),
+            "repository": repository,
+            "project": project_name
+        })
+        
+        # Gerçek tarama süresi (CLI + metrik + kayıt) araç/proje bazında özetlenir
+        latency_registry.record("deepsource", project_name, timer.total_seconds())
+        record_scan("deepsource", project_name, metric_result.timings, resource_usages)
+    
+    return saved_path, metric_result, resource_usages
+
+
+@profiled_scan("deepsource")
+def run_deepsource_scan_and_save(project_name: str, force: bool = False) -> dict:
     """
     Belirli bir proje için DeepSource taraması yapar ve sonucu kaydeder.
     API'den çağrılabilir fonksiyon.
     
+    Proje dosyaları ve DeepSource yapılandırması aynıysa cache'teki sonuç
+    döner. GraphQL API modunda sonuçlar yerel ağaca değil repository'nin son
+    analizine bağlı olduğundan cache'teki sonuç sadece
+    DEEPSOURCE_API_CACHE_SECONDS boyunca kullanılır.
+    Aynı proje ağacı için tarama zaten sürüyorsa onun sonucu beklenir
+    (bkz. single_flight).
+    
     Args:
         project_name: Test projesi adı
+        force: True ise cache atlanır ve tarama her durumda yapılır
     
     Returns:
         {
             "success": bool,
             "project": str,
             "file_path": str,
-            "metric_result": MetricResult (dict olarak),
+            "metric_result": MetricResult (dict olarak; timings: taramanın faz
+                bazında süre dökümü, cache'ten gelen sonuçta orijinal taramanınki),
+            "cached": bool (sonuç cache'ten geldiyse True),
+            "coalesced": bool (eşzamanlı özdeş bir taramanın sonucu paylaşıldıysa True),
+            "resource_usage": dict (DeepSource CLI process ağacının kaynak kullanımı;
+                cache, GraphQL API veya mock modunda None),
             "error": str (varsa)
         }
     """
     try:
         # Proje yolunu oluştur
-        target_path = f"../test_projects/{project_name}"
+        target_path = os.path.join(PROJECTS_ROOT, project_name)
         
         # Proje var mı kontrol et
         if not Path(target_path).exists():
             return {
                 "success": False,
                 "project": project_name,
-                "error": f"Project '{project_name}' not found in test_projects/"
+                "error": f"Project '{project_name}' not found in {PROJECTS_ROOT}"
             }
         
-        # Tarama yap
-        raw_output = run_deepsource_scan(target_path)
-        
-        # Sonucu kaydet
-        saved_path = save_scan_result(raw_output, "deepsource", project_name)
+        # Cache anahtarı: araç + versiyon + proje ağacı hash'i + repository
+        repository = f"{DEEPSOURCE_VCS_PROVIDER}/{DEEPSOURCE_REPO_OWNER}/{DEEPSOURCE_REPO_NAME}"
+        cache_key = make_cache_key(
+            "deepsource", get_deepsource_version(), compute_tree_hash(target_path), repository
+        )
+        max_age = DEEPSOURCE_API_CACHE_SECONDS if _streams_graphql_pages() else None
+        cached = None if force else scan_cache.get(cache_key, max_age_seconds=max_age)
         
-        # Metrik hesapla
-        metric = DeepSourceMetrics()
-        metric_result = metric.calculate(raw_output)
+        coalesced = False
+        if cached:
+            saved_path = cached["file_path"]
+            metric_result = cached["metric_result"]
+            resource_usages = []
+        else:
+            # Aynı proje ağacının eşzamanlı taramaları tek çalıştırmayı paylaşır
+            (saved_path, metric_result, resource_usages), coalesced = scan_flights.run(
+                cache_key,
+                lambda: _scan_and_record(target_path, project_name, cache_key, repository)
+            )
         
         # MetricResult'ı dict'e çevir
         metric_dict = {
@@ -290,14 +657,18 @@ def run_deepsource_scan_and_save(project_name: str) -> dict:
             "medium": metric_result.medium,
             "low": metric_result.low,
             "total_issues": metric_result.total_issues,
-            "scan_duration": metric_result.scan_duration
+            "scan_duration": metric_result.scan_duration,
+            "timings": metric_result.timings
         }
         
         return {
             "success": True,
             "project": project_name,
             "file_path": saved_path,
-            "metric_result": metric_dict
+            "metric_result": metric_dict,
+            "cached": cached is not None,
+            "coalesced": coalesced,
+            "resource_usage": resource_usages[0].to_dict() if resource_usages else None
         }
         
     except Exception as e:
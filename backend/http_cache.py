@@ -0,0 +1,249 @@
+"""
+HTTP Cache ve Sıkıştırma Modülü
+
+Bu modül, sonuç/rapor dosyalarını sunan endpoint'ler için koşullu istek,
+sıkıştırma ve Range desteği sağlar. Dashboard'lar aynı dosyayı birkaç
+saniyede bir sorguladığında dosya değişmediyse sadece 304 döner.
+
+- ETag: Dosya içeriğinin SHA-256 hash'i (strong ETag). Hash, dosyanın
+  (boyut, mtime) bilgisine göre bellekte tutulur; tekrar eden isteklerde
+  dosya okunmaz, sadece stat edilir.
+- If-None-Match / If-Modified-Since: Dosya değişmediyse 304
+- Sıkıştırma: Dosyanın yanına önceden sıkıştırılmış kopyalar (sidecar)
+  yazılır: <dosya>.gz ve brotli kuruluysa <dosya>.br. Kopyalar sadece
+  sunulan dosyalar için, ilk sıkıştırılmış istekte üretilir; sonuç kaydı
+  sıkıştırma maliyeti ödemez. İstemcinin Accept-Encoding'ine göre sidecar
+  gönderilir (br > gzip).
+- Range: Range isteklerine sıkıştırılmamış dosyanın ilgili byte aralığı
+  döner (206)
+
+Sidecar'ların mtime'ı kaynak dosyanınkine eşitlenir; kaynak değişince
+(mtime farklı) sidecar eski sayılır ve yeniden üretilir.
+
+Proje Yapısı İçindeki Yeri:
+- backend/http_cache.py: Bu dosya
+- backend/app.py: /scan/latest ve /scan/file/<name> endpoint'leri (results/ dosyaları)
+
+Kullanım:
+    from http_cache import send_cached_file
+    return send_cached_file(path)   # Flask view içinde
+
+Environment Variables:
+    HTTP_CACHE_SIDECARS: "0" ise sıkıştırılmış kopyalar üretilmez/kullanılmaz (default: 1)
+    HTTP_CACHE_MIN_COMPRESS_BYTES: Bu boyuttan küçük dosyalar sıkıştırılmaz (default: 1024)
+    HTTP_CACHE_CONTROL: Cache-Control header'ı (default: no-cache; her istekte ETag ile doğrulanır)
+
+Not: Brotli sidecar'ları için brotli paketi gerekir (pip install brotli);
+kurulu değilse sadece gzip kullanılır.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from flask import request, send_file
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+HTTP_CACHE_SIDECARS = os.getenv("HTTP_CACHE_SIDECARS", "1") != "0"
+HTTP_CACHE_MIN_COMPRESS_BYTES = int(os.getenv("HTTP_CACHE_MIN_COMPRESS_BYTES", "1024"))
+HTTP_CACHE_CONTROL = os.getenv("HTTP_CACHE_CONTROL", "no-cache")
+
+# Content-Encoding -> sidecar uzantısı (tercih sırasıyla)
+SIDECAR_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+# Zaten sıkıştırılmış formatlar için sidecar üretilmez
+_PRECOMPRESSED_SUFFIXES = {".gz", ".br", ".rstore", ".zip", ".png", ".jpg", ".jpeg"}
+
+# Bellekte tutulan en fazla ETag sayısı
+_ETAG_CACHE_SIZE = 1024
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+_etags = OrderedDict()   # yol -> ((size, mtime_ns), etag)
+_etags_lock = threading.Lock()
+
+
+def _stat_key(stat: os.stat_result) -> Tuple[int, int]:
+    return stat.st_size, stat.st_mtime_ns
+
+
+def content_etag(path: str, stat: os.stat_result = None) -> str:
+    """
+    Dosya içeriğinin SHA-256 hash'inden üretilen ETag (tırnaksız)
+
+    Dosyanın boyutu ve mtime'ı değişmediyse bellekteki değer döner.
+    """
+    path = os.path.abspath(path)
+    stat = stat or os.stat(path)
+    with _etags_lock:
+        cached = _etags.get(path)
+        if cached is not None and cached[0] == _stat_key(stat):
+            _etags.move_to_end(path)
+            return cached[1]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    etag = f"sha256-{digest.hexdigest()[:32]}"
+
+    with _etags_lock:
+        _etags[path] = (_stat_key(stat), etag)
+        _etags.move_to_end(path)
+        while len(_etags) > _ETAG_CACHE_SIZE:
+            _etags.popitem(last=False)
+    return etag
+
+
+# ============================================
+# SIDECAR'LAR
+# ============================================
+
+def is_http_cache_artifact(name: str) -> bool:
+    """Dosya bu modülün ürettiği bir sidecar veya geçici dosya mı?"""
+    return name.endswith(tuple(suffix for _, suffix in SIDECAR_ENCODINGS) + (".tmp",))
+
+
+def _available_encodings() -> List[Tuple[str, str]]:
+    return [
+        (encoding, suffix) for encoding, suffix in SIDECAR_ENCODINGS
+        if encoding != "br" or brotli is not None
+    ]
+
+
+def _compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=11)
+    # mtime=0: aynı içerik her zaman aynı byte'ları üretir
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _should_compress(path: str, size: int) -> bool:
+    return (
+        HTTP_CACHE_SIDECARS
+        and size >= HTTP_CACHE_MIN_COMPRESS_BYTES
+        and os.path.splitext(path)[1].lower() not in _PRECOMPRESSED_SUFFIXES
+    )
+
+
+def _is_fresh(sidecar_path: str, stat: os.stat_result) -> bool:
+    try:
+        return os.stat(sidecar_path).st_mtime_ns == stat.st_mtime_ns
+    except OSError:
+        return False
+
+
+def _write_sidecar(path: str, data: bytes, encoding: str, suffix: str, stat: os.stat_result) -> str:
+    """Sıkıştırılmış kopyayı atomik olarak yazar; mtime'ı kaynağa eşitlenir"""
+    sidecar_path = path + suffix
+    directory = os.path.dirname(sidecar_path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_compress(data, encoding))
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(tmp_path, sidecar_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return sidecar_path
+
+
+def write_sidecars(path: str) -> List[str]:
+    """
+    Dosyanın sıkıştırılmış kopyalarını (.gz, brotli kuruluysa .br) yazar
+
+    Küçük ve zaten sıkıştırılmış (.rstore, .gz vb.) dosyalar atlanır.
+    Yazma hatası kaydı başarısız yapmamalı; hata mesajı yazdırılır.
+
+    Returns:
+        list: Yazılan sidecar yolları
+    """
+    try:
+        stat = os.stat(path)
+        if not _should_compress(path, stat.st_size):
+            return []
+        with open(path, "rb") as f:
+            data = f.read()
+        return [
+            _write_sidecar(path, data, encoding, suffix, stat)
+            for encoding, suffix in _available_encodings()
+        ]
+    except OSError as e:
+        print(f"WARNING: Sıkıştırılmış kopya yazılamadı ({path}): {e}")
+        return []
+
+
+def _select_encoding(path: str, stat: os.stat_result) -> Tuple[Optional[str], str]:
+    """
+    İstemcinin kabul ettiği en iyi sidecar'ı seçer (eski veya eksikse üretir)
+
+    Returns:
+        (Content-Encoding veya None, gönderilecek dosyanın yolu)
+    """
+    if not _should_compress(path, stat.st_size):
+        return None, path
+
+    accepted = request.accept_encodings
+    for encoding, suffix in _available_encodings():
+        if not accepted[encoding]:
+            continue
+        sidecar_path = path + suffix
+        if not _is_fresh(sidecar_path, stat):
+            write_sidecars(path)
+            if not _is_fresh(sidecar_path, stat):
+                continue
+        return encoding, sidecar_path
+    return None, path
+
+
+# ============================================
+# RESPONSE
+# ============================================
+
+def send_cached_file(path: str, mimetype: str = None):
+    """
+    Dosyayı ETag, 304, sıkıştırma ve Range desteğiyle gönderir
+
+    Range isteklerinde sıkıştırılmamış dosya gönderilir (byte aralıkları
+    istemcinin gördüğü dosyaya göre olsun). Her temsilin (identity, gzip, br)
+    ETag'i farklıdır.
+
+    Args:
+        path: Gönderilecek dosya
+        mimetype: Content-Type (verilmezse dosya adından tahmin edilir)
+
+    Returns:
+        Flask response (200, 206 veya 304)
+
+    Raises:
+        FileNotFoundError: Dosya yoksa
+    """
+    stat = os.stat(path)
+    etag = content_etag(path, stat)
+    mimetype = mimetype or mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+    encoding, serve_path = (None, path) if "Range" in request.headers else _select_encoding(path, stat)
+
+    response = send_file(
+        os.path.abspath(serve_path),
+        mimetype=mimetype,
+        conditional=True,
+        etag=f"{etag}-{encoding}" if encoding else etag,
+        last_modified=stat.st_mtime
+    )
+    if encoding and response.status_code == 200:
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    response.headers["Cache-Control"] = HTTP_CACHE_CONTROL
+    return response
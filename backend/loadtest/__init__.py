@@ -0,0 +1,11 @@
+"""
+Loadtest Package
+
+Bu paket, API'nin kapasitesini gerçek Snyk CLI veya DeepSource API'sine
+ihtiyaç duymadan ölçmek için sahte araçları ve yük sürücüsünü içerir.
+
+Dosyalar:
+- fake_snyk.py (+ fake_snyk.cmd): SNYK_PATH ile kullanılan sahte Snyk CLI
+- stub_deepsource.py: DEEPSOURCE_API_URL ile kullanılan stub GraphQL sunucusu
+- driver.py: Eşzamanlı istek sürücüsü; throughput, p50/p99 ve hata sayılarını raporlar
+"""
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+API Yük Testi Sürücüsü
+
+Çalışan API'ye (veya --start-stack ile sahte araçlara bağlı olarak
+başlatılan bir API'ye) eşzamanlı istekler gönderir ve her (endpoint,
+eşzamanlılık) seviyesi için throughput, p50/p99 gecikme ve hata sayılarını
+raporlar.
+
+Her seviyede `concurrency` kadar worker thread'i, süre dolana kadar kendi
+keep-alive HTTP session'ı üzerinden art arda istek gönderir. Gecikmeler
+worker başına LatencyStats özetlerinde tutulur ve seviye sonunda
+birleştirilir (bkz. metrics/latency_stats.py). 4xx/5xx yanıtlar ve bağlantı
+hataları hata sayılır; hatalar durum koduna göre ayrıca listelenir.
+
+Endpoint'ler:
+- code: POST /scan/code {"project", "wait": true, "force": true}
+- deepsource: POST /scan/deepsource {"project", "wait": true, "force": true}
+- latest: GET /scan/latest (results/ klasöründeki en son sonuç dosyası; sonuç yoksa
+  404 döner, bu yüzden default sırada tarama endpoint'lerinden sonra ölçülür)
+
+Tarama istekleri default olarak force=true gönderir: aksi halde ilk
+istekten sonrası tarama cache'inden döner ve aracın yolu ölçülmez
+(--no-force ile cache yolu ölçülür).
+
+--start-stack modu:
+- Stub DeepSource GraphQL sunucusu başlatılır (bkz. stub_deepsource.py)
+- API ayrı bir process'te, SNYK_PATH sahte Snyk CLI'a (fake_snyk.py) ve
+  DEEPSOURCE_API_URL stub sunucuya yönlendirilerek başlatılır
+- API geçici bir çalışma klasöründe çalışır: results/, cache ve index
+  gerçek results/ klasörüne yazılmaz; test projeleri PROJECTS_ROOT'tan okunur
+
+Proje Yapısı İçindeki Yeri:
+- backend/loadtest/driver.py: Bu dosya
+- backend/loadtest/fake_snyk.py: Sahte Snyk CLI
+- backend/loadtest/stub_deepsource.py: Stub DeepSource GraphQL sunucusu
+
+Kullanım:
+    cd backend
+
+    # Sahte araçlarla kendi API'sini başlatarak
+    python loadtest/driver.py --start-stack --concurrency 1,4,16 --duration 10 \\
+        --snyk-latency 0.5 --snyk-issues 1000 --deepsource-issues 2000
+
+    # Zaten çalışan bir API'ye karşı
+    python loadtest/driver.py --url http://127.0.0.1:5001 --endpoints code --concurrency 8
+
+    # Sonuçları JSON olarak kaydet
+    python loadtest/driver.py --start-stack --output loadtest_results.json
+
+Environment Variables:
+    LOADTEST_URL: Hedef API adresi (default: http://127.0.0.1:5001)
+    LOADTEST_CONCURRENCY: Eşzamanlılık seviyeleri (default: 1,4,16)
+    LOADTEST_DURATION: Seviye başına süre (saniye, default: 10)
+    LOADTEST_TIMEOUT: İstek timeout'u (saniye, default: 300)
+    LOADTEST_STARTUP_TIMEOUT: --start-stack'te API'nin hazır olmasını bekleme süresi (default: 30)
+"""
+
+import argparse
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Sequence
+
+import requests
+
+# Backend klasörünü Python path'ine ekle
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from loadtest.stub_deepsource import StubDeepSourceServer
+from metrics.latency_stats import LatencyStats
+
+# ============================================
+# YAPILANDIRMA
+# ============================================
+LOADTEST_URL = os.getenv("LOADTEST_URL", "http://127.0.0.1:5001")
+LOADTEST_CONCURRENCY = tuple(
+    int(value) for value in os.getenv("LOADTEST_CONCURRENCY", "1,4,16").split(",") if value.strip()
+)
+LOADTEST_DURATION = float(os.getenv("LOADTEST_DURATION", "10"))
+LOADTEST_TIMEOUT = float(os.getenv("LOADTEST_TIMEOUT", "300"))
+LOADTEST_STARTUP_TIMEOUT = float(os.getenv("LOADTEST_STARTUP_TIMEOUT", "30"))
+
+FAKE_SNYK_PATH = BACKEND_DIR / "loadtest" / ("fake_snyk.cmd" if os.name == "nt" else "fake_snyk.py")
+
+
+@dataclass
+class Endpoint:
+    """Yük altında tutulan bir API endpoint'i"""
+    name: str
+    method: str
+    path: str
+    scan: bool = False  # True ise body'de project/wait/force gönderilir
+
+    def request_kwargs(self, project: str, force: bool) -> dict:
+        if not self.scan:
+            return {}
+        return {"json": {"project": project, "wait": True, "force": force}}
+
+
+ENDPOINTS = {
+    endpoint.name: endpoint for endpoint in (
+        Endpoint("code", "POST", "/scan/code", scan=True),
+        Endpoint("deepsource", "POST", "/scan/deepsource", scan=True),
+        Endpoint("latest", "GET", "/scan/latest")
+    )
+}
+
+
+@dataclass
+class LevelResult:
+    """Bir (endpoint, eşzamanlılık) seviyesinin sonucu"""
+    endpoint: str
+    concurrency: int
+    requests: int
+    errors: int
+    elapsed_seconds: float
+    throughput_per_second: float
+    latency: Dict[str, float]
+    statuses: Dict[str, int] = field(default_factory=dict)
+
+
+# ============================================
+# YÜK ÜRETİMİ
+# ============================================
+
+def run_level(
+    base_url: str,
+    endpoint: Endpoint,
+    concurrency: int,
+    duration: float = LOADTEST_DURATION,
+    project: str = "flask_demo",
+    force: bool = True,
+    timeout: float = LOADTEST_TIMEOUT
+) -> LevelResult:
+    """
+    Bir endpoint'i verilen eşzamanlılıkla `duration` saniye yük altında tutar
+
+    Süre dolduğunda yeni istek başlatılmaz; süren istekler beklenir ve
+    throughput toplam geçen süreye göre hesaplanır.
+    """
+    url = base_url.rstrip("/") + endpoint.path
+    kwargs = endpoint.request_kwargs(project, force)
+    deadline = time.perf_counter() + duration
+
+    worker_stats = [LatencyStats() for _ in range(concurrency)]
+    worker_statuses = [Counter() for _ in range(concurrency)]
+
+    def work(index: int):
+        stats, statuses = worker_stats[index], worker_statuses[index]
+        with requests.Session() as session:
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = session.request(endpoint.method, url, timeout=timeout, **kwargs)
+                    response.content  # gövdeyi oku (bağlantı tekrar kullanılabilsin)
+                    status = str(response.status_code)
+                except requests.exceptions.RequestException as e:
+                    status = type(e).__name__
+                stats.record(time.perf_counter() - started)
+                statuses[status] += 1
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=work, args=(index,), daemon=True) for index in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    stats = LatencyStats()
+    statuses = Counter()
+    for index in range(concurrency):
+        stats.merge(worker_stats[index])
+        statuses.update(worker_statuses[index])
+
+    summary = stats.summary()
+    errors = sum(count for status, count in statuses.items() if not (status.isdigit() and int(status) < 400))
+    return LevelResult(
+        endpoint=endpoint.name,
+        concurrency=concurrency,
+        requests=stats.count,
+        errors=errors,
+        elapsed_seconds=round(elapsed, 3),
+        throughput_per_second=round(stats.count / elapsed, 3) if elapsed > 0 else 0.0,
+        latency={key: None if summary[key] is None else round(summary[key], 6)
+                 for key in ("mean", "p50", "p90", "p99", "max")},
+        statuses=dict(sorted(statuses.items()))
+    )
+
+
+def run_load_test(
+    base_url: str,
+    endpoint_names: Sequence[str] = tuple(ENDPOINTS),
+    levels: Sequence[int] = LOADTEST_CONCURRENCY,
+    duration: float = LOADTEST_DURATION,
+    project: str = "flask_demo",
+    force: bool = True,
+    on_result: Callable[[LevelResult], None] = None
+) -> List[LevelResult]:
+    """
+    Her endpoint'i sırayla her eşzamanlılık seviyesinde ölçer
+
+    Returns:
+        LevelResult listesi (endpoint, seviye sırasıyla)
+    """
+    unknown = [name for name in endpoint_names if name not in ENDPOINTS]
+    if unknown:
+        raise ValueError(f"Unknown endpoint(s): {', '.join(unknown)}")
+
+    results = []
+    for name in endpoint_names:
+        for concurrency in levels:
+            result = run_level(base_url, ENDPOINTS[name], concurrency, duration, project, force)
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    return results
+
+
+# ============================================
+# SAHTE ARAÇLARLA API BAŞLATMA
+# ============================================
+
+def _free_port(host: str) -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def stack_environment(deepsource_url: str, workdir: str, fake_snyk: Dict[str, str] = None) -> Dict[str, str]:
+    """
+    API process'inin sahte araçlara bağlanması için environment
+
+    DeepSource CLI yolu var olmayan bir dosyaya yönlendirilir ki runner
+    doğrudan GraphQL API yoluna (stub sunucu) geçsin.
+    """
+    env = dict(os.environ)
+    env.update({
+        "SNYK_PATH": str(FAKE_SNYK_PATH),
+        "DEEPSOURCE_API_URL": deepsource_url,
+        "DEEPSOURCE_API_TOKEN": "loadtest",
+        "DEEPSOURCE_CLI_PATH": os.path.join(workdir, "deepsource-cli-disabled"),
+        "PROJECTS_ROOT": os.path.abspath(
+            os.getenv("PROJECTS_ROOT", str(BACKEND_DIR.parent / "test_projects"))
+        ),
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(BACKEND_DIR), os.getenv("PYTHONPATH")]))
+    })
+    env.update(fake_snyk or {})
+    return env
+
+
+@contextmanager
+def start_stack(
+    host: str = "127.0.0.1",
+    snyk_options: Dict[str, str] = None,
+    deepsource_options: Dict[str, float] = None,
+    startup_timeout: float = LOADTEST_STARTUP_TIMEOUT
+) -> Iterator[str]:
+    """
+    Stub DeepSource sunucusunu ve sahte araçlara bağlı API'yi başlatır
+
+    API geçici bir klasörün içindeki backend/ klasöründe çalışır; böylece
+    ../results gibi göreli yollar geçici klasöre düşer.
+
+    Args:
+        host: Dinlenecek adres
+        snyk_options: Sahte Snyk CLI environment'ı (örn. {"FAKE_SNYK_LATENCY": "0.5"})
+        deepsource_options: StubDeepSourceServer argümanları (issues, latency, jitter, error_rate)
+        startup_timeout: API'nin yanıt vermesi için beklenecek süre
+
+    Yields:
+        API'nin adresi (örn. http://127.0.0.1:54321)
+    """
+    workdir = tempfile.mkdtemp(prefix="loadtest_")
+    app_dir = os.path.join(workdir, "backend")
+    os.makedirs(app_dir)
+    port = _free_port(host)
+    base_url = f"http://{host}:{port}"
+    log_path = os.path.join(workdir, "app.log")
+
+    with StubDeepSourceServer(host=host, **(deepsource_options or {})) as stub:
+        env = stack_environment(stub.url, workdir, snyk_options)
+        command = [
+            sys.executable, "-c",
+            f"from app import app; app.run(host={host!r}, port={port}, threaded=True)"
+        ]
+        with open(log_path, "wb") as log:
+            process = subprocess.Popen(command, cwd=app_dir, env=env, stdout=log, stderr=subprocess.STDOUT)
+        try:
+            deadline = time.monotonic() + startup_timeout
+            while True:
+                if process.poll() is not None:
+                    raise RuntimeError(f"API process exited with {process.returncode} (log: {log_path})")
+                try:
+                    if requests.get(f"{base_url}/tools", timeout=1).status_code == 200:
+                        break
+                except requests.exceptions.RequestException:
+                    pass
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"API did not start within {startup_timeout}s (log: {log_path})")
+                time.sleep(0.1)
+            yield base_url
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+    shutil.rmtree(workdir, ignore_errors=True)
+
+
+# ============================================
+# KOMUT SATIRI
+# ============================================
+
+def _format_ms(seconds) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.1f}"
+
+
+def _format_result(result: LevelResult) -> str:
+    statuses = ", ".join(f"{status}: {count}" for status, count in result.statuses.items())
+    return (f"{result.endpoint:<11} c={result.concurrency:<4} {result.requests:>6} req  "
+            f"{result.throughput_per_second:>8.2f} req/s  "
+            f"p50 {_format_ms(result.latency['p50']):>9} ms  "
+            f"p99 {_format_ms(result.latency['p99']):>9} ms  "
+            f"errors {result.errors:>5}  [{statuses}]")
+
+
+def _parse_levels(value: str) -> List[int]:
+    try:
+        levels = [int(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError("concurrency must be comma separated integers")
+    if not levels or any(level <= 0 for level in levels):
+        raise argparse.ArgumentTypeError("concurrency levels must be positive")
+    return levels
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="API yük testi (sahte Snyk / stub DeepSource ile)")
+    parser.add_argument("--url", default=LOADTEST_URL, help="Hedef API adresi")
+    parser.add_argument("--start-stack", action="store_true",
+                        help="Stub DeepSource sunucusunu ve sahte araçlara bağlı API'yi başlat")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS),
+                        help=f"Virgülle ayrılmış endpoint'ler ({', '.join(ENDPOINTS)})")
+    parser.add_argument("--concurrency", type=_parse_levels, default=list(LOADTEST_CONCURRENCY),
+                        help="Eşzamanlılık seviyeleri (örn. 1,4,16)")
+    parser.add_argument("--duration", type=float, default=LOADTEST_DURATION, help="Seviye başına süre (saniye)")
+    parser.add_argument("--project", default="flask_demo", help="Taranacak proje")
+    parser.add_argument("--no-force", action="store_true", help="force=true gönderme (cache yolunu ölç)")
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+
+    stack = parser.add_argument_group("--start-stack seçenekleri")
+    stack.add_argument("--snyk-latency", type=float, help="Sahte Snyk tarama süresi (saniye)")
+    stack.add_argument("--snyk-jitter", type=float, help="Sahte Snyk rastgele ek süresi (saniye)")
+    stack.add_argument("--snyk-issues", type=int, help="Sahte Snyk SARIF result sayısı")
+    stack.add_argument("--snyk-error-rate", type=float, help="Sahte Snyk hata olasılığı (0-1)")
+    stack.add_argument("--deepsource-latency", type=float, help="Stub GraphQL istek süresi (saniye)")
+    stack.add_argument("--deepsource-jitter", type=float, help="Stub GraphQL rastgele ek süresi (saniye)")
+    stack.add_argument("--deepsource-issues", type=int, help="Stub repository issue sayısı")
+    stack.add_argument("--deepsource-error-rate", type=float, help="Stub GraphQL 503 olasılığı (0-1)")
+    args = parser.parse_args(argv)
+
+    endpoint_names = [name.strip() for name in args.endpoints.split(",") if name.strip()]
+    unknown = [name for name in endpoint_names if name not in ENDPOINTS]
+    if unknown:
+        parser.error(f"unknown endpoint(s): {', '.join(unknown)}")
+
+    snyk_options = {
+        env_name: str(value) for env_name, value in (
+            ("FAKE_SNYK_LATENCY", args.snyk_latency),
+            ("FAKE_SNYK_JITTER", args.snyk_jitter),
+            ("FAKE_SNYK_ISSUES", args.snyk_issues),
+            ("FAKE_SNYK_ERROR_RATE", args.snyk_error_rate)
+        ) if value is not None
+    }
+    deepsource_options = {
+        name: value for name, value in (
+            ("latency", args.deepsource_latency),
+            ("jitter", args.deepsource_jitter),
+            ("issues", args.deepsource_issues),
+            ("error_rate", args.deepsource_error_rate)
+        ) if value is not None
+    }
+
+    def run(base_url: str) -> List[LevelResult]:
+        print(f"Hedef: {base_url}\n")
+        return run_load_test(
+            base_url, endpoint_names, args.concurrency, args.duration,
+            args.project, force=not args.no_force, on_result=lambda result: print(_format_result(result))
+        )
+
+    try:
+        if args.start_stack:
+            with start_stack(snyk_options=snyk_options, deepsource_options=deepsource_options) as base_url:
+                results = run(base_url)
+        else:
+            results = run(args.url)
+    except RuntimeError as e:
+        print(f"ERROR: {e}")
+        return 2
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({
+                "endpoints": endpoint_names,
+                "concurrency": args.concurrency,
+                "duration_seconds": args.duration,
+                "force": not args.no_force,
+                "results": [asdict(result) for result in results]
+            }, f, indent=2, ensure_ascii=False)
+        print(f"\nSonuçlar kaydedildi: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3 @@
+@echo off
+rem Sahte Snyk CLI icin Windows sarmalayicisi (SNYK_PATH bu dosyaya yonlendirilir)
+python "%~dp0fake_snyk.py" %*
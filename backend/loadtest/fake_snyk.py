@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Sahte Snyk CLI (yük testi için)
+
+Gerçek Snyk CLI'ın metric_runner tarafından kullanılan komutlarını taklit
+eder; ağ, Snyk hesabı veya Node.js gerekmez. SNYK_PATH bu dosyaya (Windows'ta
+fake_snyk.cmd'ye) yönlendirilerek API'nin kapasitesi aracın kendisinden
+bağımsız ölçülür.
+
+Desteklenen komutlar:
+- snyk --version: FAKE_SNYK_VERSION'ı yazdırır
+- snyk code test <path> --json: FAKE_SNYK_LATENCY (+ rastgele FAKE_SNYK_JITTER)
+  kadar bekler, FAKE_SNYK_ISSUES result'lı sentetik SARIF yazdırır ve gerçek
+  CLI gibi issue bulunduysa 1 ile çıkar. FAKE_SNYK_ERROR_RATE olasılıkla
+  stdout'a hiçbir şey yazmadan 2 ile çıkar (runner bunu tarama hatası sayar).
+
+Proje Yapısı İçindeki Yeri:
+- backend/loadtest/fake_snyk.py: Bu dosya
+- backend/loadtest/fake_snyk.cmd: Windows için sarmalayıcı
+- backend/benchmarks/payloads.py: Sentetik SARIF üretimi
+- backend/metric_runner.py: SNYK_PATH ile çağırır
+
+Kullanım:
+    export SNYK_PATH=$PWD/loadtest/fake_snyk.py
+    export FAKE_SNYK_LATENCY=0.5 FAKE_SNYK_ISSUES=1000
+    python app.py
+
+Environment Variables:
+    FAKE_SNYK_LATENCY: Tarama başına bekleme (saniye, default: 0.5)
+    FAKE_SNYK_JITTER: Beklemeye eklenen rastgele en fazla süre (saniye, default: 0)
+    FAKE_SNYK_ISSUES: SARIF'teki result sayısı (default: 100)
+    FAKE_SNYK_ERROR_RATE: Taramanın başarısız olma olasılığı, 0-1 (default: 0)
+    FAKE_SNYK_VERSION: --version çıktısı (default: 1.0.0-loadtest)
+"""
+
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+FAKE_SNYK_LATENCY = float(os.getenv("FAKE_SNYK_LATENCY", "0.5"))
+FAKE_SNYK_JITTER = float(os.getenv("FAKE_SNYK_JITTER", "0"))
+FAKE_SNYK_ISSUES = int(os.getenv("FAKE_SNYK_ISSUES", "100"))
+FAKE_SNYK_ERROR_RATE = float(os.getenv("FAKE_SNYK_ERROR_RATE", "0"))
+FAKE_SNYK_VERSION = os.getenv("FAKE_SNYK_VERSION", "1.0.0-loadtest")
+
+
+def main(argv) -> int:
+    if "--version" in argv:
+        print(FAKE_SNYK_VERSION)
+        return 0
+
+    if argv[:2] != ["code", "test"]:
+        sys.stderr.write(f"fake snyk: unsupported command: {' '.join(argv)}\n")
+        return 2
+
+    time.sleep(FAKE_SNYK_LATENCY + random.uniform(0, FAKE_SNYK_JITTER))
+
+    if random.random() < FAKE_SNYK_ERROR_RATE:
+        sys.stderr.write("fake snyk: simulated scan failure\n")
+        return 2
+
+    from benchmarks.payloads import sarif_payload
+
+    # Her taramada farklı ama aynı boyutta çıktı
+    json.dump(sarif_payload(FAKE_SNYK_ISSUES, seed=random.getrandbits(32)), sys.stdout)
+    sys.stdout.flush()
+    return 1 if FAKE_SNYK_ISSUES else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
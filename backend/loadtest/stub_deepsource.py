@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Stub DeepSource GraphQL Sunucusu (yük testi için)
+
+deepsource_runner'ın gönderdiği repository issues sorgusunu yanıtlayan yerel
+bir HTTP sunucusu. Cursor tabanlı sayfalama (first/after) gerçek API gibi
+çalışır; issue'lar sentetiktir (bkz. benchmarks/payloads.py) ve sunucu
+başlarken bir kez üretilir. DEEPSOURCE_API_URL bu sunucuya yönlendirilerek
+API'nin kapasitesi DeepSource'tan bağımsız ölçülür.
+
+Her istek STUB_DEEPSOURCE_LATENCY (+ rastgele jitter) kadar bekletilir;
+STUB_DEEPSOURCE_ERROR_RATE olasılıkla 503 döner (runner bunu tarama
+hatası sayar).
+
+Proje Yapısı İçindeki Yeri:
+- backend/loadtest/stub_deepsource.py: Bu dosya
+- backend/loadtest/driver.py: --start-stack ile sunucuyu başlatır
+- backend/deepsource_runner.py: DEEPSOURCE_API_URL ile istek gönderir
+
+Kullanım:
+    # Ayrı bir terminalde
+    python loadtest/stub_deepsource.py --port 8765 --issues 2000 --latency 0.05
+
+    export DEEPSOURCE_API_URL=http://127.0.0.1:8765/graphql/
+    export DEEPSOURCE_API_TOKEN=loadtest DEEPSOURCE_CLI_PATH=/nonexistent
+    python app.py
+
+Environment Variables:
+    STUB_DEEPSOURCE_LATENCY: İstek (sayfa) başına bekleme (saniye, default: 0.05)
+    STUB_DEEPSOURCE_JITTER: Beklemeye eklenen rastgele en fazla süre (saniye, default: 0)
+    STUB_DEEPSOURCE_ISSUES: Repository'deki issue sayısı (default: 250)
+    STUB_DEEPSOURCE_ERROR_RATE: İsteğin 503 ile başarısız olma olasılığı, 0-1 (default: 0)
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.payloads import deepsource_payload
+
+STUB_DEEPSOURCE_LATENCY = float(os.getenv("STUB_DEEPSOURCE_LATENCY", "0.05"))
+STUB_DEEPSOURCE_JITTER = float(os.getenv("STUB_DEEPSOURCE_JITTER", "0"))
+STUB_DEEPSOURCE_ISSUES = int(os.getenv("STUB_DEEPSOURCE_ISSUES", "250"))
+STUB_DEEPSOURCE_ERROR_RATE = float(os.getenv("STUB_DEEPSOURCE_ERROR_RATE", "0"))
+
+
+class _GraphQLHandler(BaseHTTPRequestHandler):
+    """Repository issues sorgusunu sunucunun ayarlarıyla yanıtlar"""
+
+    protocol_version = "HTTP/1.1"  # keep-alive (runner paylaşılan session kullanır)
+
+    def do_POST(self):
+        stub = self.server.stub
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        variables = body.get("variables") or {}
+
+        time.sleep(stub.latency + random.uniform(0, stub.jitter))
+        with stub.lock:
+            stub.requests += 1
+
+        if random.random() < stub.error_rate:
+            with stub.lock:
+                stub.errors += 1
+            self._send(503, b"stub: simulated upstream failure", "text/plain")
+            return
+
+        total = len(stub.edges)
+        start = int(variables["after"]) if variables.get("after") else 0
+        end = min(start + int(variables.get("first") or 100), total)
+        payload = json.dumps({"data": {"repository": {
+            "name": variables.get("name", "loadtest"),
+            "issues": {
+                "totalCount": total,
+                "pageInfo": {"hasNextPage": end < total, "endCursor": str(end)},
+                "edges": stub.edges[start:end]
+            }
+        }}}).encode("utf-8")
+        self._send(200, payload, "application/json")
+
+    def _send(self, status: int, payload: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubDeepSourceServer:
+    """
+    Arka plan thread'inde çalışan stub GraphQL sunucusu
+
+    Attributes:
+        url: DEEPSOURCE_API_URL olarak verilecek adres
+        requests, errors: Alınan istek ve simüle edilen hata sayıları
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        issues: int = None,
+        latency: float = None,
+        jitter: float = None,
+        error_rate: float = None
+    ):
+        self.latency = STUB_DEEPSOURCE_LATENCY if latency is None else latency
+        self.jitter = STUB_DEEPSOURCE_JITTER if jitter is None else jitter
+        self.error_rate = STUB_DEEPSOURCE_ERROR_RATE if error_rate is None else error_rate
+        issue_count = STUB_DEEPSOURCE_ISSUES if issues is None else issues
+        self.edges = deepsource_payload(issue_count)["data"]["repository"]["issues"]["edges"]
+
+        self.requests = 0
+        self.errors = 0
+        self.lock = threading.Lock()
+
+        self._server = ThreadingHTTPServer((host, port), _GraphQLHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/graphql/"
+
+    def start(self) -> "StubDeepSourceServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub DeepSource GraphQL sunucusu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--issues", type=int, help="Issue sayısı")
+    parser.add_argument("--latency", type=float, help="İstek başına bekleme (saniye)")
+    parser.add_argument("--jitter", type=float, help="Rastgele ek bekleme (saniye)")
+    parser.add_argument("--error-rate", type=float, help="503 olasılığı (0-1)")
+    args = parser.parse_args()
+
+    server = StubDeepSourceServer(
+        args.host, args.port, args.issues, args.latency, args.jitter, args.error_rate
+    )
+    print(f"Stub DeepSource GraphQL: {server.url} ({len(server.edges)} issue)")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
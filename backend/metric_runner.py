@@ -11,8 +11,12 @@ Proje Yapısı İçindeki Yeri:
 
 Ana Fonksiyonlar:
 - run_snyk_code_scan(): Snyk CLI ile tarama yapar
-- save_scan_result(): Sonuçları JSON formatında kaydeder
-- run_code_scan_and_save(): Tam tarama ve kaydetme işlemi
+- stream_snyk_code_scan(): Snyk CLI çıktısını akış halinde diske yazar ve sayar
+- run_incremental_snyk_code_scan(): Sadece değişen dosyaları tarar, önceki sonuçla birleştirir
+- merge_sarif_results(): Önceki SARIF çıktısına kısmi tarama sonuçlarını ekler
+- get_snyk_version(): Snyk CLI versiyonunu döner (cache anahtarı için)
+- save_scan_result(): Sonuçları result_store formatında (.rstore veya JSON) kaydeder
+- run_code_scan_and_save(): Tam tarama ve kaydetme işlemi (cache ve tarama birleştirme destekli)
 
 Kullanım:
     cd backend
@@ -25,113 +29,612 @@ Kullanım:
 import json
 import subprocess
 import os
-from datetime import datetime
+import shutil
+import tempfile
+import threading
+from functools import lru_cache
 from pathlib import Path
+from metrics.result_model import MetricResult
 from metrics.snyk_metrics import SnykMetrics
+from sarif_stream import SarifResultStream, TeeReader, CHUNK_SIZE
+import result_store
+from result_store import ResultStoreWriter, is_compact_result
+from project_tree import compute_tree_hash, compute_file_fingerprints
+from project_catalog import PROJECTS_ROOT
+from scan_cache import scan_cache, make_cache_key
+from single_flight import scan_flights, tool_limiter
+from results_index import results_index
+from metrics.latency_stats import latency_registry
+from telemetry import record_scan
+from profiling import profiled_scan
+from process_profiler import ProcessTreeProfiler, SCAN_PROFILING_ENABLED, profiled_run
+from scan_fanout import remaining_scan_seconds
+from scan_timing import (
+    ScanTimer, scan_phase, PHASE_SPAWN, PHASE_TOOL, PHASE_PARSE, PHASE_PREPARE,
+    PHASE_NORMALIZE, PHASE_PERSIST
+)
 
-# Snyk CLI yolu (Windows için)
-# Not: Bu yol sistemden sisteme değişebilir
-SNYK_PATH = r"C:\Users\LOQ\AppData\Roaming\npm\snyk.cmd"
+# Snyk CLI yolu (default: Windows npm kurulumu)
+# Not: Bu yol sistemden sisteme değişebilir; SNYK_PATH ile verilebilir
+# (örn. /usr/local/bin/snyk veya yük testi için loadtest/fake_snyk.py)
+SNYK_PATH = os.getenv("SNYK_PATH", r"C:\Users\LOQ\AppData\Roaming\npm\snyk.cmd")
 
 # Sonuç dosyalarının kaydedileceği klasör
 RESULTS_DIR = "../results"
 
-def run_snyk_code_scan(target_path: str) -> dict:
+# Incremental tarama durumunun (dosya parmak izleri + son SARIF) saklandığı klasör
+INCREMENTAL_STATE_DIR = os.getenv("SNYK_INCREMENTAL_STATE_DIR", "../results/.incremental")
+
+# Kısmi taramada her zaman kopyalanan proje yapılandırma dosyaları
+# (değişmemiş olsalar bile Snyk'in davranışını etkilerler)
+INCREMENTAL_CONFIG_FILES = (".snyk", ".gitignore", ".dcignore")
+
+# Tam taramada CLI çıktısı belleğe alınmadan akış halinde işlenir
+# ("0" ise çıktı eskisi gibi tek seferde okunup json.loads edilir)
+SNYK_STREAM_OUTPUT = os.getenv("SNYK_STREAM_OUTPUT", "1") != "0"
+
+def run_snyk_code_scan(target_path: str, on_resource_usage=None) -> dict:
     """
     Snyk Code CLI kullanarak kod analizi yapar
     
+    CLI, process ağacı profili altında çalışır (bkz. process_profiler).
+    Tarama bir zaman aşımı ile çalışıyorsa (bkz. scan_fanout.scan_deadline)
+    CLI süre dolunca öldürülür.
+    
     Args:
         target_path: Taranacak proje klasörünün yolu
+        on_resource_usage: CLI'ın ResourceUsage kaydı ile çağrılacak fonksiyon (opsiyonel)
     
     Returns:
         dict: Snyk'ten gelen JSON formatındaki ham sonuç
         (SARIF formatı veya eski vulnerabilities formatı)
     
     Raises:
-        RuntimeError: Snyk CLI hatası veya tarama başarısız olduğunda
+        RuntimeError: Snyk CLI hatası, tarama başarısız olduğunda veya zaman aşımında
     """
     # Snyk CLI komutunu çalıştır
     # --json flag'i ile JSON formatında çıktı al
-    result = subprocess.run(
-        [SNYK_PATH, "code", "test", target_path, "--json"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
+    try:
+        result, usage = profiled_run(
+            [SNYK_PATH, "code", "test", target_path, "--json"],
+            timeout=remaining_scan_seconds()
+        )
+    except subprocess.TimeoutExpired:
+        raise RuntimeError("Snyk Code scan timeout (CLI killed at the scan deadline)")
+    if on_resource_usage is not None and usage is not None:
+        on_resource_usage(usage)
 
     # Hata kontrolü
     if result.returncode != 0 and not result.stdout:
         raise RuntimeError(result.stderr)
 
     # JSON çıktısını parse et
-    return json.loads(result.stdout)
+    with scan_phase(PHASE_PARSE):
+        return json.loads(result.stdout)
+
+def stream_snyk_code_scan(
+    target_path: str,
+    output_path: str,
+    on_issue=None,
+    on_resource_usage=None
+) -> MetricResult:
+    """
+    Snyk Code taramasını çıktıyı belleğe almadan yapar
+    
+    CLI'ın stdout pipe'ı parça parça okunur ve runs[*].results[*] elemanları
+    tek tek severity sayaçlarına (ve varsa on_issue callback'ine) verilir.
+    Aynı anda sonuç dosyasına yazılır: kompakt formatta (.rstore) her result
+    ResultStoreWriter'a eklenir, JSON formatında ise okunan her byte olduğu
+    gibi dosyaya aktarılır. Böylece bellek kullanımı çıktı boyutundan
+    bağımsız kalır.
+    
+    Args:
+        target_path: Taranacak proje klasörünün yolu
+        output_path: Sonuç dosyası (uzantısı formatı belirler, atomik olarak oluşturulur)
+        on_issue: Her issue için çağrılacak fonksiyon (opsiyonel)
+            (SnykMetrics.sarif_result_to_issue formatında dict alır)
+        on_resource_usage: CLI'ın ResourceUsage kaydı ile çağrılacak fonksiyon (opsiyonel)
+    
+    Aktif bir tarama ölçümünde (bkz. scan_timing) parse ve normalizasyon CLI
+    çalışırken yapıldığından "tool" fazına dahildir; sadece spawn ve dosyanın
+    kesinleştirilmesi (persist) ayrı ölçülür.
+    
+    Tarama bir zaman aşımı ile çalışıyorsa (bkz. scan_fanout.scan_deadline)
+    CLI süre dolunca öldürülür ve yarım dosya silinir.
+    
+    Returns:
+        MetricResult: Normalize edilmiş metrik sonucu
+    
+    Raises:
+        RuntimeError: Snyk CLI hatası veya tarama başarısız olduğunda
+    """
+    compact = is_compact_result(output_path)
+    with scan_phase(PHASE_SPAWN):
+        process = subprocess.Popen(
+            [SNYK_PATH, "code", "test", target_path, "--json"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+    profiler = ProcessTreeProfiler(process.pid).start() if SCAN_PROFILING_ENABLED else None
+    
+    # stderr ayrı thread'de okunur (pipe dolup CLI'ı bloklamasın)
+    stderr_chunks = []
+    stderr_thread = threading.Thread(
+        target=lambda: stderr_chunks.append(process.stderr.read()),
+        daemon=True
+    )
+    stderr_thread.start()
+    
+    # Zaman aşımında CLI öldürülür; pipe kapanınca okuma döngüsü biter
+    timed_out = threading.Event()
+    
+    def _expire():
+        timed_out.set()
+        process.kill()
+    
+    remaining = remaining_scan_seconds()
+    watchdog = threading.Timer(remaining, _expire) if remaining is not None else None
+    if watchdog is not None:
+        watchdog.daemon = True
+        watchdog.start()
+    
+    writer = None
+    sink = None
+    tmp_path = None
+    try:
+        if compact:
+            writer = ResultStoreWriter(output_path, "snyk_code", get_snyk_version())
+        else:
+            output_dir = os.path.dirname(output_path) or "."
+            os.makedirs(output_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix=".tmp")
+            sink = os.fdopen(fd, "wb")
+        
+        metric = SnykMetrics()
+        tee = TeeReader(process.stdout, sink)
+        stream = SarifResultStream(tee, capture=compact)
+        
+        def first_run_results():
+            for run_index, result in stream:
+                if writer is not None:
+                    writer.add_item(("runs", run_index, "results"), result)
+                # SnykMetrics.calculate ile aynı şekilde sadece ilk run sayılır
+                if run_index != 0:
+                    continue
+                if on_issue is not None:
+                    issue = metric.sarif_result_to_issue(result)
+                    if issue is not None:
+                        on_issue(issue)
+                yield result
+        
+        metric_result = metric.calculate_from_results(first_run_results())
+        
+        # Parser'ın okumadığı kalan çıktıyı da oku (JSON formatında dosyaya aktarılır)
+        while tee.read(CHUNK_SIZE):
+            pass
+        if sink is not None:
+            sink.close()
+        
+        process.wait()
+        stderr_thread.join()
+        if watchdog is not None:
+            watchdog.cancel()
+        if timed_out.is_set():
+            raise RuntimeError("Snyk Code scan timeout (CLI killed at the scan deadline)")
+        
+        if profiler is not None:
+            usage = profiler.stop()
+            if on_resource_usage is not None:
+                on_resource_usage(usage)
+        
+        # Hata kontrolü
+        if process.returncode != 0 and tee.bytes_read == 0:
+            raise RuntimeError(b"".join(stderr_chunks).decode("utf-8", "replace"))
+        
+        if compact:
+            # SARIF değilse (eski vulnerabilities formatı) doküman iskelette tamdır
+            if not stream.saw_runs:
+                metric_result = metric.calculate(stream.document)
+            with scan_phase(PHASE_PERSIST):
+                writer.commit(stream.document)
+        else:
+            # SARIF değilse (eski vulnerabilities formatı) dosyayı normal yoldan oku
+            if not stream.saw_runs:
+                with open(tmp_path, "r", encoding="utf-8") as f:
+                    metric_result = metric.calculate(json.load(f))
+            with scan_phase(PHASE_PERSIST):
+                os.replace(tmp_path, output_path)
+    except BaseException as e:
+        if watchdog is not None:
+            watchdog.cancel()
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        if profiler is not None:
+            profiler.stop()
+        if writer is not None:
+            writer.abort()
+        if sink is not None:
+            sink.close()
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        # Yarım kalan çıktının parse hatası yerine zaman aşımı bildirilir
+        if timed_out.is_set() and isinstance(e, Exception) and not isinstance(e, RuntimeError):
+            raise RuntimeError("Snyk Code scan timeout (CLI killed at the scan deadline)") from e
+        raise
+    
+    print(f"Tarama sonucu kaydedildi: {output_path}")
+    return metric_result
+
+def _normalize_sarif_uri(uri: str) -> str:
+    """SARIF artifactLocation.uri değerini proje köküne göre POSIX yola çevirir"""
+    uri = uri.replace("\\", "/")
+    if uri.startswith("file://"):
+        uri = uri[len("file://"):]
+    while uri.startswith("./"):
+        uri = uri[2:]
+    return uri
+
+def _sarif_result_uri(result: dict) -> str:
+    """SARIF result'ının ilk lokasyonundaki dosya yolunu döner"""
+    locations = result.get("locations", [])
+    if not locations:
+        return ""
+    uri = locations[0].get("physicalLocation", {}).get("artifactLocation", {}).get("uri", "")
+    return _normalize_sarif_uri(uri)
+
+def merge_sarif_results(previous: dict, partial: dict, dropped_files: set, current_files: list) -> dict:
+    """
+    Önceki tam SARIF çıktısına, değişen dosyaların kısmi tarama sonucunu ekler
+    
+    1. Önceki sonuçlardan silinen veya değişen dosyalara ait result'lar çıkarılır
+    2. Kısmi taramanın result'ları eklenir
+    3. Rule listesi id'ye göre birleştirilir ve ruleIndex'ler yeniden hesaplanır
+    4. Coverage, güncel dosya listesine göre dosya uzantısı bazında yeniden sayılır
+    
+    Args:
+        previous: Önceki taramanın (birleştirilmiş) SARIF çıktısı
+        partial: Sadece değişen dosyaları içeren taramanın SARIF çıktısı
+        dropped_files: Sonuçları atılacak dosyalar (değişen + silinen, göreli yol)
+        current_files: Projedeki güncel dosyaların göreli yolları
+    
+    Returns:
+        dict: Tam taramaya eşdeğer SARIF çıktısı (previous yerinde güncellenir)
+    """
+    if not previous.get("runs"):
+        return partial
+    
+    run = previous["runs"][0]
+    partial_run = partial["runs"][0] if partial.get("runs") else {}
+    
+    # Rule'ları id'ye göre birleştir
+    rules = run.setdefault("tool", {}).setdefault("driver", {}).setdefault("rules", [])
+    partial_rules = partial_run.get("tool", {}).get("driver", {}).get("rules", [])
+    rule_index = {rule.get("id"): i for i, rule in enumerate(rules)}
+    for rule in partial_rules:
+        if rule.get("id") not in rule_index:
+            rule_index[rule.get("id")] = len(rules)
+            rules.append(rule)
+    
+    # Değişen/silinen dosyaların eski sonuçlarını at, yenilerini ekle
+    results = [r for r in run.get("results", []) if _sarif_result_uri(r) not in dropped_files]
+    for result in partial_run.get("results", []):
+        if result.get("ruleId") in rule_index:
+            result["ruleIndex"] = rule_index[result["ruleId"]]
+        results.append(result)
+    run["results"] = results
+    
+    # Coverage'ı uzantı bazında güncel dosya sayısıyla yeniden hesapla
+    coverage = {}
+    for entry in run.get("properties", {}).get("coverage", []) + \
+            partial_run.get("properties", {}).get("coverage", []):
+        coverage.setdefault((entry.get("lang"), entry.get("type")), dict(entry))
+    if coverage:
+        for entry in coverage.values():
+            lang = entry.get("lang") or ""
+            entry["files"] = sum(1 for path in current_files if path.endswith(lang))
+        run.setdefault("properties", {})["coverage"] = [
+            entry for entry in coverage.values() if entry["files"] > 0
+        ]
+    
+    return previous
+
+def _incremental_state_path(project_name: str) -> Path:
+    return Path(INCREMENTAL_STATE_DIR) / f"snyk_code_{project_name}.json"
+
+def _load_incremental_state(project_name: str):
+    """Projenin son incremental tarama durumunu okur (yoksa None)"""
+    state_path = _incremental_state_path(project_name)
+    if not state_path.exists():
+        return None
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+def _save_incremental_state(project_name: str, state: dict):
+    """Incremental tarama durumunu atomik olarak yazar"""
+    state_path = _incremental_state_path(project_name)
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=state_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, state_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def run_incremental_snyk_code_scan(target_path: str, project_name: str, on_resource_usage=None) -> dict:
+    """
+    Sadece son taramadan beri değişen dosyaları tarar
+    
+    Her taramadan sonra dosya bazlı parmak izleri (SHA-256) ve birleştirilmiş
+    SARIF çıktısı INCREMENTAL_STATE_DIR altında saklanır. Sonraki taramada:
+    
+    - Önceki durum yoksa veya Snyk versiyonu değiştiyse tam tarama yapılır
+    - Hiçbir dosya değişmediyse önceki SARIF çıktısı döner
+    - Değişen dosyalar geçici bir klasöre kopyalanır (staging) ve sadece o
+      klasör taranır, sonuç önceki çıktıyla birleştirilir (merge_sarif_results)
+    
+    Not: Snyk Code dosyalar arası veri akışını da analiz eder; sadece
+    değişmemiş bir dosyadaki kaynaktan değişen dosyaya akan bulgular kısmi
+    taramada görünmeyebilir. Bu yüzden periyodik olarak tam tarama
+    (force=True) yapılması önerilir.
+    
+    Args:
+        target_path: Taranacak proje klasörünün yolu
+        project_name: Test projesi adı (durum dosyasının adı için)
+        on_resource_usage: CLI çalıştırılırsa ResourceUsage kaydı ile çağrılacak fonksiyon
+    
+    Returns:
+        dict: Tam taramaya eşdeğer SARIF çıktısı
+    """
+    fingerprints = compute_file_fingerprints(target_path)
+    snyk_version = get_snyk_version()
+    state = _load_incremental_state(project_name)
+    
+    if state is None or state.get("snyk_version") != snyk_version or "runs" not in state.get("sarif", {}):
+        # İlk tarama: tam tarama yap
+        raw_output = run_snyk_code_scan(target_path, on_resource_usage)
+    else:
+        previous_fingerprints = state["fingerprints"]
+        changed = {path for path, digest in fingerprints.items() if previous_fingerprints.get(path) != digest}
+        deleted = {path for path in previous_fingerprints if path not in fingerprints}
+        
+        if not changed and not deleted:
+            raw_output = state["sarif"]
+        elif not changed:
+            # Sadece silinen dosyalar var: tarama gerekmez
+            raw_output = merge_sarif_results(state["sarif"], {}, deleted, list(fingerprints))
+        else:
+            with tempfile.TemporaryDirectory(prefix="snyk_incremental_") as staging_dir:
+                for relative_path in changed | set(INCREMENTAL_CONFIG_FILES):
+                    source = Path(target_path) / relative_path
+                    if not source.is_file():
+                        continue
+                    destination = Path(staging_dir) / relative_path
+                    destination.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copy2(source, destination)
+                
+                partial_output = run_snyk_code_scan(staging_dir, on_resource_usage)
+            
+            raw_output = merge_sarif_results(
+                state["sarif"], partial_output, changed | deleted, list(fingerprints)
+            )
+    
+    _save_incremental_state(project_name, {
+        "snyk_version": snyk_version,
+        "fingerprints": fingerprints,
+        "sarif": raw_output
+    })
+    return raw_output
 
-def save_scan_result(raw_output: dict, tool_name: str, project_name: str) -> str:
+@lru_cache(maxsize=1)
+def get_snyk_version() -> str:
+    """
+    Snyk CLI versiyonunu döner
+
+    Versiyon, cache anahtarının parçasıdır: CLI güncellendiğinde eski
+    sonuçlar kullanılmaz. Sonuç process ömrü boyunca bellekte tutulur.
+
+    Returns:
+        str: Versiyon (örn: "1.1301.2") veya alınamazsa "unknown"
+    """
+    try:
+        result = subprocess.run(
+            [SNYK_PATH, "--version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=30
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return "unknown"
+
+    version = result.stdout.strip()
+    return version if result.returncode == 0 and version else "unknown"
+
+def save_scan_result(
+    raw_output: dict,
+    tool_name: str,
+    project_name: str,
+    metric_result: MetricResult = None
+) -> str:
     """
     Tarama sonucunu results/ klasörüne kaydeder.
     
+    Kayıt formatı result_store modülüne aittir (default: kompakt .rstore,
+    RESULT_STORE_FORMAT=json ise girintili JSON). Kayıt, metrikleriyle
+    birlikte results_index'e de eklenir.
+    
     Args:
         raw_output: Snyk'ten gelen ham JSON çıktısı
         tool_name: Kullanılan araç adı (örn: "snyk_code")
         project_name: Test projesi adı (örn: "nodejs-goof", "flask_demo")
+        metric_result: Normalize edilmiş metrik sonucu (verilmezse hesaplanır)
     
     Returns:
         Kaydedilen dosyanın yolu
     """
-    # results klasörünü oluştur
-    results_path = Path(RESULTS_DIR)
-    results_path.mkdir(parents=True, exist_ok=True)
-    
-    # Dosya adını oluştur: tool_project_timestamp.json
-    timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-    filename = f"{tool_name}_{project_name}_{timestamp}.json"
-    file_path = results_path / filename
+    file_path = result_store.save_scan_result(
+        raw_output, tool_name, project_name,
+        tool_version=get_snyk_version(),
+        results_dir=RESULTS_DIR
+    )
     
-    # JSON'u kaydet
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(raw_output, f, indent=2, ensure_ascii=False)
+    if metric_result is None:
+        metric_result = SnykMetrics().calculate(raw_output)
+    results_index.record(tool_name, project_name, file_path, metric_result, tool_version=get_snyk_version())
     
     print(f"Tarama sonucu kaydedildi: {file_path}")
-    return str(file_path)
+    return file_path
+
+def _scan_and_record(
+    target_path: str,
+    project_name: str,
+    cache_key: str,
+    incremental: bool,
+    stream: bool
+) -> tuple:
+    """
+    Taramayı aracın eşzamanlılık sınırı içinde yapar, sonucu kaydeder ve cache'e yazar
+    
+    Tarama fazları ölçülür (bkz. scan_timing); süre dökümü MetricResult.timings'e,
+    aracın çalışma süresi (Snyk kendisi bildirmiyorsa) scan_duration'a yazılır.
+    
+    Returns:
+        (sonuç dosyası yolu, MetricResult, CLI ResourceUsage listesi)
+    """
+    # Bu taramada çalışan CLI çağrılarının kaynak kullanımı
+    resource_usages = []
+    
+    with tool_limiter.limit("snyk_code"):
+        timer = ScanTimer()
+        
+        with timer.activate():
+            if stream and not incremental:
+                # Ham çıktı belleğe alınmaz; cache girdisi sonuç dosyasını gösterir
+                with result_store.reserve_result_path(RESULTS_DIR, "snyk_code", project_name) as result_path:
+                    saved_path = str(result_path)
+                    with scan_phase(PHASE_TOOL):
+                        metric_result = stream_snyk_code_scan(
+                            target_path, saved_path, on_resource_usage=resource_usages.append
+                        )
+                if not metric_result.scan_duration:
+                    metric_result.scan_duration = round(timer.tool_seconds(), 6)
+                with scan_phase(PHASE_PERSIST):
+                    results_index.record(
+                        "snyk_code", project_name, saved_path, metric_result, tool_version=get_snyk_version()
+                    )
+                raw_output = None
+            else:
+                # Tarama yap (incremental taramada CLI dışındaki süre "prepare" fazına gider)
+                if incremental:
+                    with scan_phase(PHASE_PREPARE):
+                        raw_output = run_incremental_snyk_code_scan(
+                            target_path, project_name, on_resource_usage=resource_usages.append
+                        )
+                else:
+                    with scan_phase(PHASE_TOOL):
+                        raw_output = run_snyk_code_scan(target_path, on_resource_usage=resource_usages.append)
+                
+                # Metrik hesapla
+                with scan_phase(PHASE_NORMALIZE):
+                    metric = SnykMetrics()
+                    metric_result = metric.calculate(raw_output)
+                if not metric_result.scan_duration:
+                    metric_result.scan_duration = round(timer.tool_seconds(), 6)
+                
+                # Sonucu kaydet (index'e metrikleriyle birlikte eklenir)
+                with scan_phase(PHASE_PERSIST):
+                    saved_path = save_scan_result(raw_output, "snyk_code", project_name, metric_result)
+        
+        metric_result.timings = timer.to_dict()
+        scan_cache.put(cache_key, raw_output, metric_result, saved_path, meta={
+            "tool": "snyk_code",
+            "tool_version": get_snyk_version(),
+            "project": project_name
+        })
+        
+        # Gerçek tarama süresi (CLI + metrik + kayıt) araç/proje bazında özetlenir
+        latency_registry.record("snyk_code", project_name, timer.total_seconds())
+        record_scan("snyk_code", project_name, metric_result.timings, resource_usages)
+    
+    return saved_path, metric_result, resource_usages
 
-def run_code_scan_and_save(project_name: str) -> dict:
+@profiled_scan("snyk_code")
+def run_code_scan_and_save(
+    project_name: str,
+    force: bool = False,
+    incremental: bool = False,
+    stream: bool = None
+) -> dict:
     """
     Belirli bir proje için code taraması yapar ve sonucu kaydeder.
     API'den çağrılabilir fonksiyon.
     
+    Proje dosyaları, Snyk versiyonu aynıysa tarama tekrar yapılmaz;
+    cache'teki sonuç döner ve yeni sonuç dosyası yazılmaz. Aynı proje
+    ağacı için tarama zaten sürüyorsa yeni tarama başlatılmaz, süren
+    taramanın sonucu beklenir (bkz. single_flight).
+    
     Args:
         project_name: Test projesi adı ("flask_demo" veya "nodejs-goof")
+        force: True ise cache atlanır ve tarama her durumda yapılır
+        incremental: True ise sadece son taramadan beri değişen dosyalar taranır
+            (bkz. run_incremental_snyk_code_scan)
+        stream: True ise CLI çıktısı akış halinde işlenir (bkz. stream_snyk_code_scan);
+            None ise SNYK_STREAM_OUTPUT kullanılır. Incremental taramada
+            önceki sonuçla birleştirme gerektiği için kullanılmaz.
     
     Returns:
         {
             "success": bool,
             "project": str,
             "file_path": str,
-            "metric_result": MetricResult (dict olarak),
+            "metric_result": MetricResult (dict olarak; timings: taramanın faz
+                bazında süre dökümü, cache'ten gelen sonuçta orijinal taramanınki),
+            "cached": bool (sonuç cache'ten geldiyse True),
+            "coalesced": bool (eşzamanlı özdeş bir taramanın sonucu paylaşıldıysa True),
+            "resource_usage": dict (CLI process ağacının kaynak kullanımı,
+                cache'ten gelen veya CLI çalıştırmayan taramalarda None),
             "error": str (varsa)
         }
     """
     try:
         # Proje yolunu oluştur
-        target_path = f"../test_projects/{project_name}"
+        target_path = os.path.join(PROJECTS_ROOT, project_name)
         
         # Proje var mı kontrol et
         if not Path(target_path).exists():
             return {
                 "success": False,
                 "project": project_name,
-                "error": f"Project '{project_name}' not found in test_projects/"
+                "error": f"Project '{project_name}' not found in {PROJECTS_ROOT}"
             }
         
-        # Tarama yap
-        raw_output = run_snyk_code_scan(target_path)
+        # Cache anahtarı: araç + versiyon + proje ağacı hash'i
+        cache_key = make_cache_key("snyk_code", get_snyk_version(), compute_tree_hash(target_path))
+        cached = None if force else scan_cache.get(cache_key)
         
-        # Sonucu kaydet
-        saved_path = save_scan_result(raw_output, "snyk_code", project_name)
+        if stream is None:
+            stream = SNYK_STREAM_OUTPUT
         
-        # Metrik hesapla
-        metric = SnykMetrics()
-        metric_result = metric.calculate(raw_output)
+        coalesced = False
+        if cached:
+            saved_path = cached["file_path"]
+            metric_result = cached["metric_result"]
+            resource_usages = []
+        else:
+            # Aynı proje ağacının eşzamanlı taramaları tek CLI çalıştırmasını paylaşır
+            flight_key = f"{cache_key}:{'incremental' if incremental else 'full'}"
+            (saved_path, metric_result, resource_usages), coalesced = scan_flights.run(
+                flight_key,
+                lambda: _scan_and_record(target_path, project_name, cache_key, incremental, stream)
+            )
         
         # MetricResult'ı dict'e çevir
         metric_dict = {
@@ -141,14 +644,18 @@ def run_code_scan_and_save(project_name: str) -> dict:
             "medium": metric_result.medium,
             "low": metric_result.low,
             "total_issues": metric_result.total_issues,
-            "scan_duration": metric_result.scan_duration
+            "scan_duration": metric_result.scan_duration,
+            "timings": metric_result.timings
         }
         
         return {
             "success": True,
             "project": project_name,
             "file_path": saved_path,
-            "metric_result": metric_dict
+            "metric_result": metric_dict,
+            "cached": cached is not None,
+            "coalesced": coalesced,
+            "resource_usage": resource_usages[0].to_dict() if resource_usages else None
         }
         
     except Exception as e:
@@ -15,6 +15,7 @@ Hesaplanan Metrikler:
    - Taranan kod satırı yüzdesi
    - Analiz edilen dosya sayısı
    - Analiz edilen satır sayısı
+   (payda: backend/source_census.py ile sayılan proje dosya/satır sayıları)
 
 3. Operational Efficiency (Operasyonel Verimlilik):
    - Ortalama tarama süresi
@@ -31,12 +32,16 @@ Kullanım:
     )
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque
 from dataclasses import dataclass
-import time
-import psutil
+import heapq
 import os
 
+from .latency_stats import LatencyStats
+from .resource_sampler import get_resource_sampler
+
 
 @dataclass
 class AdvancedMetricResult:
@@ -65,6 +70,495 @@ class AdvancedMetricResult:
     
     # Kod Kalitesi ve Standart Uyumu (opsiyonel - manuel değerlendirme gerekebilir)
     code_quality_score: Optional[float] = None  # 0-100 arası kod kalitesi skoru
+    
+    # Operasyonel Verimlilik pencere istatistikleri (arka plan örnekleyiciden, opsiyonel)
+    cpu_usage_p95: Optional[float] = None       # Penceredeki CPU kullanımının p95'i
+    cpu_usage_max: Optional[float] = None       # Penceredeki en yüksek CPU kullanımı
+    memory_usage_p95_mb: Optional[float] = None  # Penceredeki RSS'in p95'i (MB)
+    memory_usage_max_mb: Optional[float] = None  # Penceredeki en yüksek RSS (MB)
+
+
+# Optimal eşleştirmede Hungarian algoritmasının kullanılacağı en büyük bileşen
+# (bir taraftaki issue sayısı). Daha büyük bileşenlerde Hopcroft–Karp kullanılır.
+HUNGARIAN_COMPONENT_LIMIT = int(os.getenv("ISSUE_MATCH_HUNGARIAN_LIMIT", "64"))
+
+MATCHING_MODES = ("greedy", "optimal")
+
+# Kural tipinin okunduğu alanlar (SARIF ruleId, DeepSource shortcode vb.)
+_TYPE_FIELDS = ("type", "rule_id", "ruleId", "rule")
+
+
+class IssueMatchingEngine:
+    """
+    Bulunan issue'ları ground truth ile bire bir eşleştiren motor
+    
+    İki issue; dosya adları aynıysa, satır farkı line_tolerance'ı aşmıyorsa ve
+    (match_types açıksa) kural/CWE tipleri uyumluysa eşleşebilir. Adaylar,
+    ground truth'un dosya bazında sıralı satır dizilerinde bisect ile bulunur.
+    
+    Modlar:
+        greedy: Bulunan issue'lar sırayla en yakın eşleşmemiş adayı alır
+        optimal: Eşleşme sayısını en büyük yapan bire bir atama (sıradan bağımsız).
+                 match_types kapalıyken her bulunan issue bir satır aralığıdır;
+                 aralık-greedy O(n log n) ile en büyük eşleşme bulunur.
+                 match_types açıkken küçük bileşenlerde Hungarian ile toplam
+                 satır farkı da en aza indirilir, büyük bileşenlerde
+                 Hopcroft–Karp kullanılır.
+    """
+    
+    def __init__(self, line_tolerance: int = 0, match_types: bool = False, mode: str = "greedy"):
+        if mode not in MATCHING_MODES:
+            raise ValueError(f"Unknown matching mode: {mode}. Expected one of {MATCHING_MODES}")
+        if line_tolerance < 0:
+            raise ValueError("line_tolerance must be >= 0")
+        
+        self.line_tolerance = int(line_tolerance)
+        self.match_types = match_types
+        self.mode = mode
+    
+    @staticmethod
+    def location_key(issue: Dict):
+        """
+        Issue'nun (dosya adı, satır) anahtarını döner
+        
+        Dosya yolunun sadece son parçası (dosya adı) kullanılır.
+        Dosya bilgisi yoksa None döner (böyle issue'lar hiçbir şeyle eşleşmez).
+        """
+        issue_file = issue.get("file", issue.get("location", {}).get("file", ""))
+        if not issue_file:
+            return None
+        
+        issue_line = issue.get("line", issue.get("location", {}).get("line", -1))
+        return issue_file.rsplit("/", 1)[-1], issue_line
+    
+    @staticmethod
+    def type_tokens(issue: Dict) -> frozenset:
+        """
+        Issue'nun kural/CWE tiplerini normalize edilmiş küme olarak döner
+        
+        "CWE-89", "89" ve 89 aynı ("cwe-89") kabul edilir; kural id'leri küçük harfe çevrilir.
+        """
+        tokens = []
+        
+        cwe = issue.get("cwe")
+        if cwe is None:
+            cwe = issue.get("cwes")
+        if cwe is not None:
+            for value in (cwe if isinstance(cwe, (list, tuple, set)) else (cwe,)):
+                text = str(value).strip().lower()
+                if text:
+                    tokens.append(text if text.startswith("cwe-") else f"cwe-{text}")
+        
+        for field in _TYPE_FIELDS:
+            value = issue.get(field)
+            if value:
+                tokens.append(str(value).strip().lower())
+        
+        return frozenset(tokens)
+    
+    @staticmethod
+    def _types_compatible(detected_types: frozenset, truth_types: frozenset) -> bool:
+        # Tip bilgisi olmayan taraf her tiple uyumlu sayılır
+        return not detected_types or not truth_types or not detected_types.isdisjoint(truth_types)
+    
+    def match(self, detected_issues: List[Dict], ground_truth: List[Dict]) -> List[Tuple[int, int]]:
+        """
+        Issue'ları eşleştirir
+        
+        Returns:
+            (detected_index, ground_truth_index) çiftleri
+        """
+        groups = self._index_ground_truth(ground_truth)
+        detected = [self._normalize(issue) for issue in detected_issues]
+        
+        if self.mode == "greedy":
+            return self._match_greedy(detected, groups)
+        return self._match_optimal(detected, groups)
+    
+    def _normalize(self, issue: Dict):
+        """Issue'yu (dosya adı, tam sayı satır, tipler) haline getirir; eşleşemezse None"""
+        key = self.location_key(issue)
+        if key is None:
+            return None
+        
+        file_name, line = key
+        if isinstance(line, bool):
+            return None
+        try:
+            line = int(line)
+        except (TypeError, ValueError):
+            return None
+        
+        types = self.type_tokens(issue) if self.match_types else frozenset()
+        return file_name, line, types
+    
+    def _index_ground_truth(self, ground_truth: List[Dict]) -> Dict[str, "_TruthGroup"]:
+        """Ground truth'u dosya adına göre satır sıralı gruplara ayırır"""
+        entries = defaultdict(list)
+        for index, truth in enumerate(ground_truth):
+            normalized = self._normalize(truth)
+            if normalized is not None:
+                file_name, line, types = normalized
+                entries[file_name].append((line, index, types))
+        
+        return {file_name: _TruthGroup(sorted(items, key=lambda item: item[:2]))
+                for file_name, items in entries.items()}
+    
+    def _match_greedy(self, detected: List, groups: Dict[str, "_TruthGroup"]) -> List[Tuple[int, int]]:
+        """Her bulunan issue, sırayla en yakın (eşitlikte en küçük indeksli) eşleşmemiş adayı alır"""
+        tolerance = self.line_tolerance
+        pairs = []
+        
+        for detected_index, normalized in enumerate(detected):
+            if normalized is None:
+                continue
+            file_name, line, types = normalized
+            group = groups.get(file_name)
+            if group is None:
+                continue
+            
+            # Sağ ve sol işaretçiler yalnızca eşleşmemiş pozisyonlarda durur;
+            # her adımda en yakın satır bloğu (iki taraf eşitse ikisi) denenir
+            start = bisect_left(group.lines, line)
+            right = group.next_free(start)
+            left = group.previous_free(start - 1)
+            
+            while True:
+                right_distance = group.lines[right] - line if right < group.size else None
+                if right_distance is not None and right_distance > tolerance:
+                    right_distance = None
+                left_distance = line - group.lines[left] if left >= 0 else None
+                if left_distance is not None and left_distance > tolerance:
+                    left_distance = None
+                
+                if right_distance is None and left_distance is None:
+                    break
+                
+                use_right = right_distance is not None and (left_distance is None or right_distance <= left_distance)
+                use_left = left_distance is not None and (right_distance is None or left_distance <= right_distance)
+                
+                candidates = []
+                if use_right:
+                    candidates.append(group.first_compatible(right, types, self._types_compatible))
+                if use_left:
+                    block_start = group.next_free(bisect_left(group.lines, group.lines[left]))
+                    candidates.append(group.first_compatible(block_start, types, self._types_compatible))
+                candidates = [position for position in candidates if position is not None]
+                
+                if candidates:
+                    # Eşit uzaklıkta en küçük indeksli ground truth seçilir
+                    position = min(candidates, key=lambda candidate: group.indices[candidate])
+                    group.take(position)
+                    pairs.append((detected_index, group.indices[position]))
+                    break
+                
+                if use_right:
+                    right = group.next_free(bisect_right(group.lines, group.lines[right]))
+                if use_left:
+                    left = group.previous_free(bisect_left(group.lines, group.lines[left]) - 1)
+        
+        return pairs
+    
+    def _candidate_edges(self, detected: List, groups: Dict[str, "_TruthGroup"]) -> Dict[int, List[Tuple[int, int]]]:
+        """Bulunan issue -> [(ground_truth_index, satır farkı)] aday listesi"""
+        tolerance = self.line_tolerance
+        edges = {}
+        
+        for detected_index, normalized in enumerate(detected):
+            if normalized is None:
+                continue
+            file_name, line, types = normalized
+            group = groups.get(file_name)
+            if group is None:
+                continue
+            
+            low = bisect_left(group.lines, line - tolerance)
+            high = bisect_right(group.lines, line + tolerance)
+            candidates = [
+                (group.indices[position], abs(group.lines[position] - line))
+                for position in range(low, high)
+                if self._types_compatible(types, group.types[position])
+            ]
+            if candidates:
+                edges[detected_index] = candidates
+        
+        return edges
+    
+    def _match_intervals(self, detected: List, groups: Dict[str, "_TruthGroup"]) -> List[Tuple[int, int]]:
+        """
+        Tip kısıtı yokken en büyük bire bir eşleşmeyi aralık-greedy ile bulur
+        
+        Her bulunan issue [satır - tolerans, satır + tolerans] aralığıdır. Ground
+        truth satır sırasıyla gezilir ve açık aralıklardan en erken biteni
+        (eşitlikte en küçük indeksli) atanır; bu seçim eşleşme sayısını en büyük
+        yapar. Toplam satır farkı ayrıca en aza indirilmez.
+        """
+        tolerance = self.line_tolerance
+        windows = defaultdict(list)
+        for detected_index, normalized in enumerate(detected):
+            if normalized is not None and normalized[0] in groups:
+                windows[normalized[0]].append((normalized[1] - tolerance, detected_index))
+        
+        pairs = []
+        for file_name, starts in windows.items():
+            starts.sort()
+            group = groups[file_name]
+            open_windows = []
+            next_window = 0
+            
+            for position in range(group.size):
+                line = group.lines[position]
+                while next_window < len(starts) and starts[next_window][0] <= line:
+                    start, detected_index = starts[next_window]
+                    heapq.heappush(open_windows, (start + 2 * tolerance, detected_index))
+                    next_window += 1
+                while open_windows and open_windows[0][0] < line:
+                    heapq.heappop(open_windows)
+                if open_windows:
+                    _, detected_index = heapq.heappop(open_windows)
+                    pairs.append((detected_index, group.indices[position]))
+        
+        pairs.sort()
+        return pairs
+    
+    def _match_optimal(self, detected: List, groups: Dict[str, "_TruthGroup"]) -> List[Tuple[int, int]]:
+        """Bağlı bileşenlere ayırıp her birinde en büyük bire bir eşleşmeyi bulur"""
+        if not self.match_types:
+            return self._match_intervals(detected, groups)
+        
+        edges = self._candidate_edges(detected, groups)
+        
+        # Bileşenler: bulunan issue'lar ortak ground truth adayları üzerinden birleşir
+        parent = {}
+        
+        def find(node):
+            root = node
+            while parent.setdefault(root, root) != root:
+                root = parent[root]
+            while parent[node] != root:
+                parent[node], node = root, parent[node]
+            return root
+        
+        for detected_index, candidates in edges.items():
+            for truth_index, _ in candidates:
+                a, b = find(("d", detected_index)), find(("t", truth_index))
+                if a != b:
+                    parent[a] = b
+        
+        components = defaultdict(list)
+        for detected_index in edges:
+            components[find(("d", detected_index))].append(detected_index)
+        
+        pairs = []
+        for members in components.values():
+            if len(members) == 1 and len(edges[members[0]]) == 1:
+                pairs.append((members[0], edges[members[0]][0][0]))
+                continue
+            
+            truth_count = len({truth_index for member in members for truth_index, _ in edges[member]})
+            if max(len(members), truth_count) <= HUNGARIAN_COMPONENT_LIMIT:
+                pairs.extend(_hungarian_component(members, edges, self.line_tolerance))
+            else:
+                pairs.extend(_hopcroft_karp(members, {member: [t for t, _ in edges[member]] for member in members}))
+        
+        pairs.sort()
+        return pairs
+
+
+class _TruthGroup:
+    """
+    Bir dosyanın ground truth issue'ları (satıra göre sıralı)
+    
+    next_free / previous_free, eşleşmiş pozisyonları union-find ile atlayarak
+    greedy eşleştirmede aynı satırda çok sayıda issue olsa bile adımları kısa tutar.
+    """
+    
+    def __init__(self, items: List[Tuple[int, int, frozenset]]):
+        self.lines = [line for line, _, _ in items]
+        self.indices = [index for _, index, _ in items]
+        self.types = [types for _, _, types in items]
+        self.size = len(items)
+        # _right[p]: p'den itibaren ilk boş pozisyon (size = yok)
+        # _left[p + 1]: p'ye kadar son boş pozisyon + 1 (0 = yok)
+        self._right = list(range(self.size + 1))
+        self._left = list(range(self.size + 1))
+    
+    @staticmethod
+    def _find(parent: List[int], node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+    
+    def next_free(self, position: int) -> int:
+        return self._find(self._right, min(position, self.size))
+    
+    def previous_free(self, position: int) -> int:
+        if position < 0:
+            return -1
+        return self._find(self._left, position + 1) - 1
+    
+    def first_compatible(self, position: int, types: frozenset, compatible) -> Optional[int]:
+        """position'ın satır bloğunda tipi uyumlu ilk boş pozisyonu döner"""
+        line = self.lines[position]
+        while position < self.size and self.lines[position] == line:
+            if compatible(types, self.types[position]):
+                return position
+            position = self.next_free(position + 1)
+        return None
+    
+    def take(self, position: int):
+        self._right[position] = position + 1
+        self._left[position + 1] = position
+
+
+def _hungarian_component(members: List[int], edges: Dict[int, List[Tuple[int, int]]], tolerance: int) -> List[Tuple[int, int]]:
+    """
+    Küçük bir bileşende Hungarian algoritması ile atama yapar
+    
+    Aday olmayan çiftlere, tüm gerçek maliyetlerin toplamından büyük bir ceza
+    verilir; böylece önce eşleşme sayısı en büyük, sonra toplam satır farkı
+    en küçük olur.
+    """
+    truths = sorted({truth_index for member in members for truth_index, _ in edges[member]})
+    column_of = {truth_index: column for column, truth_index in enumerate(truths)}
+    penalty = (tolerance + 1) * (len(members) + len(truths)) + 1
+    
+    cost = [[penalty] * len(truths) for _ in members]
+    for row, member in enumerate(members):
+        for truth_index, distance in edges[member]:
+            cost[row][column_of[truth_index]] = distance
+    
+    transposed = len(members) > len(truths)
+    if transposed:
+        cost = [list(column) for column in zip(*cost)]
+    
+    assignment = _hungarian(cost)
+    
+    pairs = []
+    for row, column in enumerate(assignment):
+        if cost[row][column] >= penalty:
+            continue
+        member_row, truth_column = (column, row) if transposed else (row, column)
+        pairs.append((members[member_row], truths[truth_column]))
+    return pairs
+
+
+def _hungarian(cost: List[List[int]]) -> List[int]:
+    """
+    Dikdörtgen (satır <= sütun) maliyet matrisi için en küçük maliyetli atama
+    
+    Returns:
+        Her satıra atanan sütun indeksi
+    """
+    rows, columns = len(cost), len(cost[0])
+    infinity = float("inf")
+    u = [0] * (rows + 1)
+    v = [0] * (columns + 1)
+    assigned_row = [0] * (columns + 1)  # sütun -> satır (1 tabanlı, 0 = boş)
+    way = [0] * (columns + 1)
+    
+    for row in range(1, rows + 1):
+        assigned_row[0] = row
+        column = 0
+        min_value = [infinity] * (columns + 1)
+        used = [False] * (columns + 1)
+        while True:
+            used[column] = True
+            current_row = assigned_row[column]
+            delta = infinity
+            next_column = 0
+            for j in range(1, columns + 1):
+                if not used[j]:
+                    reduced = cost[current_row - 1][j - 1] - u[current_row] - v[j]
+                    if reduced < min_value[j]:
+                        min_value[j] = reduced
+                        way[j] = column
+                    if min_value[j] < delta:
+                        delta = min_value[j]
+                        next_column = j
+            for j in range(columns + 1):
+                if used[j]:
+                    u[assigned_row[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_value[j] -= delta
+            column = next_column
+            if assigned_row[column] == 0:
+                break
+        while column:
+            previous = way[column]
+            assigned_row[column] = assigned_row[previous]
+            column = previous
+    
+    assignment = [0] * rows
+    for column in range(1, columns + 1):
+        if assigned_row[column]:
+            assignment[assigned_row[column] - 1] = column - 1
+    return assignment
+
+
+def _hopcroft_karp(left_nodes: List[int], adjacency: Dict[int, List[int]]) -> List[Tuple[int, int]]:
+    """En büyük bire bir eşleşme (Hopcroft–Karp, özyinelemesiz)"""
+    match_left = {}
+    match_right = {}
+    
+    while True:
+        # BFS: boş soldaki düğümlerden katmanlı graf
+        layer = {}
+        queue = deque()
+        for node in left_nodes:
+            if node not in match_left:
+                layer[node] = 0
+                queue.append(node)
+        
+        found_free = False
+        while queue:
+            node = queue.popleft()
+            for right in adjacency[node]:
+                partner = match_right.get(right)
+                if partner is None:
+                    found_free = True
+                elif partner not in layer:
+                    layer[partner] = layer[node] + 1
+                    queue.append(partner)
+        
+        if not found_free:
+            break
+        
+        # DFS: katmanlar boyunca ayrık artırıcı yollar
+        for start in left_nodes:
+            if start in match_left:
+                continue
+            stack = [(start, iter(adjacency[start]))]
+            chosen = []
+            while stack:
+                node, candidates = stack[-1]
+                advanced = False
+                for right in candidates:
+                    partner = match_right.get(right)
+                    if partner is None:
+                        # Artırıcı yol bulundu: yol boyunca eşleşmeleri çevir
+                        chosen.append(right)
+                        for (path_node, _), path_right in zip(stack, chosen):
+                            match_left[path_node] = path_right
+                            match_right[path_right] = path_node
+                        stack = []
+                        advanced = True
+                        break
+                    if layer.get(partner) == layer[node] + 1:
+                        chosen.append(right)
+                        stack.append((partner, iter(adjacency[partner])))
+                        advanced = True
+                        break
+                if not advanced:
+                    # Bu düğümden yol yok: katmandan çıkar
+                    layer[node] = None
+                    stack.pop()
+                    if chosen:
+                        chosen.pop()
+    
+    return sorted(match_left.items())
 
 
 class AdvancedMetricsCalculator:
@@ -72,15 +566,20 @@ class AdvancedMetricsCalculator:
     Gelişmiş metrik hesaplama sınıfı
     """
     
-    def __init__(self):
-        self.scan_times = []  # Tarama sürelerini saklamak için
-        self.process = psutil.Process(os.getpid())
+    def __init__(self, sampler=None):
+        # Tarama süreleri sabit bellekli bir özette tutulur (ortalama + yüzdelikler)
+        self.scan_stats = LatencyStats()
+        # CPU/bellek örnekleri paylaşılan arka plan örnekleyiciden okunur (bloklamaz)
+        self.sampler = sampler if sampler is not None else get_resource_sampler()
     
     def calculate_defect_detection_accuracy(
         self,
         detected_issues: List[Dict],
         ground_truth: List[Dict],
-        issue_matching_func=None
+        issue_matching_func=None,
+        line_tolerance: int = 0,
+        match_types: bool = False,
+        matching_mode: str = "greedy"
     ) -> Dict[str, float]:
         """
         Hata Tespit Başarısı (Defect Detection Accuracy) hesaplar
@@ -89,6 +588,13 @@ class AdvancedMetricsCalculator:
             detected_issues: Araç tarafından bulunan issue'lar
             ground_truth: Gerçekte var olan issue'lar (test verisi)
             issue_matching_func: Issue'ları eşleştirmek için fonksiyon (opsiyonel)
+            line_tolerance: Eşleşme için izin verilen satır farkı (varsayılan 0 = aynı satır)
+            match_types: True ise kural/CWE tipleri de uyumlu olmalı
+            matching_mode: "greedy" (sıralı, en yakın aday) veya "optimal" (en büyük bire bir eşleşme)
+        
+        Not: line_tolerance, match_types ve matching_mode yalnızca varsayılan
+        eşleştirici ile kullanılır; özel issue_matching_func verilirse iç içe
+        greedy döngü çalışır.
         
         Returns:
             {
@@ -100,31 +606,42 @@ class AdvancedMetricsCalculator:
                 "false_negatives": int
             }
         """
-        if issue_matching_func is None:
-            # Varsayılan eşleştirme: Issue key'lerine göre
-            issue_matching_func = self._default_issue_matcher
-        
         # True Positives: Hem bulundu hem de gerçekte var
         # False Positives: Bulundu ama gerçekte yok
         # False Negatives: Bulunmadı ama gerçekte var
         
-        true_positives = 0
-        false_positives = 0
-        matched_ground_truth = set()
-        
-        for detected in detected_issues:
-            matched = False
-            for i, truth in enumerate(ground_truth):
-                if i not in matched_ground_truth and issue_matching_func(detected, truth):
-                    true_positives += 1
-                    matched_ground_truth.add(i)
-                    matched = True
-                    break
+        if self._uses_default_matcher(issue_matching_func):
+            if line_tolerance == 0 and not match_types and matching_mode == "greedy":
+                # Hızlı yol: (dosya adı, satır) hash index'i ile O(n + m) eşleştirme
+                true_positives = self._match_by_location_index(detected_issues, ground_truth)
+            else:
+                engine = IssueMatchingEngine(line_tolerance, match_types, matching_mode)
+                true_positives = len(engine.match(detected_issues, ground_truth))
+            false_positives = len(detected_issues) - true_positives
+            matched_count = true_positives
+        else:
+            if issue_matching_func is None:
+                issue_matching_func = self._default_issue_matcher
+            
+            true_positives = 0
+            false_positives = 0
+            matched_ground_truth = set()
             
-            if not matched:
-                false_positives += 1
+            for detected in detected_issues:
+                matched = False
+                for i, truth in enumerate(ground_truth):
+                    if i not in matched_ground_truth and issue_matching_func(detected, truth):
+                        true_positives += 1
+                        matched_ground_truth.add(i)
+                        matched = True
+                        break
+                
+                if not matched:
+                    false_positives += 1
+            
+            matched_count = len(matched_ground_truth)
         
-        false_negatives = len(ground_truth) - len(matched_ground_truth)
+        false_negatives = len(ground_truth) - matched_count
         true_negatives = 0  # Genellikle hesaplanmaz (çok büyük sayı)
         
         # Precision: TP / (TP + FP)
@@ -155,26 +672,56 @@ class AdvancedMetricsCalculator:
         Varsayılan issue eşleştirme fonksiyonu
         Issue'ları dosya yolu ve satır numarasına göre eşleştirir
         """
-        detected_file = detected.get("file", detected.get("location", {}).get("file", ""))
-        detected_line = detected.get("line", detected.get("location", {}).get("line", -1))
-        
-        truth_file = truth.get("file", truth.get("location", {}).get("file", ""))
-        truth_line = truth.get("line", truth.get("location", {}).get("line", -1))
+        detected_key = IssueMatchingEngine.location_key(detected)
+        truth_key = IssueMatchingEngine.location_key(truth)
         
         # Dosya adı ve satır numarası eşleşiyorsa aynı issue kabul et
-        if detected_file and truth_file:
-            detected_file_name = detected_file.split("/")[-1] if "/" in detected_file else detected_file
-            truth_file_name = truth_file.split("/")[-1] if "/" in truth_file else truth_file
-            
-            return detected_file_name == truth_file_name and detected_line == truth_line
+        return detected_key is not None and truth_key is not None and detected_key == truth_key
+    
+    def _uses_default_matcher(self, issue_matching_func) -> bool:
+        """Eşleştirme varsayılan (dosya adı + satır) kuralıyla mı yapılıyor?"""
+        default = AdvancedMetricsCalculator._default_issue_matcher
+        if issue_matching_func is None:
+            # Alt sınıf _default_issue_matcher'ı override ettiyse hızlı yol kullanılmaz
+            return getattr(type(self), "_default_issue_matcher", None) is default
+        return getattr(issue_matching_func, "__func__", None) is default
+    
+    def _match_by_location_index(self, detected_issues: List[Dict], ground_truth: List[Dict]) -> int:
+        """
+        Greedy eşleştirmenin hash index'li hali
         
-        return False
+        Ground truth bir kez (dosya adı, satır) -> [indeksler] index'ine konur;
+        her bulunan issue, anahtarındaki en küçük indeksli eşleşmemiş ground
+        truth ile eşleşir. Bu, iç içe döngüdeki "ilk eşleşmemiş ground truth"
+        seçimiyle birebir aynı sonucu verir.
+        
+        Returns:
+            True positive sayısı (eşleşen ground truth sayısına eşittir)
+        """
+        index = defaultdict(deque)
+        for i, truth in enumerate(ground_truth):
+            key = IssueMatchingEngine.location_key(truth)
+            if key is not None:
+                index[key].append(i)
+        
+        true_positives = 0
+        for detected in detected_issues:
+            key = IssueMatchingEngine.location_key(detected)
+            if key is None:
+                continue
+            candidates = index.get(key)
+            if candidates:
+                candidates.popleft()
+                true_positives += 1
+        
+        return true_positives
     
     def calculate_code_coverage(
         self,
         raw_data: Dict,
         total_lines: Optional[int] = None,
-        total_files: Optional[int] = None
+        total_files: Optional[int] = None,
+        source_census=None
     ) -> Dict[str, float]:
         """
         Kod Kapsama Oranı (Code Coverage) hesaplar
@@ -183,6 +730,9 @@ class AdvancedMetricsCalculator:
             raw_data: Araçtan gelen ham veri
             total_lines: Toplam kod satırı sayısı (opsiyonel)
             total_files: Toplam dosya sayısı (opsiyonel)
+            source_census: Projenin source_census.SourceCensus'u (opsiyonel);
+                total_files/total_lines verilmezse kaynak dosya/satır sayıları
+                buradan alınır, analiz edilen satırlar uzantı bazında hesaplanır
         
         Returns:
             {
@@ -191,6 +741,12 @@ class AdvancedMetricsCalculator:
                 "lines_analyzed": int
             }
         """
+        if source_census is not None:
+            if total_files is None:
+                total_files = source_census.source_files
+            if total_lines is None:
+                total_lines = source_census.source_lines
+        
         # Snyk SARIF formatından coverage bilgisi
         if "runs" in raw_data and len(raw_data.get("runs", [])) > 0:
             run = raw_data["runs"][0]
@@ -198,17 +754,28 @@ class AdvancedMetricsCalculator:
             coverage = properties.get("coverage", [])
             
             if coverage:
-                total_files_analyzed = sum(c.get("files", 0) for c in coverage)
+                # Sadece Snyk'in desteklediği (analiz ettiği) dosya türleri sayılır
+                # örn. {"files": 1, "isSupported": true, "lang": ".py", "type": "SUPPORTED"}
+                supported = [c for c in coverage if c.get("isSupported", True)]
+                total_files_analyzed = sum(c.get("files", 0) for c in supported)
                 # Coverage bilgisi varsa kullan
                 if total_files and total_files > 0:
-                    code_coverage = (total_files_analyzed / total_files) * 100
+                    code_coverage = min(100.0, (total_files_analyzed / total_files) * 100)
                 else:
                     code_coverage = 100.0 if total_files_analyzed > 0 else 0.0
                 
+                # Snyk satır sayısı vermez; desteklenen uzantıların satırları sayımdan alınır
+                lines_analyzed = 0
+                if source_census is not None:
+                    lines_analyzed = source_census.lines_for_extensions(
+                        c["lang"] for c in supported
+                        if c.get("files", 0) > 0 and str(c.get("lang", "")).startswith(".")
+                    )
+                
                 return {
                     "code_coverage": code_coverage,
                     "files_analyzed": total_files_analyzed,
-                    "lines_analyzed": 0  # Snyk'te satır sayısı genelde yok
+                    "lines_analyzed": lines_analyzed
                 }
         
         # DeepSource GraphQL formatından
@@ -232,34 +799,77 @@ class AdvancedMetricsCalculator:
             "lines_analyzed": 0
         }
     
-    def calculate_operational_efficiency(self) -> Dict[str, float]:
+    def calculate_operational_efficiency(self, resource_usage=None, window_seconds: float = None) -> Dict[str, float]:
         """
         Operasyonel Verimlilik metriklerini hesaplar
         
+        Args:
+            resource_usage: Taramayı yapan CLI process ağacının kaynak kullanımı
+                (process_profiler.ResourceUsage veya to_dict() çıktısı, opsiyonel).
+                Verilirse CPU/bellek değerleri aracın kendisinden alınır;
+                verilmezse bu (Python) process'i ölçülür.
+            window_seconds: Python process'i ölçülürken kullanılan örnek penceresi
+                (None ise RESOURCE_SAMPLE_WINDOW)
+        
         Returns:
             {
                 "average_scan_time": float,
                 "cpu_usage_percent": float,
-                "memory_usage_mb": float
+                "memory_usage_mb": float,
+                "cpu_usage_p95": float veya None,
+                "cpu_usage_max": float veya None,
+                "memory_usage_p95_mb": float veya None,
+                "memory_usage_max_mb": float veya None
             }
         """
         # Ortalama tarama süresi
-        average_scan_time = sum(self.scan_times) / len(self.scan_times) if self.scan_times else 0.0
+        average_scan_time = self.scan_stats.mean if self.scan_stats.count else 0.0
+        
+        if resource_usage is not None:
+            if not isinstance(resource_usage, dict):
+                resource_usage = resource_usage.to_dict()
+            # CPU: tarama boyunca ortalama kullanım, Bellek: ağacın zirve RSS'i
+            return {
+                "average_scan_time": average_scan_time,
+                "cpu_usage_percent": resource_usage["cpu_percent"],
+                "memory_usage_mb": resource_usage["peak_rss_mb"],
+                "cpu_usage_p95": None,
+                "cpu_usage_max": None,
+                "memory_usage_p95_mb": None,
+                "memory_usage_max_mb": resource_usage["peak_rss_mb"]
+            }
+        
+        # CPU ve Memory kullanımı: örnekleyicinin penceresinden (beklemeden) okunur
+        stats = self.sampler.window_stats(window_seconds)
+        cpu = stats["cpu_percent"]
+        memory = stats["memory_mb"]
         
-        # CPU ve Memory kullanımı
-        cpu_usage = self.process.cpu_percent(interval=0.1)
-        memory_info = self.process.memory_info()
-        memory_usage_mb = memory_info.rss / (1024 * 1024)  # Bytes to MB
+        if stats["samples"] == 0:
+            # Örnekleyici yeni başladı: anlık RSS kullanılır, CPU henüz ölçülmedi
+            memory_usage_mb = self.sampler.process.memory_info().rss / (1024 * 1024)  # Bytes to MB
+            return {
+                "average_scan_time": average_scan_time,
+                "cpu_usage_percent": 0.0,
+                "memory_usage_mb": memory_usage_mb,
+                "cpu_usage_p95": None,
+                "cpu_usage_max": None,
+                "memory_usage_p95_mb": None,
+                "memory_usage_max_mb": None
+            }
         
         return {
             "average_scan_time": average_scan_time,
-            "cpu_usage_percent": cpu_usage,
-            "memory_usage_mb": memory_usage_mb
+            "cpu_usage_percent": cpu["mean"],
+            "memory_usage_mb": memory["mean"],
+            "cpu_usage_p95": cpu["p95"],
+            "cpu_usage_max": cpu["max"],
+            "memory_usage_p95_mb": memory["p95"],
+            "memory_usage_max_mb": memory["max"]
         }
     
     def record_scan_time(self, scan_duration: float):
         """Tarama süresini kaydeder"""
-        self.scan_times.append(scan_duration)
+        self.scan_stats.record(scan_duration)
     
     def calculate_all_advanced_metrics(
         self,
@@ -268,7 +878,12 @@ class AdvancedMetricsCalculator:
         ground_truth: Optional[List[Dict]] = None,
         scan_duration: float = 0.0,
         total_lines: Optional[int] = None,
-        total_files: Optional[int] = None
+        total_files: Optional[int] = None,
+        line_tolerance: int = 0,
+        match_types: bool = False,
+        matching_mode: str = "greedy",
+        resource_usage=None,
+        source_census=None
     ) -> AdvancedMetricResult:
         """
         Tüm gelişmiş metrikleri hesaplar
@@ -280,6 +895,12 @@ class AdvancedMetricsCalculator:
             scan_duration: Tarama süresi
             total_lines: Toplam kod satırı sayısı
             total_files: Toplam dosya sayısı
+            line_tolerance: Ground truth eşleştirmesinde izin verilen satır farkı
+            match_types: Eşleştirmede kural/CWE tipleri de karşılaştırılsın mı
+            matching_mode: "greedy" veya "optimal"
+            resource_usage: Tarama CLI'ının kaynak kullanımı (bkz. calculate_operational_efficiency)
+            source_census: Çağıranın hesapladığı proje sayımı (opsiyonel,
+                bkz. source_census.census_project); kod kapsama paydası olur
         
         Returns:
             AdvancedMetricResult
@@ -291,7 +912,10 @@ class AdvancedMetricsCalculator:
         # Hata Tespit Başarısı
         if ground_truth:
             accuracy_metrics = self.calculate_defect_detection_accuracy(
-                detected_issues, ground_truth
+                detected_issues, ground_truth,
+                line_tolerance=line_tolerance,
+                match_types=match_types,
+                matching_mode=matching_mode
             )
         else:
             # Ground truth yoksa varsayılan değerler
@@ -307,11 +931,11 @@ class AdvancedMetricsCalculator:
         
         # Kod Kapsama
         coverage_metrics = self.calculate_code_coverage(
-            raw_data, total_lines, total_files
+            raw_data, total_lines, total_files, source_census
         )
         
         # Operasyonel Verimlilik
-        efficiency_metrics = self.calculate_operational_efficiency()
+        efficiency_metrics = self.calculate_operational_efficiency(resource_usage)
         
         return AdvancedMetricResult(
             precision=accuracy_metrics["precision"],
@@ -328,6 +952,10 @@ class AdvancedMetricsCalculator:
             average_scan_time=efficiency_metrics["average_scan_time"],
             cpu_usage_percent=efficiency_metrics["cpu_usage_percent"],
             memory_usage_mb=efficiency_metrics["memory_usage_mb"],
-            code_quality_score=None  # Manuel değerlendirme gerekebilir
+            code_quality_score=None,  # Manuel değerlendirme gerekebilir
+            cpu_usage_p95=efficiency_metrics["cpu_usage_p95"],
+            cpu_usage_max=efficiency_metrics["cpu_usage_max"],
+            memory_usage_p95_mb=efficiency_metrics["memory_usage_p95_mb"],
+            memory_usage_max_mb=efficiency_metrics["memory_usage_max_mb"]
         )
 
@@ -47,7 +47,8 @@ class BaseMetric(ABC):
         raw_data: dict, 
         detected_issues: list, 
         ground_truth: list = None, 
-        scan_duration: float = 0.0
+        scan_duration: float = 0.0,
+        source_census=None
     ) -> dict:
         """
         Gelişmiş metrikleri hesaplar (opsiyonel)
@@ -61,6 +62,7 @@ class BaseMetric(ABC):
             detected_issues: Bulunan issue'lar listesi
             ground_truth: Gerçek issue'lar listesi (precision/recall için gerekli)
             scan_duration: Tarama süresi (saniye)
+            source_census: Projenin kaynak kod sayımı (kod kapsama paydası, opsiyonel)
         
         Returns:
             dict: Gelişmiş metrik sonuçları (AdvancedMetricResult formatında)
@@ -77,5 +79,6 @@ class BaseMetric(ABC):
             raw_data=raw_data,
             detected_issues=detected_issues,
             ground_truth=ground_truth,
-            scan_duration=scan_duration
+            scan_duration=scan_duration,
+            source_census=source_census
         )
@@ -30,9 +30,21 @@ Severity Mapping:
 - INFO -> low
 """
 
+from typing import Iterable
 from .base_metric import BaseMetric
 from .result_model import MetricResult
 
+# DeepSource severity -> Standart format mapping
+SEVERITY_MAPPING = {
+    "CRITICAL": "critical",
+    "MAJOR": "high",
+    "MINOR": "medium",
+    "INFO": "low"
+}
+
+# Bilinmeyen severity'lerin sayıldığı standart severity
+DEFAULT_SEVERITY = "medium"
+
 class DeepSourceMetrics(BaseMetric):
     """
     DeepSource çıktılarını standart metrik formatına normalize eder
@@ -75,46 +87,49 @@ class DeepSourceMetrics(BaseMetric):
             MetricResult: Normalize edilmiş metrik sonucu
         """
         # ============================================
-        # GraphQL RESPONSE'DAN ISSUES'LARI ÇIKAR
+        # GraphQL RESPONSE'DAN EDGE'LERİ ÇIKAR
         # ============================================
-        issues = []
+        edges = []
         if "data" in raw_data and "repository" in raw_data["data"]:
             repo_data = raw_data["data"]["repository"]
             if "issues" in repo_data and "edges" in repo_data["issues"]:
-                # GraphQL edges yapısından issue'ları çıkar
-                for edge in repo_data["issues"]["edges"]:
-                    if "node" in edge and "issue" in edge["node"]:
-                        issues.append(edge["node"]["issue"])
+                edges = repo_data["issues"]["edges"]
+        
+        return self.calculate_from_pages([{"edges": edges}])
+    
+    def calculate_from_pages(self, pages: Iterable[dict]) -> MetricResult:
+        """
+        Sayfa sayfa gelen GraphQL issue edge'lerinden MetricResult hesaplar
+        
+        Sayfalar bir generator olabilir (bkz. deepsource_runner.iter_deepsource_issue_pages);
+        her sayfa işlendikten sonra bellekte tutulmaz, sadece sayaçlar güncellenir.
+        
+        Args:
+            pages: {"edges": [...]} formatında sayfalar
         
+        Returns:
+            MetricResult: Normalize edilmiş metrik sonucu
+        """
         # ============================================
         # SEVERITY MAPPING
         # ============================================
         # DeepSource severity formatı: "CRITICAL", "MAJOR", "MINOR", "INFO"
         # Standart formata çevir: critical, high, medium, low
         counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+        total_issues = 0
         
-        for issue in issues:
-            # DeepSource severity formatı: "CRITICAL", "MAJOR", "MINOR", "INFO"
-            severity = issue.get("severity", "").upper()
-            
-            # DeepSource severity -> Standart format mapping
-            if severity == "CRITICAL":
-                counts["critical"] += 1
-            elif severity == "MAJOR":
-                counts["high"] += 1
-            elif severity == "MINOR":
-                counts["medium"] += 1
-            elif severity == "INFO":
-                counts["low"] += 1
-            else:
-                # Bilinmeyen severity'leri medium olarak say (varsayılan)
-                counts["medium"] += 1
+        for page in pages:
+            for edge in page.get("edges", []):
+                # GraphQL edges yapısından issue'ları çıkar
+                if "node" in edge and "issue" in edge["node"]:
+                    self._count_issue(counts, edge["node"]["issue"])
+                    total_issues += 1
         
         # ============================================
         # SCAN DURATION
         # ============================================
         # DeepSource GraphQL API'sinde scan duration bilgisi yok
-        # 0.0 olarak bırakıyoruz
+        # 0.0 olarak bırakıyoruz; runner ölçtüğü süreyi yazar (bkz. scan_timing)
         scan_duration = 0.0
         
         # ============================================
@@ -126,7 +141,16 @@ class DeepSourceMetrics(BaseMetric):
             high=counts["high"],
             medium=counts["medium"],
             low=counts["low"],
-            total_issues=len(issues),
+            total_issues=total_issues,
             scan_duration=scan_duration
         )
-
+    
+    @staticmethod
+    def _count_issue(counts: dict, issue: dict):
+        """Tek bir issue'nun severity'sini standart sayaçlara ekler"""
+        # DeepSource severity formatı: "CRITICAL", "MAJOR", "MINOR", "INFO"
+        severity = issue.get("severity", "").upper()
+        
+        # DeepSource severity -> Standart format mapping
+        # (bilinmeyen severity'ler medium olarak sayılır)
+        counts[SEVERITY_MAPPING.get(severity, DEFAULT_SEVERITY)] += 1
@@ -0,0 +1,375 @@
+"""
+Tarama Süresi İstatistikleri (Latency Stats)
+
+Bu modül, tarama sürelerini sabit bellekle özetler. Her süre listesi yerine:
+- Welford algoritması ile sayı, ortalama, varyans, min ve max
+- Logaritmik kovalı bir histogram (DDSketch benzeri) ile yüzdelikler
+  (p50/p90/p99); göreli hata LATENCY_RELATIVE_ERROR ile sınırlıdır
+
+tutulur. Özetler birleştirilebilir (merge): farklı worker'ların veya
+çalıştırmaların istatistikleri, ham süreler olmadan tek özette toplanır.
+
+LatencyRegistry, özetleri (araç, proje) bazında tutar ve results/ yanında
+bir klasöre kaydeder. Her process kendi dosyasını yazar
+(<hostname>-<pid>.json); okuma sırasında klasördeki tüm dosyalar
+birleştirilir, böylece birden fazla worker dosya kilidi olmadan aynı
+klasörü kullanabilir. Aynı makinede süreci bitmiş worker'ların dosyaları
+(ve aynı pid ile yeniden başlayan process'in eski dosyası) ilk kullanımda
+ve her okumada canlı process'in dosyasına katılıp silinir; böylece klasörde
+en fazla canlı worker sayısı kadar dosya kalır.
+
+Kullanım:
+    from metrics.latency_stats import latency_registry
+    latency_registry.record("snyk_code", "flask_demo", 12.4)
+    latency_registry.stats(tool="snyk_code").summary()
+    # {"count": 1, "mean": 12.4, "p50": ..., "p90": ..., "p99": ..., "max": 12.4, ...}
+
+Environment Variables:
+    LATENCY_STATS_DIR: Özetlerin kaydedildiği klasör (default: ../results/.latency)
+    LATENCY_RELATIVE_ERROR: Yüzdeliklerin göreli hatası (default: 0.01)
+"""
+
+import json
+import math
+import os
+import socket
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+LATENCY_STATS_DIR = os.getenv("LATENCY_STATS_DIR", "../results/.latency")
+LATENCY_RELATIVE_ERROR = float(os.getenv("LATENCY_RELATIVE_ERROR", "0.01"))
+
+# Histogramın en fazla kova sayısı; aşılırsa en küçük kovalar birleştirilir
+# (%1 hata ile 1 ms - 1 gün aralığı ~900 kova tutar)
+LATENCY_MAX_BUCKETS = 2048
+
+# Bu değerden küçük süreler sıfır kovasında sayılır
+_MIN_VALUE = 1e-6
+
+
+class LatencyStats:
+    """
+    Birleştirilebilir, sabit bellekli süre özeti
+
+    Attributes:
+        count, mean, min, max: Welford ile tutulan temel istatistikler
+        relative_error: Histogram kovalarının göreli hatası
+    """
+
+    def __init__(self, relative_error: float = None):
+        self.relative_error = LATENCY_RELATIVE_ERROR if relative_error is None else relative_error
+        self._gamma = (1 + self.relative_error) / (1 - self.relative_error)
+        self._log_gamma = math.log(self._gamma)
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._zero_count = 0
+        self._buckets = {}  # kova indeksi -> sayı
+
+    def record(self, value: float):
+        """Bir süre ekler (saniye)"""
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        if value < _MIN_VALUE:
+            self._zero_count += 1
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+            if len(self._buckets) > LATENCY_MAX_BUCKETS:
+                self._collapse()
+
+    def merge(self, other: "LatencyStats") -> "LatencyStats":
+        """
+        Başka bir özeti bu özete ekler (Chan et al. paralel varyans formülü)
+
+        Raises:
+            ValueError: Göreli hatalar farklıysa (kovalar uyuşmaz)
+        """
+        if other.count == 0:
+            return self
+        if other.relative_error != self.relative_error:
+            raise ValueError("Cannot merge latency stats with different relative errors")
+
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._zero_count += other._zero_count
+        for index, bucket_count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + bucket_count
+        if len(self._buckets) > LATENCY_MAX_BUCKETS:
+            self._collapse()
+        return self
+
+    def _collapse(self):
+        """En küçük kovaları, kova sayısı sınıra inene kadar birleştirir"""
+        indices = sorted(self._buckets)
+        excess = len(indices) - LATENCY_MAX_BUCKETS
+        target = indices[excess]
+        for index in indices[:excess]:
+            self._buckets[target] += self._buckets.pop(index)
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        q yüzdeliğini (0-100) döner; göreli hata relative_error ile sınırlıdır
+
+        Returns:
+            Süre (saniye) veya özet boşsa None
+        """
+        if self.count == 0:
+            return None
+
+        rank = q / 100 * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return max(self.min, 0.0)
+
+        value = self.max
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if rank < seen:
+                # Kovanın (gamma^(i-1), gamma^i] aralığının temsilî değeri
+                value = 2 * self._gamma ** index / (self._gamma + 1)
+                break
+        return min(max(value, self.min), self.max)
+
+    def summary(self) -> Dict:
+        """count, mean, stddev, min, max, p50, p90, p99 içeren özet"""
+        empty = self.count == 0
+        return {
+            "count": self.count,
+            "mean": None if empty else self.mean,
+            "stddev": None if empty else self.stddev,
+            "min": None if empty else self.min,
+            "max": None if empty else self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99)
+        }
+
+    def to_dict(self) -> Dict:
+        """JSON'a yazılabilir tam durum (from_dict ile geri yüklenir)"""
+        return {
+            "relative_error": self.relative_error,
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self._m2,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "zero_count": self._zero_count,
+            "buckets": {str(index): count for index, count in self._buckets.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LatencyStats":
+        stats = cls(relative_error=data["relative_error"])
+        stats.count = data["count"]
+        stats.mean = data["mean"]
+        stats._m2 = data["m2"]
+        if stats.count:
+            stats.min = data["min"]
+            stats.max = data["max"]
+        stats._zero_count = data["zero_count"]
+        stats._buckets = {int(index): count for index, count in data["buckets"].items()}
+        return stats
+
+
+class LatencyRegistry:
+    """
+    (araç, proje) bazında süre özetleri; her kayıttan sonra diske yazılır
+
+    Bu process'in özetleri kendi dosyasında tutulur; stats() okurken
+    klasördeki diğer worker dosyalarını da (mtime değiştiyse yeniden
+    okuyarak) birleştirir. Bitmiş worker dosyaları okunurken bu process'in
+    dosyasına katılır (bkz. _adopt).
+    """
+
+    def __init__(self, directory: str = None):
+        self.directory = Path(directory or LATENCY_STATS_DIR)
+        self.file_name = f"{socket.gethostname()}-{os.getpid()}.json"
+        self._own = {}          # (tool, project) -> LatencyStats
+        self._others = {}       # dosya adı -> (mtime, {(tool, project): LatencyStats})
+        self._started = False
+        self._lock = threading.Lock()
+
+    def record(self, tool: str, project: str, duration: float):
+        """Bir tarama süresini ekler ve bu process'in dosyasını günceller"""
+        with self._lock:
+            self._start()
+            stats = self._own.get((tool, project))
+            if stats is None:
+                stats = self._own[(tool, project)] = LatencyStats()
+            stats.record(duration)
+            self._save()
+
+    def _start(self):
+        """
+        İlk kullanımda, aynı dosya adını kullanmış önceki process'in dosyasını
+        katar (lock altında çağrılır)
+
+        Container'larda pid'ler tekrar ettiğinden dosya önceki bir çalıştırmadan
+        kalmış olabilir; üzerine yazmak o çalıştırmanın özetlerini silerdi.
+        """
+        if self._started:
+            return
+        self._started = True
+        path = self.directory / self.file_name
+        if path.exists():
+            self._adopt(path)
+
+    def _save(self) -> bool:
+        """Bu process'in özetlerini atomik olarak yazar (lock altında çağrılır)"""
+        data = {
+            "entries": [
+                {"tool": tool, "project": project, "stats": stats.to_dict()}
+                for (tool, project), stats in self._own.items()
+            ]
+        }
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.directory / self.file_name)
+            return True
+        except OSError as e:
+            # İstatistik kaydı taramayı başarısız yapmamalı
+            print(f"WARNING: Latency stats kaydedilemedi: {e}")
+            return False
+
+    @staticmethod
+    def _load_file(path: Path) -> Dict[tuple, LatencyStats]:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return {
+            (entry["tool"], entry["project"]): LatencyStats.from_dict(entry["stats"])
+            for entry in data.get("entries", [])
+        }
+
+    @staticmethod
+    def _is_stale(name: str) -> bool:
+        """Dosya bu makinede süreci bitmiş bir worker'a mı ait (<hostname>-<pid>.json)"""
+        host, separator, pid = name[:-len(".json")].rpartition("-")
+        if not separator or not pid.isdigit() or host != socket.gethostname():
+            return False
+        if os.name == "nt":
+            # Windows'ta os.kill(pid, 0) process'i sonlandırır; canlı sayılır
+            return False
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            # Başka kullanıcıya ait canlı process (PermissionError) vb.
+            return False
+        return False
+
+    def _adopt(self, path: Path) -> bool:
+        """
+        Başka (bitmiş) bir process'in dosyasını bu process'in özetlerine katar
+        ve siler (lock altında çağrılır)
+
+        Dosya önce bu process'e özel bir ada taşınır; rename atomik olduğundan
+        aynı dosyayı aynı anda katmaya çalışan worker'lardan yalnızca biri
+        başarılı olur ve özetler iki kez sayılmaz.
+        """
+        claimed = path.with_name(f"{path.name}.{self.file_name}.adopt")
+        try:
+            os.replace(path, claimed)
+        except OSError:
+            # Başka bir worker dosyayı zaten aldı
+            return False
+
+        try:
+            entries = self._load_file(claimed)
+        except (OSError, ValueError, KeyError):
+            # Bozuk dosya: katılacak bir şey yok
+            entries = {}
+        for key, stats in entries.items():
+            own = self._own.get(key)
+            if own is None:
+                self._own[key] = stats
+            elif own.relative_error == stats.relative_error:
+                own.merge(stats)
+
+        self._others.pop(path.name, None)
+        if self._save():
+            claimed.unlink(missing_ok=True)
+        return True
+
+    def _other_entries(self) -> List[Dict[tuple, LatencyStats]]:
+        """Diğer worker'ların (ve önceki çalıştırmaların) dosyalarını okur"""
+        if not self.directory.exists():
+            return []
+
+        current = set()
+        for path in self.directory.glob("*.json"):
+            if path.name == self.file_name:
+                continue
+            if self._is_stale(path.name) and self._adopt(path):
+                continue
+            current.add(path.name)
+            try:
+                mtime = path.stat().st_mtime
+                cached = self._others.get(path.name)
+                if cached is None or cached[0] != mtime:
+                    self._others[path.name] = (mtime, self._load_file(path))
+            except (OSError, ValueError, KeyError):
+                # Yarım yazılmış veya bozuk dosya: atlanır
+                continue
+
+        for name in list(self._others):
+            if name not in current:
+                del self._others[name]
+        return [entries for _, entries in self._others.values()]
+
+    def entries(self, tool: str = None, project: str = None) -> Dict[tuple, LatencyStats]:
+        """
+        Tüm worker'ların özetlerini (araç, proje) bazında birleştirerek döner
+
+        Args:
+            tool: Sadece bu aracın özetleri (opsiyonel)
+            project: Sadece bu projenin özetleri (opsiyonel)
+        """
+        with self._lock:
+            self._start()
+            sources = self._other_entries() + [self._own]
+            merged = {}
+            for source in sources:
+                for key, stats in source.items():
+                    if (tool and key[0] != tool) or (project and key[1] != project):
+                        continue
+                    merged.setdefault(key, LatencyStats(stats.relative_error)).merge(stats)
+        return merged
+
+    def stats(self, tool: str = None, project: str = None) -> LatencyStats:
+        """Filtreye uyan tüm (araç, proje) özetlerinin tek özeti"""
+        total = LatencyStats()
+        for stats in self.entries(tool, project).values():
+            total.merge(stats)
+        return total
+
+
+# Uygulama genelinde kullanılan registry
+latency_registry = LatencyRegistry()
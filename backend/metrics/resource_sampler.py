@@ -0,0 +1,168 @@
+"""
+Arka Plan Kaynak Örnekleyici (Resource Sampler)
+
+Bu modül, Python process'inin CPU ve bellek (RSS) kullanımını arka plandaki
+tek bir thread'de sabit aralıkla örnekler ve son örnekleri bir ring
+buffer'da tutar. AdvancedMetricsCalculator, her hesaplamada
+cpu_percent(interval=0.1) ile 100 ms beklemek yerine bu buffer'dan pencere
+istatistiklerini (ortalama, p95, maksimum) bloklamadan okur.
+
+Örnekleyici process başına tektir (get_resource_sampler), ilk kullanımda
+başlar ve process kapanırken (atexit) durdurulur.
+
+Kullanım:
+    from metrics.resource_sampler import get_resource_sampler
+    stats = get_resource_sampler().window_stats(window_seconds=60)
+    print(stats["cpu_percent"]["p95"], stats["memory_mb"]["max"])
+
+Environment Variables:
+    RESOURCE_SAMPLE_INTERVAL: Örnekleme aralığı (saniye, default: 1.0)
+    RESOURCE_SAMPLE_BUFFER: Ring buffer'daki en fazla örnek sayısı (default: 600)
+    RESOURCE_SAMPLE_WINDOW: Varsayılan istatistik penceresi (saniye, default: 60)
+"""
+
+import atexit
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+import psutil
+
+RESOURCE_SAMPLE_INTERVAL = float(os.getenv("RESOURCE_SAMPLE_INTERVAL", "1.0"))
+RESOURCE_SAMPLE_BUFFER = int(os.getenv("RESOURCE_SAMPLE_BUFFER", "600"))
+RESOURCE_SAMPLE_WINDOW = float(os.getenv("RESOURCE_SAMPLE_WINDOW", "60"))
+
+
+def _summarize(values: List[float]) -> Dict[str, Optional[float]]:
+    """Değerlerin ortalama, p95 (nearest-rank) ve maksimumunu döner"""
+    if not values:
+        return {"mean": None, "p95": None, "max": None}
+
+    ordered = sorted(values)
+    rank = max(0, -(-95 * len(ordered) // 100) - 1)
+    return {
+        "mean": sum(ordered) / len(ordered),
+        "p95": ordered[rank],
+        "max": ordered[-1]
+    }
+
+
+class ResourceSampler:
+    """
+    CPU/RSS örneklerini ring buffer'da tutan arka plan örnekleyici
+
+    Her örnek (monotonic zaman, cpu_percent, rss_mb) üçlüsüdür. cpu_percent,
+    bir önceki örnekten bu yana geçen aralığın ortalamasıdır (psutil
+    cpu_percent(interval=None)); tek çekirdek = %100.
+    """
+
+    def __init__(self, interval: float = None, buffer_size: int = None, pid: int = None):
+        self.interval = RESOURCE_SAMPLE_INTERVAL if interval is None else interval
+        self.process = psutil.Process(pid or os.getpid())
+        self._samples = deque(maxlen=RESOURCE_SAMPLE_BUFFER if buffer_size is None else buffer_size)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "ResourceSampler":
+        """Örnekleme thread'ini başlatır (zaten çalışıyorsa bir şey yapmaz)"""
+        with self._lock:
+            if self.running:
+                return self
+            self._stop_event.clear()
+            # İlk cpu_percent çağrısı referans noktasıdır, her zaman 0.0 döner
+            self.process.cpu_percent(interval=None)
+            self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0):
+        """Örnekleme thread'ini durdurur ve bitmesini bekler"""
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        """Bir örnek alır ve buffer'a ekler (bloklamaz)"""
+        try:
+            with self.process.oneshot():
+                cpu_percent = self.process.cpu_percent(interval=None)
+                rss_mb = self.process.memory_info().rss / (1024 * 1024)
+        except psutil.Error:
+            return
+
+        with self._lock:
+            self._samples.append((time.monotonic(), cpu_percent, rss_mb))
+
+    def samples(self, window_seconds: float = None) -> List[tuple]:
+        """Son window_seconds içindeki örnekleri döner (None ise tümü)"""
+        with self._lock:
+            samples = list(self._samples)
+        if window_seconds is None:
+            return samples
+        since = time.monotonic() - window_seconds
+        return [sample for sample in samples if sample[0] >= since]
+
+    def window_stats(self, window_seconds: float = None) -> Dict:
+        """
+        Pencere istatistiklerini döner
+
+        Args:
+            window_seconds: Pencere uzunluğu (None ise RESOURCE_SAMPLE_WINDOW)
+
+        Returns:
+            {
+                "samples": int,
+                "window_seconds": float,
+                "cpu_percent": {"mean", "p95", "max"},
+                "memory_mb": {"mean", "p95", "max"}
+            }
+            Pencerede örnek yoksa istatistikler None olur.
+        """
+        if window_seconds is None:
+            window_seconds = RESOURCE_SAMPLE_WINDOW
+        samples = self.samples(window_seconds)
+        return {
+            "samples": len(samples),
+            "window_seconds": window_seconds,
+            "cpu_percent": _summarize([cpu for _, cpu, _ in samples]),
+            "memory_mb": _summarize([rss for _, _, rss in samples])
+        }
+
+
+_sampler = None
+_sampler_lock = threading.Lock()
+
+
+def get_resource_sampler() -> ResourceSampler:
+    """
+    Process'in paylaşılan örnekleyicisini döner (ilk çağrıda başlatılır)
+
+    Örnekleyici process kapanırken atexit ile durdurulur.
+    """
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = ResourceSampler()
+            atexit.register(shutdown_resource_sampler)
+        sampler = _sampler
+    return sampler.start()
+
+
+def shutdown_resource_sampler():
+    """Paylaşılan örnekleyiciyi durdurur (uygulama kapanırken çağrılır)"""
+    with _sampler_lock:
+        sampler = _sampler
+    if sampler is not None:
+        sampler.stop()
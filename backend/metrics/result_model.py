@@ -15,9 +15,14 @@ Kullanım:
         total_issues=40,
         scan_duration=12.5
     )
+
+Runner'lar taramayı fazlara ayırarak ölçer (bkz. backend/scan_timing.py);
+süre dökümü timings alanına yazılır. Araç kendi süresini bildirmiyorsa
+scan_duration, aracın ölçülen çalışma süresidir (spawn + tool).
 """
 
 from dataclasses import dataclass
+from typing import Optional
 
 @dataclass
 class MetricResult:
@@ -35,6 +40,8 @@ class MetricResult:
         low: Low seviyesindeki issue sayısı
         total_issues: Toplam issue sayısı
         scan_duration: Tarama süresi (saniye)
+        timings: Faz bazında süre dökümü (ScanTimer.to_dict formatında;
+            runner dışında hesaplanan sonuçlarda None)
     """
     tool_name: str
     critical: int
@@ -43,3 +50,4 @@ class MetricResult:
     low: int
     total_issues: int
     scan_duration: float
+    timings: Optional[dict] = None
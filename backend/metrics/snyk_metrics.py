@@ -9,6 +9,10 @@ Snyk Code iki farklı format kullanabilir:
 
 Her iki format da desteklenir ve otomatik olarak algılanır.
 
+Çok büyük SARIF çıktıları için calculate_from_results() result'ları tek tek
+(örn. sarif_stream.SarifResultStream'den) alarak sayar; dokümanın tamamının
+bellekte olması gerekmez.
+
 Severity Mapping:
 - Priority Score >= 900 -> critical
 - Priority Score >= 700 -> high
@@ -19,15 +23,24 @@ Severity Mapping:
 - Diğer -> low
 """
 
+from typing import Iterable, Optional
+
 from .base_metric import BaseMetric
 from .result_model import MetricResult
-import time
 
 class SnykMetrics(BaseMetric):
     """
     Snyk Code çıktılarını standart metrik formatına normalize eder
     """
     
+    # Priority score eşikleri (0-1000): score >= eşik ise o severity
+    CRITICAL_PRIORITY_SCORE = 900
+    HIGH_PRIORITY_SCORE = 700
+    MEDIUM_PRIORITY_SCORE = 500
+    
+    # Priority score yoksa level -> severity (diğer level'lar "low")
+    LEVEL_SEVERITIES = {"error": "high", "warning": "medium"}
+    
     def calculate(self, raw_data: dict) -> MetricResult:
         """
         Snyk Code'un ham çıktısını standart MetricResult formatına çevirir
@@ -50,53 +63,9 @@ class SnykMetrics(BaseMetric):
         # Snyk Code'un yeni SARIF formatı: runs[0].results[]
         if "runs" in raw_data and len(raw_data.get("runs", [])) > 0:
             # SARIF formatından results listesini al
-            results = raw_data["runs"][0].get("results", [])
-            
-            # Severity sayacıları
-            counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-            
-            # Her result için severity belirleme
-            for result in results:
-                level = result.get("level", "error").lower()
-                priority_score = result.get("properties", {}).get("priorityScore", 0)
-                
-                # Priority score varsa, ona göre severity belirle
-                # Snyk Code priority score: 0-1000 arası
-                if priority_score > 0:
-                    if priority_score >= 900:
-                        counts["critical"] += 1
-                    elif priority_score >= 700:
-                        counts["high"] += 1
-                    elif priority_score >= 500:
-                        counts["medium"] += 1
-                    else:
-                        counts["low"] += 1
-                else:
-                    # Priority score yoksa, level'a göre belirle
-                    if level == "error":
-                        counts["high"] += 1
-                    elif level == "warning":
-                        counts["medium"] += 1
-                    else:
-                        counts["low"] += 1
-            
-            # Scan duration SARIF formatında genelde yok
-            # automationDetails içinde olabilir ama genelde 0.0 olarak bırakıyoruz
-            scan_duration = 0.0
-            if "runs" in raw_data and len(raw_data["runs"]) > 0:
-                automation_details = raw_data["runs"][0].get("automationDetails", {})
-                # Duration bilgisi genelde automationDetails'te yok
-            
-            # Normalize edilmiş sonucu döndür
-            return MetricResult(
-                tool_name="Snyk Code",
-                critical=counts["critical"],
-                high=counts["high"],
-                medium=counts["medium"],
-                low=counts["low"],
-                total_issues=len(results),
-                scan_duration=scan_duration
-            )
+            # Scan duration SARIF formatında genelde yok, 0.0 olarak bırakıyoruz
+            # (runner ölçtüğü süreyi yazar, bkz. scan_timing)
+            return self.calculate_from_results(raw_data["runs"][0].get("results", []))
         
         # ============================================
         # ESKİ FORMAT DESTEĞİ (Geriye dönük uyumluluk)
@@ -123,3 +92,83 @@ class SnykMetrics(BaseMetric):
             total_issues=len(vulns),
             scan_duration=raw_data.get("scanDuration", 0.0)
         )
+    
+    def calculate_from_results(self, results: Iterable[dict]) -> MetricResult:
+        """
+        SARIF result'larını tek tek okuyarak MetricResult üretir
+        
+        Result'lar bir liste veya generator olabilir; her biri sayıldıktan
+        sonra tutulmaz.
+        
+        Args:
+            results: runs[0].results[] elemanları
+        
+        Returns:
+            MetricResult: Normalize edilmiş metrik sonucu
+        """
+        counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+        for result in results:
+            counts[self.classify_sarif_result(result)] += 1
+        
+        return MetricResult(
+            tool_name="Snyk Code",
+            critical=counts["critical"],
+            high=counts["high"],
+            medium=counts["medium"],
+            low=counts["low"],
+            total_issues=sum(counts.values()),
+            scan_duration=0.0
+        )
+    
+    @classmethod
+    def classify_sarif_result(cls, result: dict) -> str:
+        """
+        Tek bir SARIF result'ının severity'sini belirler
+        
+        Args:
+            result: runs[*].results[*] elemanı
+        
+        Returns:
+            str: "critical", "high", "medium" veya "low"
+        """
+        level = result.get("level", "error").lower()
+        priority_score = result.get("properties", {}).get("priorityScore", 0)
+        
+        # Priority score varsa, ona göre severity belirle
+        # Snyk Code priority score: 0-1000 arası
+        if priority_score > 0:
+            if priority_score >= cls.CRITICAL_PRIORITY_SCORE:
+                return "critical"
+            if priority_score >= cls.HIGH_PRIORITY_SCORE:
+                return "high"
+            if priority_score >= cls.MEDIUM_PRIORITY_SCORE:
+                return "medium"
+            return "low"
+        
+        # Priority score yoksa, level'a göre belirle
+        return cls.LEVEL_SEVERITIES.get(level, "low")
+    
+    @staticmethod
+    def sarif_result_to_issue(result: dict) -> Optional[dict]:
+        """
+        SARIF result'ını gelişmiş metriklerin kullandığı issue formatına çevirir
+        
+        Args:
+            result: runs[*].results[*] elemanı
+        
+        Returns:
+            dict: {"file", "line", "type", "severity", "description"}
+            veya result'ın konumu yoksa None
+        """
+        locations = result.get("locations", [])
+        if not locations:
+            return None
+        
+        location = locations[0].get("physicalLocation", {})
+        return {
+            "file": location.get("artifactLocation", {}).get("uri", ""),
+            "line": location.get("region", {}).get("startLine", -1),
+            "type": result.get("ruleId", ""),
+            "severity": result.get("level", "error"),
+            "description": result.get("message", {}).get("text", "")
+        }
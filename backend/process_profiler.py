@@ -0,0 +1,231 @@
+"""
+Tarama Process'i Kaynak Profili Modülü
+
+Bu modül, Snyk Code ve DeepSource CLI'larının çalıştığı alt process
+ağacının (CLI + onun başlattığı tüm alt process'ler) kaynak kullanımını
+ölçer. Flask/Python process'inin kendisi değil, taramayı yapan araç
+ölçüldüğü için araçlar maliyet açısından karşılaştırılabilir.
+
+Ölçüm arka plandaki bir thread'de örnekleme ile yapılır (psutil):
+- CPU süresi: Ağaçtaki her process'in son görülen user + system süresi toplamı
+- Bellek: Ağacın toplam RSS'inin zirvesi
+- I/O: Ağaçtaki her process'in son görülen okuma/yazma byte'ları toplamı
+- Thread/process sayısı: Ağaçtaki zirve değerler
+
+Not: Örnekleme aralığından kısa yaşayan process'ler ve bir process'in son
+örnekten sonraki kullanımı ölçülemez; bu yüzden değerler alt sınırdır.
+
+Proje Yapısı İçindeki Yeri:
+- backend/process_profiler.py: Bu dosya
+- backend/metric_runner.py, backend/deepsource_runner.py: CLI'ları profil altında çalıştırır
+- backend/metrics/advanced_metrics.py: Operasyonel verimlilik için kullanır
+
+Kullanım:
+    from process_profiler import profiled_run
+    completed, usage = profiled_run(["snyk", "code", "test", path, "--json"])
+    print(usage.cpu_seconds, usage.peak_rss_mb)
+
+Environment Variables:
+    SCAN_PROFILE_INTERVAL: Örnekleme aralığı (saniye, default: 0.2)
+    SCAN_PROFILING_ENABLED: "0" ise CLI'lar profilsiz çalıştırılır (default: 1)
+"""
+
+import os
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, Optional, Tuple
+
+import psutil
+
+from scan_timing import PHASE_SPAWN, PHASE_TOOL, scan_phase
+
+SCAN_PROFILE_INTERVAL = float(os.getenv("SCAN_PROFILE_INTERVAL", "0.2"))
+SCAN_PROFILING_ENABLED = os.getenv("SCAN_PROFILING_ENABLED", "1") != "0"
+
+
+@dataclass
+class ResourceUsage:
+    """
+    Bir taramanın alt process ağacının kaynak kullanımı
+
+    Attributes:
+        wall_seconds: Profilin açık kaldığı süre (saniye)
+        cpu_user_seconds: Ağacın toplam user CPU süresi
+        cpu_system_seconds: Ağacın toplam system CPU süresi
+        peak_rss_mb: Ağacın toplam RSS'inin zirvesi (MB)
+        io_read_bytes: Ağacın okuduğu byte (platform desteklemiyorsa 0)
+        io_write_bytes: Ağacın yazdığı byte (platform desteklemiyorsa 0)
+        peak_threads: Ağaçtaki toplam thread sayısının zirvesi
+        peak_processes: Ağaçtaki process sayısının zirvesi
+        samples: Alınan örnek sayısı
+    """
+    wall_seconds: float = 0.0
+    cpu_user_seconds: float = 0.0
+    cpu_system_seconds: float = 0.0
+    peak_rss_mb: float = 0.0
+    io_read_bytes: int = 0
+    io_write_bytes: int = 0
+    peak_threads: int = 0
+    peak_processes: int = 0
+    samples: int = 0
+
+    @property
+    def cpu_seconds(self) -> float:
+        return self.cpu_user_seconds + self.cpu_system_seconds
+
+    @property
+    def cpu_percent(self) -> float:
+        """Ortalama CPU kullanımı (tek çekirdek = %100)"""
+        return self.cpu_seconds / self.wall_seconds * 100 if self.wall_seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["cpu_seconds"] = self.cpu_seconds
+        data["cpu_percent"] = self.cpu_percent
+        return data
+
+
+class ProcessTreeProfiler:
+    """
+    Bir process'i ve tüm alt process'lerini arka planda örnekler
+
+    Process'ler (pid, create_time) ile tanınır; böylece örnekler arasında
+    pid tekrar kullanılsa bile sayaçlar karışmaz.
+    """
+
+    def __init__(self, pid: int, interval: float = None):
+        self.pid = pid
+        self.interval = SCAN_PROFILE_INTERVAL if interval is None else interval
+        self._cpu = {}   # (pid, create_time) -> (user, system)
+        self._io = {}    # (pid, create_time) -> (read_bytes, write_bytes)
+        self._peak_rss = 0
+        self._peak_threads = 0
+        self._peak_processes = 0
+        self._samples = 0
+        self._started_at = None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self) -> "ProcessTreeProfiler":
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name=f"profiler-{self.pid}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> ResourceUsage:
+        """Örneklemeyi durdurur ve toplanan kullanımı döner"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+
+        wall_seconds = time.perf_counter() - self._started_at if self._started_at else 0.0
+        return ResourceUsage(
+            wall_seconds=wall_seconds,
+            cpu_user_seconds=sum(user for user, _ in self._cpu.values()),
+            cpu_system_seconds=sum(system for _, system in self._cpu.values()),
+            peak_rss_mb=self._peak_rss / (1024 * 1024),
+            io_read_bytes=sum(read for read, _ in self._io.values()),
+            io_write_bytes=sum(write for _, write in self._io.values()),
+            peak_threads=self._peak_threads,
+            peak_processes=self._peak_processes,
+            samples=self._samples
+        )
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _run(self):
+        # İlk örnek hemen alınır (kısa süren CLI'lar için)
+        while True:
+            if not self.sample():
+                break
+            if self._stop_event.wait(self.interval):
+                break
+
+    def sample(self) -> bool:
+        """
+        Ağacın bir anlık görüntüsünü alır
+
+        Returns:
+            Kök process hâlâ yaşıyorsa True
+        """
+        try:
+            root = psutil.Process(self.pid)
+            processes = [root] + root.children(recursive=True)
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            return False
+        except psutil.AccessDenied:
+            processes = []
+
+        total_rss = 0
+        total_threads = 0
+        alive = 0
+        for process in processes:
+            try:
+                with process.oneshot():
+                    key = (process.pid, process.create_time())
+                    cpu = process.cpu_times()
+                    total_rss += process.memory_info().rss
+                    total_threads += process.num_threads()
+                    io = process.io_counters() if hasattr(process, "io_counters") else None
+            except (psutil.NoSuchProcess, psutil.ZombieProcess, psutil.AccessDenied):
+                continue
+
+            alive += 1
+            self._cpu[key] = (cpu.user, cpu.system)
+            if io is not None:
+                self._io[key] = (io.read_bytes, io.write_bytes)
+
+        self._peak_rss = max(self._peak_rss, total_rss)
+        self._peak_threads = max(self._peak_threads, total_threads)
+        self._peak_processes = max(self._peak_processes, alive)
+        self._samples += 1
+        return True
+
+
+def profiled_run(
+    args,
+    timeout: float = None,
+    text: bool = True
+) -> Tuple[subprocess.CompletedProcess, Optional[ResourceUsage]]:
+    """
+    subprocess.run(args, stdout=PIPE, stderr=PIPE) eşdeğeri, process ağacını profiller
+
+    Aktif bir tarama ölçümü varsa spawn ve tool fazlarını ölçer (bkz. scan_timing).
+
+    Args:
+        args: Çalıştırılacak komut
+        timeout: Zaman aşımı (saniye); aşılırsa process öldürülür ve
+            subprocess.TimeoutExpired fırlatılır
+        text: stdout/stderr'ın str olarak dönmesi için True
+
+    Returns:
+        (CompletedProcess, ResourceUsage); SCAN_PROFILING_ENABLED kapalıysa usage None
+
+    Raises:
+        FileNotFoundError / OSError: Komut başlatılamazsa (subprocess.run ile aynı)
+        subprocess.TimeoutExpired: Zaman aşımında
+    """
+    # Aktif bir tarama ölçümü varsa (bkz. scan_timing) process'in başlatılması
+    # "spawn", çalışması "tool" fazına eklenir
+    with scan_phase(PHASE_SPAWN):
+        process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=text)
+    profiler = ProcessTreeProfiler(process.pid).start() if SCAN_PROFILING_ENABLED else None
+    try:
+        with scan_phase(PHASE_TOOL):
+            stdout, stderr = process.communicate(timeout=timeout)
+    except BaseException:
+        process.kill()
+        process.communicate()
+        if profiler is not None:
+            profiler.stop()
+        raise
+
+    usage = profiler.stop() if profiler is not None else None
+    return subprocess.CompletedProcess(args, process.returncode, stdout, stderr), usage
+
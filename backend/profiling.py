@@ -0,0 +1,429 @@
+"""
+Opt-in Kod Profili (cProfile / Örnekleme) Modülü
+
+Bu modül, bir taramanın Python tarafında zamanın nereye gittiğini
+(subprocess beklemesi, json.loads, SnykMetrics.calculate'in severity
+döngüleri, sonuç dosyasının serileştirilmesi...) görmek için profil
+oturumları sağlar. Profil kapalıyken maliyeti yoktur.
+
+Modlar:
+- cprofile: Deterministik profil (cProfile). Her fonksiyon çağrısı sayılır;
+  kısa fonksiyonlarda belirgin ek yük getirir.
+- sample: Örnekleme profili. Arka plandaki bir thread, PROFILING_SAMPLE_INTERVAL
+  aralıkla profillenen thread'in call stack'ini okur (sys._current_frames).
+  Ek yükü düşüktür; kısa süren fonksiyonlar görünmeyebilir.
+
+Çıktı (flamegraph'a hazır):
+- <sonuç dosyası>.profile-<zaman>.folded: Collapsed stack formatı
+  ("a;b;c <ağırlık>" satırları; flamegraph.pl, speedscope, inferno ile açılır).
+  Ağırlık sample modunda örnek sayısı, cprofile modunda mikrosaniyedir
+  (cProfile çağrı grafiğinden orantılı olarak dağıtılır).
+- <sonuç dosyası>.profile-<zaman>.prof: Sadece cprofile modunda, pstats
+  dosyası (snakeviz, pstats ile açılır)
+Sonuç dosyası yoksa (örn. tarama başarısız) çıktılar PROFILING_OUTPUT_DIR'e yazılır.
+
+Profil şu yollarla açılır:
+- İstek bazında: POST /scan/<tool>?profile=1 (veya profile=cprofile|sample);
+  app.py runner'ı run_profiled ile çağırır, response'a "profile" özeti eklenir
+- Process bazında: PROFILING_MODE=cprofile|sample; @profiled_scan ile
+  işaretlenmiş runner'lar (run_code_scan_and_save, run_deepsource_scan_and_save)
+  her çağrıda profillenir
+- BaseMetric.calculate implementasyonları bölüm (section) olarak ölçülür:
+  ilk oturum açılırken bu modül onları profile_section ile sarar; sadece
+  aktif bir oturum içindeyken çağrı sayısı ve süresi özete eklenir
+
+Proje Yapısı İçindeki Yeri:
+- backend/profiling.py: Bu dosya
+- backend/app.py: ?profile= parametresi
+- backend/metric_runner.py, backend/deepsource_runner.py: @profiled_scan
+- backend/metrics/base_metric.py: calculate implementasyonları buradan sarılır
+  (metrics paketi bu modülü import etmez)
+
+Kullanım:
+    from profiling import run_profiled
+    result = run_profiled("snyk_code", "sample", run_code_scan_and_save, "flask_demo", force=True)
+    print(result["profile"]["files"]["folded"])
+
+Environment Variables:
+    PROFILING_MODE: Process bazında profil modu: cprofile veya sample (default: kapalı)
+    PROFILING_DEFAULT_MODE: ?profile=1 verildiğinde kullanılan mod (default: sample)
+    PROFILING_SAMPLE_INTERVAL: Örnekleme aralığı (saniye, default: 0.005)
+    PROFILING_OUTPUT_DIR: Sonuç dosyası olmayan profillerin klasörü (default: ../results/.profiles)
+"""
+
+import cProfile
+import functools
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from metrics.base_metric import BaseMetric
+
+PROFILING_MODE = os.getenv("PROFILING_MODE", "")
+PROFILING_DEFAULT_MODE = os.getenv("PROFILING_DEFAULT_MODE", "sample")
+PROFILING_SAMPLE_INTERVAL = float(os.getenv("PROFILING_SAMPLE_INTERVAL", "0.005"))
+PROFILING_OUTPUT_DIR = os.getenv("PROFILING_OUTPUT_DIR", "../results/.profiles")
+
+PROFILE_MODES = ("cprofile", "sample")
+
+# Özette gösterilen en fazla fonksiyon sayısı
+PROFILE_TOP_FUNCTIONS = 20
+
+# cProfile çağrı grafiği dolaşılırken bundan kısa yollar atlanır (saniye)
+_MIN_PATH_SECONDS = 1e-5
+# cProfile çağrı grafiğinde en fazla stack derinliği ve ziyaret edilen yol sayısı
+_MAX_STACK_DEPTH = 128
+_MAX_PATHS = 200000
+
+_local = threading.local()
+
+# BaseMetric alt sınıflarının sarılması (bkz. instrument_metric_classes)
+_instrument_lock = threading.Lock()
+
+
+def resolve_mode(value) -> Optional[str]:
+    """
+    ?profile= değerini profil moduna çevirir
+
+    Returns:
+        "cprofile", "sample" veya profil istenmediyse None
+
+    Raises:
+        ValueError: Değer tanınmıyorsa
+    """
+    if value is None or value is False:
+        return None
+    value = str(value).strip().lower()
+    if value in ("", "0", "false", "no"):
+        return None
+    if value in ("1", "true", "yes"):
+        return PROFILING_DEFAULT_MODE
+    if value in PROFILE_MODES:
+        return value
+    raise ValueError(f"Invalid profile mode '{value}', expected one of {list(PROFILE_MODES)} or 1")
+
+
+def _frame_label(code) -> str:
+    """Collapsed stack satırındaki çerçeve adı (';' ayraç olduğu için kullanılmaz)"""
+    label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    return label.replace(";", ":")
+
+
+def _pstats_label(func: tuple) -> str:
+    filename, line, name = func
+    if filename == "~":
+        # Yerleşik fonksiyonlar: "<built-in method posix.waitpid>" gibi
+        return name.replace(";", ":")
+    return f"{name} ({os.path.basename(filename)}:{line})".replace(";", ":")
+
+
+# ============================================
+# ÖRNEKLEME PROFİLCİSİ
+# ============================================
+
+class _StackSampler:
+    """
+    Bir thread'in call stack'ini arka planda periyodik olarak okur
+
+    Stack'ler root_frame'de (oturumu açan fonksiyon) kesilir; onun üstündeki
+    çerçeveler (Flask, job worker'ı) her örnekte aynı olduğu için alınmaz.
+    """
+
+    def __init__(self, thread_id: int, interval: float, root_frame=None):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.root_frame = root_frame
+        self.stacks = Counter()
+        self.samples = 0
+        self._labels: Dict[object, str] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiling-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            labels = []
+            while frame is not None:
+                code = frame.f_code
+                label = self._labels.get(code)
+                if label is None:
+                    label = self._labels[code] = _frame_label(code)
+                labels.append(label)
+                if frame is self.root_frame:
+                    break
+                frame = frame.f_back
+            frame = None
+            self.stacks[";".join(reversed(labels))] += 1
+            self.samples += 1
+
+
+def _pstats_to_folded(stats: pstats.Stats) -> Counter:
+    """
+    cProfile çağrı grafiğini collapsed stack'lere çevirir (ağırlık: mikrosaniye)
+
+    cProfile sadece çağıran-çağrılan çiftlerini tutar; bir fonksiyonun süresi,
+    onu çağıranlara kenar sürelerine orantılı olarak dağıtılır.
+    """
+    raw = stats.stats
+    callees = defaultdict(list)
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees[caller].append((func, edge[3]))
+
+    folded = Counter()
+    visited = 0
+
+    def walk(func, path, on_path, scale, depth):
+        nonlocal visited
+        visited += 1
+        _, _, self_seconds, _, _ = raw[func]
+        weight = int(round(self_seconds * scale * 1e6))
+        if weight > 0:
+            folded[";".join(path)] += weight
+        if depth >= _MAX_STACK_DEPTH or visited >= _MAX_PATHS:
+            return
+        for callee, edge_seconds in callees.get(func, ()):
+            callee_total = raw[callee][3]
+            path_seconds = edge_seconds * scale
+            if callee in on_path or callee_total <= 0 or path_seconds < _MIN_PATH_SECONDS:
+                continue
+            on_path.add(callee)
+            path.append(_pstats_label(callee))
+            walk(callee, path, on_path, min(path_seconds / callee_total, 1.0), depth + 1)
+            path.pop()
+            on_path.discard(callee)
+
+    for func, (_, _, _, _, callers) in raw.items():
+        if not callers:
+            walk(func, [_pstats_label(func)], {func}, 1.0, 1)
+    return folded
+
+
+# ============================================
+# PROFİL OTURUMU
+# ============================================
+
+class ProfileSession:
+    """
+    Tek bir thread'de açılan profil oturumu
+
+    with bloğu süresince bu thread'in aktif oturumudur; içerdeki
+    profile_section çağrıları bölüm olarak özete eklenir.
+    """
+
+    def __init__(self, mode: str, interval: float = None):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Invalid profile mode '{mode}', expected one of {list(PROFILE_MODES)}")
+        self.mode = mode
+        self.interval = PROFILING_SAMPLE_INTERVAL if interval is None else interval
+        self.sections: Dict[str, Dict[str, float]] = {}
+        self.wall_seconds = 0.0
+        self._profiler = None
+        self._sampler = None
+        self._started = None
+        self._previous = None
+
+    def __enter__(self):
+        instrument_metric_classes()
+        self._previous = getattr(_local, "session", None)
+        _local.session = self
+        self._started = time.perf_counter()
+        if self.mode == "cprofile":
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            # Oturumu açan fonksiyonun çerçevesi (with bloğunun bulunduğu yer)
+            self._sampler = _StackSampler(threading.get_ident(), self.interval, sys._getframe(1))
+            self._sampler.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._profiler is not None:
+            self._profiler.disable()
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler.root_frame = None
+        self.wall_seconds = time.perf_counter() - self._started
+        _local.session = self._previous
+
+    def record_section(self, name: str, seconds: float):
+        section = self.sections.setdefault(name, {"calls": 0, "seconds": 0.0})
+        section["calls"] += 1
+        section["seconds"] += seconds
+
+    def folded(self) -> Counter:
+        """Collapsed stack'ler (bkz. modül açıklaması)"""
+        if self._profiler is not None:
+            return _pstats_to_folded(pstats.Stats(self._profiler))
+        return Counter(self._sampler.stacks)
+
+    def top_functions(self, limit: int = PROFILE_TOP_FUNCTIONS) -> list:
+        """Kendi süresi (self time) en yüksek fonksiyonlar"""
+        if self._profiler is not None:
+            stats = pstats.Stats(self._profiler).stats
+            ranked = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+            return [
+                {"function": _pstats_label(func), "calls": nc,
+                 "self_seconds": round(tt, 6), "total_seconds": round(ct, 6)}
+                for func, (_, nc, tt, ct, _) in ranked
+            ]
+        leaves = Counter()
+        for stack, count in self._sampler.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return [
+            {"function": function, "samples": count, "self_seconds": round(count * self.interval, 6)}
+            for function, count in leaves.most_common(limit)
+        ]
+
+    def write(self, base_path: str) -> Dict[str, str]:
+        """
+        Flamegraph'a hazır çıktıları yazar
+
+        Returns:
+            {"folded": yol, "pstats": yol (sadece cprofile)}
+        """
+        Path(base_path).parent.mkdir(parents=True, exist_ok=True)
+        files = {"folded": f"{base_path}.folded"}
+        with open(files["folded"], "w", encoding="utf-8") as f:
+            for stack, weight in sorted(self.folded().items()):
+                f.write(f"{stack} {weight}\n")
+        if self._profiler is not None:
+            files["pstats"] = f"{base_path}.prof"
+            self._profiler.dump_stats(files["pstats"])
+        return files
+
+    def summary(self, files: Dict[str, str] = None) -> dict:
+        """API response'una eklenen özet"""
+        return {
+            "mode": self.mode,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "samples": self._sampler.samples if self._sampler is not None else None,
+            "sections": {
+                name: {"calls": section["calls"], "seconds": round(section["seconds"], 6)}
+                for name, section in self.sections.items()
+            },
+            "top_functions": self.top_functions(),
+            "files": files or {}
+        }
+
+
+def current_session() -> Optional[ProfileSession]:
+    """Bu thread'in aktif profil oturumu (yoksa None)"""
+    return getattr(_local, "session", None)
+
+
+def _timestamp() -> str:
+    return datetime.now().strftime("%Y-%m-%d_%H-%M-%S-%f")
+
+
+def _output_base(tool: str, project_name: str, result_path: str = None) -> str:
+    """Profil çıktılarının yolu (uzantısız); sonuç dosyası varsa onun yanı"""
+    if result_path:
+        return f"{result_path}.profile-{_timestamp()}"
+    return os.path.join(PROFILING_OUTPUT_DIR, f"{tool}_{project_name}_{_timestamp()}")
+
+
+# ============================================
+# RUNNER VE METRİK SARMALAYICILARI
+# ============================================
+
+def run_profiled(tool: str, mode: str, runner: Callable[..., dict], project_name: str, *args, **kwargs) -> dict:
+    """
+    Runner'ı profil oturumunda çalıştırır ve çıktıları sonuç dosyasının yanına yazar
+
+    Args:
+        tool: Araç adı (sonuç dosyası yoksa çıktı adı için)
+        mode: "cprofile" veya "sample"
+        runner: run_*_scan_and_save fonksiyonu
+        project_name: Proje adı
+
+    Returns:
+        dict: Runner'ın sonucu; "profile" alanında özet ve çıktı dosyaları
+    """
+    session = ProfileSession(mode)
+    with session:
+        result = runner(project_name, *args, **kwargs)
+
+    try:
+        files = session.write(_output_base(tool, project_name, result.get("file_path")))
+    except OSError as e:
+        print(f"WARNING: Profil çıktısı yazılamadı ({tool}/{project_name}): {e}")
+        files = {}
+    result["profile"] = session.summary(files)
+    return result
+
+
+def profiled_scan(tool: str):
+    """
+    Runner'ı PROFILING_MODE açıksa profil oturumunda çalıştıran decorator
+
+    Aktif bir oturum varsa (örn. ?profile=1 ile app.py açtıysa) runner
+    doğrudan çağrılır.
+    """
+    def decorator(runner):
+        @functools.wraps(runner)
+        def wrapper(project_name, *args, **kwargs):
+            if not PROFILING_MODE or current_session() is not None:
+                return runner(project_name, *args, **kwargs)
+            return run_profiled(tool, PROFILING_MODE, runner, project_name, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def profile_section(name: str):
+    """
+    Fonksiyonu profil bölümü olarak işaretleyen decorator
+
+    Aktif oturum varsa çağrı sayısı ve süresi oturumun özetine eklenir;
+    yoksa fonksiyon doğrudan çağrılır (kendi oturumunu açmaz, profil sadece
+    runner veya istek seviyesinde açılır).
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            session = current_session()
+            if session is None:
+                return fn(*args, **kwargs)
+
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                session.record_section(name, time.perf_counter() - started)
+
+        wrapper.__profile_section__ = name
+        return wrapper
+    return decorator
+
+
+def instrument_metric_classes():
+    """
+    BaseMetric alt sınıflarının calculate implementasyonlarını bölüm olarak sarar
+
+    Her oturum açılışında çağrılır; sonradan yüklenen araçların (bkz.
+    tool_registry) sınıfları da sarılır, sarılmış olanlar atlanır. Hiç
+    profil açılmayan process'te calculate'ler sarılmaz.
+    """
+    with _instrument_lock:
+        classes = list(BaseMetric.__subclasses__())
+        while classes:
+            cls = classes.pop()
+            classes.extend(cls.__subclasses__())
+            calculate = cls.__dict__.get("calculate")
+            if calculate is not None and not hasattr(calculate, "__profile_section__"):
+                cls.calculate = profile_section(f"{cls.__name__}.calculate")(calculate)
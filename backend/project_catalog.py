@@ -0,0 +1,327 @@
+"""
+Proje Kataloğu Modülü
+
+Bu modül, taranabilecek projeleri sabit bir liste yerine PROJECTS_ROOT
+klasörünün alt klasörlerinden keşfeder ve her proje için metadata tutar:
+dil dağılımı, dosya sayısı, satır sayısı (LOC), toplam boyut ve ağaç hash'i.
+
+Katalog bellekte tutulur; /projects ve tarama endpoint'leri dosya sistemine
+her request'te dokunmaz. Yenileme artımlıdır:
+- Kök klasör en fazla PROJECT_CATALOG_REFRESH_INTERVAL saniyede bir
+  listelenir (eklenen/silinen projeler)
+- Her projenin dosyaları sadece stat edilir; (boyut, mtime) değişmeyen
+  dosyaların satır sayısı yeniden hesaplanmaz
+- Hiçbir dosyası değişmeyen projenin metadata'sı (ve ağaç hash'i) aynen kalır
+
+Yenileme sırasında diğer request'ler bir önceki kataloğu okur; bekletilmez.
+
+Proje Yapısı İçindeki Yeri:
+- backend/project_catalog.py: Bu dosya
+- backend/project_tree.py: Dosya gezme ve ağaç hash'i
+- backend/source_census.py: Dil tespiti ve satır sayımı
+- backend/app.py: /projects endpoint'i ve proje doğrulaması
+- backend/metric_runner.py, backend/deepsource_runner.py: Proje yolları (PROJECTS_ROOT)
+
+Kullanım:
+    from project_catalog import project_catalog
+    project_catalog.names()                   # ["flask_demo", ...]
+    info = project_catalog.get("flask_demo")  # ProjectInfo veya None
+    total, page = project_catalog.query(language="Python", limit=20)
+
+Environment Variables:
+    PROJECTS_ROOT: Projelerin bulunduğu klasör (default: ../test_projects)
+    PROJECT_CATALOG_REFRESH_INTERVAL: Yenilemeler arası en az süre (saniye, default: 10)
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from project_tree import IGNORED_DIRS, compute_tree_hash, iter_project_files
+from source_census import count_lines, detect_language
+
+PROJECTS_ROOT = os.getenv("PROJECTS_ROOT", "../test_projects")
+PROJECT_CATALOG_REFRESH_INTERVAL = float(os.getenv("PROJECT_CATALOG_REFRESH_INTERVAL", "10"))
+
+
+@dataclass
+class ProjectInfo:
+    """
+    Bir projenin katalog kaydı
+
+    Attributes:
+        name: Proje adı (PROJECTS_ROOT altındaki klasör adı)
+        path: Proje klasörünün yolu
+        file_count: Dosya sayısı (IGNORED_DIRS hariç)
+        total_lines: Metin dosyalarının toplam satır sayısı
+        size_bytes: Dosyaların toplam boyutu
+        languages: Dil -> {"files", "lines"}
+        tree_hash: project_tree.compute_tree_hash ile Merkle hash
+        updated_at: Metadata'nın son hesaplandığı zaman
+    """
+    name: str
+    path: str
+    file_count: int = 0
+    total_lines: int = 0
+    size_bytes: int = 0
+    languages: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    tree_hash: str = ""
+    updated_at: str = ""
+
+    @property
+    def primary_language(self) -> Optional[str]:
+        """En çok satıra sahip dil (eşitlikte "Other" dışındaki dil seçilir)"""
+        if not self.languages:
+            return None
+        return max(self.languages, key=lambda lang: (self.languages[lang]["lines"], lang != "Other"))
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "path": self.path,
+            "exists": True,
+            "file_count": self.file_count,
+            "total_lines": self.total_lines,
+            "size_bytes": self.size_bytes,
+            "primary_language": self.primary_language,
+            "languages": self.languages,
+            "tree_hash": self.tree_hash,
+            "updated_at": self.updated_at
+        }
+
+
+class ProjectCatalog:
+    """
+    PROJECTS_ROOT altındaki projelerin bellekteki kataloğu
+
+    Her proje için dosya bazında (boyut, mtime_ns, dil, satır) tutulur;
+    yenilemede sadece stat'ı değişen dosyalar okunur.
+    """
+
+    def __init__(self, root: str = None, refresh_interval: float = None):
+        self.root = root or PROJECTS_ROOT
+        self.refresh_interval = (
+            PROJECT_CATALOG_REFRESH_INTERVAL if refresh_interval is None else refresh_interval
+        )
+        self._projects = {}      # ad -> ProjectInfo
+        self._files = {}         # ad -> {göreli yol: (size, mtime_ns, dil, satır)}
+        self._refreshed_at = None
+        self._refresh_lock = threading.Lock()
+
+    # ============================================
+    # YENİLEME
+    # ============================================
+
+    def refresh(self) -> int:
+        """
+        Kataloğu kök klasörle senkronize eder (bloklayarak)
+
+        Returns:
+            int: Metadata'sı yeniden hesaplanan proje sayısı
+        """
+        with self._refresh_lock:
+            return self._refresh()
+
+    def _refresh_if_stale(self):
+        """Süre dolduysa yeniler; başka bir thread yeniliyorsa eski kataloğu kullanır"""
+        refreshed_at = self._refreshed_at
+        if refreshed_at is not None and time.monotonic() - refreshed_at < self.refresh_interval:
+            return
+        # İlk yüklemede katalog boş olduğu için beklenir
+        if self._refresh_lock.acquire(blocking=refreshed_at is None):
+            try:
+                if self._refreshed_at == refreshed_at:
+                    self._refresh()
+            finally:
+                self._refresh_lock.release()
+
+    def _refresh(self) -> int:
+        names = self._discover()
+        projects = {}
+        files = {}
+        updated = 0
+        for name in names:
+            path = os.path.join(self.root, name)
+            try:
+                info, project_files, changed = self._analyze(name, path)
+            except OSError:
+                # Yenileme sırasında silinen proje
+                continue
+            projects[name] = info
+            files[name] = project_files
+            updated += changed
+
+        # Okuyucular her zaman tutarlı bir kataloğu görür (referans değişimi atomik)
+        self._projects = projects
+        self._files = files
+        self._refreshed_at = time.monotonic()
+        return updated
+
+    def _discover(self) -> List[str]:
+        """Kök klasördeki proje klasörlerinin adları (gizli ve IGNORED_DIRS hariç)"""
+        if not os.path.isdir(self.root):
+            return []
+        with os.scandir(self.root) as entries:
+            return sorted(
+                entry.name for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+                and not entry.name.startswith(".")
+                and entry.name not in IGNORED_DIRS
+            )
+
+    def _analyze(self, name: str, path: str) -> Tuple[ProjectInfo, dict, bool]:
+        """
+        Projeyi stat eder; değişen dosyaları okuyup metadata'yı günceller
+
+        Returns:
+            (ProjectInfo, dosya tablosu, metadata yeniden hesaplandı mı)
+        """
+        previous_files = self._files.get(name, {})
+        stats = {}
+        for relative_path, entry in iter_project_files(path):
+            stat = entry.stat(follow_symlinks=False)
+            stats[relative_path] = (stat.st_size, stat.st_mtime_ns, entry.path)
+
+        previous_info = self._projects.get(name)
+        if previous_info is not None and len(stats) == len(previous_files) and all(
+            previous_files.get(relative_path, ())[:2] == stat[:2]
+            for relative_path, stat in stats.items()
+        ):
+            return previous_info, previous_files, False
+
+        project_files = {}
+        for relative_path, (size, mtime_ns, file_path) in stats.items():
+            cached = previous_files.get(relative_path)
+            if cached is not None and cached[:2] == (size, mtime_ns):
+                project_files[relative_path] = cached
+                continue
+            try:
+                lines = count_lines(file_path, size)
+            except OSError:
+                lines = 0
+            project_files[relative_path] = (size, mtime_ns, detect_language(relative_path), lines)
+
+        languages = {}
+        for _, _, language, lines in project_files.values():
+            totals = languages.setdefault(language, {"files": 0, "lines": 0})
+            totals["files"] += 1
+            totals["lines"] += lines
+
+        info = ProjectInfo(
+            name=name,
+            path=path,
+            file_count=len(project_files),
+            total_lines=sum(lines for _, _, _, lines in project_files.values()),
+            size_bytes=sum(size for size, _, _, _ in project_files.values()),
+            languages=dict(sorted(languages.items(), key=lambda item: -item[1]["lines"])),
+            tree_hash=compute_tree_hash(path),
+            updated_at=datetime.now().isoformat(timespec="seconds")
+        )
+        return info, project_files, True
+
+    # ============================================
+    # SORGULAR
+    # ============================================
+
+    def projects(self) -> List[ProjectInfo]:
+        """Tüm projeler (ada göre sıralı)"""
+        self._refresh_if_stale()
+        return list(self._projects.values())
+
+    def names(self) -> List[str]:
+        self._refresh_if_stale()
+        return list(self._projects)
+
+    def get(self, name: str) -> Optional[ProjectInfo]:
+        """
+        Projeyi adıyla döner; katalogda yoksa None
+
+        Katalogda olmayan ama klasörü yeni oluşturulmuş projeler süre
+        beklenmeden eklenir; sadece o proje analiz edilir.
+        """
+        self._refresh_if_stale()
+        info = self._projects.get(name)
+        if info is None and self._is_project_dir(name):
+            info = self._add(name)
+        return info
+
+    def _is_project_dir(self, name: str) -> bool:
+        """Ad, kök klasörde keşfedilebilir bir proje klasörü mü (_discover ile aynı kurallar)"""
+        if not name or name.startswith(".") or name in IGNORED_DIRS:
+            return False
+        if os.sep in name or (os.altsep and os.altsep in name):
+            return False
+        path = os.path.join(self.root, name)
+        return os.path.isdir(path) and not os.path.islink(path)
+
+    def _add(self, name: str) -> Optional[ProjectInfo]:
+        """Tek bir projeyi analiz edip kataloğa ekler (diğer projeler stat edilmez)"""
+        try:
+            info, project_files, _ = self._analyze(name, os.path.join(self.root, name))
+        except OSError:
+            return None
+
+        # Okuyucular için referans değişimi; sıralama _refresh ile aynı (ada göre)
+        projects = dict(self._projects)
+        projects[name] = info
+        files = dict(self._files)
+        files[name] = project_files
+        self._projects = dict(sorted(projects.items()))
+        self._files = files
+        return info
+
+    def project_path(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+    def query(
+        self,
+        language: str = None,
+        search: str = None,
+        sort: str = "name",
+        offset: int = 0,
+        limit: int = 50
+    ) -> Tuple[int, List[ProjectInfo]]:
+        """
+        Filtrelenmiş ve sayfalanmış proje listesi
+
+        Args:
+            language: Sadece bu dili içeren projeler (büyük/küçük harf duyarsız)
+            search: Adında bu metin geçen projeler (büyük/küçük harf duyarsız)
+            sort: "name", "files" veya "lines" (files/lines büyükten küçüğe)
+            offset: Atlanacak proje sayısı
+            limit: En fazla dönecek proje sayısı
+
+        Returns:
+            (filtreye uyan toplam proje sayısı, sayfadaki projeler)
+
+        Raises:
+            ValueError: sort geçersizse
+        """
+        sort_keys = {
+            "name": lambda info: info.name,
+            "files": lambda info: (-info.file_count, info.name),
+            "lines": lambda info: (-info.total_lines, info.name)
+        }
+        if sort not in sort_keys:
+            raise ValueError(f"sort must be one of {sorted(sort_keys)}")
+
+        projects = self.projects()
+        if language:
+            language = language.lower()
+            projects = [
+                info for info in projects
+                if any(lang.lower() == language for lang in info.languages)
+            ]
+        if search:
+            search = search.lower()
+            projects = [info for info in projects if search in info.name.lower()]
+
+        projects.sort(key=sort_keys[sort])
+        return len(projects), projects[offset:offset + limit]
+
+
+# Uygulama genelinde kullanılan katalog
+project_catalog = ProjectCatalog()
@@ -0,0 +1,180 @@
+"""
+Proje Ağacı Hash Modülü
+
+Bu modül, bir test projesinin dosya ağacı için Merkle tarzı bir içerik hash'i
+hesaplar. Her dosyanın SHA-256 hash'i, her klasörün hash'i ise içindeki
+girdilerin (isim + tür + hash) sıralı listesinden üretilir. Böylece projede
+herhangi bir dosya değiştiğinde kök hash de değişir.
+
+Proje Yapısı İçindeki Yeri:
+- backend/project_tree.py: Bu dosya
+- backend/scan_cache.py: Tarama sonucu cache'i bu hash'i anahtar olarak kullanır
+- backend/metric_runner.py: Incremental tarama dosya bazlı parmak izlerini kullanır
+
+Dosya hash'leri yola göre, (boyut, mtime) ile birlikte bellekte tutulur;
+değişmeyen dosyalar tekrar okunmaz, sadece stat edilir. Değişen dosyanın eski
+girdisi üzerine yazılır ve cache en fazla PROJECT_HASH_CACHE_MAX_FILES dosya
+tutar (en uzun süredir kullanılmayan silinir).
+
+Kullanım:
+    from project_tree import compute_tree_hash, compute_file_fingerprints
+    tree_hash = compute_tree_hash("../test_projects/flask_demo")
+    fingerprints = compute_file_fingerprints("../test_projects/flask_demo")
+
+Environment Variables:
+    PROJECT_HASH_CACHE_MAX_FILES: Hash'i bellekte tutulan en fazla dosya sayısı (default: 100000)
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterator, Tuple
+
+# Hash hesaplamasına dahil edilmeyen klasörler
+# (VCS metadata'sı, Python cache'leri, bağımlılık klasörleri)
+IGNORED_DIRS = {
+    ".git", ".hg", ".svn", "__pycache__", ".mypy_cache", ".pytest_cache",
+    ".ruff_cache", ".tox", ".venv", "venv", "node_modules"
+}
+
+# Dosya okuma blok boyutu
+_CHUNK_SIZE = 1024 * 1024
+
+PROJECT_HASH_CACHE_MAX_FILES = int(os.getenv("PROJECT_HASH_CACHE_MAX_FILES", "100000"))
+
+# mutlak yol -> (size, mtime_ns, sha256 hex); en son kullanılan sonda (LRU)
+_file_hash_cache: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+_file_hash_lock = threading.Lock()
+
+
+def hash_file(path: str, size: int = None, mtime_ns: int = None) -> str:
+    """
+    Dosyanın SHA-256 hash'ini döner
+
+    Boyut ve mtime değişmediyse bellekteki hash kullanılır; değiştiyse dosya
+    yeniden okunur ve yolun girdisi güncellenir.
+
+    Args:
+        path: Dosya yolu
+        size: Dosya boyutu (verilmezse stat edilir)
+        mtime_ns: Dosya değişiklik zamanı (verilmezse stat edilir)
+
+    Returns:
+        str: Hex formatında SHA-256 hash
+    """
+    if size is None or mtime_ns is None:
+        stat = os.stat(path)
+        size, mtime_ns = stat.st_size, stat.st_mtime_ns
+
+    cache_key = os.path.abspath(path)
+    with _file_hash_lock:
+        cached = _file_hash_cache.get(cache_key)
+        if cached is not None and cached[:2] == (size, mtime_ns):
+            _file_hash_cache.move_to_end(cache_key)
+            return cached[2]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    file_hash = digest.hexdigest()
+
+    with _file_hash_lock:
+        # Dosyanın eski sürümünün girdisi üzerine yazılır
+        _file_hash_cache[cache_key] = (size, mtime_ns, file_hash)
+        _file_hash_cache.move_to_end(cache_key)
+        while len(_file_hash_cache) > PROJECT_HASH_CACHE_MAX_FILES:
+            _file_hash_cache.popitem(last=False)
+    return file_hash
+
+
+def iter_project_files(root: str) -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Proje klasöründeki dosyaları gezer
+
+    IGNORED_DIRS içindeki klasörler ve sembolik link'ler atlanır.
+
+    Args:
+        root: Proje klasörü yolu
+
+    Yields:
+        (relative_path, entry): POSIX formatında göreli yol ve os.DirEntry
+    """
+    stack = [("", root)]
+    while stack:
+        prefix, path = stack.pop()
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    continue
+                relative_path = f"{prefix}{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in IGNORED_DIRS:
+                        stack.append((relative_path + "/", entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    yield relative_path, entry
+
+
+def compute_file_fingerprints(root: str) -> Dict[str, str]:
+    """
+    Projedeki her dosyanın içerik hash'ini döner
+
+    Args:
+        root: Proje klasörü yolu
+
+    Returns:
+        dict: {göreli_yol: sha256_hex}
+
+    Raises:
+        FileNotFoundError: Klasör bulunamazsa
+    """
+    if not os.path.isdir(root):
+        raise FileNotFoundError(f"Project directory not found: {root}")
+
+    fingerprints = {}
+    for relative_path, entry in iter_project_files(root):
+        stat = entry.stat(follow_symlinks=False)
+        fingerprints[relative_path] = hash_file(entry.path, stat.st_size, stat.st_mtime_ns)
+    return fingerprints
+
+
+def compute_tree_hash(root: str) -> str:
+    """
+    Klasör ağacının Merkle hash'ini hesaplar
+
+    Args:
+        root: Proje klasörü yolu
+
+    Returns:
+        str: Hex formatında SHA-256 kök hash
+
+    Raises:
+        FileNotFoundError: Klasör bulunamazsa
+    """
+    if not os.path.isdir(root):
+        raise FileNotFoundError(f"Project directory not found: {root}")
+    return _hash_directory(root)
+
+
+def _hash_directory(path: str) -> str:
+    """Klasörün hash'ini, alt girdilerin hash'lerinden üretir"""
+    digest = hashlib.sha256()
+
+    with os.scandir(path) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            # Sembolik link'leri takip etme (döngü riskini önler)
+            if entry.is_symlink():
+                continue
+
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in IGNORED_DIRS:
+                    continue
+                digest.update(b"d\0" + entry.name.encode("utf-8", "surrogateescape") + b"\0")
+                digest.update(_hash_directory(entry.path).encode("ascii"))
+            elif entry.is_file(follow_symlinks=False):
+                stat = entry.stat(follow_symlinks=False)
+                digest.update(b"f\0" + entry.name.encode("utf-8", "surrogateescape") + b"\0")
+                digest.update(hash_file(entry.path, stat.st_size, stat.st_mtime_ns).encode("ascii"))
+
+    return digest.hexdigest()
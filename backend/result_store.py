@@ -0,0 +1,637 @@
+"""
+Tarama Sonucu Saklama Modülü
+
+Bu modül, tarama sonuçlarını results/ klasörüne girintili (indent=2) JSON
+yerine sıkıştırılmış, kompakt bir formatta (.rstore) kaydeder ve okur.
+
+Kompakt Format (.rstore):
+- Issue listeleri (SARIF runs[*].results, DeepSource issues.edges) birbirinden
+  bağımsız gzip frame'lerine bölünür; her frame bir JSON dizisidir
+- Dokümanın geri kalanı (iskelet) ve frame index'i dosyanın sonundaki
+  index frame'inde tutulur; en sondaki sabit boyutlu footer index'in yerini gösterir
+- SARIF kural kataloğu (runs[*].tool.driver.rules) dosyaya yazılmaz;
+  her kural içerik hash'i ile results/catalog/<araç>/<versiyon>/ altında bir kez
+  saklanır ve sonuç dosyası sadece hash'leri tutar
+
+    MAGIC | frame 1 (gzip) | frame 2 (gzip) | ... | index (gzip) | footer
+
+Frame index'i sayesinde issue'lar frame frame okunabilir; dosyanın tamamını
+belleğe almak gerekmez. Yazma atomiktir: dosya önce geçici bir isimle yazılır,
+sonra yerine taşınır.
+
+Proje Yapısı İçindeki Yeri:
+- backend/result_store.py: Bu dosya
+- backend/metric_runner.py, backend/deepsource_runner.py: save_scan_result() buraya yönlenir
+- results/: Sonuç dosyaları (.rstore veya eski .json)
+- results/catalog/: Araç ve versiyona göre tekilleştirilmiş kural kataloğu
+- backend/telemetry.py: Kayıt (serileştirme) süresi /metrics'e eklenir
+
+Kullanım:
+    from result_store import save_scan_result, load_scan_result, list_scan_results
+    path = save_scan_result(raw_output, "snyk_code", "flask_demo", tool_version="1.1301.2")
+    raw_output = load_scan_result(path)     # .json dosyalarını da okur
+    latest = list_scan_results(tool="snyk_code")[0]
+
+Environment Variables:
+    RESULT_STORE_FORMAT: "compact" (default) veya "json" (eski girintili JSON)
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import struct
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+from telemetry import time_json
+
+RESULT_STORE_FORMAT = os.getenv("RESULT_STORE_FORMAT", "compact")
+
+# Kompakt sonuç dosyası uzantısı
+COMPACT_SUFFIX = ".rstore"
+
+# Bir frame'e yazılan sıkıştırılmamış en fazla issue verisi (byte)
+FRAME_BYTES = 256 * 1024
+
+# Sonuç dosyaları ile aynı klasördeki kural kataloğu klasörü
+CATALOG_DIRNAME = "catalog"
+
+# Sonuç listelerken tanınan araç adları (dosya adı: <araç>_<proje>_<zaman>)
+KNOWN_TOOLS = ("snyk_code", "deepsource")
+
+_MAGIC = b"KRSTORE1"
+_FOOTER = struct.Struct("<QQ8s")  # index offset, index uzunluğu, magic
+_FORMAT_VERSION = 1
+
+_FILENAME_PATTERN = re.compile(
+    r"^(?P<name>.+)_(?P<timestamp>\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})(?:_\d+)?$"
+)
+
+# result_file_path'in verdiği ama henüz yazılmamış olabilecek yollar
+# (eşzamanlı taramalar aynı saniyede aynı dosya adını almasın)
+_reserved_paths = set()
+_reserved_lock = threading.Lock()
+
+# Sonuç dosyasındaki issue koleksiyonları: SARIF ve DeepSource GraphQL
+_SARIF_RESULTS = ("runs", None, "results")
+_SARIF_RULES = ("runs", None, "tool", "driver", "rules")
+_DEEPSOURCE_EDGES = ("data", "repository", "issues", "edges")
+
+
+class ResultStoreError(RuntimeError):
+    """Sonuç dosyası bozuk veya tanınmayan formatta olduğunda fırlatılır"""
+
+
+# ============================================
+# YAZMA
+# ============================================
+
+class ResultStoreWriter:
+    """
+    Kompakt sonuç dosyası yazıcısı
+
+    Issue'lar add_item() ile tek tek eklenir ve FRAME_BYTES dolunca gzip
+    frame'i olarak diske yazılır; bellekte en fazla bir frame tutulur.
+    commit() iskelet dokümanı ve index'i yazıp dosyayı yerine taşır.
+
+    Kullanım:
+        writer = ResultStoreWriter(path, "snyk_code", "1.1301.2")
+        try:
+            for run_index, result in stream:
+                writer.add_item(("runs", run_index, "results"), result)
+            writer.commit(document)
+        except BaseException:
+            writer.abort()
+            raise
+    """
+
+    def __init__(self, path: str, tool_name: str, tool_version: str = "unknown",
+                 frame_bytes: int = FRAME_BYTES):
+        self.path = Path(path)
+        self.tool_name = tool_name
+        self.tool_version = tool_version
+        self.frame_bytes = frame_bytes
+        self._collections = {}  # path tuple -> {"frames": [...], "count": int}
+        self._pending = {}      # path tuple -> [encoded item, ...]
+        self._pending_bytes = {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        self._file = os.fdopen(fd, "wb")
+        self._file.write(_MAGIC)
+
+    def add_item(self, collection: tuple, item) -> None:
+        """
+        Koleksiyona bir issue ekler
+
+        Args:
+            collection: Issue listesinin dokümandaki yolu (örn: ("runs", 0, "results"))
+            item: Issue (JSON'a çevrilebilir değer)
+        """
+        encoded = json.dumps(item, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.ensure_collection(collection)
+        self._pending[collection].append(encoded)
+        self._pending_bytes[collection] += len(encoded) + 1
+        if self._pending_bytes[collection] >= self.frame_bytes:
+            self._flush(collection)
+
+    def ensure_collection(self, collection: tuple) -> None:
+        """Koleksiyonu (boş olsa bile) dosyaya kaydeder"""
+        if collection not in self._collections:
+            self._collections[collection] = {"frames": [], "count": 0}
+            self._pending[collection] = []
+            self._pending_bytes[collection] = 0
+
+    def commit(self, document: dict) -> str:
+        """
+        İskelet dokümanı ve index'i yazar, dosyayı atomik olarak yerine taşır
+
+        Args:
+            document: Issue koleksiyonları hariç doküman (koleksiyonların
+                yerindeki değer load sırasında issue listesiyle değiştirilir)
+
+        Returns:
+            str: Kaydedilen dosyanın yolu
+        """
+        for collection in self._collections:
+            self._flush(collection)
+
+        skeleton, rules = _extract_rules(document, self.path.parent, self.tool_name, self.tool_version)
+        index = {
+            "format_version": _FORMAT_VERSION,
+            "tool": self.tool_name,
+            "tool_version": self.tool_version,
+            "document": skeleton,
+            "rules": rules,
+            "collections": [
+                {"path": list(path), "frames": info["frames"], "count": info["count"]}
+                for path, info in self._collections.items()
+            ]
+        }
+
+        index_offset = self._file.tell()
+        index_data = gzip.compress(
+            json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        )
+        self._file.write(index_data)
+        self._file.write(_FOOTER.pack(index_offset, len(index_data), _MAGIC))
+        self._file.close()
+
+        os.replace(self._tmp_path, self.path)
+        return str(self.path)
+
+    def abort(self) -> None:
+        """Yarım kalan geçici dosyayı siler"""
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def _flush(self, collection: tuple) -> None:
+        """Koleksiyonun bekleyen issue'larını bir gzip frame'i olarak yazar"""
+        items = self._pending[collection]
+        if not items:
+            return
+
+        frame = gzip.compress(b"[" + b",".join(items) + b"]", compresslevel=6)
+        info = self._collections[collection]
+        info["frames"].append([self._file.tell(), len(frame), len(items)])
+        info["count"] += len(items)
+        self._file.write(frame)
+
+        self._pending[collection] = []
+        self._pending_bytes[collection] = 0
+
+
+def save_scan_result(
+    raw_output: dict,
+    tool_name: str,
+    project_name: str,
+    tool_version: str = "unknown",
+    results_dir: str = "../results",
+    file_format: str = None
+) -> str:
+    """
+    Tarama sonucunu results/ klasörüne kaydeder
+
+    Args:
+        raw_output: Aracın ham JSON çıktısı
+        tool_name: Araç adı (örn: "snyk_code")
+        project_name: Test projesi adı
+        tool_version: Araç versiyonu (kural kataloğu bu versiyona göre ayrılır)
+        results_dir: Sonuç klasörü
+        file_format: "compact" veya "json" (default: RESULT_STORE_FORMAT)
+
+    Returns:
+        str: Kaydedilen dosyanın yolu
+    """
+    file_format = file_format or RESULT_STORE_FORMAT
+    with reserve_result_path(results_dir, tool_name, project_name, file_format) as file_path:
+        if file_format == "json":
+            with time_json("serialize", tool_name):
+                _atomic_write_json(file_path, raw_output)
+            return str(file_path)
+
+        writer = ResultStoreWriter(file_path, tool_name, tool_version)
+        try:
+            with time_json("serialize", tool_name):
+                skeleton = raw_output
+                for collection, items in _find_collections(raw_output):
+                    writer.ensure_collection(collection)
+                    for item in items:
+                        writer.add_item(collection, item)
+                    skeleton = _replace_at(skeleton, collection, [])
+                return writer.commit(skeleton)
+        except BaseException:
+            writer.abort()
+            raise
+
+
+def result_file_path(results_dir: str, tool_name: str, project_name: str,
+                     file_format: str = None) -> Path:
+    """
+    Yeni sonuç dosyasının yolunu üretir (klasörü oluşturur)
+
+    Dosya adı: <araç>_<proje>_<zaman>.rstore (veya .json). Aynı saniyede
+    ikinci bir dosya yazılırsa (veya bu process'te yolu daha önce verilmiş
+    bir dosya henüz yazılmadıysa) sonuna sıra numarası eklenir.
+
+    Yol, release_result_path çağrılana kadar ayrılmış kalır; dosyayı yazan
+    kod reserve_result_path kullanmalıdır.
+    """
+    results_path = Path(results_dir)
+    results_path.mkdir(parents=True, exist_ok=True)
+
+    suffix = ".json" if (file_format or RESULT_STORE_FORMAT) == "json" else COMPACT_SUFFIX
+    timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+    file_path = results_path / f"{tool_name}_{project_name}_{timestamp}{suffix}"
+
+    with _reserved_lock:
+        counter = 1
+        while file_path.exists() or file_path in _reserved_paths:
+            file_path = results_path / f"{tool_name}_{project_name}_{timestamp}_{counter}{suffix}"
+            counter += 1
+        _reserved_paths.add(file_path)
+    return file_path
+
+
+def release_result_path(file_path) -> None:
+    """result_file_path'in ayırdığı yolu serbest bırakır (dosya yazıldıktan veya yazılamadıktan sonra)"""
+    with _reserved_lock:
+        _reserved_paths.discard(Path(file_path))
+
+
+@contextmanager
+def reserve_result_path(results_dir: str, tool_name: str, project_name: str,
+                        file_format: str = None) -> Iterator[Path]:
+    """
+    result_file_path ile yol ayırır; blok bitince (tarama başarısız olsa da) serbest bırakır
+
+    Blok içinde dosya yazılmış olmalıdır; sonrasında exists() aynı adın
+    tekrar verilmesini engeller.
+    """
+    file_path = result_file_path(results_dir, tool_name, project_name, file_format)
+    try:
+        yield file_path
+    finally:
+        release_result_path(file_path)
+
+
+def _atomic_write_json(file_path: Path, data: dict) -> None:
+    """Girintili JSON dosyasını geçici dosya üzerinden atomik olarak yazar"""
+    fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# ============================================
+# OKUMA
+# ============================================
+
+class ResultStoreReader:
+    """
+    Kompakt sonuç dosyası okuyucusu
+
+    Açılışta sadece footer ve index okunur; issue frame'leri istendikçe
+    okunur ve açılır.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self.index = self._read_index()
+        except BaseException:
+            self._file.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+
+    @property
+    def tool_name(self) -> str:
+        return self.index["tool"]
+
+    @property
+    def tool_version(self) -> str:
+        return self.index["tool_version"]
+
+    def count(self, collection: tuple = None) -> int:
+        """Koleksiyondaki (verilmezse tüm koleksiyonlardaki) issue sayısı"""
+        return sum(
+            info["count"] for info in self.index["collections"]
+            if collection is None or tuple(info["path"]) == tuple(collection)
+        )
+
+    def iter_items(self, collection: tuple = None) -> Iterator[Tuple[tuple, object]]:
+        """
+        Issue'ları frame frame okuyarak döner
+
+        Args:
+            collection: Sadece bu koleksiyon (verilmezse hepsi, yazılma sırasıyla)
+
+        Yields:
+            (collection_path, item) çiftleri
+        """
+        for info in self.index["collections"]:
+            path = tuple(info["path"])
+            if collection is not None and path != tuple(collection):
+                continue
+            for offset, length, _ in info["frames"]:
+                for item in self._read_frame(offset, length):
+                    yield path, item
+
+    def load(self) -> dict:
+        """Dokümanı (kurallar ve issue'lar dahil) eksiksiz olarak döner"""
+        document = self.index["document"]
+        for rules in self.index["rules"]:
+            document = _replace_at(document, tuple(rules["path"]), [
+                _load_catalog_rule(str(self.path.parent), self.tool_name, self.tool_version, digest)
+                for digest in rules["digests"]
+            ])
+
+        for info in self.index["collections"]:
+            items = []
+            for offset, length, _ in info["frames"]:
+                items.extend(self._read_frame(offset, length))
+            document = _replace_at(document, tuple(info["path"]), items)
+        return document
+
+    def _read_index(self) -> dict:
+        self._file.seek(0, os.SEEK_END)
+        size = self._file.tell()
+        if size < len(_MAGIC) + _FOOTER.size:
+            raise ResultStoreError(f"Not a result store file: {self.path}")
+
+        self._file.seek(0)
+        header = self._file.read(len(_MAGIC))
+        self._file.seek(size - _FOOTER.size)
+        index_offset, index_length, footer_magic = _FOOTER.unpack(self._file.read(_FOOTER.size))
+        if header != _MAGIC or footer_magic != _MAGIC:
+            raise ResultStoreError(f"Not a result store file: {self.path}")
+
+        index = json.loads(self._read_gzip(index_offset, index_length))
+        if index.get("format_version") != _FORMAT_VERSION:
+            raise ResultStoreError(
+                f"Unsupported result store version {index.get('format_version')}: {self.path}"
+            )
+        return index
+
+    def _read_frame(self, offset: int, length: int) -> list:
+        return json.loads(self._read_gzip(offset, length))
+
+    def _read_gzip(self, offset: int, length: int) -> bytes:
+        self._file.seek(offset)
+        data = self._file.read(length)
+        if len(data) != length:
+            raise ResultStoreError(f"Truncated result store file: {self.path}")
+        return gzip.decompress(data)
+
+
+def is_compact_result(path: str) -> bool:
+    """Dosya kompakt (.rstore) formatında mı?"""
+    return str(path).endswith(COMPACT_SUFFIX)
+
+
+def load_scan_result(path: str) -> dict:
+    """
+    Sonuç dosyasını okur (hem .rstore hem eski .json dosyaları)
+
+    Args:
+        path: Sonuç dosyası yolu
+
+    Returns:
+        dict: Aracın ham çıktısı (kaydedildiği haliyle)
+    """
+    if is_compact_result(path):
+        with ResultStoreReader(path) as reader:
+            return reader.load()
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def iter_scan_items(path: str) -> Iterator[Tuple[tuple, object]]:
+    """
+    Sonuç dosyasındaki issue'ları (collection_path, item) olarak döner
+
+    .rstore dosyalarında frame frame okunur; .json dosyaları tek seferde yüklenir.
+    """
+    if is_compact_result(path):
+        with ResultStoreReader(path) as reader:
+            yield from reader.iter_items()
+        return
+
+    for collection, items in _find_collections(load_scan_result(path)):
+        for item in items:
+            yield collection, item
+
+
+def list_scan_results(results_dir: str = "../results", tool: str = None,
+                      project: str = None) -> List[dict]:
+    """
+    results/ klasöründeki tarama sonucu dosyalarını en yeniden eskiye listeler
+
+    Gelişmiş metrik dosyaları (*_advanced_metrics_*) listelenmez.
+
+    Args:
+        results_dir: Sonuç klasörü
+        tool: Sadece bu aracın sonuçları (opsiyonel)
+        project: Sadece bu projenin sonuçları (opsiyonel)
+
+    Returns:
+        list: [{"path", "tool", "project", "timestamp", "format", "size"}, ...]
+    """
+    results_path = Path(results_dir)
+    if not results_path.is_dir():
+        return []
+
+    entries = []
+    with os.scandir(results_path) as scan:
+        for entry in scan:
+            if not entry.is_file() or "advanced_metrics" in entry.name:
+                continue
+            stem, suffix = os.path.splitext(entry.name)
+            if suffix not in (".json", COMPACT_SUFFIX):
+                continue
+
+            match = _FILENAME_PATTERN.match(stem)
+            if not match:
+                continue
+            file_tool = next((t for t in KNOWN_TOOLS if match["name"].startswith(t + "_")), None)
+            if file_tool is None:
+                continue
+            file_project = match["name"][len(file_tool) + 1:]
+            if (tool and file_tool != tool) or (project and file_project != project):
+                continue
+
+            stat = entry.stat()
+            entries.append({
+                "path": entry.path,
+                "tool": file_tool,
+                "project": file_project,
+                "timestamp": match["timestamp"],
+                "format": "compact" if suffix == COMPACT_SUFFIX else "json",
+                "size": stat.st_size,
+                "_mtime": stat.st_mtime
+            })
+
+    entries.sort(key=lambda e: (e["timestamp"], e["_mtime"]), reverse=True)
+    for entry in entries:
+        del entry["_mtime"]
+    return entries
+
+
+# ============================================
+# KURAL KATALOĞU
+# ============================================
+
+def _catalog_dir(results_dir: str, tool_name: str, tool_version: str) -> Path:
+    safe_version = re.sub(r"[^A-Za-z0-9._-]", "_", tool_version) or "unknown"
+    return Path(results_dir) / CATALOG_DIRNAME / tool_name / safe_version
+
+
+def _store_catalog_rule(results_dir: str, tool_name: str, tool_version: str, rule: dict) -> str:
+    """
+    Kuralı kataloğa yazar (zaten varsa yazmaz) ve içerik hash'ini döner
+
+    Katalog girdileri içerik adreslidir: aynı hash her zaman aynı içeriği
+    gösterir, bu yüzden eşzamanlı yazmalar birbirini bozmaz.
+    """
+    encoded = json.dumps(rule, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    digest = hashlib.sha256(encoded).hexdigest()
+
+    directory = _catalog_dir(results_dir, tool_name, tool_version)
+    entry_path = directory / f"{digest}.json.gz"
+    if not entry_path.exists():
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(encoded))
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    return digest
+
+
+@lru_cache(maxsize=4096)
+def _load_catalog_rule_cached(results_dir: str, tool_name: str, tool_version: str, digest: str) -> str:
+    entry_path = _catalog_dir(results_dir, tool_name, tool_version) / f"{digest}.json.gz"
+    try:
+        with open(entry_path, "rb") as f:
+            return gzip.decompress(f.read()).decode("utf-8")
+    except FileNotFoundError:
+        raise ResultStoreError(f"Rule catalog entry missing: {entry_path}")
+
+
+def _load_catalog_rule(results_dir: str, tool_name: str, tool_version: str, digest: str) -> dict:
+    # Cache'te string tutulur; her çağrıda yeni dict döner (çağıran değiştirebilir)
+    return json.loads(_load_catalog_rule_cached(results_dir, tool_name, tool_version, digest))
+
+
+def _extract_rules(document: dict, results_dir: Path, tool_name: str, tool_version: str):
+    """
+    SARIF kurallarını kataloğa taşır
+
+    Returns:
+        (skeleton, rules): Kuralları boşaltılmış doküman ve
+        [{"path": [...], "digests": [...]}] listesi
+    """
+    rules = []
+    skeleton = document
+    for path, items in _find_paths(document, _SARIF_RULES):
+        if not isinstance(items, list):
+            continue
+        digests = [_store_catalog_rule(str(results_dir), tool_name, tool_version, rule) for rule in items]
+        rules.append({"path": list(path), "digests": digests})
+        skeleton = _replace_at(skeleton, path, [])
+    return skeleton, rules
+
+
+# ============================================
+# DOKÜMAN YOLLARI
+# ============================================
+
+def _find_collections(document: dict):
+    """Dokümandaki issue listelerini (path, items) olarak döner"""
+    for pattern in (_SARIF_RESULTS, _DEEPSOURCE_EDGES):
+        for path, items in _find_paths(document, pattern):
+            if isinstance(items, list):
+                yield path, items
+
+
+def _find_paths(value, pattern: tuple, prefix: tuple = ()):
+    """
+    Kalıba uyan yolları gezer (None: listenin her elemanı)
+
+    Yields:
+        (path, value): Tam yol ve o yoldaki değer
+    """
+    if not pattern:
+        yield prefix, value
+        return
+
+    key, rest = pattern[0], pattern[1:]
+    if key is None:
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                yield from _find_paths(item, rest, prefix + (index,))
+    elif isinstance(value, dict) and key in value:
+        yield from _find_paths(value[key], rest, prefix + (key,))
+
+
+def _replace_at(value, path: tuple, new_value):
+    """
+    Yoldaki değeri değiştirilmiş bir kopya döner
+
+    Sadece yol üzerindeki dict/list'ler kopyalanır; orijinal doküman değişmez.
+    """
+    if not path:
+        return new_value
+
+    key, rest = path[0], path[1:]
+    copy = list(value) if isinstance(value, list) else dict(value)
+    copy[key] = _replace_at(value[key], rest, new_value) if rest else new_value
+    return copy
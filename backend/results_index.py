@@ -0,0 +1,376 @@
+"""
+Tarama Sonucu Index Modülü
+
+Bu modül, results/ klasöründeki tarama sonuçları için SQLite tabanlı bir
+index tutar. Her kayıtta araç, proje, zaman, severity sayıları, tarama süresi
+ve sonuç dosyasının yolu bulunur. "X aracının Y projesindeki son taraması",
+"belirli aralıktaki taramalar" ve "en çok critical bulunan projeler" gibi
+sorgular dosya sistemine dokunmadan, index üzerinden O(log n) cevaplanır.
+
+Proje Yapısı İçindeki Yeri:
+- backend/results_index.py: Bu dosya
+- backend/metric_runner.py, backend/deepsource_runner.py: save_scan_result() index'i günceller
+- backend/app.py: /results, /results/latest ve /results/top-projects endpoint'leri
+- results/index.sqlite3: Index veritabanı (WAL modunda)
+
+Tablolar:
+- scan_results: Her sonuç dosyası için bir satır
+- latest_results: Her (araç, proje) için son taramanın kopyası
+  (top-projects sorgusu gruplama yapmadan index üzerinden çalışır)
+
+Kullanım:
+    from results_index import results_index
+    results_index.record("snyk_code", "flask_demo", file_path, metric_result)
+    results_index.latest(tool="snyk_code", project="flask_demo")
+
+    # Index'i results/ klasöründen yeniden oluşturmak için:
+    cd backend
+    python results_index.py rebuild
+
+Environment Variables:
+    RESULTS_INDEX_PATH: Index veritabanı yolu (default: ../results/index.sqlite3)
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from metrics.result_model import MetricResult
+
+RESULTS_INDEX_PATH = os.getenv("RESULTS_INDEX_PATH", "../results/index.sqlite3")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scan_results (
+    id INTEGER PRIMARY KEY,
+    tool TEXT NOT NULL,
+    project TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    tool_name TEXT NOT NULL,
+    critical INTEGER NOT NULL,
+    high INTEGER NOT NULL,
+    medium INTEGER NOT NULL,
+    low INTEGER NOT NULL,
+    total_issues INTEGER NOT NULL,
+    scan_duration REAL NOT NULL,
+    tool_version TEXT,
+    file_path TEXT NOT NULL UNIQUE
+);
+CREATE INDEX IF NOT EXISTS idx_scan_results_tool_project_time
+    ON scan_results (tool, project, created_at);
+CREATE INDEX IF NOT EXISTS idx_scan_results_tool_time
+    ON scan_results (tool, created_at);
+CREATE INDEX IF NOT EXISTS idx_scan_results_project_time
+    ON scan_results (project, created_at);
+CREATE INDEX IF NOT EXISTS idx_scan_results_time
+    ON scan_results (created_at);
+
+CREATE TABLE IF NOT EXISTS latest_results (
+    tool TEXT NOT NULL,
+    project TEXT NOT NULL,
+    result_id INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    critical INTEGER NOT NULL,
+    PRIMARY KEY (tool, project)
+);
+CREATE INDEX IF NOT EXISTS idx_latest_results_critical
+    ON latest_results (critical DESC, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_latest_results_tool_critical
+    ON latest_results (tool, critical DESC, created_at DESC);
+"""
+
+_COLUMNS = (
+    "id, tool, project, created_at, tool_name, critical, high, medium, low, "
+    "total_issues, scan_duration, tool_version, file_path"
+)
+
+
+class ResultsIndex:
+    """
+    SQLite tabanlı tarama sonucu index'i
+
+    Her thread kendi bağlantısını kullanır; WAL modu sayesinde okumalar
+    yazmaları beklemez.
+    """
+
+    def __init__(self, db_path: str = RESULTS_INDEX_PATH):
+        self.db_path = str(db_path)
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    # ============================================
+    # BAĞLANTI
+    # ============================================
+
+    def _connect(self) -> sqlite3.Connection:
+        """Thread'e ait bağlantıyı döner (ilk kullanımda açar, şemayı oluşturur)"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            return connection
+
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+
+        with self._schema_lock:
+            if not self._schema_ready:
+                connection.executescript(_SCHEMA)
+                self._schema_ready = True
+
+        self._local.connection = connection
+        return connection
+
+    def close(self):
+        """Bu thread'in bağlantısını kapatır"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    # ============================================
+    # YAZMA
+    # ============================================
+
+    def record(
+        self,
+        tool: str,
+        project: str,
+        file_path: str,
+        metric_result: MetricResult,
+        created_at: Optional[datetime] = None,
+        tool_version: Optional[str] = None
+    ) -> int:
+        """
+        Tarama sonucunu index'e ekler
+
+        Aynı file_path tekrar kaydedilirse satır güncellenir.
+
+        Args:
+            tool: Araç adı (örn: "snyk_code")
+            project: Proje adı
+            file_path: results/ altındaki sonuç dosyası
+            metric_result: Normalize edilmiş metrik sonucu
+            created_at: Tarama zamanı (default: şimdi)
+            tool_version: Araç versiyonu (opsiyonel)
+
+        Returns:
+            int: Satır id'si
+        """
+        connection = self._connect()
+        with connection:
+            return self._insert(connection, tool, project, file_path, metric_result, created_at, tool_version)
+
+    def _insert(self, connection, tool, project, file_path, metric_result, created_at, tool_version) -> int:
+        """Satırı ekler ve latest_results'ı günceller (transaction içinde çağrılmalı)"""
+        created_at = (created_at or datetime.now()).isoformat(timespec="microseconds")
+        metrics = asdict(metric_result)
+
+        row_id = connection.execute(
+            """
+            INSERT INTO scan_results (
+                tool, project, created_at, tool_name, critical, high, medium, low,
+                total_issues, scan_duration, tool_version, file_path
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (file_path) DO UPDATE SET
+                tool = excluded.tool, project = excluded.project,
+                created_at = excluded.created_at, tool_name = excluded.tool_name,
+                critical = excluded.critical, high = excluded.high,
+                medium = excluded.medium, low = excluded.low,
+                total_issues = excluded.total_issues,
+                scan_duration = excluded.scan_duration,
+                tool_version = excluded.tool_version
+            RETURNING id
+            """,
+            (
+                tool, project, created_at, metrics["tool_name"], metrics["critical"],
+                metrics["high"], metrics["medium"], metrics["low"], metrics["total_issues"],
+                metrics["scan_duration"], tool_version, str(file_path)
+            )
+        ).fetchone()[0]
+
+        # Sadece daha yeni bir tarama ise son tarama kaydını değiştir
+        connection.execute(
+            """
+            INSERT INTO latest_results (tool, project, result_id, created_at, critical)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (tool, project) DO UPDATE SET
+                result_id = excluded.result_id,
+                created_at = excluded.created_at,
+                critical = excluded.critical
+            WHERE excluded.created_at >= latest_results.created_at
+            """,
+            (tool, project, row_id, created_at, metrics["critical"])
+        )
+        return row_id
+
+    def rebuild(self, results_dir: str) -> int:
+        """
+        Index'i results/ klasöründeki dosyalardan baştan oluşturur
+
+        Metrikler her dosya okunarak yeniden hesaplanır; tarama zamanı dosya
+        adındaki zaman damgasından alınır.
+
+        Args:
+            results_dir: Sonuç klasörü
+
+        Returns:
+            int: Index'e eklenen dosya sayısı
+        """
+        from metrics.deepsource_metrics import DeepSourceMetrics
+        from metrics.snyk_metrics import SnykMetrics
+        from result_store import list_scan_results, load_scan_result
+
+        calculators = {"snyk_code": SnykMetrics(), "deepsource": DeepSourceMetrics()}
+        entries = list(reversed(list_scan_results(results_dir)))
+
+        connection = self._connect()
+        with connection:
+            connection.execute("DELETE FROM latest_results")
+            connection.execute("DELETE FROM scan_results")
+            for entry in entries:
+                metric_result = calculators[entry["tool"]].calculate(load_scan_result(entry["path"]))
+                created_at = datetime.strptime(entry["timestamp"], "%Y-%m-%d_%H-%M-%S")
+                self._insert(
+                    connection, entry["tool"], entry["project"], entry["path"],
+                    metric_result, created_at, None
+                )
+        return len(entries)
+
+    # ============================================
+    # SORGULAR
+    # ============================================
+
+    def latest(self, tool: Optional[str] = None, project: Optional[str] = None) -> Optional[dict]:
+        """
+        En son taramayı döner
+
+        Args:
+            tool: Sadece bu aracın taramaları (opsiyonel)
+            project: Sadece bu projenin taramaları (opsiyonel)
+
+        Returns:
+            dict: Tarama kaydı (bkz. _row_to_dict) veya kayıt yoksa None
+        """
+        where, params = self._filters(tool=tool, project=project)
+        row = self._connect().execute(
+            f"SELECT {_COLUMNS} FROM scan_results {where} ORDER BY created_at DESC, id DESC LIMIT 1",
+            params
+        ).fetchone()
+        return _row_to_dict(row) if row else None
+
+    def runs_in_range(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        tool: Optional[str] = None,
+        project: Optional[str] = None,
+        limit: int = 100
+    ) -> List[dict]:
+        """
+        Zaman aralığındaki taramaları en yeniden eskiye döner
+
+        Args:
+            start: Bu zamandan sonraki (dahil) taramalar (opsiyonel)
+            end: Bu zamandan önceki (hariç) taramalar (opsiyonel)
+            tool: Sadece bu aracın taramaları (opsiyonel)
+            project: Sadece bu projenin taramaları (opsiyonel)
+            limit: En fazla dönecek kayıt sayısı
+        """
+        where, params = self._filters(tool=tool, project=project, start=start, end=end)
+        rows = self._connect().execute(
+            f"SELECT {_COLUMNS} FROM scan_results {where} ORDER BY created_at DESC, id DESC LIMIT ?",
+            params + [limit]
+        ).fetchall()
+        return [_row_to_dict(row) for row in rows]
+
+    def top_projects_by_critical(self, tool: Optional[str] = None, limit: int = 10) -> List[dict]:
+        """
+        Son taramalarındaki critical sayısına göre en riskli projeleri döner
+
+        Her (araç, proje) için sadece son tarama dikkate alınır.
+
+        Args:
+            tool: Sadece bu aracın taramaları (opsiyonel)
+            limit: En fazla dönecek proje sayısı
+        """
+        where, params = ("WHERE l.tool = ?", [tool]) if tool else ("", [])
+        columns = ", ".join(f"s.{column.strip()}" for column in _COLUMNS.split(","))
+        rows = self._connect().execute(
+            f"""
+            SELECT {columns} FROM latest_results l
+            JOIN scan_results s ON s.id = l.result_id
+            {where}
+            ORDER BY l.critical DESC, l.created_at DESC
+            LIMIT ?
+            """,
+            params + [limit]
+        ).fetchall()
+        return [_row_to_dict(row) for row in rows]
+
+    def count(self) -> int:
+        """Index'teki kayıt sayısı"""
+        return self._connect().execute("SELECT COUNT(*) FROM scan_results").fetchone()[0]
+
+    @staticmethod
+    def _filters(tool=None, project=None, start=None, end=None):
+        """WHERE koşulunu ve parametrelerini üretir"""
+        clauses, params = [], []
+        if tool:
+            clauses.append("tool = ?")
+            params.append(tool)
+        if project:
+            clauses.append("project = ?")
+            params.append(project)
+        if start:
+            clauses.append("created_at >= ?")
+            params.append(start.isoformat(timespec="microseconds"))
+        if end:
+            clauses.append("created_at < ?")
+            params.append(end.isoformat(timespec="microseconds"))
+        return ("WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def _row_to_dict(row: sqlite3.Row) -> dict:
+    """Index satırını API response formatına çevirir"""
+    return {
+        "id": row["id"],
+        "tool": row["tool"],
+        "project": row["project"],
+        "created_at": row["created_at"],
+        "tool_version": row["tool_version"],
+        "file_path": row["file_path"],
+        "metrics": {
+            "tool_name": row["tool_name"],
+            "critical": row["critical"],
+            "high": row["high"],
+            "medium": row["medium"],
+            "low": row["low"],
+            "total_issues": row["total_issues"],
+            "scan_duration": row["scan_duration"]
+        }
+    }
+
+
+# Runner'ların ve API'nin paylaştığı varsayılan index
+results_index = ResultsIndex()
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] != "rebuild":
+        print("Kullanım: python results_index.py rebuild [results_dir]")
+        sys.exit(1)
+
+    results_dir = sys.argv[2] if len(sys.argv) > 2 else str(Path(RESULTS_INDEX_PATH).parent)
+    count = results_index.rebuild(results_dir)
+    print(f"Index yeniden oluşturuldu: {count} sonuç dosyası ({results_index.db_path})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""
+Streaming SARIF Parser Modülü
+
+Bu modül, Snyk Code'un SARIF çıktısını tamamını belleğe almadan okur.
+Çıktı parça parça (chunk) okunur; sadece runs[*].results[*] elemanları tek tek
+parse edilip döndürülür, diğer değerler okunduktan sonra atılır. Tek bir
+değer SKIP_DECODE_LIMIT'ten büyükse (örn. çok büyük bir rules dizisi) parse
+edilmeden, sadece yapı takip edilerek atlanır. Böylece yüzlerce MB'lık
+çıktılarda bile bellek kullanımı en büyük tek değerin boyutuyla sınırlı kalır.
+
+Proje Yapısı İçindeki Yeri:
+- backend/sarif_stream.py: Bu dosya
+- backend/metric_runner.py: stream_snyk_code_scan() CLI stdout'unu bu parser ile okur
+- backend/metrics/snyk_metrics.py: SnykMetrics.calculate_from_results() sayaçları
+
+Kullanım:
+    from sarif_stream import SarifResultStream
+    with open("snyk_output.json", "rb") as f:
+        stream = SarifResultStream(f)
+        for run_index, result in stream:
+            print(run_index, result["ruleId"])
+        stream.saw_runs  # Çıktıda "runs" anahtarı var mıydı (SARIF mi?)
+
+    # Result'lar dışındaki kısımları (rules, properties...) da saklamak için:
+    stream = SarifResultStream(f, capture=True)
+    ...
+    stream.document  # {"runs": [{"tool": ..., "results": []}], ...}
+"""
+
+import codecs
+import json
+import re
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+# Okuma blok boyutu (byte)
+CHUNK_SIZE = 64 * 1024
+
+# Bu boyuttan (karakter) büyük değerler parse edilmeden yapısal olarak atlanır
+SKIP_DECODE_LIMIT = 8 * 1024 * 1024
+
+_DECODER = json.JSONDecoder()
+
+_NON_WHITESPACE = re.compile(r"[^ \t\r\n]")
+_STRUCTURAL = re.compile(r'["\[\]{}]')
+_PRIMITIVE_END = re.compile(r"[,\]} \t\r\n]")
+
+
+# _read_value'ın limit aşıldığında döndüğü işaret değeri
+_TOO_LARGE = object()
+
+
+class TeeReader:
+    """
+    Okunan her byte'ı ayrıca bir dosyaya yazan okuyucu
+
+    CLI stdout'u parse edilirken ham çıktının aynı anda diske yazılması
+    için kullanılır. sink None ise sadece okunan byte sayısı tutulur.
+    """
+
+    def __init__(self, source: BinaryIO, sink: Optional[BinaryIO] = None):
+        self.source = source
+        self.sink = sink
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.source.read(size)
+        if data:
+            if self.sink is not None:
+                self.sink.write(data)
+            self.bytes_read += len(data)
+        return data
+
+
+class SarifResultStream:
+    """
+    SARIF dokümanındaki runs[*].results[*] elemanlarını sırayla döndürür
+
+    Parser sadece gezinme için gereken yapıyı (obje anahtarları, dizi
+    elemanları) takip eder. Result dışındaki değerler okunup atılır ve
+    okunan kısım buffer'dan silinir.
+
+    capture=True ise result'lar dışındaki değerler (örn. rules) de parse
+    edilip document'te tutulur; result listelerinin yerinde boş liste kalır.
+    Bu durumda bellek kullanımı result'lar hariç dokümanın boyutu kadardır.
+
+    Attributes:
+        saw_runs: Dokümanda üst seviye "runs" anahtarı bulunduysa True
+        run_count: Görülen run sayısı
+        document: Result'lar hariç doküman iskeleti (sadece capture=True ise dolu)
+    """
+
+    def __init__(self, source: BinaryIO, chunk_size: int = CHUNK_SIZE, capture: bool = False):
+        self.source = source
+        self.chunk_size = chunk_size
+        self.capture = capture
+        self.saw_runs = False
+        self.run_count = 0
+        self.document = {}
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._index = 0
+        self._keep_from: Optional[int] = None
+        self._eof = False
+
+    def __iter__(self) -> Iterator[Tuple[int, dict]]:
+        if self._skip_whitespace() != "{":
+            return
+
+        for key in self._iter_object_keys():
+            if key != "runs":
+                self._keep_or_skip(self.document, key)
+                continue
+
+            self.saw_runs = True
+            if self._skip_whitespace() != "[":
+                self._keep_or_skip(self.document, key)
+                continue
+
+            runs = self.document[key] = []
+            for run_index in self._iter_array_items():
+                self.run_count += 1
+                if self._skip_whitespace() != "{":
+                    if self.capture:
+                        runs.append(self._read_value())
+                    else:
+                        self._skip_value()
+                    continue
+
+                run = {}
+                runs.append(run)
+                for run_key in self._iter_object_keys():
+                    if run_key == "results" and self._skip_whitespace() == "[":
+                        # Result'lar döndürülür, iskelette sadece boş liste kalır
+                        run[run_key] = []
+                        for _ in self._iter_array_items():
+                            yield run_index, self._read_value()
+                    else:
+                        self._keep_or_skip(run, run_key)
+
+    def _keep_or_skip(self, target: dict, key: str):
+        """capture açıksa değeri iskelete ekler, değilse atlar"""
+        if self.capture:
+            target[key] = self._read_value()
+        else:
+            self._skip_value()
+
+    # ============================================
+    # BUFFER YÖNETİMİ
+    # ============================================
+
+    def _fill(self, size: int = None) -> bool:
+        """
+        Kaynaktan bir chunk daha okur
+
+        Buffer'ın okunmuş (ve saklanması gerekmeyen) kısmı silinir.
+
+        Args:
+            size: Okunacak byte sayısı (default: chunk_size)
+
+        Returns:
+            bool: Yeni veri okunduysa True, kaynak bittiyse False
+        """
+        if self._eof:
+            return False
+
+        cut = self._index if self._keep_from is None else min(self._index, self._keep_from)
+        if cut:
+            self._buffer = self._buffer[cut:]
+            self._index -= cut
+            if self._keep_from is not None:
+                self._keep_from -= cut
+
+        chunk = self.source.read(size or self.chunk_size)
+        if not chunk:
+            self._eof = True
+            self._buffer += self._decoder.decode(b"", final=True)
+            return False
+
+        self._buffer += self._decoder.decode(chunk)
+        return True
+
+    def _skip_whitespace(self) -> str:
+        """Boşlukları atlar ve sıradaki karakteri döner (doküman bittiyse "")"""
+        while True:
+            match = _NON_WHITESPACE.search(self._buffer, self._index)
+            if match:
+                self._index = match.start()
+                return self._buffer[self._index]
+            self._index = len(self._buffer)
+            if not self._fill():
+                return ""
+
+    # ============================================
+    # YAPI GEZİNME
+    # ============================================
+
+    def _iter_object_keys(self) -> Iterator[str]:
+        """
+        Objenin anahtarlarını döner; her anahtardan sonra değer okunmalıdır
+
+        Çağrıldığında _index "{" karakterinde olmalıdır.
+        """
+        self._index += 1
+        while True:
+            char = self._skip_whitespace()
+            if char == "}":
+                self._index += 1
+                return
+            if char == ",":
+                self._index += 1
+                continue
+            if char != '"':
+                raise ValueError(f"Invalid SARIF JSON: expected object key, got {char!r}")
+
+            key = self._read_value()
+            if self._skip_whitespace() != ":":
+                raise ValueError("Invalid SARIF JSON: expected ':' after object key")
+            self._index += 1
+            self._skip_whitespace()
+            yield key
+
+    def _iter_array_items(self) -> Iterator[int]:
+        """
+        Dizinin eleman indekslerini döner; her indeksten sonra değer okunmalıdır
+
+        Çağrıldığında _index "[" karakterinde olmalıdır.
+        """
+        self._index += 1
+        position = 0
+        while True:
+            char = self._skip_whitespace()
+            if char == "]":
+                self._index += 1
+                return
+            if char == ",":
+                self._index += 1
+                continue
+            if not char:
+                raise ValueError("Invalid SARIF JSON: unexpected end of array")
+            yield position
+            position += 1
+
+    def _read_value(self, limit: int = None):
+        """
+        Sıradaki değeri parse edip döner
+
+        Değer buffer'da tamamlanmamışsa buffer büyütülerek (her seferinde
+        iki katına çıkarılarak) tekrar denenir.
+
+        Args:
+            limit: Değer bu boyutu (karakter) aşarsa vazgeç (default: sınırsız)
+
+        Returns:
+            Parse edilen değer; limit aşıldıysa _index değişmeden _TOO_LARGE
+        """
+        self._skip_whitespace()
+        self._keep_from = self._index
+        try:
+            while True:
+                try:
+                    value, end = _DECODER.raw_decode(self._buffer, self._index)
+                    # Sayı chunk sınırında bölünmüş olabilir ("12." veya "1e"): sadece
+                    # ardından bir ayraç geliyorsa (veya kaynak bittiyse) tamamdır
+                    if (self._eof or not isinstance(value, (int, float))
+                            or _PRIMITIVE_END.match(self._buffer, end)):
+                        self._index = end
+                        return value
+                except json.JSONDecodeError:
+                    if self._eof:
+                        raise ValueError("Invalid SARIF JSON: could not decode value")
+
+                pending = len(self._buffer) - self._index
+                if limit is not None and pending >= limit:
+                    return _TOO_LARGE
+                self._fill(max(self.chunk_size, pending))
+        finally:
+            self._keep_from = None
+
+    def _skip_value(self):
+        """
+        Sıradaki değeri atlar
+
+        Küçük obje/diziler C json decoder ile hızlıca okunup atılır; çok büyük
+        olanlar parse edilmeden yapısal olarak atlanır.
+        """
+        char = self._skip_whitespace()
+        if char in "{[":
+            if self._read_value(limit=SKIP_DECODE_LIMIT) is _TOO_LARGE:
+                self._skip_container()
+        elif char == '"':
+            self._index += 1
+            self._skip_string_body()
+        elif char:
+            self._skip_primitive()
+        else:
+            raise ValueError("Invalid SARIF JSON: unexpected end of document")
+
+    def _skip_container(self):
+        """Obje veya diziyi, iç içe yapı derinliğini sayarak atlar"""
+        depth = 0
+        while True:
+            match = _STRUCTURAL.search(self._buffer, self._index)
+            if match is None:
+                self._index = len(self._buffer)
+                if not self._fill():
+                    raise ValueError("Invalid SARIF JSON: unexpected end of container")
+                continue
+
+            char = match.group()
+            self._index = match.end()
+            if char == '"':
+                self._skip_string_body()
+            elif char in "{[":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def _skip_string_body(self):
+        """Açılış tırnağından sonraki string içeriğini kapanış tırnağına kadar atlar"""
+        segment_start = self._index
+        while True:
+            quote = self._buffer.find('"', self._index)
+            if quote == -1:
+                # Sondaki ters bölü karakterlerini sakla (kaçış dizisi sınırda bölünmüş olabilir)
+                end = len(self._buffer)
+                while end > segment_start and self._buffer[end - 1] == "\\":
+                    end -= 1
+                self._index = end
+                if not self._fill():
+                    raise ValueError("Invalid SARIF JSON: unterminated string")
+                segment_start = self._index
+                continue
+
+            backslashes = 0
+            position = quote - 1
+            while position >= segment_start and self._buffer[position] == "\\":
+                backslashes += 1
+                position -= 1
+
+            self._index = quote + 1
+            if backslashes % 2 == 0:
+                return
+
+    def _skip_primitive(self):
+        """Sayı, true, false veya null değerini atlar"""
+        while True:
+            match = _PRIMITIVE_END.search(self._buffer, self._index)
+            if match:
+                self._index = match.start()
+                return
+            self._index = len(self._buffer)
+            if not self._fill():
+                return
+
+
+def iter_sarif_results(source: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[int, dict]]:
+    """
+    SARIF kaynağındaki (run_index, result) çiftlerini sırayla döner
+
+    Args:
+        source: read(size) metodu olan binary kaynak (dosya, pipe, TeeReader)
+        chunk_size: Okuma blok boyutu
+
+    Yields:
+        (run_index, result): Run indeksi ve parse edilmiş result dict'i
+    """
+    return iter(SarifResultStream(source, chunk_size))
@@ -0,0 +1,269 @@
+"""
+Tarama Sonucu Cache Modülü
+
+Bu modül, Snyk Code ve DeepSource taramalarının önüne içerik adresli bir
+cache katmanı koyar. Cache anahtarı; araç adı, araç versiyonu ve projenin
+Merkle ağaç hash'inden (bkz. project_tree.py) üretilir. Proje dosyaları
+değişmediği sürece aynı tarama tekrar çalıştırılmaz, kayıtlı ham çıktı ve
+MetricResult döner.
+
+Proje Yapısı İçindeki Yeri:
+- backend/scan_cache.py: Bu dosya
+- backend/project_tree.py: Proje ağacı hash'i
+- backend/metric_runner.py, backend/deepsource_runner.py: Cache'i kullanan runner'lar
+- results/.cache/: Cache girdileri (her anahtar için bir JSON dosyası)
+
+Eviction:
+- Yaş: SCAN_CACHE_MAX_AGE_SECONDS'tan eski girdiler okunurken silinir
+- Boyut: Toplam boyut SCAN_CACHE_MAX_BYTES'ı aşarsa en eski girdiler silinir
+
+Kullanım:
+    from scan_cache import scan_cache, make_cache_key
+    key = make_cache_key("snyk_code", "1.1301.2", tree_hash)
+    cached = scan_cache.get(key)
+    if cached is None:
+        ...
+        scan_cache.put(key, raw_output, metric_result, file_path)
+
+Environment Variables:
+    SCAN_CACHE_DIR: Cache klasörü (default: ../results/.cache)
+    SCAN_CACHE_MAX_BYTES: Cache'in toplam en fazla boyutu (default: 512 MB)
+    SCAN_CACHE_MAX_AGE_SECONDS: Girdilerin en fazla yaşı (default: 7 gün)
+    SCAN_CACHE_ENABLED: "0" ise cache devre dışı (default: 1)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Optional
+
+from metrics.result_model import MetricResult
+
+SCAN_CACHE_DIR = os.getenv("SCAN_CACHE_DIR", "../results/.cache")
+SCAN_CACHE_MAX_BYTES = int(os.getenv("SCAN_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+SCAN_CACHE_MAX_AGE_SECONDS = float(os.getenv("SCAN_CACHE_MAX_AGE_SECONDS", str(7 * 24 * 3600)))
+SCAN_CACHE_ENABLED = os.getenv("SCAN_CACHE_ENABLED", "1") != "0"
+
+
+def make_cache_key(tool_name: str, tool_version: str, tree_hash: str, extra: str = "") -> str:
+    """
+    Cache anahtarını üretir
+
+    Args:
+        tool_name: Araç adı (örn: "snyk_code")
+        tool_version: Araç versiyonu (örn: "1.1301.2")
+        tree_hash: Projenin Merkle ağaç hash'i
+        extra: Anahtara eklenecek ek bilgi (örn: DeepSource repository adı)
+
+    Returns:
+        str: Hex formatında SHA-256 anahtar
+    """
+    material = "\0".join([tool_name, tool_version, tree_hash, extra])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ScanCache:
+    """
+    Disk tabanlı, boyut ve yaş sınırlı tarama sonucu cache'i
+
+    Her girdi cache klasöründe <anahtar>.json olarak saklanır. Bellekte
+    sadece girdilerin boyut ve oluşturulma zamanı tutulur.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = SCAN_CACHE_DIR,
+        max_bytes: int = SCAN_CACHE_MAX_BYTES,
+        max_age_seconds: float = SCAN_CACHE_MAX_AGE_SECONDS,
+        enabled: bool = SCAN_CACHE_ENABLED
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: Optional[Dict[str, Dict[str, float]]] = None  # key -> {size, created_at}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, max_age_seconds: float = None) -> Optional[dict]:
+        """
+        Anahtara ait cache girdisini döner
+
+        Args:
+            key: make_cache_key ile üretilmiş anahtar
+            max_age_seconds: Bu girdi için daha kısa bir en fazla yaş (opsiyonel;
+                örn. sonucu uzak bir sistemin durumuna bağlı taramalar için)
+
+        Returns:
+            {
+                "raw_output": dict,            # Aracın ham çıktısı (None ise file_path'te)
+                "metric_result": MetricResult,
+                "file_path": str,              # İlk taramada kaydedilen sonuç dosyası
+                "created_at": float
+            }
+            veya girdi yoksa / süresi dolduysa None
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entries = self._load_entries()
+            entry = entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            age = time.time() - entry["created_at"]
+            if age > self.max_age_seconds:
+                self._remove(key)
+                self.misses += 1
+                return None
+            if max_age_seconds is not None and age >= max_age_seconds:
+                # Girdi silinmez; yeni tarama put ile üzerine yazar
+                self.misses += 1
+                return None
+
+        try:
+            with open(self._entry_path(key), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            # Bozuk veya elle silinmiş girdi
+            with self._lock:
+                self._remove(key)
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+
+        return {
+            "raw_output": data["raw_output"],
+            "metric_result": MetricResult(**data["metric_result"]),
+            "file_path": data.get("file_path"),
+            "created_at": data["created_at"]
+        }
+
+    def put(
+        self,
+        key: str,
+        raw_output: Optional[dict],
+        metric_result: MetricResult,
+        file_path: Optional[str] = None,
+        meta: Optional[dict] = None
+    ):
+        """
+        Tarama sonucunu cache'e yazar
+
+        Yazma atomiktir: önce geçici dosyaya yazılır, sonra yerine taşınır.
+
+        Args:
+            key: make_cache_key ile üretilmiş anahtar
+            raw_output: Aracın ham çıktısı (çok büyük çıktılar için None verilir;
+                ham çıktı file_path'teki sonuç dosyasından okunur)
+            metric_result: Normalize edilmiş metrik sonucu
+            file_path: results/ altındaki sonuç dosyasının yolu
+            meta: Ek bilgi (araç adı, versiyon, tree hash vb.)
+        """
+        if not self.enabled:
+            return
+
+        created_at = time.time()
+        data = {
+            "key": key,
+            "created_at": created_at,
+            "file_path": file_path,
+            "meta": meta or {},
+            "metric_result": asdict(metric_result),
+            "raw_output": raw_output
+        }
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self._entry_path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        size = os.path.getsize(self._entry_path(key))
+        with self._lock:
+            entries = self._load_entries()
+            entries[key] = {"size": size, "created_at": created_at}
+            self._evict()
+
+    def stats(self) -> dict:
+        """Cache istatistiklerini döner (hit/miss sayaçları, girdi sayısı, boyut)"""
+        with self._lock:
+            entries = self._load_entries()
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups > 0 else 0.0,
+                "evictions": self.evictions,
+                "entries": len(entries),
+                "total_bytes": sum(e["size"] for e in entries.values()),
+                "max_bytes": self.max_bytes,
+                "max_age_seconds": self.max_age_seconds
+            }
+
+    def clear(self):
+        """Tüm cache girdilerini siler"""
+        with self._lock:
+            for key in list(self._load_entries()):
+                self._remove(key)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load_entries(self) -> Dict[str, Dict[str, float]]:
+        """Cache klasörünü ilk kullanımda tarar (lock altında çağrılmalı)"""
+        if self._entries is None:
+            self._entries = {}
+            if self.cache_dir.exists():
+                for path in self.cache_dir.glob("*.json"):
+                    stat = path.stat()
+                    self._entries[path.stem] = {
+                        "size": stat.st_size,
+                        "created_at": stat.st_mtime
+                    }
+        return self._entries
+
+    def _remove(self, key: str):
+        """Girdiyi bellekten ve diskten siler (lock altında çağrılmalı)"""
+        self._load_entries().pop(key, None)
+        try:
+            os.remove(self._entry_path(key))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        """Yaşı dolan ve boyut sınırını aşan girdileri siler (lock altında çağrılmalı)"""
+        entries = self._load_entries()
+        now = time.time()
+
+        for key in [k for k, e in entries.items() if now - e["created_at"] > self.max_age_seconds]:
+            self._remove(key)
+            self.evictions += 1
+
+        total = sum(e["size"] for e in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k]["created_at"]):
+            if total <= self.max_bytes:
+                break
+            total -= entries[key]["size"]
+            self._remove(key)
+            self.evictions += 1
+
+
+# Runner'ların paylaştığı varsayılan cache
+scan_cache = ScanCache()
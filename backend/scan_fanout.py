@@ -0,0 +1,372 @@
+"""
+Paralel Tarama (Fan-out) Modülü
+
+Bu modül, birden fazla projeyi (ve birden fazla aracı) aynı anda taramak için
+kullanılır. Her tarama çoğunlukla harici bir süreç (Snyk CLI) veya HTTP
+çağrısı (DeepSource API) beklediği için thread havuzu ile paralel çalıştırmak
+toplam süreyi taramaların toplamından en uzun taramaya yaklaştırır.
+
+Proje Yapısı İçindeki Yeri:
+- backend/scan_fanout.py: Bu dosya
+- backend/app.py: /scan/<tool>/all ve /scan/all endpoint'leri (toplu veya akış halinde)
+
+Kullanım:
+    from scan_fanout import ScanTask, iter_parallel_scans, run_parallel_scans
+    tasks = [ScanTask("snyk_code", p, run_code_scan_and_save) for p in projects]
+    summary = run_parallel_scans(tasks, max_concurrency=4, timeout=300)
+    summary["results"]  # Her görev için bir sonuç (görev sırasıyla)
+    summary["timing"]   # wall-clock süre, toplam tarama süresi, hızlanma
+
+    # Sonuçlar bitme sırasıyla, oluştukça
+    for event in iter_parallel_scans(tasks):
+        ...  # "start", "result", "progress", "done"
+
+Zaman aşımı runner'lara contextvars ile iletilir: CLI çalıştıran runner'lar
+remaining_scan_seconds() ile kalan süreyi alır ve süre dolunca CLI process'ini
+öldürür (bkz. metric_runner.run_snyk_code_scan, process_profiler.profiled_run).
+Böylece zaman aşımına uğrayan tarama arka planda çalışmaya devam etmez.
+Araç eşzamanlılık slotu beklenirken (bkz. single_flight.ToolConcurrencyLimiter)
+zaman aşımı saati durur (paused_scan_deadline); sıradaki tarama süresini
+CLI başlamadan tüketmez.
+
+Environment Variables:
+    SCAN_FANOUT_CONCURRENCY: Varsayılan eşzamanlı tarama sayısı (default: 4)
+    SCAN_TIMEOUT_SECONDS: Varsayılan tarama başına zaman aşımı (default: 300)
+    SCAN_STREAM_HEARTBEAT_SECONDS: Akış modunda progress olayları arasındaki süre (default: 5)
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional
+
+SCAN_FANOUT_CONCURRENCY = int(os.getenv("SCAN_FANOUT_CONCURRENCY", "4"))
+SCAN_TIMEOUT_SECONDS = float(os.getenv("SCAN_TIMEOUT_SECONDS", "300"))
+SCAN_STREAM_HEARTBEAT_SECONDS = float(os.getenv("SCAN_STREAM_HEARTBEAT_SECONDS", "5"))
+
+# Zaman aşımı kontrolü için bekleme aralığı (saniye)
+_POLL_INTERVAL = 0.5
+
+class ScanClock:
+    """
+    Durdurulabilen zaman aşımı saati
+
+    Durdurulduğu (pause) süre geçen süreye sayılmaz. Tarama thread'i
+    durdurup başlatırken fan-out'un ana thread'i aynı anda okuyabildiği
+    için alanlar lock altında güncellenir.
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._started = time.monotonic()
+        self._paused_seconds = 0.0
+        self._paused_since = None
+        self._pause_depth = 0
+        self._lock = threading.Lock()
+
+    def pause(self):
+        with self._lock:
+            if self._pause_depth == 0:
+                self._paused_since = time.monotonic()
+            self._pause_depth += 1
+
+    def resume(self):
+        with self._lock:
+            self._pause_depth -= 1
+            if self._pause_depth == 0:
+                self._paused_seconds += time.monotonic() - self._paused_since
+                self._paused_since = None
+
+    @property
+    def paused(self) -> bool:
+        with self._lock:
+            return self._pause_depth > 0
+
+    def elapsed(self) -> float:
+        """Durdurulduğu süreler hariç geçen süre (saniye)"""
+        with self._lock:
+            now = time.monotonic()
+            paused = self._paused_seconds
+            if self._paused_since is not None:
+                paused += now - self._paused_since
+            return now - self._started - paused
+
+    def remaining(self) -> float:
+        """Zaman aşımına kalan süre (saniye, en az 0)"""
+        return max(0.0, self.timeout - self.elapsed())
+
+
+# Bu thread'de çalışan taramanın zaman aşımı saatleri (dıştan içe)
+_scan_clocks: ContextVar[tuple] = ContextVar("scan_clocks", default=())
+
+
+@contextmanager
+def scan_deadline(timeout: Optional[float]) -> Iterator[Optional[ScanClock]]:
+    """
+    Blok süresince çalışan tarama için zaman aşımı belirler
+
+    İç içe kullanılırsa daha erken biten süre geçerlidir.
+
+    Args:
+        timeout: Şu andan itibaren izin verilen süre (saniye, None ise sınırsız)
+
+    Yields:
+        Bloğun ScanClock'u (timeout None ise None)
+    """
+    if timeout is None:
+        yield None
+        return
+    clock = ScanClock(timeout)
+    token = _scan_clocks.set(_scan_clocks.get() + (clock,))
+    try:
+        yield clock
+    finally:
+        _scan_clocks.reset(token)
+
+
+@contextmanager
+def paused_scan_deadline():
+    """Blok süresince (örn. araç slotu beklenirken) aktif zaman aşımı saatlerini durdurur"""
+    clocks = _scan_clocks.get()
+    for clock in clocks:
+        clock.pause()
+    try:
+        yield
+    finally:
+        for clock in clocks:
+            clock.resume()
+
+
+def remaining_scan_seconds() -> Optional[float]:
+    """Aktif taramanın zaman aşımına kalan süresi (saniye, en az 0; sınır yoksa None)"""
+    clocks = _scan_clocks.get()
+    if not clocks:
+        return None
+    return min(clock.remaining() for clock in clocks)
+
+
+@dataclass
+class ScanTask:
+    """
+    Paralel çalıştırılacak tek bir tarama
+
+    Attributes:
+        tool: Araç adı (örn: "snyk_code", "deepsource")
+        project: Proje adı
+        runner: Taramayı yapan fonksiyon (project adını argüman olarak alır)
+    """
+    tool: str
+    project: str
+    runner: Callable[[str], dict]
+
+
+def iter_parallel_scans(
+    tasks: List[ScanTask],
+    max_concurrency: int = SCAN_FANOUT_CONCURRENCY,
+    timeout: float = SCAN_TIMEOUT_SECONDS,
+    heartbeat: float = SCAN_STREAM_HEARTBEAT_SECONDS
+) -> Iterator[Dict]:
+    """
+    Görevleri sınırlı eşzamanlılıkla paralel çalıştırır, olayları oluştukça üretir
+
+    Zaman aşımı her tarama için ayrı ayrı, taramanın başladığı andan itibaren
+    ölçülür; fan-out kuyruğunda ve araç eşzamanlılık slotu için beklenen süre
+    dahil değildir (bkz. paused_scan_deadline). Zaman aşımına uğrayan
+    tarama için başarısız bir sonuç döner. Süre runner'a da iletilir (bkz.
+    scan_deadline): runner'ın çalıştırdığı CLI süre dolunca öldürülür, thread
+    kısa sürede biter ve sonucu yok sayılır.
+
+    Generator erken kapatılırsa (örn. istemci bağlantıyı kestiyse) henüz
+    başlamamış taramalar iptal edilir.
+
+    Args:
+        tasks: Çalıştırılacak taramalar
+        max_concurrency: Aynı anda çalışabilecek en fazla tarama sayısı
+        timeout: Tarama başına zaman aşımı (saniye)
+        heartbeat: Hiçbir tarama bitmezse "progress" olayları arasındaki süre
+            (saniye, 0 ise progress olayı üretilmez)
+
+    Yields:
+        {"event": "start", "total", "max_concurrency", "timeout_seconds"}
+        {"event": "result", "index", "completed", "total", "result"}
+            (görev bitme sırasıyla; index görevin listedeki sırası)
+        {"event": "progress", "completed", "running", "queued", "total", "elapsed_seconds"}
+        {"event": "done", "total", "succeeded", "failed", "timing"}
+            (timing: run_parallel_scans ile aynı)
+    """
+    # durations worker thread'leri tarafından, measured ana thread tarafından yazılır
+    durations: List[float] = [0.0] * len(tasks)
+    measured: List[float] = [0.0] * len(tasks)
+    clocks: Dict[int, ScanClock] = {}
+    started_lock = threading.Lock()
+
+    def _run(index: int, task: ScanTask) -> dict:
+        with scan_deadline(timeout) as clock:
+            with started_lock:
+                clocks[index] = clock
+            try:
+                result = task.runner(task.project)
+            except Exception as e:
+                result = {"success": False, "project": task.project, "error": str(e)}
+        durations[index] = clock.elapsed()
+        return result
+
+    def _progress() -> Dict:
+        # Araç slotu bekleyen taramalar kuyrukta sayılır
+        with started_lock:
+            started = list(clocks.values())
+        waiting = sum(1 for clock in started if clock.paused)
+        running = max(0, len(started) - waiting - completed)
+        return {
+            "event": "progress",
+            "completed": completed,
+            "running": running,
+            "queued": len(tasks) - completed - running,
+            "total": len(tasks),
+            "elapsed_seconds": time.monotonic() - wall_start
+        }
+
+    wall_start = time.monotonic()
+    completed = 0
+    succeeded = 0
+    yield {
+        "event": "start",
+        "total": len(tasks),
+        "max_concurrency": max_concurrency,
+        "timeout_seconds": timeout
+    }
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, max_concurrency),
+        thread_name_prefix="scan-fanout"
+    )
+
+    try:
+        futures = {
+            executor.submit(_run, index, task): index
+            for index, task in enumerate(tasks)
+        }
+        pending = set(futures)
+        last_event = time.monotonic()
+
+        while pending:
+            # En yakın zaman aşımına (veya heartbeat'e) kadar, en fazla _POLL_INTERVAL bekle
+            with started_lock:
+                running = [clocks[futures[future]] for future in pending if futures[future] in clocks]
+            deadlines = [time.monotonic() + clock.remaining() for clock in running if not clock.paused]
+            if heartbeat > 0:
+                deadlines.append(last_event + heartbeat)
+            poll = _POLL_INTERVAL
+            if deadlines:
+                poll = min(poll, max(0.0, min(deadlines) - time.monotonic()))
+
+            done, pending = wait(pending, timeout=poll, return_when=FIRST_COMPLETED)
+
+            finished = []
+            for future in done:
+                index = futures[future]
+                measured[index] = durations[index]
+                finished.append((index, _with_task_fields(future.result(), tasks[index], measured[index])))
+
+            # Başlamış ama süresi dolmuş taramaları zaman aşımı olarak işaretle
+            with started_lock:
+                expired = [
+                    future for future in pending
+                    if futures[future] in clocks and clocks[futures[future]].remaining() <= 0
+                ]
+            for future in expired:
+                index = futures[future]
+                pending.discard(future)
+                measured[index] = timeout
+                finished.append((index, _with_task_fields({
+                    "success": False,
+                    "project": tasks[index].project,
+                    "error": f"Scan timeout (exceeded {timeout:g} seconds)"
+                }, tasks[index], timeout)))
+
+            for index, result in finished:
+                completed += 1
+                succeeded += 1 if result.get("success") else 0
+                yield {
+                    "event": "result",
+                    "index": index,
+                    "completed": completed,
+                    "total": len(tasks),
+                    "result": result
+                }
+                last_event = time.monotonic()
+
+            if pending and heartbeat > 0 and time.monotonic() - last_event >= heartbeat:
+                yield _progress()
+                last_event = time.monotonic()
+    finally:
+        # Zaman aşımına uğrayan thread'leri beklemeden dön
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    wall_clock = time.monotonic() - wall_start
+    summed = sum(measured)
+
+    yield {
+        "event": "done",
+        "total": len(tasks),
+        "succeeded": succeeded,
+        "failed": len(tasks) - succeeded,
+        "timing": {
+            "wall_clock_seconds": wall_clock,
+            "summed_scan_seconds": summed,
+            "speedup": summed / wall_clock if wall_clock > 0 else 0.0,
+            "max_concurrency": max_concurrency,
+            "timeout_seconds": timeout
+        }
+    }
+
+
+def run_parallel_scans(
+    tasks: List[ScanTask],
+    max_concurrency: int = SCAN_FANOUT_CONCURRENCY,
+    timeout: float = SCAN_TIMEOUT_SECONDS
+) -> Dict:
+    """
+    Görevleri paralel çalıştırır ve tüm sonuçları birlikte döner
+
+    Tüm taramalar bitene kadar bekler (bkz. iter_parallel_scans).
+
+    Args:
+        tasks: Çalıştırılacak taramalar
+        max_concurrency: Aynı anda çalışabilecek en fazla tarama sayısı
+        timeout: Tarama başına zaman aşımı (saniye)
+
+    Returns:
+        {
+            "results": [...],  # Her görev için runner sonucu (görev sırasıyla)
+            "timing": {
+                "wall_clock_seconds": float,   # Toplam geçen süre
+                "summed_scan_seconds": float,  # Tarama sürelerinin toplamı
+                "speedup": float,              # summed / wall_clock
+                "max_concurrency": int,
+                "timeout_seconds": float
+            }
+        }
+    """
+    results: List[dict] = [None] * len(tasks)
+    timing = None
+    for event in iter_parallel_scans(tasks, max_concurrency, timeout, heartbeat=0):
+        if event["event"] == "result":
+            results[event["index"]] = event["result"]
+        elif event["event"] == "done":
+            timing = event["timing"]
+
+    return {"results": results, "timing": timing}
+
+
+def _with_task_fields(result: dict, task: ScanTask, duration: float) -> dict:
+    """Runner sonucuna araç adını ve ölçülen tarama süresini ekler"""
+    result = dict(result)
+    result.setdefault("project", task.project)
+    result["tool"] = task.tool
+    result["scan_seconds"] = duration
+    return result
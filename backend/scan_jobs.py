@@ -0,0 +1,255 @@
+"""
+Scan Job Queue Modülü
+
+Bu modül, Snyk Code ve DeepSource taramalarını Flask request thread'inden
+ayırmak için asenkron bir iş (job) kuyruğu sağlar. POST endpoint'leri
+taramayı kuyruğa ekler ve hemen bir job id döner; tarama sınırlı sayıda
+worker thread'i olan bir havuzda çalışır.
+
+Proje Yapısı İçindeki Yeri:
+- backend/scan_jobs.py: Bu dosya
+- backend/app.py: /scan/code, /scan/deepsource ve /jobs endpoint'leri
+- backend/metric_runner.py, backend/deepsource_runner.py: Job'ların çalıştırdığı runner'lar
+
+Job Durumları:
+- queued: Kuyrukta, worker bekliyor
+- running: Worker tarafından çalıştırılıyor
+- done: Tarama başarıyla tamamlandı
+- failed: Tarama hata ile sonuçlandı
+
+Kullanım:
+    from scan_jobs import ScanJobQueue
+    queue = ScanJobQueue(max_workers=4)
+    job = queue.submit("snyk_code", "flask_demo", run_code_scan_and_save)
+    queue.get(job.job_id).to_dict()
+
+Environment Variables:
+    SCAN_MAX_WORKERS: Aynı anda çalışabilecek tarama sayısı (default: 4)
+    SCAN_MAX_PENDING_JOBS: Kuyrukta bekleyebilecek en fazla job sayısı (default: 100)
+    SCAN_JOB_HISTORY_LIMIT: Bellekte tutulan bitmiş job sayısı (default: 500)
+"""
+
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+# Worker havuzu ve kuyruk sınırları
+SCAN_MAX_WORKERS = int(os.getenv("SCAN_MAX_WORKERS", "4"))
+SCAN_MAX_PENDING_JOBS = int(os.getenv("SCAN_MAX_PENDING_JOBS", "100"))
+SCAN_JOB_HISTORY_LIMIT = int(os.getenv("SCAN_JOB_HISTORY_LIMIT", "500"))
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+
+class QueueFullError(RuntimeError):
+    """Kuyrukta bekleyen job sayısı sınırı aşıldığında fırlatılır"""
+
+
+@dataclass
+class ScanJob:
+    """
+    Tek bir tarama işinin durumu
+
+    Attributes:
+        job_id: Benzersiz job kimliği
+        tool: Araç adı (örn: "snyk_code", "deepsource")
+        project: Taranan proje adı
+        status: queued, running, done veya failed
+        created_at: Kuyruğa eklenme zamanı (epoch saniye)
+        started_at: Çalışmaya başlama zamanı (epoch saniye)
+        finished_at: Bitiş zamanı (epoch saniye)
+        result: Runner'ın döndürdüğü sonuç dict'i
+        error: Hata mesajı (varsa)
+    """
+    job_id: str
+    tool: str
+    project: str
+    status: str = JOB_QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[dict] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Job'ı API response'u için dict'e çevirir"""
+        # status en son güncellenen alandır (bkz. ScanJobQueue._run_job); önce
+        # okunursa diğer alanlar en az onun kadar günceldir
+        status = self.status
+        queue_seconds = None
+        run_seconds = None
+        if self.started_at is not None:
+            queue_seconds = self.started_at - self.created_at
+            if self.finished_at is not None:
+                run_seconds = self.finished_at - self.started_at
+
+        data = {
+            "job_id": self.job_id,
+            "tool": self.tool,
+            "project": self.project,
+            "status": status,
+            "timings": {
+                "created_at": _format_timestamp(self.created_at),
+                "started_at": _format_timestamp(self.started_at),
+                "finished_at": _format_timestamp(self.finished_at),
+                "queue_seconds": queue_seconds,
+                "run_seconds": run_seconds
+            }
+        }
+
+        if status == JOB_DONE and self.result:
+            data["file_path"] = self.result.get("file_path")
+            data["metrics"] = self.result.get("metric_result")
+            data["cached"] = self.result.get("cached", False)
+            if "profile" in self.result:
+                data["profile"] = self.result["profile"]
+        if self.error:
+            data["error"] = self.error
+
+        return data
+
+
+def _format_timestamp(value: Optional[float]) -> Optional[str]:
+    """Epoch saniyeyi ISO formatına çevirir"""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value).isoformat(timespec="milliseconds")
+
+
+class ScanJobQueue:
+    """
+    Sınırlı worker havuzu ile çalışan tarama kuyruğu
+
+    Runner fonksiyonları (run_code_scan_and_save, run_deepsource_scan_and_save)
+    {"success": bool, ...} formatında dict döner. Job, success alanına göre
+    done veya failed durumuna geçer.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = SCAN_MAX_WORKERS,
+        max_pending: int = SCAN_MAX_PENDING_JOBS,
+        history_limit: int = SCAN_JOB_HISTORY_LIMIT
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.history_limit = history_limit
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="scan-job"
+        )
+        self._jobs: "OrderedDict[str, ScanJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, tool: str, project: str, runner: Callable[..., dict], **runner_kwargs) -> ScanJob:
+        """
+        Yeni bir tarama job'ı oluşturur ve kuyruğa ekler
+
+        Args:
+            tool: Araç adı
+            project: Proje adı
+            runner: Taramayı yapan fonksiyon (project adını ilk argüman olarak alır)
+            **runner_kwargs: Runner'a iletilecek ek argümanlar
+
+        Returns:
+            ScanJob: Oluşturulan job (status: queued)
+
+        Raises:
+            QueueFullError: Bekleyen job sayısı sınırı aşıldıysa
+        """
+        job = ScanJob(job_id=uuid.uuid4().hex, tool=tool, project=project)
+
+        with self._lock:
+            if self._count_pending() >= self.max_pending:
+                raise QueueFullError(
+                    f"Scan queue is full ({self.max_pending} pending jobs)"
+                )
+            self._jobs[job.job_id] = job
+            self._trim_history()
+
+        self._executor.submit(self._run_job, job, runner, runner_kwargs)
+        return job
+
+    def _run_job(self, job: ScanJob, runner: Callable[..., dict], runner_kwargs: dict):
+        """
+        Worker thread'inde job'ı çalıştırır ve durumunu günceller
+
+        Durum alanları lock altında güncellenir ve status en son değişir;
+        böylece status'u done/failed gören okuyucu result, error ve
+        finished_at'i de dolu görür.
+        """
+        with self._lock:
+            job.started_at = time.time()
+            job.status = JOB_RUNNING
+
+        try:
+            result = runner(job.project, **runner_kwargs)
+        except Exception as e:
+            # Runner'lar normalde exception yakalar, yine de job'ı kaybetmeyelim
+            result = {"success": False, "project": job.project, "error": str(e)}
+
+        with self._lock:
+            job.result = result
+            if not result.get("success"):
+                job.error = result.get("error", "Scan failed")
+            job.finished_at = time.time()
+            job.status = JOB_DONE if result.get("success") else JOB_FAILED
+
+    def get(self, job_id: str) -> Optional[ScanJob]:
+        """Job id'ye göre job'ı döner (yoksa None)"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self, status: Optional[str] = None, limit: Optional[int] = None) -> List[ScanJob]:
+        """
+        Job'ları en yeniden eskiye doğru listeler
+
+        Args:
+            status: Sadece bu durumdaki job'lar (opsiyonel)
+            limit: En fazla dönecek job sayısı (opsiyonel)
+        """
+        with self._lock:
+            jobs = list(reversed(self._jobs.values()))
+
+        if status:
+            jobs = [job for job in jobs if job.status == status]
+        if limit is not None:
+            jobs = jobs[:limit]
+        return jobs
+
+    def stats(self) -> Dict[str, int]:
+        """Durumlara göre job sayılarını döner"""
+        counts = {JOB_QUEUED: 0, JOB_RUNNING: 0, JOB_DONE: 0, JOB_FAILED: 0}
+        with self._lock:
+            for job in self._jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+        return counts
+
+    def _count_pending(self) -> int:
+        """Henüz bitmemiş job sayısı (lock altında çağrılmalı)"""
+        return sum(
+            1 for job in self._jobs.values()
+            if job.status in (JOB_QUEUED, JOB_RUNNING)
+        )
+
+    def _trim_history(self):
+        """Bitmiş job'ların en eskilerini siler (lock altında çağrılmalı)"""
+        finished = [
+            job_id for job_id, job in self._jobs.items()
+            if job.status in (JOB_DONE, JOB_FAILED)
+        ]
+        for job_id in finished[:max(0, len(finished) - self.history_limit)]:
+            del self._jobs[job_id]
+
+    def shutdown(self, wait: bool = True):
+        """Worker havuzunu kapatır"""
+        self._executor.shutdown(wait=wait)
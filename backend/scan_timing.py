@@ -0,0 +1,159 @@
+"""
+Tarama Süresi Ölçümü (Scan Timing) Modülü
+
+Bu modül, runner'ların bir taramanın fazlarını monotonic saatle
+(time.perf_counter) ölçmesini sağlar. Böylece sürenin araca mı (CLI/API)
+yoksa kendi pipeline'ımıza mı (parse, normalizasyon, kayıt) gittiği
+ayrılabilir.
+
+Fazlar:
+- spawn: CLI process'inin başlatılması (Popen)
+- tool: Aracın çalışması (CLI'ın bitmesi / GraphQL isteklerinin cevabı)
+- parse: Araç çıktısının JSON olarak okunması
+- prepare: Incremental taramada parmak izi, staging ve sonuç birleştirme
+- normalize: Çıktının MetricResult'a çevrilmesi
+- persist: Sonuç dosyası, sonuç index'i ve cache kaydı
+
+Fazlar iç içe açılabilir; her faz sadece kendi süresini (self time) alır,
+içindeki fazların süresi ondan düşülür. Örneğin runner bir taramayı "tool"
+fazında çağırır, CLI'ın parse edilmesi içerde "parse" fazında ölçülürse
+"tool" fazına parse süresi dahil edilmez. Fazların toplamı böylece ölçülen
+toplam süreyi aşmaz.
+
+Aktif ölçüm contextvars ile tutulur: runner ScanTimer.activate() ile ölçümü
+açar; profiled_run ve GraphQL sayfalama gibi alt fonksiyonlar imzaları
+değişmeden scan_phase() ile faz ekler. Aktif ölçüm yoksa scan_phase()
+hiçbir şey yapmaz. Ölçüm thread'e özeldir (yeni thread'ler ölçümü görmez).
+
+Not: Akış halinde taramada (bkz. metric_runner.stream_snyk_code_scan)
+parse ve normalizasyon CLI çalışırken aynı anda yapılır; bu süre "tool"
+fazına dahildir.
+
+Proje Yapısı İçindeki Yeri:
+- backend/scan_timing.py: Bu dosya
+- backend/metric_runner.py, backend/deepsource_runner.py: Taramaları fazlara ayırarak ölçer
+- backend/process_profiler.py: CLI'ın spawn ve tool fazlarını ölçer
+- backend/metrics/result_model.py: MetricResult.timings alanı
+
+Kullanım:
+    from scan_timing import ScanTimer, scan_phase
+    timer = ScanTimer()
+    with timer.activate():
+        with scan_phase("tool"):
+            raw_output = run_snyk_code_scan(path)
+        with scan_phase("normalize"):
+            metric_result = SnykMetrics().calculate(raw_output)
+    metric_result.timings = timer.to_dict()
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+# Faz adları
+PHASE_SPAWN = "spawn"
+PHASE_TOOL = "tool"
+PHASE_PARSE = "parse"
+PHASE_PREPARE = "prepare"
+PHASE_NORMALIZE = "normalize"
+PHASE_PERSIST = "persist"
+
+# Aracın kendisine ait fazlar; geri kalanı pipeline'ımıza aittir
+TOOL_PHASES = (PHASE_SPAWN, PHASE_TOOL)
+PIPELINE_PHASES = (PHASE_PARSE, PHASE_PREPARE, PHASE_NORMALIZE, PHASE_PERSIST)
+
+# Süreler bu kadar ondalık basamağa yuvarlanır (mikrosaniye)
+_PRECISION = 6
+
+_active_timer: ContextVar[Optional["ScanTimer"]] = ContextVar("active_scan_timer", default=None)
+
+
+class ScanTimer:
+    """
+    Bir taramanın fazlarının süresini (saniye) toplar
+
+    Aynı faz birden fazla kez açılırsa (örn. birden fazla CLI çağrısı)
+    süreleri toplanır.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self._started = clock()
+        self._phases: Dict[str, float] = {}
+        # Açık fazların içindeki fazlara harcanan süre (self time için)
+        self._child_seconds: List[float] = []
+
+    @contextmanager
+    def phase(self, name: str):
+        """Blok süresini faza ekler (iç içe fazların süresi düşülür)"""
+        self._child_seconds.append(0.0)
+        started = self._clock()
+        try:
+            yield
+        finally:
+            elapsed = self._clock() - started
+            children = self._child_seconds.pop()
+            self.add(name, elapsed - children)
+            if self._child_seconds:
+                self._child_seconds[-1] += elapsed
+
+    def add(self, name: str, seconds: float):
+        """Başka yoldan ölçülmüş süreyi faza ekler"""
+        self._phases[name] = self._phases.get(name, 0.0) + max(seconds, 0.0)
+
+    @contextmanager
+    def activate(self):
+        """Blok süresince bu ölçümü scan_phase() için aktif yapar"""
+        token = _active_timer.set(self)
+        try:
+            yield self
+        finally:
+            _active_timer.reset(token)
+
+    def seconds(self, *names: str) -> float:
+        """Verilen fazların toplam süresi"""
+        return sum(self._phases.get(name, 0.0) for name in names)
+
+    def tool_seconds(self) -> float:
+        """Aracın çalışma süresi (spawn + tool)"""
+        return self.seconds(*TOOL_PHASES)
+
+    def total_seconds(self) -> float:
+        """Ölçüm başlangıcından bu yana geçen süre"""
+        return self._clock() - self._started
+
+    def to_dict(self) -> dict:
+        """
+        Süre dökümü
+
+        Returns:
+            {
+                "phases": {faz: saniye} (sadece ölçülen fazlar),
+                "tool_seconds": spawn + tool,
+                "pipeline_seconds": parse + prepare + normalize + persist,
+                "total_seconds": Ölçüm başlangıcından bu yana geçen süre
+            }
+        """
+        return {
+            "phases": {name: round(seconds, _PRECISION) for name, seconds in self._phases.items()},
+            "tool_seconds": round(self.tool_seconds(), _PRECISION),
+            "pipeline_seconds": round(self.seconds(*PIPELINE_PHASES), _PRECISION),
+            "total_seconds": round(self.total_seconds(), _PRECISION)
+        }
+
+
+def current_timer() -> Optional[ScanTimer]:
+    """Bu thread'de aktif olan ölçüm (yoksa None)"""
+    return _active_timer.get()
+
+
+@contextmanager
+def scan_phase(name: str):
+    """Aktif ölçüm varsa blok süresini faza ekler, yoksa hiçbir şey yapmaz"""
+    timer = _active_timer.get()
+    if timer is None:
+        yield
+        return
+    with timer.phase(name):
+        yield
@@ -0,0 +1,233 @@
+"""
+Tarama Birleştirme (Single-Flight) ve Araç Eşzamanlılık Sınırı Modülü
+
+Bu modül iki şey sağlar:
+
+1. SingleFlight: Aynı anahtarla aynı anda başlatılan işleri tek bir
+   çalıştırmada birleştirir. İlk gelen çağrı (lider) işi çalıştırır; iş
+   sürerken aynı anahtarla gelen çağrılar bekler ve liderin sonucunu (veya
+   hatasını) alır. Runner'lar anahtar olarak tarama cache anahtarını (araç +
+   versiyon + proje ağacı hash'i) kullanır; böylece aynı anda gelen iki
+   POST /scan/code isteği tek bir Snyk CLI process'i çalıştırır ve tek bir
+   sonuç dosyası yazar. İş bittiğinde anahtar silinir; sonraki çağrılar
+   tarama cache'inden döner.
+
+2. ToolConcurrencyLimiter: Araç bazında aynı anda çalışan tarama sayısını
+   sınırlar (Snyk CLI'ı veya DeepSource API kotasını aşırı yüklememek için).
+   Sınıra ulaşıldığında yeni taramalar sıra bekler. Sırada beklenen süre
+   fan-out taramasının zaman aşımına sayılmaz (bkz. scan_fanout.paused_scan_deadline).
+
+Proje Yapısı İçindeki Yeri:
+- backend/single_flight.py: Bu dosya
+- backend/metric_runner.py, backend/deepsource_runner.py: Taramaları birleştirir ve sınırlar
+- backend/app.py: /stats/concurrency endpoint'i
+
+Kullanım:
+    from single_flight import scan_flights, tool_limiter
+    result, shared = scan_flights.run(cache_key, lambda: scan(...))
+    with tool_limiter.limit("snyk_code"):
+        ...
+
+Environment Variables:
+    SCAN_TOOL_CONCURRENCY: Araç bazında sınırlar, örn. "snyk_code=2,deepsource=4"
+        (0 sınırsız demektir; verilmeyen araçlar için DEFAULT_TOOL_CONCURRENCY)
+    SCAN_TOOL_DEFAULT_CONCURRENCY: Listede olmayan araçların sınırı (default: 2)
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Tuple
+
+from scan_fanout import paused_scan_deadline
+
+SCAN_TOOL_CONCURRENCY = os.getenv("SCAN_TOOL_CONCURRENCY", "")
+SCAN_TOOL_DEFAULT_CONCURRENCY = int(os.getenv("SCAN_TOOL_DEFAULT_CONCURRENCY", "2"))
+
+# Yerleşik araçların varsayılan sınırları: Snyk CLI CPU/bellek yoğun,
+# DeepSource çağrıları çoğunlukla HTTP bekler
+DEFAULT_TOOL_CONCURRENCY = {"snyk_code": 2, "deepsource": 4}
+
+
+def parse_tool_limits(value: str) -> Dict[str, int]:
+    """
+    "araç=sınır,araç=sınır" biçimindeki değeri okur
+
+    Raises:
+        ValueError: Girdi "araç=tam sayı" biçiminde değilse veya sınır negatifse
+    """
+    limits = {}
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        tool, separator, limit = item.partition("=")
+        if not separator or not tool.strip():
+            raise ValueError(f"Invalid tool concurrency '{item}', expected 'tool=limit'")
+        limit = int(limit)
+        if limit < 0:
+            raise ValueError(f"Tool concurrency must not be negative: '{item}'")
+        limits[tool.strip()] = limit
+    return limits
+
+
+# ============================================
+# SINGLE-FLIGHT
+# ============================================
+
+class _Flight:
+    """Süren tek bir çalıştırma; bekleyenler done event'ini bekler"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Aynı anahtarlı eşzamanlı çağrıları tek çalıştırmada birleştirir
+
+    Sonuçlar iş bittikten sonra saklanmaz (cache değildir); sadece iş
+    sürerken gelen çağrılar sonucu paylaşır.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.shared = 0
+
+    def run(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Anahtar için süren bir iş varsa onun sonucunu bekler, yoksa fn'i çalıştırır
+
+        Args:
+            key: Birleştirme anahtarı (örn. tarama cache anahtarı)
+            fn: Argümansız iş fonksiyonu
+
+        Returns:
+            (sonuç, paylaşıldı mı): Başka bir çağrının sonucu alındıysa True
+
+        Raises:
+            Liderin fırlattığı hata, bekleyen tüm çağrılarda da fırlatılır
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+                self.executions += 1
+            else:
+                flight.waiters += 1
+                self.shared += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        try:
+            flight.result = fn()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result, False
+
+    def in_flight(self) -> int:
+        """Şu anda süren iş sayısı"""
+        with self._lock:
+            return len(self._flights)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "in_flight": len(self._flights),
+                "waiting": sum(flight.waiters for flight in self._flights.values()),
+                "executions": self.executions,
+                "shared": self.shared
+            }
+
+
+# ============================================
+# ARAÇ EŞZAMANLILIK SINIRI
+# ============================================
+
+class ToolConcurrencyLimiter:
+    """
+    Araç bazında eşzamanlı tarama sınırı
+
+    Her araç için bir semaphore tutulur; sınırı 0 olan araçlar sınırlanmaz.
+    """
+
+    def __init__(self, limits: Dict[str, int] = None, default_limit: int = None):
+        if limits is None:
+            limits = dict(DEFAULT_TOOL_CONCURRENCY, **parse_tool_limits(SCAN_TOOL_CONCURRENCY))
+        self.limits = dict(limits)
+        self.default_limit = SCAN_TOOL_DEFAULT_CONCURRENCY if default_limit is None else default_limit
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._active: Dict[str, int] = {}
+        self._waiting: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def limit_for(self, tool: str) -> int:
+        return self.limits.get(tool, self.default_limit)
+
+    def _semaphore(self, tool: str):
+        with self._lock:
+            if tool not in self._semaphores:
+                limit = self.limit_for(tool)
+                self._semaphores[tool] = threading.BoundedSemaphore(limit) if limit > 0 else None
+            return self._semaphores[tool]
+
+    def _count(self, table: Dict[str, int], tool: str, delta: int):
+        with self._lock:
+            table[tool] = table.get(tool, 0) + delta
+
+    @contextmanager
+    def limit(self, tool: str):
+        """
+        Aracın boş bir tarama slotu olana kadar bekler, blok süresince slotu tutar
+
+        Beklerken taramanın zaman aşımı saati durur; süre slot alındığında işlemeye devam eder.
+        """
+        semaphore = self._semaphore(tool)
+        if semaphore is not None:
+            self._count(self._waiting, tool, 1)
+            try:
+                with paused_scan_deadline():
+                    semaphore.acquire()
+            finally:
+                self._count(self._waiting, tool, -1)
+        self._count(self._active, tool, 1)
+        try:
+            yield
+        finally:
+            self._count(self._active, tool, -1)
+            if semaphore is not None:
+                semaphore.release()
+
+    def stats(self) -> dict:
+        """Araç bazında sınır, çalışan ve sıra bekleyen tarama sayıları"""
+        with self._lock:
+            tools = sorted(set(self.limits) | set(self._active) | set(self._waiting))
+            return {
+                tool: {
+                    "limit": self.limit_for(tool),
+                    "active": self._active.get(tool, 0),
+                    "waiting": self._waiting.get(tool, 0)
+                }
+                for tool in tools
+            }
+
+
+# Runner'ların paylaştığı örnekler
+scan_flights = SingleFlight()
+tool_limiter = ToolConcurrencyLimiter()
@@ -0,0 +1,388 @@
+"""
+Kaynak Kod Sayımı (Source Census) Modülü
+
+Bu modül, bir projenin dosya ve satır sayılarını dil ve uzantı bazında
+çıkarır. AdvancedMetricsCalculator.calculate_code_coverage bu sayıları
+payda olarak kullanır; böylece kod kapsama oranı %0/%100 yerine
+"aracın analiz ettiği dosyalar / projedeki kaynak dosyalar" olarak hesaplanır.
+
+Sayım:
+- Klasörler os.scandir ile gezilir; IGNORED_DIRS ve projenin kökündeki
+  .gitignore / .dcignore (Snyk Code'un kullandığı) kuralları uygulanır
+- Satırlar bir thread havuzunda sayılır; küçük dosyalar tek read() ile,
+  büyük dosyalar SOURCE_CENSUS_CHUNK_SIZE'lık bloklarla okunur
+- Binary dosyalar (ilk 8 KB'ta NUL byte) dosya olarak sayılır, satırları sayılmaz
+
+Sonuçlar proje ağacı hash'ine (project_tree.compute_tree_hash) göre hem
+bellekte hem de SOURCE_CENSUS_CACHE_DIR altında JSON olarak saklanır;
+değişmemiş bir proje için sayım tekrar yapılmaz.
+
+Proje Yapısı İçindeki Yeri:
+- backend/source_census.py: Bu dosya
+- backend/project_tree.py: Ağaç hash'i ve IGNORED_DIRS
+- backend/project_catalog.py: Dil tespiti ve satır sayımı için kullanır
+- backend/metrics/advanced_metrics.py: Kod kapsama oranı için kullanır
+
+Kullanım:
+    from source_census import census_project
+    census = census_project("../test_projects/flask_demo")
+    print(census.source_files, census.source_lines, census.languages)
+
+Environment Variables:
+    SOURCE_CENSUS_CACHE_DIR: Sayım cache klasörü (default: ../results/.census)
+    SOURCE_CENSUS_WORKERS: Satır sayan thread sayısı (default: 4 x CPU, en fazla 32)
+"""
+
+import fnmatch
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from project_tree import IGNORED_DIRS, compute_tree_hash
+
+SOURCE_CENSUS_CACHE_DIR = os.getenv("SOURCE_CENSUS_CACHE_DIR", "../results/.census")
+SOURCE_CENSUS_WORKERS = int(os.getenv("SOURCE_CENSUS_WORKERS", str(min(32, (os.cpu_count() or 1) * 4))))
+
+# Bu boyuttan büyük dosyalar bloklar halinde okunur
+SOURCE_CENSUS_CHUNK_SIZE = 1024 * 1024
+
+# Binary dosya kontrolü için bakılan ilk byte sayısı (git ile aynı)
+_BINARY_CHECK_BYTES = 8000
+
+# Bellekte tutulan en fazla sayım sayısı
+_MEMORY_CACHE_SIZE = 128
+
+# Kök klasörde okunan ignore dosyaları
+IGNORE_FILES = (".gitignore", ".dcignore")
+
+# Dosya uzantısı -> dil
+LANGUAGE_EXTENSIONS = {
+    ".py": "Python",
+    ".js": "JavaScript", ".mjs": "JavaScript", ".cjs": "JavaScript", ".jsx": "JavaScript",
+    ".ts": "TypeScript", ".tsx": "TypeScript",
+    ".java": "Java", ".kt": "Kotlin", ".go": "Go", ".rb": "Ruby", ".php": "PHP",
+    ".cs": "C#", ".c": "C", ".h": "C", ".cpp": "C++", ".cc": "C++", ".hpp": "C++",
+    ".rs": "Rust", ".swift": "Swift", ".scala": "Scala",
+    ".html": "HTML", ".htm": "HTML", ".css": "CSS", ".scss": "CSS",
+    ".sh": "Shell", ".sql": "SQL",
+    ".json": "JSON", ".yml": "YAML", ".yaml": "YAML", ".xml": "XML", ".md": "Markdown"
+}
+
+# Uzantısız, adıyla tanınan dosyalar
+LANGUAGE_FILENAMES = {"Dockerfile": "Dockerfile", "Makefile": "Makefile"}
+
+# Kaynak kod sayılmayan diller (veri/doküman formatları ve bilinmeyenler)
+NON_SOURCE_LANGUAGES = {"JSON", "YAML", "XML", "Markdown", "Other"}
+
+
+def detect_language(relative_path: str) -> str:
+    """Dosyanın dilini adından/uzantısından belirler (bilinmiyorsa "Other")"""
+    name = relative_path.rsplit("/", 1)[-1]
+    if name in LANGUAGE_FILENAMES:
+        return LANGUAGE_FILENAMES[name]
+    return LANGUAGE_EXTENSIONS.get(os.path.splitext(name)[1].lower(), "Other")
+
+
+def count_lines(path: str, size: int = None) -> int:
+    """
+    Metin dosyasının satır sayısı (binary dosyalar için 0)
+
+    Son satır newline ile bitmese de sayılır.
+
+    Args:
+        path: Dosya yolu
+        size: Dosya boyutu (biliniyorsa; küçük dosyalar tek seferde okunur)
+    """
+    with open(path, "rb") as f:
+        if size is not None and size <= SOURCE_CENSUS_CHUNK_SIZE:
+            data = f.read()
+            if b"\0" in data[:_BINARY_CHECK_BYTES]:
+                return 0
+            return data.count(b"\n") + (1 if data and not data.endswith(b"\n") else 0)
+
+        lines = 0
+        last_byte = b"\n"
+        first = True
+        for chunk in iter(lambda: f.read(SOURCE_CENSUS_CHUNK_SIZE), b""):
+            if first and b"\0" in chunk[:_BINARY_CHECK_BYTES]:
+                return 0
+            first = False
+            lines += chunk.count(b"\n")
+            last_byte = chunk[-1:]
+    return lines + (0 if last_byte == b"\n" else 1)
+
+
+# ============================================
+# IGNORE KURALLARI
+# ============================================
+
+class IgnoreRules:
+    """
+    .gitignore sözdiziminin sade bir alt kümesi
+
+    Desteklenenler: glob desenleri, "/" ile başlayan (köke bağlı) desenler,
+    "/" ile biten (sadece klasör) desenler ve "**". "!" ile başlayan
+    istisna desenleri desteklenmez ve atlanır.
+    """
+
+    def __init__(self, patterns: List[str] = None):
+        self.rules = []   # (desen, köke bağlı mı, sadece klasör mü)
+        for pattern in patterns or []:
+            pattern = pattern.strip()
+            if not pattern or pattern.startswith("#") or pattern.startswith("!"):
+                continue
+            directory_only = pattern.endswith("/")
+            pattern = pattern.rstrip("/")
+            anchored = "/" in pattern
+            self.rules.append((pattern.lstrip("/"), anchored, directory_only))
+
+    @classmethod
+    def from_project(cls, root: str) -> "IgnoreRules":
+        """Projenin kökündeki IGNORE_FILES dosyalarını okur"""
+        patterns = []
+        for name in IGNORE_FILES:
+            try:
+                with open(os.path.join(root, name), "r", encoding="utf-8", errors="replace") as f:
+                    patterns.extend(f.read().splitlines())
+            except OSError:
+                continue
+        return cls(patterns)
+
+    def matches(self, relative_path: str, is_dir: bool) -> bool:
+        name = relative_path.rsplit("/", 1)[-1]
+        for pattern, anchored, directory_only in self.rules:
+            if directory_only and not is_dir:
+                continue
+            target = relative_path if anchored else name
+            if fnmatch.fnmatchcase(target, pattern):
+                return True
+            # "**/" ile başlayan desenler kökteki girdilere de uyar
+            if anchored and pattern.startswith("**/") and fnmatch.fnmatchcase(relative_path, pattern[3:]):
+                return True
+        return False
+
+
+def list_source_files(root: str, rules: IgnoreRules = None) -> List[Tuple[str, str, int]]:
+    """
+    Ignore kurallarıyla dışlanmayan dosyaları döner
+
+    Args:
+        root: Proje klasörü
+        rules: Ignore kuralları (verilmezse projenin ignore dosyalarından okunur)
+
+    Returns:
+        list: (göreli yol, tam yol, boyut) üçlüleri
+    """
+    if rules is None:
+        rules = IgnoreRules.from_project(root)
+
+    files = []
+    stack = [("", root)]
+    while stack:
+        prefix, path = stack.pop()
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    continue
+                relative_path = f"{prefix}{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in IGNORED_DIRS and not rules.matches(relative_path, True):
+                        stack.append((relative_path + "/", entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    if not rules.matches(relative_path, False):
+                        files.append((relative_path, entry.path, entry.stat(follow_symlinks=False).st_size))
+    return files
+
+
+# ============================================
+# SAYIM
+# ============================================
+
+@dataclass
+class SourceCensus:
+    """
+    Bir proje ağacının dosya/satır sayımı
+
+    Attributes:
+        tree_hash: Sayılan ağacın hash'i (cache anahtarı)
+        total_files: Ignore kurallarından sonra kalan tüm dosyalar
+        total_lines: Tüm metin dosyalarının satırları
+        source_files: Kaynak kod dosyaları (NON_SOURCE_LANGUAGES hariç)
+        source_lines: Kaynak kod dosyalarının satırları
+        languages: Dil -> {"files", "lines"}
+        extensions: Uzantı (örn. ".py", uzantısızsa "") -> {"files", "lines"}
+        duration_seconds: Sayımın süresi (cache'ten geldiyse ilk sayımın süresi)
+        cached: Sonuç cache'ten mi geldi
+    """
+    tree_hash: str
+    total_files: int = 0
+    total_lines: int = 0
+    source_files: int = 0
+    source_lines: int = 0
+    languages: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    extensions: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    duration_seconds: float = 0.0
+    cached: bool = False
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SourceCensus":
+        return cls(**{key: data[key] for key in cls.__dataclass_fields__ if key in data})
+
+    def lines_for_extensions(self, extensions) -> int:
+        """Verilen uzantılara (örn. [".py", ".js"]) sahip dosyaların toplam satırı"""
+        return sum(
+            self.extensions.get(extension, {}).get("lines", 0)
+            for extension in {extension.lower() for extension in extensions}
+        )
+
+
+def _count_batch(batch: List[Tuple[str, str, int]]) -> List[int]:
+    counts = []
+    for _, path, size in batch:
+        try:
+            counts.append(count_lines(path, size))
+        except OSError:
+            counts.append(0)
+    return counts
+
+
+def _count_all(files: List[Tuple[str, str, int]], max_workers: int) -> List[int]:
+    """Dosyaların satırlarını thread havuzunda, dosya grupları halinde sayar"""
+    if max_workers <= 1 or len(files) < 64:
+        return _count_batch(files)
+
+    batch_size = max(16, len(files) // (max_workers * 4))
+    batches = [files[start:start + batch_size] for start in range(0, len(files), batch_size)]
+    counts = []
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="census") as executor:
+        for batch_counts in executor.map(_count_batch, batches):
+            counts.extend(batch_counts)
+    return counts
+
+
+def _tally(tree_hash: str, files: List[Tuple[str, str, int]], counts: List[int]) -> SourceCensus:
+    census = SourceCensus(tree_hash=tree_hash)
+    for (relative_path, _, _), lines in zip(files, counts):
+        language = detect_language(relative_path)
+        extension = os.path.splitext(relative_path.rsplit("/", 1)[-1])[1].lower()
+        for table, key in ((census.languages, language), (census.extensions, extension)):
+            totals = table.setdefault(key, {"files": 0, "lines": 0})
+            totals["files"] += 1
+            totals["lines"] += lines
+
+        census.total_files += 1
+        census.total_lines += lines
+        if language not in NON_SOURCE_LANGUAGES:
+            census.source_files += 1
+            census.source_lines += lines
+
+    census.languages = dict(sorted(census.languages.items(), key=lambda item: -item[1]["lines"]))
+    return census
+
+
+class SourceCensusCache:
+    """Ağaç hash'ine göre sayım cache'i (bellek + disk)"""
+
+    def __init__(self, cache_dir: str = None):
+        self.cache_dir = Path(cache_dir or SOURCE_CENSUS_CACHE_DIR)
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, tree_hash: str) -> Optional[SourceCensus]:
+        with self._lock:
+            data = self._memory.get(tree_hash)
+            if data is not None:
+                self._memory.move_to_end(tree_hash)
+        if data is None:
+            try:
+                with open(self.cache_dir / f"{tree_hash}.json", "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                return None
+            self._remember(tree_hash, data)
+        census = SourceCensus.from_dict(data)
+        census.cached = True
+        return census
+
+    def set(self, census: SourceCensus):
+        data = census.to_dict()
+        data["cached"] = False
+        self._remember(census.tree_hash, data)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.cache_dir / f"{census.tree_hash}.json")
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        except OSError as e:
+            # Cache yazılamaması sayımı başarısız yapmamalı
+            print(f"WARNING: Source census cache yazılamadı: {e}")
+
+    def _remember(self, tree_hash: str, data: Dict):
+        with self._lock:
+            self._memory[tree_hash] = data
+            self._memory.move_to_end(tree_hash)
+            while len(self._memory) > _MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
+
+
+# Uygulama genelinde kullanılan cache
+census_cache = SourceCensusCache()
+
+
+def census_project(
+    root: str,
+    tree_hash: str = None,
+    max_workers: int = None,
+    cache: Optional[SourceCensusCache] = None,
+    use_cache: bool = True
+) -> SourceCensus:
+    """
+    Projenin dosya/satır sayımını döner (ağaç değişmediyse cache'ten)
+
+    Args:
+        root: Proje klasörü
+        tree_hash: Ağaç hash'i (runner'lar zaten hesapladıysa tekrar hesaplanmaz)
+        max_workers: Satır sayan thread sayısı (default: SOURCE_CENSUS_WORKERS)
+        cache: Kullanılacak cache (default: census_cache)
+        use_cache: False ise cache okunmaz (sonuç yine yazılır)
+
+    Returns:
+        SourceCensus
+
+    Raises:
+        FileNotFoundError: Klasör bulunamazsa
+    """
+    if not os.path.isdir(root):
+        raise FileNotFoundError(f"Project directory not found: {root}")
+
+    cache = census_cache if cache is None else cache
+    tree_hash = tree_hash or compute_tree_hash(root)
+    if use_cache:
+        cached = cache.get(tree_hash)
+        if cached is not None:
+            return cached
+
+    started = time.perf_counter()
+    files = list_source_files(root)
+    counts = _count_all(files, SOURCE_CENSUS_WORKERS if max_workers is None else max_workers)
+    census = _tally(tree_hash, files, counts)
+    census.duration_seconds = time.perf_counter() - started
+
+    cache.set(census)
+    return census
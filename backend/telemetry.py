@@ -0,0 +1,451 @@
+"""
+Operasyonel Telemetri (Prometheus /metrics) Modülü
+
+Bu modül, uygulamanın kendi içindeki metrikleri tutan küçük bir registry
+sağlar ve bunları Prometheus text exposition formatında (version 0.0.4)
+üretir. Harici bir paket gerektirmez.
+
+Metrik türleri:
+- Counter: Sadece artan sayaç (örn. CLI CPU saniyeleri)
+- Histogram: Sabit kovalı dağılım (örn. istek ve tarama süreleri)
+- Callback: Scrape anında bir fonksiyondan okunan değerler (örn. job kuyruğu
+  derinliği, süren taramalar, cache hit oranı); sıcak yolda maliyeti yoktur
+
+Sıcak yol maliyeti: Counter ve Histogram değerleri thread başına ayrı
+hücrelerde (cell) tutulur; inc()/observe() lock almaz, sadece kendi
+thread'inin hücresini günceller (GIL altında birkaç mikrosaniye). Lock
+sadece bir thread bir metriğe ilk kez yazdığında ve scrape sırasında
+hücreler toplanırken alınır. Ölen thread'lerin hücreleri toplama sırasında
+tek bir hücrede birleştirilir; böylece istek başına thread açan sunucularda
+hücre sayısı büyümez.
+
+Scrape sırasında okunan değerler thread'lerin o anki yazmalarıyla
+senkronize değildir (örn. bir histogramın _count ve _sum'ı bir gözlem
+kadar farklı olabilir); Prometheus için bu kabul edilebilir.
+
+Proje Yapısı İçindeki Yeri:
+- backend/telemetry.py: Bu dosya
+- backend/app.py: /metrics endpoint'i, istek süresi ölçümü ve callback metrikleri
+- backend/metric_runner.py, backend/deepsource_runner.py: Tarama süreleri (record_scan)
+- backend/result_store.py: Sonuçların JSON serileştirme süresi
+
+Kullanım:
+    from telemetry import telemetry, record_scan
+    requests_total = telemetry.counter("requests_total", "İstek sayısı", ("route",))
+    requests_total.labels("/scan/code").inc()
+    print(telemetry.render())
+
+Environment Variables:
+    TELEMETRY_ENABLED: "0" ise metrikler toplanmaz ve /metrics 404 döner (default: 1)
+"""
+
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+TELEMETRY_ENABLED = os.getenv("TELEMETRY_ENABLED", "1") != "0"
+
+# Tüm metrik adlarının ön eki
+METRIC_PREFIX = "smarttestai_"
+
+# Prometheus text exposition formatının Content-Type'ı
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Kısa işlemler (HTTP istekleri, parse, kayıt) için kovalar (saniye)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Tam taramalar için kovalar (saniye)
+SCAN_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+
+# Bu kadar hücre birikince yeni hücre açılırken ölen thread'lerinkiler birleştirilir
+_CELL_SWEEP_THRESHOLD = 64
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+# ============================================
+# THREAD BAŞINA HÜCRELER
+# ============================================
+
+class _ThreadCells:
+    """
+    Thread başına sabit uzunlukta sayı listeleri (hücre)
+
+    Her thread sadece kendi hücresine yazar; toplam, scrape sırasında tüm
+    hücreler toplanarak bulunur.
+    """
+
+    def __init__(self, size: int):
+        self._size = size
+        self._local = threading.local()
+        self._cells: List[Tuple[threading.Thread, list]] = []
+        # Ölen thread'lerin hücrelerinin toplamı
+        self._retired = [0.0] * size
+        self._lock = threading.Lock()
+
+    def cell(self) -> list:
+        """Bu thread'in hücresi (ilk çağrıda oluşturulur)"""
+        try:
+            return self._local.cell
+        except AttributeError:
+            pass
+        cell = [0.0] * self._size
+        with self._lock:
+            if len(self._cells) >= _CELL_SWEEP_THRESHOLD:
+                self._sweep()
+            self._cells.append((threading.current_thread(), cell))
+        self._local.cell = cell
+        return cell
+
+    def _sweep(self):
+        """Ölen thread'lerin hücrelerini _retired'a ekler (lock altında çağrılmalı)"""
+        alive = []
+        for thread, cell in self._cells:
+            if thread.is_alive():
+                alive.append((thread, cell))
+            else:
+                for index, value in enumerate(cell):
+                    self._retired[index] += value
+        self._cells = alive
+
+    def totals(self) -> list:
+        """Tüm hücrelerin eleman bazında toplamı"""
+        with self._lock:
+            self._sweep()
+            totals = list(self._retired)
+            for _, cell in self._cells:
+                for index, value in enumerate(cell):
+                    totals[index] += value
+        return totals
+
+
+# ============================================
+# METRİK TÜRLERİ
+# ============================================
+
+class _Family:
+    """Aynı ada sahip, etiket değerleriyle ayrılan metrikler"""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values):
+        """
+        Etiket değerlerine ait metrik (ilk çağrıda oluşturulur)
+
+        Raises:
+            ValueError: Etiket sayısı labelnames ile uyuşmazsa
+        """
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is not None:
+            return child
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+        with self._lock:
+            return self._children.setdefault(key, self._new_child())
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _items(self) -> List[Tuple[tuple, object]]:
+        with self._lock:
+            return sorted(self._children.items())
+
+    def samples(self) -> Iterable[Tuple[str, tuple, tuple, float]]:
+        """(ad son eki, etiket adları, etiket değerleri, değer) dörtlüleri"""
+        raise NotImplementedError
+
+
+class _CounterChild:
+    __slots__ = ("_cells",)
+
+    def __init__(self):
+        self._cells = _ThreadCells(1)
+
+    def inc(self, amount: float = 1.0):
+        """Sayacı artırır (negatif değerler yok sayılır)"""
+        if amount > 0:
+            self._cells.cell()[0] += amount
+
+    def value(self) -> float:
+        return self._cells.totals()[0]
+
+
+class Counter(_Family):
+    """Sadece artan sayaç"""
+
+    type_name = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0):
+        """Etiketsiz sayacı artırır"""
+        self.labels().inc(amount)
+
+    def samples(self):
+        for values, child in self._items():
+            yield "", self.labelnames, values, child.value()
+
+
+class _HistogramChild:
+    __slots__ = ("_bounds", "_cells")
+
+    def __init__(self, bounds: tuple):
+        self._bounds = bounds
+        # Hücre: [kova 1, ..., kova n, +Inf kovası, toplam]
+        self._cells = _ThreadCells(len(bounds) + 2)
+
+    def observe(self, value: float):
+        """Bir değeri histograma ekler"""
+        cell = self._cells.cell()
+        cell[bisect_left(self._bounds, value)] += 1
+        cell[-1] += value
+
+    @contextmanager
+    def time(self):
+        """Blok süresini (saniye) histograma ekler"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    def snapshot(self) -> Tuple[List[Tuple[float, float]], float, float]:
+        """
+        Returns:
+            ([(üst sınır, kümülatif sayı), ...], toplam, sayı)
+        """
+        totals = self._cells.totals()
+        cumulative = []
+        running = 0.0
+        for bound, count in zip(self._bounds + (math.inf,), totals[:-1]):
+            running += count
+            cumulative.append((bound, running))
+        return cumulative, totals[-1], running
+
+
+class Histogram(_Family):
+    """Sabit kovalı dağılım (kova üst sınırları dahildir: le)"""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(bound) for bound in buckets if not math.isinf(bound)))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        """Etiketsiz histograma değer ekler"""
+        self.labels().observe(value)
+
+    def samples(self):
+        bucket_labels = self.labelnames + ("le",)
+        for values, child in self._items():
+            cumulative, total, count = child.snapshot()
+            for bound, running in cumulative:
+                yield "_bucket", bucket_labels, values + (_format_value(bound),), running
+            yield "_sum", self.labelnames, values, total
+            yield "_count", self.labelnames, values, count
+
+
+class CallbackMetric(_Family):
+    """
+    Değerleri scrape anında bir fonksiyondan okunan metrik
+
+    Fonksiyon (etiket değerleri tuple'ı, değer) çiftleri döner.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str],
+                 collect: Callable[[], Iterable[Tuple[tuple, float]]], type_name: str = "gauge"):
+        super().__init__(name, documentation, labelnames)
+        self.collect = collect
+        self.type_name = type_name
+
+    def samples(self):
+        for values, value in self.collect():
+            yield "", self.labelnames, tuple(str(v) for v in values), value
+
+
+# ============================================
+# REGISTRY
+# ============================================
+
+class MetricsRegistry:
+    """Metrikleri adlarıyla tutar ve text exposition formatında üretir"""
+
+    def __init__(self, prefix: str = METRIC_PREFIX):
+        self.prefix = prefix
+        self._families: Dict[str, _Family] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, family: _Family) -> _Family:
+        with self._lock:
+            if family.name in self._families:
+                raise ValueError(f"Metric '{family.name}' is already registered")
+            self._families[family.name] = family
+        return family
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Sayaç oluşturur (ad _total son eki olmadan verilir, eklenir)"""
+        return self._register(Counter(f"{self.prefix}{name}_total", documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(self.prefix + name, documentation, labelnames, buckets))
+
+    def callback(self, name: str, documentation: str, labelnames: Sequence[str],
+                 collect: Callable[[], Iterable[Tuple[tuple, float]]],
+                 type_name: str = "gauge") -> CallbackMetric:
+        """Scrape anında collect() ile okunan metrik oluşturur (counter ise ada _total eklenir)"""
+        if type_name == "counter":
+            name = f"{name}_total"
+        return self._register(CallbackMetric(self.prefix + name, documentation, labelnames, collect, type_name))
+
+    def get(self, name: str):
+        """Ön eksiz tam adıyla metrik (counter'larda _total dahil)"""
+        return self._families.get(self.prefix + name)
+
+    def render(self) -> str:
+        """
+        Tüm metrikleri Prometheus text exposition formatında üretir
+
+        Bir callback hata verirse o metrik atlanır (scrape başarısız olmaz).
+        """
+        with self._lock:
+            families = sorted(self._families.values(), key=lambda family: family.name)
+
+        lines = []
+        for family in families:
+            try:
+                samples = list(family.samples())
+            except Exception as e:
+                print(f"WARNING: {family.name} metriği okunamadı: {e}")
+                continue
+            lines.append(f"# HELP {family.name} {family.documentation}")
+            lines.append(f"# TYPE {family.name} {family.type_name}")
+            for suffix, names, values, value in samples:
+                lines.append(f"{family.name}{suffix}{_format_labels(names, values)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+# ============================================
+# FLASK VE RUNNER ENTEGRASYONU
+# ============================================
+
+def instrument_app(app):
+    """
+    Flask uygulamasının her isteğinin süresini route şablonu bazında ölçer
+
+    Route etiketi URL değil, URL kuralıdır (örn. /scan/<tool>); eşleşmeyen
+    istekler "<unmatched>" olarak sayılır. Akış halinde dönen response'larda
+    süre, header'lar gönderilmeye hazır olana kadar ölçülür.
+    """
+    if not TELEMETRY_ENABLED:
+        return app
+
+    from flask import g, request
+
+    @app.before_request
+    def _start_request_timer():
+        g.telemetry_started = time.perf_counter()
+
+    @app.after_request
+    def _record_request_duration(response):
+        started = g.pop("telemetry_started", None)
+        if started is not None:
+            route = request.url_rule.rule if request.url_rule is not None else "<unmatched>"
+            http_request_duration.labels(request.method, route, response.status_code).observe(
+                time.perf_counter() - started
+            )
+        return response
+
+    return app
+
+
+def record_scan(tool: str, project: str, timings: dict, resource_usages: Sequence = ()):
+    """
+    Biten bir taramanın süresini ve CLI kaynak kullanımını metriklere ekler
+
+    Args:
+        tool: Araç adı (örn. "snyk_code")
+        project: Proje adı
+        timings: ScanTimer.to_dict() çıktısı (bkz. scan_timing)
+        resource_usages: CLI çağrılarının ResourceUsage kayıtları
+    """
+    if not TELEMETRY_ENABLED or not timings:
+        return
+    scan_duration.labels(tool, project).observe(timings["total_seconds"])
+    for phase, seconds in timings["phases"].items():
+        scan_phase_duration.labels(tool, phase).observe(seconds)
+    if "parse" in timings["phases"]:
+        json_duration.labels("parse", tool).observe(timings["phases"]["parse"])
+    for usage in resource_usages:
+        subprocess_cpu_seconds.labels(tool, "user").inc(usage.cpu_user_seconds)
+        subprocess_cpu_seconds.labels(tool, "system").inc(usage.cpu_system_seconds)
+
+
+@contextmanager
+def time_json(operation: str, tool: str):
+    """Blok süresini JSON parse/serialize histogramına ekler"""
+    if not TELEMETRY_ENABLED:
+        yield
+        return
+    with json_duration.labels(operation, tool).time():
+        yield
+
+
+# Uygulamanın paylaştığı registry ve sıcak yol metrikleri
+telemetry = MetricsRegistry()
+
+http_request_duration = telemetry.histogram(
+    "http_request_duration_seconds", "HTTP isteklerinin süresi (route şablonu bazında)",
+    ("method", "route", "status")
+)
+scan_duration = telemetry.histogram(
+    "scan_duration_seconds", "Cache'ten dönmeyen taramaların toplam süresi",
+    ("tool", "project"), buckets=SCAN_BUCKETS
+)
+scan_phase_duration = telemetry.histogram(
+    "scan_phase_duration_seconds", "Tarama fazlarının süresi (spawn, tool, parse, prepare, normalize, persist)",
+    ("tool", "phase"), buckets=DEFAULT_BUCKETS + (30.0, 60.0, 120.0, 300.0, 600.0)
+)
+json_duration = telemetry.histogram(
+    "json_duration_seconds", "Araç çıktısının JSON parse ve sonuç dosyasının serileştirme süresi",
+    ("operation", "tool")
+)
+subprocess_cpu_seconds = telemetry.counter(
+    "scan_subprocess_cpu_seconds", "Tarama CLI process ağacının CPU süresi",
+    ("tool", "mode")
+)
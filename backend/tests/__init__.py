@@ -6,5 +6,30 @@ Bu paket, SmartTestAI Feature Metrics Engine için test script'lerini içerir.
 Test Dosyaları:
 - test_advanced_metrics.py: Gelişmiş metrik hesaplama testleri
 - test_deepsource_api.py: DeepSource API entegrasyon testleri
+- test_deepsource_pagination.py: DeepSource GraphQL pagination testleri (stub sunucu ile)
+- test_sarif_stream.py: Streaming SARIF parser ve akış halinde metrik hesaplama testleri
+- test_incremental_scan.py: Incremental Snyk Code taraması ve SARIF birleştirme testleri
+- test_result_store.py: Kompakt sonuç dosyası formatı ve kural kataloğu testleri
+- test_results_index.py: SQLite sonuç index sorguları testleri
+- test_issue_matching.py: Issue eşleştirme testleri (hash index hızlı yolu, satır toleransı, optimal atama)
+- test_process_profiler.py: Tarama CLI process ağacı kaynak profili testleri
+- test_resource_sampler.py: Arka plan CPU/bellek örnekleyici testleri
+- test_latency_stats.py: Tarama süresi özetleri (Welford + histogram) ve worker birleştirme testleri
+- test_batch_scoring.py: NumPy ile toplu yeniden puanlama testleri
+- test_tool_registry.py: Araç registry'si, tembel yükleme ve /scan/<tool> endpoint testleri
+- test_project_catalog.py: Proje kataloğu keşfi, artımlı yenileme ve /projects sayfalama testleri
+- test_source_census.py: Kaynak kod sayımı, ignore kuralları, ağaç hash'i cache'i ve kod kapsama testleri
+- test_single_flight.py: Eşzamanlı özdeş taramaların birleştirilmesi ve araç eşzamanlılık sınırı testleri
+- test_scan_streaming.py: Toplu taramaların NDJSON/SSE ile akış halinde gönderilmesi testleri
+- test_scan_fanout.py: Paralel taramada tarama başına zaman aşımı, CLI sonlandırma ve timing testleri
+- test_scan_jobs.py: Tarama job kuyruğu durum geçişleri, dolu kuyruk (503), geçmiş kırpma ve /jobs testleri
+- test_scan_cache.py: Tarama sonucu cache'i (hit/miss, yaş ve boyut sınırı, force) ve sınırlı dosya hash cache'i testleri
+- test_http_cache.py: Dosya endpoint'lerinde ETag/304, gzip sidecar ve Range testleri
+- test_scan_timing.py: Tarama fazlarının süre ölçümü ve MetricResult.scan_duration/timings testleri
+- test_telemetry.py: Prometheus /metrics formatı, thread başına sayaçlar ve sıcak yol maliyeti testleri
+- test_profiling.py: Opt-in cProfile/örnekleme profili ve flamegraph çıktısı testleri
+- test_benchmarks.py: Sentetik çıktılarla pipeline benchmark'ı, baseline ve regresyon karşılaştırması testleri
+- test_loadtest.py: Sahte Snyk CLI, stub DeepSource sunucusu ve yük sürücüsü testleri
+- runner_patches.py: Runner testlerinin ortak kurulumu (geçici klasör, cache, index, sahte CLI)
 """
 
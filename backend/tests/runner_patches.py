@@ -0,0 +1,67 @@
+"""
+Runner Test Yardımcıları
+
+metric_runner ve deepsource_runner testlerinin ortak kurulumu: runner'ın
+modül seviyesindeki klasörleri, cache'i, sonuç index'i, süre kayıtları ve
+tarama birleştirici geçici bir klasöre yönlendirilir; test bitince eski
+değerler geri yüklenir.
+
+Kullanım:
+    from tests.runner_patches import patched_runner
+
+    with tempfile.TemporaryDirectory() as directory:
+        with patched_runner(metric_runner, directory, run_snyk_code_scan=fake_cli) as patches:
+            metric_runner.run_code_scan_and_save("flask_demo", stream=False)
+"""
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def patched(module, patches: dict):
+    """Modül attribute'larını blok süresince değiştirir"""
+    original = {name: getattr(module, name) for name in patches}
+    for name, value in patches.items():
+        setattr(module, name, value)
+    try:
+        yield patches
+    finally:
+        for name, value in original.items():
+            setattr(module, name, value)
+
+
+@contextmanager
+def patched_runner(module, directory: str, **overrides):
+    """
+    Runner modülünü geçici klasördeki bir flask_demo projesine yönlendirir
+
+    Args:
+        module: metric_runner veya deepsource_runner
+        directory: Geçici klasör (projects/, results/, cache/ burada oluşur)
+        **overrides: Ek olarak değiştirilecek attribute'lar (örn. sahte CLI)
+
+    Yields:
+        dict: Uygulanan değerler (PROJECTS_ROOT, RESULTS_DIR, ... ve overrides)
+    """
+    from metrics.latency_stats import LatencyRegistry
+    from results_index import ResultsIndex
+    from scan_cache import ScanCache
+    from single_flight import SingleFlight
+
+    projects_root = os.path.join(directory, "projects")
+    os.makedirs(os.path.join(projects_root, "flask_demo"))
+    Path(projects_root, "flask_demo", "app.py").write_text("import flask\n", encoding="utf-8")
+
+    patches = {
+        "PROJECTS_ROOT": projects_root,
+        "RESULTS_DIR": os.path.join(directory, "results"),
+        "scan_cache": ScanCache(cache_dir=os.path.join(directory, "cache")),
+        "results_index": ResultsIndex(os.path.join(directory, "index.sqlite3")),
+        "latency_registry": LatencyRegistry(os.path.join(directory, "latency")),
+        "scan_flights": SingleFlight()
+    }
+    patches.update(overrides)
+    with patched(module, patches):
+        yield patches
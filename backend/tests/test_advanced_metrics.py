@@ -32,10 +32,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from metrics.advanced_metrics import AdvancedMetricsCalculator, AdvancedMetricResult
 from metrics.snyk_metrics import SnykMetrics
 from metrics.deepsource_metrics import DeepSourceMetrics
+from result_store import list_scan_results, load_scan_result
+from results_index import ResultsIndex
+from source_census import census_project
 
 # Sonuç dosyalarının kaydedileceği klasör (proje root'una göre)
 RESULTS_DIR = "../../results"
 
+# Taranan projelerin klasörü (kod kapsama paydası için sayılır)
+PROJECTS_ROOT = "../../test_projects"
+
 def create_ground_truth_vulnerable_demo():
     """
     vulnerable_demo projesi için ground truth (gerçek hata listesi)
@@ -86,6 +92,40 @@ def create_ground_truth_vulnerable_demo():
         }
     ]
 
+def find_latest_result(tool: str):
+    """
+    Aracın en son sonuç dosyasını döner (yoksa None)
+    
+    Önce results/index.sqlite3 index'ine bakılır; index'te kayıt yoksa
+    (örn. index oluşturulmadan önceki dosyalar) results/ klasörü listelenir.
+    """
+    index_path = Path(RESULTS_DIR) / "index.sqlite3"
+    if index_path.exists():
+        latest = ResultsIndex(str(index_path)).latest(tool=tool)
+        if latest and Path(latest["file_path"]).exists():
+            return Path(latest["file_path"])
+    
+    files = list_scan_results(RESULTS_DIR, tool=tool)
+    return Path(files[0]["path"]) if files else None
+
+def census_scanned_project(result_path: Path, tool: str):
+    """
+    Sonuç dosyasındaki projenin kaynak sayımını döner
+
+    Proje klasörü PROJECTS_ROOT altında yoksa None döner.
+    """
+    entry = next(
+        (e for e in list_scan_results(str(result_path.parent), tool=tool)
+         if Path(e["path"]) == result_path),
+        None
+    )
+    if entry is None:
+        return None
+    project_path = Path(PROJECTS_ROOT) / entry["project"]
+    if not project_path.is_dir():
+        return None
+    return census_project(str(project_path))
+
 def extract_issues_from_snyk_result(raw_data: dict) -> list:
     """Snyk SARIF formatından issue'ları çıkarır"""
     issues = []
@@ -132,18 +172,16 @@ def test_snyk_advanced_metrics():
     print("SNYK CODE - GELISMIS METRIK TESTI")
     print("=" * 60)
     
-    # Son Snyk sonuç dosyasını bul
-    snyk_files = list(Path("../../results").glob("snyk_code_*.json"))
-    if not snyk_files:
+    # Son Snyk sonuç dosyasını bul (.rstore veya .json)
+    latest_snyk = find_latest_result("snyk_code")
+    if latest_snyk is None:
         print("HATA: Snyk sonuc dosyasi bulunamadi!")
         return
     
-    latest_snyk = max(snyk_files, key=lambda x: x.stat().st_mtime)
     print(f"\nDosya: {latest_snyk.name}")
     
     # Sonuç dosyasını oku
-    with open(latest_snyk, "r", encoding="utf-8") as f:
-        snyk_raw_data = json.load(f)
+    snyk_raw_data = load_scan_result(latest_snyk)
     
     # Issue'ları çıkar
     detected_issues = extract_issues_from_snyk_result(snyk_raw_data)
@@ -167,15 +205,37 @@ def test_snyk_advanced_metrics():
     print(f"  Low: {basic_result.low}")
     print(f"  Total: {basic_result.total_issues}")
     
+    # Kod kapsama paydası: taranan projenin kaynak sayımı
+    census = census_scanned_project(latest_snyk, "snyk_code")
+    if census is None:
+        print("UYARI: Proje klasoru bulunamadi, kod kapsama sayimsiz hesaplanir")
+    
     # Gelişmiş metrikleri hesapla
     calculator = AdvancedMetricsCalculator()
     advanced_result = calculator.calculate_all_advanced_metrics(
         raw_data=snyk_raw_data,
         detected_issues=detected_issues,
         ground_truth=ground_truth,
-        scan_duration=basic_result.scan_duration
+        scan_duration=basic_result.scan_duration,
+        source_census=census
     )
     
+    if census is not None:
+        supported = [
+            c for c in snyk_raw_data["runs"][0].get("properties", {}).get("coverage", [])
+            if c.get("isSupported", True)
+        ]
+        files_analyzed = sum(c.get("files", 0) for c in supported)
+        assert advanced_result.files_analyzed == files_analyzed
+        if census.source_files:
+            assert advanced_result.code_coverage == min(
+                100.0, files_analyzed / census.source_files * 100
+            )
+        assert advanced_result.lines_analyzed == census.lines_for_extensions(
+            c["lang"] for c in supported if c.get("files", 0) > 0
+        )
+        assert advanced_result.lines_analyzed <= census.source_lines
+    
     print(f"\nGELISMIS METRIKLER:")
     if ground_truth:
         print(f"  Precision: {advanced_result.precision:.2%}")
@@ -205,21 +265,16 @@ def test_deepsource_advanced_metrics():
     print("DEEPSOURCE - GELISMIS METRIK TESTI")
     print("=" * 60)
     
-    # Son DeepSource sonuç dosyasını bul (advanced_metrics olmayan)
-    deepsource_files = [
-        f for f in Path("../../results").glob("deepsource_*.json")
-        if "advanced_metrics" not in f.name
-    ]
-    if not deepsource_files:
+    # Son DeepSource sonuç dosyasını bul (advanced_metrics dosyaları listelenmez)
+    latest_deepsource = find_latest_result("deepsource")
+    if latest_deepsource is None:
         print("HATA: DeepSource sonuc dosyasi bulunamadi!")
         return
     
-    latest_deepsource = max(deepsource_files, key=lambda x: x.stat().st_mtime)
     print(f"\nDosya: {latest_deepsource.name}")
     
     # Sonuç dosyasını oku
-    with open(latest_deepsource, "r", encoding="utf-8") as f:
-        deepsource_raw_data = json.load(f)
+    deepsource_raw_data = load_scan_result(latest_deepsource)
     
     # Issue'ları çıkar
     detected_issues = extract_issues_from_deepsource_result(deepsource_raw_data)
@@ -239,15 +294,27 @@ def test_deepsource_advanced_metrics():
     print(f"  Low: {basic_result.low}")
     print(f"  Total: {basic_result.total_issues}")
     
+    # Kod kapsama paydası: taranan projenin kaynak sayımı
+    census = census_scanned_project(latest_deepsource, "deepsource")
+    if census is None:
+        print("UYARI: Proje klasoru bulunamadi, kod kapsama sayimsiz hesaplanir")
+    
     # Gelişmiş metrikleri hesapla
     calculator = AdvancedMetricsCalculator()
     advanced_result = calculator.calculate_all_advanced_metrics(
         raw_data=deepsource_raw_data,
         detected_issues=detected_issues,
         ground_truth=ground_truth,
-        scan_duration=basic_result.scan_duration
+        scan_duration=basic_result.scan_duration,
+        source_census=census
     )
     
+    if census is not None:
+        # DeepSource sonucunda dosya bazlı kapsama bilgisi yok; sayım payı değiştirmez
+        assert advanced_result.files_analyzed == 0
+        assert advanced_result.lines_analyzed == 0
+        print(f"  Kaynak Dosya/Satir: {census.source_files}/{census.source_lines}")
+    
     print(f"\nGELISMIS METRIKLER:")
     if ground_truth:
         print(f"  Precision: {advanced_result.precision:.2%}")
@@ -326,7 +393,11 @@ def save_advanced_metrics_result(
             "operational_efficiency": {
                 "average_scan_time": advanced_result.average_scan_time,
                 "cpu_usage_percent": advanced_result.cpu_usage_percent,
-                "memory_usage_mb": advanced_result.memory_usage_mb
+                "memory_usage_mb": advanced_result.memory_usage_mb,
+                "cpu_usage_p95": advanced_result.cpu_usage_p95,
+                "cpu_usage_max": advanced_result.cpu_usage_max,
+                "memory_usage_p95_mb": advanced_result.memory_usage_p95_mb,
+                "memory_usage_max_mb": advanced_result.memory_usage_max_mb
             },
             "code_quality_score": advanced_result.code_quality_score
         },
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Toplu Yeniden Puanlama (batch_scoring) Test Script'i
+
+Bu script, sonuç dosyalarının NumPy dizilerine yüklenip vektörel olarak
+puanlanmasını test eder. Sonuç dosyaları geçici bir klasörde oluşturulur.
+
+Test Senaryoları:
+1. Varsayılan eşiklerle sonuçlar SnykMetrics / DeepSourceMetrics ile aynı
+   (SARIF, eski Snyk formatı ve DeepSource; .rstore ve .json)
+2. Değiştirilmiş eşikler, aynı eşiklere sahip SnykMetrics ile aynı sonucu verir
+3. Diziler .npz olarak kaydedilip geri okunabilir
+4. Geçersiz eşikler reddedilir
+5. Binlerce tarama saniyeler içinde puanlanır
+
+Kullanım:
+    cd backend/tests
+    python test_batch_scoring.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_batch_scoring.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from batch_scoring import ScanArrays, load_scan_arrays, rescore_results, score_scan_arrays
+from metrics.deepsource_metrics import DeepSourceMetrics
+from metrics.snyk_metrics import SnykMetrics
+from result_store import list_scan_results, load_scan_result, save_scan_result
+
+
+def _sarif(rng: random.Random, count: int) -> dict:
+    results = []
+    for number in range(count):
+        result = {"ruleId": f"rule-{number}"}
+        if rng.random() < 0.8:
+            result["level"] = rng.choice(["error", "warning", "note", "ERROR", "Warning"])
+        if rng.random() < 0.6:
+            result["properties"] = {"priorityScore": rng.choice([0, 350, 500, 699, 700, 899, 900, 1000])}
+        results.append(result)
+    return {"runs": [{"tool": {"driver": {"name": "SnykCode", "rules": []}}, "results": results}]}
+
+
+def _legacy(rng: random.Random, count: int) -> dict:
+    severities = ["critical", "high", "medium", "low", "unknown", None]
+    return {
+        "vulnerabilities": [{"severity": rng.choice(severities)} for _ in range(count)],
+        "scanDuration": 4.5
+    }
+
+
+def _deepsource(rng: random.Random, count: int) -> dict:
+    edges = [
+        {"node": {"issue": {"severity": rng.choice(["CRITICAL", "MAJOR", "minor", "INFO", "OTHER"])}}}
+        for _ in range(count)
+    ]
+    edges.append({"node": {}})
+    return {"data": {"repository": {"issues": {"totalCount": len(edges), "edges": edges}}}}
+
+
+def _populate(directory: str) -> None:
+    rng = random.Random(14)
+    documents = [
+        ("snyk_code", _sarif), ("snyk_code", _legacy), ("deepsource", _deepsource)
+    ]
+    for number in range(12):
+        tool, factory = documents[number % len(documents)]
+        file_format = "compact" if number % 2 else "json"
+        save_scan_result(
+            factory(rng, rng.randint(0, 40)), tool, f"project{number}",
+            results_dir=directory, file_format=file_format
+        )
+
+
+def _reference(entry: dict, calculator=None):
+    if calculator is None:
+        calculator = SnykMetrics() if entry["tool"] == "snyk_code" else DeepSourceMetrics()
+    return calculator.calculate(load_scan_result(entry["path"]))
+
+
+def test_default_thresholds_match_calculators():
+    """Varsayılan eşiklerle her tarama calculate() ile aynı sonucu vermeli"""
+    with tempfile.TemporaryDirectory() as directory:
+        _populate(directory)
+        entries = list_scan_results(directory)
+        table = score_scan_arrays(load_scan_arrays(entries))
+
+        assert len(table) == len(entries) == 12
+        for entry, metric_result in zip(entries, table.metric_results()):
+            assert metric_result == _reference(entry), entry["path"]
+
+        # Dosya yolları da kabul edilir
+        paths_table = score_scan_arrays(load_scan_arrays([entry["path"] for entry in entries]))
+        assert paths_table.metric_results() == table.metric_results()
+
+
+def test_custom_thresholds_match_subclass():
+    """Değiştirilmiş eşikler aynı eşiklere sahip SnykMetrics ile aynı olmalı"""
+
+    class StrictSnykMetrics(SnykMetrics):
+        CRITICAL_PRIORITY_SCORE = 850
+        HIGH_PRIORITY_SCORE = 650
+        MEDIUM_PRIORITY_SCORE = 400
+
+    with tempfile.TemporaryDirectory() as directory:
+        _populate(directory)
+        table = rescore_results(directory, tool="snyk_code", thresholds=(400, 650, 850))
+
+        entries = list_scan_results(directory, tool="snyk_code")
+        assert [row["path"] for row in table.rows()] == [entry["path"] for entry in entries]
+        for entry, metric_result in zip(entries, table.metric_results()):
+            assert metric_result == _reference(entry, StrictSnykMetrics())
+
+
+def test_arrays_round_trip():
+    """Diziler .npz dosyasına kaydedilip aynı sonuçla geri okunmalı"""
+    with tempfile.TemporaryDirectory() as directory:
+        _populate(directory)
+        arrays = load_scan_arrays(list_scan_results(directory))
+        npz_path = os.path.join(directory, "history.npz")
+        arrays.save(npz_path)
+
+        loaded = ScanArrays.load(npz_path)
+        assert loaded.runs == arrays.runs
+        assert loaded.severity_labels == arrays.severity_labels
+        assert np.array_equal(loaded.priority_score, arrays.priority_score)
+        assert score_scan_arrays(loaded).rows() == score_scan_arrays(arrays).rows()
+
+
+def test_invalid_thresholds():
+    """Eşikler üç tane ve artan sırada olmalı"""
+    arrays = ScanArrays()
+    for thresholds in [(500, 700), (900, 700, 500), (500, 500, 900)]:
+        try:
+            score_scan_arrays(arrays, thresholds=thresholds)
+        except ValueError:
+            continue
+        raise AssertionError(f"{thresholds} kabul edilmemeli")
+    assert len(score_scan_arrays(arrays)) == 0
+
+
+def test_scoring_thousands_of_runs():
+    """5000 tarama x 200 issue saniyeler içinde puanlanmalı"""
+    runs, per_run = 5000, 200
+    rng = np.random.default_rng(14)
+    arrays = ScanArrays(
+        runs=[{"path": f"run{number}", "tool": "snyk_code", "project": "p", "timestamp": None}
+              for number in range(runs)],
+        scan_duration=np.zeros(runs),
+        run_index=np.repeat(np.arange(runs, dtype=np.int32), per_run),
+        priority_score=rng.integers(0, 1001, runs * per_run).astype(np.float64),
+        level_code=rng.integers(0, 3, runs * per_run).astype(np.int8),
+        severity_code=np.full(runs * per_run, -1, dtype=np.int16)
+    )
+
+    started = time.perf_counter()
+    table = score_scan_arrays(arrays, thresholds=(400, 650, 850))
+    metric_results = table.metric_results()
+    elapsed = time.perf_counter() - started
+
+    assert len(metric_results) == runs
+    assert all(result.total_issues == per_run for result in metric_results)
+    assert int(table.counts.sum()) == runs * per_run
+    assert elapsed < 5.0, f"Puanlama çok yavaş: {elapsed:.2f}s"
+
+
+if __name__ == "__main__":
+    print("\nTOPLU YENIDEN PUANLAMA TESTLERI\n")
+
+    test_default_thresholds_match_calculators()
+    print("OK: Varsayılan eşiklerle calculate() ile aynı sonuçlar")
+
+    test_custom_thresholds_match_subclass()
+    print("OK: Değiştirilmiş eşikler")
+
+    test_arrays_round_trip()
+    print("OK: .npz kaydetme/okuma")
+
+    test_invalid_thresholds()
+    print("OK: Geçersiz eşikler")
+
+    test_scoring_thousands_of_runs()
+    print("OK: Binlerce taramanın puanlanması")
+
+    print("\nTest tamamlandi!")
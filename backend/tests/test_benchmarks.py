@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark'ı Test Script'i
+
+Bu script, sentetik tarama çıktılarının gerçek çıktılarla aynı şekilde ve
+tekrarlanabilir üretildiğini, benchmark ölçümlerinin baseline olarak
+kaydedildiğini ve karşılaştırma modunun regresyonları işaretlediğini test
+eder. Ölçümler küçük boyutlarla yapılır.
+
+Test Senaryoları:
+1. Sentetik SARIF / DeepSource çıktıları istenen sayıda issue içerir ve seed ile aynıdır
+2. Tüm durumlar ölçülür; bilinmeyen durum hata verir
+3. Karşılaştırma eşiği aşan süre/bellek artışını işaretler, küçük gürültüyü saymaz
+4. Komut satırı baseline yazar; regresyonda 1 ile çıkar
+
+Kullanım:
+    cd backend/tests
+    python test_benchmarks.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_benchmarks.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.payloads import deepsource_payload, issue_lists, sarif_payload
+from benchmarks.pipeline_benchmark import (
+    BENCHMARK_CASES, BenchmarkRecord, build_baseline, compare_results, main, run_benchmarks
+)
+from metrics.advanced_metrics import AdvancedMetricsCalculator
+from metrics.deepsource_metrics import DeepSourceMetrics
+from metrics.resource_sampler import ResourceSampler
+from metrics.snyk_metrics import SnykMetrics
+
+
+def _record(case: str, issues: int, seconds: float, memory_mb: float) -> BenchmarkRecord:
+    return BenchmarkRecord(
+        case=case, issues=issues, repeats=3, best_seconds=seconds, median_seconds=seconds,
+        throughput_per_second=issues / seconds, peak_memory_mb=memory_mb
+    )
+
+
+def test_synthetic_payloads():
+    """Sentetik çıktılar istenen sayıda issue içermeli ve tekrarlanabilir olmalı"""
+    sarif = sarif_payload(500)
+    result = SnykMetrics().calculate(sarif)
+    assert result.total_issues == 500
+    assert result.critical + result.high + result.medium + result.low == 500
+    assert result.critical > 0 and result.low > 0
+    assert sarif == sarif_payload(500)
+    assert sarif != sarif_payload(500, seed=7)
+
+    deepsource = DeepSourceMetrics().calculate(deepsource_payload(500))
+    assert deepsource.total_issues == 500
+    assert deepsource.critical > 0 and deepsource.low > 0
+
+    detected, ground_truth = issue_lists(1000)
+    assert len(detected) == len(ground_truth) == 1000
+    accuracy = AdvancedMetricsCalculator(sampler=ResourceSampler()).calculate_defect_detection_accuracy(
+        detected, ground_truth
+    )
+    # Ground truth'un ~%70'i bulunan issue'larla aynı konumda
+    assert 0.6 < accuracy["recall"] < 0.8
+
+
+def test_run_benchmarks_measures_all_cases():
+    """Tüm durumlar ölçülmeli; bilinmeyen durum hata vermeli"""
+    records = run_benchmarks(sizes=(50,), repeats=1)
+    assert [record.case for record in records] == list(BENCHMARK_CASES)
+    for record in records:
+        assert record.issues == 50
+        assert record.best_seconds > 0
+        assert record.throughput_per_second > 0
+        assert record.peak_memory_mb >= 0
+
+    try:
+        run_benchmarks(sizes=(50,), case_names=["missing_case"])
+        raise AssertionError("Bilinmeyen durum kabul edilmemeli")
+    except ValueError:
+        pass
+
+
+def test_compare_flags_regressions():
+    """Eşiği aşan artışlar regresyon sayılmalı; mutlak olarak küçük farklar sayılmamalı"""
+    baseline = build_baseline([
+        _record("snyk_metrics.calculate", 100000, 0.1, 5.0),
+        _record("snyk_metrics.calculate", 100, 0.0002, 0.01),
+        _record("save_scan_result.json", 100000, 9.0, 80.0)
+    ])
+    current = [
+        _record("snyk_metrics.calculate", 100000, 0.15, 5.0),    # %50 yavaş
+        _record("snyk_metrics.calculate", 100, 0.0006, 0.5),     # oran büyük, mutlak fark küçük
+        _record("save_scan_result.json", 100000, 9.5, 120.0),    # süre eşik altında, bellek %50
+        _record("deepsource_metrics.calculate", 100, 0.1, 1.0)   # baseline'da yok
+    ]
+
+    comparisons = {(row["case"], row["issues"]): row for row in compare_results(baseline, current, threshold=0.2)}
+    assert len(comparisons) == 3
+
+    slower = comparisons[("snyk_metrics.calculate", 100000)]
+    assert slower["regression"] and slower["seconds"]["regression"]
+    assert slower["seconds"]["change"] == 0.5
+
+    assert not comparisons[("snyk_metrics.calculate", 100)]["regression"]
+
+    memory = comparisons[("save_scan_result.json", 100000)]
+    assert memory["regression"] and memory["memory"]["regression"]
+    assert not memory["seconds"]["regression"]
+
+
+def test_command_line_baseline_and_compare():
+    """Komut satırı baseline yazmalı; regresyonda 1, aksi halde 0 ile çıkmalı"""
+    with tempfile.TemporaryDirectory() as directory:
+        baseline_path = os.path.join(directory, "baseline.json")
+        arguments = ["--sizes", "100", "--repeats", "1", "--cases", "save_scan_result.json"]
+
+        assert main(arguments + ["--output", baseline_path]) == 0
+        with open(baseline_path, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        assert baseline["environment"]["python"]
+        assert [row["case"] for row in baseline["results"]] == ["save_scan_result.json"]
+
+        assert main(arguments + ["--compare", baseline_path, "--threshold", "100"]) == 0
+
+        # Baseline'ı gerçek dışı hızlı yap: ölçüm regresyon olmalı
+        baseline["results"][0]["best_seconds"] = 1e-6
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(baseline, f)
+        assert main(arguments + ["--compare", baseline_path]) == 1
+
+        assert main(arguments + ["--compare", os.path.join(directory, "missing.json")]) == 2
+
+
+if __name__ == "__main__":
+    print("\nPIPELINE BENCHMARK TESTLERI\n")
+
+    test_synthetic_payloads()
+    print("OK: Sentetik çıktılar")
+
+    test_run_benchmarks_measures_all_cases()
+    print("OK: Tüm durumlar ölçülüyor")
+
+    test_compare_flags_regressions()
+    print("OK: Regresyon karşılaştırması")
+
+    test_command_line_baseline_and_compare()
+    print("OK: Komut satırı")
+
+    print("\nTest tamamlandi!")
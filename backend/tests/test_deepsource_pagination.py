@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+DeepSource Pagination Test Script'i
+
+Bu script, deepsource_runner'ın GraphQL pagination, paylaşılan HTTP session
+ve tarama zaman aşımına uyma davranışını yerel bir stub GraphQL sunucusuna
+karşı test eder. Gerçek DeepSource API'sine veya ağa ihtiyaç duymaz.
+
+Test Senaryoları:
+1. 100'den fazla issue'su olan repository'nin tüm sayfaları alınır
+2. Sayfalar aynı keep-alive bağlantısı üzerinden istenir
+3. Fan-out zaman aşımında istek timeout'u kalan süreyle sınırlanır; süre
+   dolduktan sonra yeni sayfa istenmez
+4. Runner API modunda sayfaları birleştirmeden sayar ve sonuç dosyasına yazar
+   (kompakt ve JSON formatı, cache girdisi dosyayı gösterir); cache'teki sonuç
+   sadece DEEPSOURCE_API_CACHE_SECONDS boyunca kullanılır
+
+Kullanım:
+    cd backend/tests
+    python test_deepsource_pagination.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_deepsource_pagination.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import deepsource_runner
+import result_store
+from metrics.deepsource_metrics import DeepSourceMetrics
+from scan_fanout import scan_deadline
+from tests.runner_patches import patched_runner
+
+SEVERITIES = ["CRITICAL", "MAJOR", "MINOR", "INFO"]
+
+# Stub sunucudaki repository'ler: repository adı -> issue sayısı
+STUB_REPOSITORIES = {"kalite": 250, "small": 7, "empty": 0}
+
+
+class StubGraphQLHandler(BaseHTTPRequestHandler):
+    """DeepSource repository issues sorgusunu taklit eden handler"""
+
+    protocol_version = "HTTP/1.1"  # keep-alive
+    connections = set()
+    requests = 0
+    delay = 0.0  # Her yanıttan önce beklenen süre (saniye)
+
+    def do_POST(self):
+        StubGraphQLHandler.connections.add(self.client_address)
+        StubGraphQLHandler.requests += 1
+        time.sleep(StubGraphQLHandler.delay)
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        variables = body["variables"]
+
+        total = STUB_REPOSITORIES.get(variables["name"], 0)
+        start = int(variables["after"]) if variables.get("after") else 0
+        end = min(start + variables["first"], total)
+
+        edges = [
+            {"node": {"issue": {
+                "shortcode": f"PY-{i:04d}",
+                "title": f"Stub issue {i}",
+                "severity": SEVERITIES[i % len(SEVERITIES)],
+                "category": "BUG_RISK"
+            }}}
+            for i in range(start, end)
+        ]
+        payload = json.dumps({"data": {"repository": {
+            "name": variables["name"],
+            "issues": {
+                "totalCount": total,
+                "pageInfo": {"hasNextPage": end < total, "endCursor": str(end)},
+                "edges": edges
+            }
+        }}}).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        try:
+            self.wfile.write(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            # İstemci timeout nedeniyle bağlantıyı kapattı
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _start_stub_server():
+    """Stub sunucuyu rastgele bir portta başlatır ve runner'ı ona yönlendirir"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubGraphQLHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    server.original_settings = {
+        name: getattr(deepsource_runner, name)
+        for name in ("DEEPSOURCE_API_URL", "DEEPSOURCE_API_TOKEN", "DEEPSOURCE_PAGE_SIZE")
+    }
+    deepsource_runner.DEEPSOURCE_API_URL = f"http://127.0.0.1:{server.server_address[1]}/graphql/"
+    deepsource_runner.DEEPSOURCE_API_TOKEN = "stub-token"
+    deepsource_runner.DEEPSOURCE_PAGE_SIZE = 100
+    return server
+
+
+def _stop_stub_server(server):
+    """Stub sunucuyu durdurur ve runner ayarlarını geri yükler"""
+    server.shutdown()
+    server.server_close()
+    for name, value in server.original_settings.items():
+        setattr(deepsource_runner, name, value)
+
+
+def test_pagination_fetches_all_pages():
+    """100'den fazla issue tüm sayfalar gezilerek alınmalı"""
+    server = _start_stub_server()
+    try:
+        StubGraphQLHandler.connections.clear()
+        pages = list(deepsource_runner.iter_deepsource_issue_pages("elif1624", "kalite"))
+
+        assert [len(page["edges"]) for page in pages] == [100, 100, 50]
+        assert all(page["totalCount"] == 250 for page in pages)
+        # Tüm sayfalar paylaşılan session'ın tek bağlantısı üzerinden gelmeli
+        assert len(StubGraphQLHandler.connections) == 1
+    finally:
+        _stop_stub_server(server)
+
+
+def test_metrics_from_streamed_pages_match_full_response():
+    """Sayfa sayfa hesaplanan metrik, birleştirilmiş response ile aynı olmalı"""
+    server = _start_stub_server()
+    try:
+        streamed = DeepSourceMetrics().calculate_from_pages(
+            deepsource_runner.iter_deepsource_issue_pages("elif1624", "kalite")
+        )
+
+        edges = []
+        for page in deepsource_runner.iter_deepsource_issue_pages("elif1624", "kalite"):
+            edges.extend(page["edges"])
+        full = DeepSourceMetrics().calculate(
+            {"data": {"repository": {"issues": {"totalCount": len(edges), "edges": edges}}}}
+        )
+
+        assert streamed == full
+        assert streamed.total_issues == 250
+        assert (streamed.critical, streamed.high, streamed.medium, streamed.low) == (63, 63, 62, 62)
+    finally:
+        _stop_stub_server(server)
+
+
+def test_pages_respect_scan_deadline():
+    """İstek timeout'u kalan süreyle sınırlanmalı; süre dolunca yeni sayfa istenmemeli"""
+    server = _start_stub_server()
+    StubGraphQLHandler.delay = 0.3
+    try:
+        # 3 sayfa x 0.3 s: ikinci sayfa isteği kalan ~0.2 s içinde yanıt alamaz
+        StubGraphQLHandler.requests = 0
+        started = time.monotonic()
+        try:
+            with scan_deadline(0.5):
+                list(deepsource_runner.iter_deepsource_issue_pages("elif1624", "kalite"))
+            raise AssertionError("RuntimeError bekleniyordu")
+        except RuntimeError as e:
+            assert "request failed" in str(e) or "timeout" in str(e)
+        assert time.monotonic() - started < 1.0
+        assert StubGraphQLHandler.requests == 2
+
+        # Süresi dolmuş taramada hiç istek yapılmaz
+        StubGraphQLHandler.requests = 0
+        try:
+            with scan_deadline(0):
+                list(deepsource_runner.iter_deepsource_issue_pages("elif1624", "kalite"))
+            raise AssertionError("RuntimeError bekleniyordu")
+        except RuntimeError as e:
+            assert "scan deadline passed" in str(e)
+        assert StubGraphQLHandler.requests == 0
+    finally:
+        StubGraphQLHandler.delay = 0.0
+        _stop_stub_server(server)
+
+
+def test_runner_streams_api_pages_to_result_file():
+    """API modunda runner sayfaları birleştirmeden saymalı ve dosyaya yazmalı"""
+    def merged_scan(target_path, on_resource_usage=None):
+        raise AssertionError("API modunda sayfalar birleştirilmemeli")
+
+    server = _start_stub_server()
+    original_format = result_store.RESULT_STORE_FORMAT
+    try:
+        for file_format in ("compact", "json"):
+            result_store.RESULT_STORE_FORMAT = file_format
+            with tempfile.TemporaryDirectory() as directory, patched_runner(
+                deepsource_runner, directory,
+                DEEPSOURCE_CLI_PATH=os.path.join(directory, "no-deepsource-cli"),
+                DEEPSOURCE_REPO_NAME="kalite",
+                DEEPSOURCE_API_CACHE_SECONDS=300,
+                run_deepsource_scan=merged_scan,
+                get_deepsource_version=lambda: "graphql-api"
+            ):
+                result = deepsource_runner.run_deepsource_scan_and_save("flask_demo")
+                assert result["success"], result
+                assert result["metric_result"]["total_issues"] == 250
+
+                # Dosya, birleştirilmiş response ile aynı dokümanı içerir
+                document = result_store.load_scan_result(result["file_path"])
+                edges = []
+                for page in deepsource_runner.iter_deepsource_issue_pages("elif1624", "kalite"):
+                    edges.extend(page["edges"])
+                assert document == {"data": {"repository": {
+                    "name": "kalite", "issues": {"totalCount": 250, "edges": edges}
+                }}}, file_format
+                assert result_store.is_compact_result(result["file_path"]) == (file_format == "compact")
+                latest = deepsource_runner.results_index.latest("deepsource", "flask_demo")
+                assert latest["metrics"]["total_issues"] == 250
+
+                # Cache girdisi ham çıktıyı değil sonuç dosyasını taşır
+                cached = deepsource_runner.run_deepsource_scan_and_save("flask_demo")
+                assert cached["cached"] is True
+                assert cached["metric_result"]["total_issues"] == 250
+                assert not [name for name in os.listdir(deepsource_runner.RESULTS_DIR) if name.endswith(".tmp")]
+
+                # Uzak analiz değişmiş olabilir: süre dolunca yerel ağaç aynı olsa da yeniden alınır
+                deepsource_runner.DEEPSOURCE_API_CACHE_SECONDS = 0
+                refreshed = deepsource_runner.run_deepsource_scan_and_save("flask_demo")
+                assert refreshed["success"] and refreshed["cached"] is False
+                assert refreshed["file_path"] != result["file_path"]
+    finally:
+        result_store.RESULT_STORE_FORMAT = original_format
+        _stop_stub_server(server)
+
+
+if __name__ == "__main__":
+    print("\nDEEPSOURCE PAGINATION TESTLERI\n")
+
+    test_pagination_fetches_all_pages()
+    print("OK: Pagination")
+
+    test_metrics_from_streamed_pages_match_full_response()
+    print("OK: Sayfa sayfa metrik hesaplama")
+
+    test_pages_respect_scan_deadline()
+    print("OK: Sayfa istekleri tarama zaman aşımına uyuyor")
+
+    test_runner_streams_api_pages_to_result_file()
+    print("OK: Runner API sayfalarını akış halinde kaydediyor")
+
+    print("\nTest tamamlandi!")
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+HTTP Cache ve Sıkıştırma (http_cache) Test Script'i
+
+Bu script, dosya sunan endpoint'lerin içerik hash'inden üretilen ETag ile
+304 dönmesini, önceden sıkıştırılmış (.gz) kopyaların Accept-Encoding'e göre
+gönderilmesini, Range isteklerini ve /scan/latest ile /scan/file/<name>
+endpoint'lerinin sonuç klasörünü sunmasını test eder. Dosyalar geçici bir
+sonuç klasöründe, app.py'nin test client'ı ile sunulur.
+
+Test Senaryoları:
+1. Strong ETag içerikten üretilir; If-None-Match eşleşirse 304
+2. Tekrar eden isteklerde dosya yeniden hash'lenmez
+3. gzip kabul eden istemciye .gz sidecar gönderilir; eski sidecar yenilenir
+4. Range istekleri sıkıştırılmamış dosyadan 206 döner
+5. /scan/latest en son sonuç dosyasını, /scan/file/<name> istenen dosyayı sunar;
+   sidecar'lar kayıtta değil ilk istekte üretilir, küçük ve .rstore dosyalar atlanır
+
+Kullanım:
+    cd backend/tests
+    python test_http_cache.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_http_cache.py
+"""
+
+import gzip
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app as app_module
+import http_cache
+import result_store
+from http_cache import content_etag, is_http_cache_artifact, write_sidecars
+
+REPORT = {"runs": [{"results": [{"ruleId": f"rule-{number}", "level": "warning"} for number in range(200)]}]}
+
+
+@contextmanager
+def _client(directory: str):
+    """Sonuç klasörü olarak directory'yi kullanan app.py test client'ı"""
+    original = app_module.RESULTS_DIR
+    app_module.RESULTS_DIR = directory
+    try:
+        yield app_module.app.test_client()
+    finally:
+        app_module.RESULTS_DIR = original
+
+
+def _write_report(directory: str, name: str = "report.json", data: dict = REPORT) -> str:
+    path = os.path.join(directory, name)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+def test_etag_and_not_modified():
+    """ETag içerikten üretilmeli; If-None-Match eşleşirse 304 dönmeli"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_report(directory)
+        with _client(directory) as client:
+            response = client.get("/scan/file/report.json")
+            assert response.status_code == 200
+            etag = response.headers["ETag"]
+            assert etag == f'"{content_etag(path)}"' and not etag.startswith("W/")
+            assert response.headers["Cache-Control"] == "no-cache"
+            assert response.headers["Accept-Ranges"] == "bytes"
+            assert json.loads(response.data) == REPORT
+
+            response = client.get("/scan/file/report.json", headers={"If-None-Match": etag})
+            assert response.status_code == 304
+            assert response.data == b""
+
+            # İçerik değişince ETag da değişir
+            _write_report(directory, data={"runs": []})
+            os.utime(path, ns=(1, 1))
+            response = client.get("/scan/file/report.json", headers={"If-None-Match": etag})
+            assert response.status_code == 200
+            assert response.headers["ETag"] != etag
+
+
+def test_etag_is_cached_by_stat():
+    """Değişmeyen dosya için hash tekrar hesaplanmamalı"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_report(directory)
+        first = content_etag(path)
+
+        original_sha256 = http_cache.hashlib.sha256
+        http_cache.hashlib.sha256 = lambda: (_ for _ in ()).throw(AssertionError("dosya yeniden hash'lendi"))
+        try:
+            assert content_etag(path) == first
+        finally:
+            http_cache.hashlib.sha256 = original_sha256
+
+
+def test_gzip_sidecar_negotiation():
+    """gzip kabul eden istemciye .gz gönderilmeli; eski sidecar yenilenmeli"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_report(directory)
+        with _client(directory) as client:
+            response = client.get("/scan/file/report.json", headers={"Accept-Encoding": "gzip"})
+            assert response.status_code == 200
+            assert response.headers["Content-Encoding"] == "gzip"
+            assert "Accept-Encoding" in response.headers["Vary"]
+            assert len(response.data) < os.path.getsize(path) / 4
+            assert json.loads(gzip.decompress(response.data)) == REPORT
+            assert os.path.exists(path + ".gz")
+
+            etag = response.headers["ETag"]
+            assert etag.endswith('-gzip"')
+            response = client.get("/scan/file/report.json", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+            assert response.status_code == 304
+
+            # Sıkıştırma kabul etmeyen istemci düz dosyayı alır
+            response = client.get("/scan/file/report.json")
+            assert "Content-Encoding" not in response.headers
+
+            # Kaynak değişince sidecar yeniden üretilir
+            updated = {"runs": [{"results": [{"ruleId": "updated"}] * 100}]}
+            _write_report(directory, data=updated)
+            response = client.get("/scan/file/report.json", headers={"Accept-Encoding": "gzip"})
+            assert json.loads(gzip.decompress(response.data)) == updated
+
+
+def test_range_requests():
+    """Range isteği sıkıştırılmamış dosyanın byte aralığını dönmeli"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_report(directory)
+        content = Path(path).read_bytes()
+        with _client(directory) as client:
+            response = client.get("/scan/file/report.json", headers={"Range": "bytes=10-29", "Accept-Encoding": "gzip"})
+            assert response.status_code == 206
+            assert response.data == content[10:30]
+            assert "Content-Encoding" not in response.headers
+            assert response.headers["Content-Range"] == f"bytes 10-29/{len(content)}"
+
+
+def test_result_endpoints_serve_results_dir():
+    """/scan/latest ve /scan/file sonuç klasörünü sunmalı; sidecar'lar ilk istekte üretilmeli"""
+    with tempfile.TemporaryDirectory() as directory:
+        with _client(directory) as client:
+            assert client.get("/scan/latest").status_code == 404
+
+            json_path = result_store.save_scan_result(
+                REPORT, "snyk_code", "flask_demo", results_dir=directory, file_format="json"
+            )
+            # Kayıt sıkıştırma yapmaz
+            assert not os.path.exists(json_path + ".gz")
+
+            response = client.get("/scan/latest", headers={"Accept-Encoding": "gzip"})
+            assert response.status_code == 200
+            assert response.headers["Content-Encoding"] == "gzip"
+            assert json.loads(gzip.decompress(response.data)) == REPORT
+            assert os.stat(json_path + ".gz").st_mtime_ns == os.stat(json_path).st_mtime_ns
+
+            # Yeni sonuç (ve sidecar'ı) en son dosya olur; sidecar'lar sonuç sayılmaz
+            time.sleep(0.01)
+            compact_path = result_store.save_scan_result(
+                REPORT, "deepsource", "flask_demo", results_dir=directory, file_format="compact"
+            )
+            response = client.get("/scan/latest", headers={"Accept-Encoding": "gzip"})
+            assert response.status_code == 200
+            assert "Content-Encoding" not in response.headers
+            assert response.data == Path(compact_path).read_bytes()
+            assert not os.path.exists(compact_path + ".gz")
+
+            name = os.path.basename(json_path)
+            response = client.get(f"/scan/file/{name}")
+            assert response.status_code == 200 and json.loads(response.data) == REPORT
+            assert client.get("/scan/file/missing.json").status_code == 404
+            assert client.get("/scan/file/..%2Fapp.py").status_code == 404
+
+        assert write_sidecars(_write_report(directory, "small.json", {"runs": []})) == []
+        listed = {entry["path"] for entry in result_store.list_scan_results(directory)}
+        assert listed == {json_path, compact_path}
+        assert is_http_cache_artifact("report.json.gz") and not is_http_cache_artifact("report.json")
+
+    # Sonuç kaydı Flask'a (http_cache'e) bağımlı değildir
+    completed = subprocess.run(
+        [sys.executable, "-c",
+         "import sys, result_store, metric_runner, deepsource_runner; print('flask' in sys.modules)"],
+        cwd=str(Path(__file__).parent.parent), stdout=subprocess.PIPE, text=True, timeout=60
+    )
+    assert completed.stdout.strip() == "False"
+
+
+if __name__ == "__main__":
+    print("\nHTTP CACHE TESTLERI\n")
+
+    test_etag_and_not_modified()
+    print("OK: ETag ve 304")
+
+    test_etag_is_cached_by_stat()
+    print("OK: ETag stat'a göre cache'leniyor")
+
+    test_gzip_sidecar_negotiation()
+    print("OK: gzip sidecar seçimi")
+
+    test_range_requests()
+    print("OK: Range istekleri")
+
+    test_result_endpoints_serve_results_dir()
+    print("OK: /scan/latest ve /scan/file sonuç klasörü")
+
+    print("\nTest tamamlandi!")
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Incremental Snyk Code Taraması Test Script'i
+
+Bu script, önceki tam SARIF çıktısıyla sadece değişen dosyaları içeren
+kısmi taramayı birleştiren merge_sarif_results'ı ve durum dosyası üzerinden
+çalışan run_incremental_snyk_code_scan'i test eder. Snyk CLI yerine, verilen
+klasördeki dosyaları satır satır tarayan deterministik sahte bir tarayıcı
+kullanılır; böylece birleştirilmiş sonuç aynı ağacın tam taramasıyla
+karşılaştırılabilir.
+
+Test Senaryoları:
+1. Değişen/silinen dosyaların eski result'ları atılır, kısmi taramanınkiler eklenir
+2. Rule listesi id'ye göre birleştirilir ve ruleIndex'ler yeniden hesaplanır
+3. Coverage güncel dosya listesine göre uzantı bazında yeniden sayılır
+4. Incremental tarama sadece değişen dosyaları tarar ve sonucu tam taramaya eşittir
+5. Değişiklik yoksa veya sadece silme varsa CLI çalıştırılmaz; Snyk versiyonu
+   değişince tam tarama yapılır
+
+Kullanım:
+    cd backend/tests
+    python test_incremental_scan.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_incremental_scan.py
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import metric_runner
+from metric_runner import merge_sarif_results
+from metrics.snyk_metrics import SnykMetrics
+
+# Sahte tarayıcının kuralları: satırda geçen ifade -> (rule id, level)
+FAKE_RULES = {
+    "eval(": ("python/CodeInjection", "error"),
+    "password =": ("python/HardcodedPassword", "warning"),
+    "md5(": ("python/InsecureHash", "note"),
+}
+
+
+def _result(uri: str, rule_id: str, rule_index: int, level: str, line: int) -> dict:
+    return {
+        "ruleId": rule_id,
+        "ruleIndex": rule_index,
+        "level": level,
+        "message": {"text": rule_id},
+        "locations": [{"physicalLocation": {
+            "artifactLocation": {"uri": uri},
+            "region": {"startLine": line}
+        }}]
+    }
+
+
+def _sarif(rules: list, results: list, coverage: list) -> dict:
+    return {"runs": [{
+        "tool": {"driver": {"name": "SnykCode", "rules": [{"id": rule_id} for rule_id in rules]}},
+        "results": results,
+        "properties": {"coverage": coverage}
+    }]}
+
+
+def fake_snyk_scan(target_path: str, on_resource_usage=None) -> dict:
+    """
+    Snyk Code CLI yerine kullanılan deterministik tarayıcı
+
+    Rule'lar ilk görüldükleri sırayla listelenir; böylece kısmi taramadaki
+    ruleIndex'ler tam taramadakilerden farklı olur.
+    """
+    fake_snyk_scan.scanned.append(sorted(
+        str(path.relative_to(target_path).as_posix())
+        for path in Path(target_path).rglob("*") if path.is_file()
+    ))
+
+    rules, results, extensions = [], [], {}
+    for path in sorted(Path(target_path).rglob("*")):
+        if not path.is_file():
+            continue
+        relative_path = path.relative_to(target_path).as_posix()
+        if path.suffix:  # Snyk coverage'ı sadece kaynak dosyaların uzantılarını sayar
+            extensions[path.suffix] = extensions.get(path.suffix, 0) + 1
+        for line_number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+            for needle, (rule_id, level) in FAKE_RULES.items():
+                if needle in line:
+                    if rule_id not in rules:
+                        rules.append(rule_id)
+                    results.append(_result(relative_path, rule_id, rules.index(rule_id), level, line_number))
+
+    coverage = [
+        {"files": count, "isSupported": True, "lang": extension, "type": "SUPPORTED"}
+        for extension, count in sorted(extensions.items())
+    ]
+    return _sarif(rules, results, coverage)
+
+
+fake_snyk_scan.scanned = []
+
+
+def _result_keys(sarif: dict) -> list:
+    """Result'ları sıradan bağımsız karşılaştırmak için (uri, satır, rule) listesi"""
+    run = sarif["runs"][0]
+    rule_ids = [rule["id"] for rule in run["tool"]["driver"]["rules"]]
+    keys = []
+    for result in run["results"]:
+        # ruleIndex, birleştirilmiş rule listesinde doğru rule'u göstermeli
+        assert rule_ids[result["ruleIndex"]] == result["ruleId"], result
+        location = result["locations"][0]["physicalLocation"]
+        keys.append((
+            metric_runner._normalize_sarif_uri(location["artifactLocation"]["uri"]),
+            location["region"]["startLine"],
+            result["ruleId"],
+            result["level"]
+        ))
+    return sorted(keys)
+
+
+def _coverage(sarif: dict) -> dict:
+    return {entry["lang"]: entry["files"] for entry in sarif["runs"][0]["properties"]["coverage"]}
+
+
+def test_merge_drops_changed_and_deleted_files():
+    """Değişen ve silinen dosyaların eski result'ları atılmalı"""
+    previous = _sarif(
+        ["python/CodeInjection", "python/HardcodedPassword"],
+        [
+            _result("app.py", "python/CodeInjection", 0, "error", 3),
+            _result("./views.py", "python/HardcodedPassword", 1, "warning", 7),
+            _result("old.py", "python/CodeInjection", 0, "error", 1),
+        ],
+        [{"files": 3, "isSupported": True, "lang": ".py", "type": "SUPPORTED"}]
+    )
+    partial = _sarif(
+        ["python/HardcodedPassword"],
+        [_result("views.py", "python/HardcodedPassword", 0, "warning", 9)],
+        [{"files": 1, "isSupported": True, "lang": ".py", "type": "SUPPORTED"}]
+    )
+
+    merged = merge_sarif_results(previous, partial, {"views.py", "old.py"}, ["app.py", "views.py"])
+
+    assert _result_keys(merged) == [
+        ("app.py", 3, "python/CodeInjection", "error"),
+        ("views.py", 9, "python/HardcodedPassword", "warning"),
+    ]
+
+
+def test_merge_remaps_rule_indexes():
+    """Kısmi taramanın ruleIndex'leri birleştirilmiş rule listesine göre yeniden hesaplanmalı"""
+    previous = _sarif(
+        ["python/CodeInjection", "python/HardcodedPassword"],
+        [_result("app.py", "python/HardcodedPassword", 1, "warning", 2)],
+        []
+    )
+    # Kısmi taramada rule'lar farklı sırada ve yeni bir rule var
+    partial = _sarif(
+        ["python/InsecureHash", "python/CodeInjection"],
+        [
+            _result("lib.py", "python/InsecureHash", 0, "note", 4),
+            _result("lib.py", "python/CodeInjection", 1, "error", 5),
+        ],
+        []
+    )
+
+    merged = merge_sarif_results(previous, partial, {"lib.py"}, ["app.py", "lib.py"])
+    run = merged["runs"][0]
+
+    assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == [
+        "python/CodeInjection", "python/HardcodedPassword", "python/InsecureHash"
+    ]
+    assert [(result["ruleId"], result["ruleIndex"]) for result in run["results"]] == [
+        ("python/HardcodedPassword", 1), ("python/InsecureHash", 2), ("python/CodeInjection", 0)
+    ]
+
+
+def test_merge_recounts_coverage():
+    """Coverage güncel dosya listesine göre uzantı bazında yeniden sayılmalı"""
+    previous = _sarif([], [], [
+        {"files": 2, "isSupported": True, "lang": ".py", "type": "SUPPORTED"},
+        {"files": 1, "isSupported": True, "lang": ".html", "type": "SUPPORTED"},
+    ])
+    partial = _sarif([], [], [
+        {"files": 1, "isSupported": True, "lang": ".js", "type": "SUPPORTED"},
+    ])
+
+    merged = merge_sarif_results(
+        previous, partial, {"index.html", "static/app.js"}, ["app.py", "lib.py", "views.py", "static/app.js"]
+    )
+
+    # .html dosyası silindi: coverage'dan çıkar; .js kısmi taramadan gelir
+    assert _coverage(merged) == {".py": 3, ".js": 1}
+
+
+def _write_project(root: str, files: dict):
+    for relative_path, content in files.items():
+        path = Path(root, relative_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
+def _with_fake_snyk(test):
+    original = {name: getattr(metric_runner, name) for name in (
+        "run_snyk_code_scan", "get_snyk_version", "INCREMENTAL_STATE_DIR"
+    )}
+    with tempfile.TemporaryDirectory() as directory:
+        version = {"value": "1.0.0"}
+        metric_runner.run_snyk_code_scan = fake_snyk_scan
+        metric_runner.get_snyk_version = lambda: version["value"]
+        metric_runner.INCREMENTAL_STATE_DIR = os.path.join(directory, "state")
+        fake_snyk_scan.scanned.clear()
+        try:
+            project = os.path.join(directory, "project")
+            os.makedirs(project)
+            test(project, version)
+        finally:
+            for name, value in original.items():
+                setattr(metric_runner, name, value)
+
+
+def test_incremental_scan_matches_full_scan():
+    """Incremental sonuç, aynı ağacın tam taramasıyla aynı metrikleri vermeli"""
+    def check(project, version):
+        _write_project(project, {
+            "app.py": "import os\nresult = eval(user_input)\n",
+            "auth/views.py": "password = 'admin'\nx = 1\n",
+            "lib/hashing.py": "h = md5(data)\n",
+            "templates/index.html": "<p>eval(x)</p>\n",
+            ".snyk": "version: v1.25.0\n",
+        })
+
+        first = metric_runner.run_incremental_snyk_code_scan(project, "demo")
+        assert len(fake_snyk_scan.scanned) == 1  # İlk tarama tamdır
+        assert _result_keys(first) == _result_keys(fake_snyk_scan(project))
+
+        # Bir dosya değişir, biri silinir, biri eklenir
+        _write_project(project, {
+            "auth/views.py": "x = 1\ny = eval(z)\npassword = 'root'\n",
+            "lib/crypto.py": "digest = md5(payload)\nother = eval(code)\n",
+        })
+        os.remove(os.path.join(project, "templates", "index.html"))
+        fake_snyk_scan.scanned.clear()
+
+        merged = metric_runner.run_incremental_snyk_code_scan(project, "demo")
+
+        # Sadece değişen/eklenen dosyalar (ve yapılandırma dosyaları) taranır
+        assert fake_snyk_scan.scanned == [[".snyk", "auth/views.py", "lib/crypto.py"]]
+
+        full = fake_snyk_scan(project)
+        assert _result_keys(merged) == _result_keys(full)
+        assert _coverage(merged) == _coverage(full)
+        assert SnykMetrics().calculate(merged) == SnykMetrics().calculate(full)
+
+    _with_fake_snyk(check)
+
+
+def test_incremental_scan_skips_cli_when_possible():
+    """Değişiklik yoksa veya sadece silme varsa CLI çalışmamalı; versiyon değişince tam tarama yapılmalı"""
+    def check(project, version):
+        _write_project(project, {
+            "app.py": "result = eval(user_input)\n",
+            "old.py": "password = 'admin'\n",
+        })
+        first = metric_runner.run_incremental_snyk_code_scan(project, "demo")
+        fake_snyk_scan.scanned.clear()
+
+        # Değişiklik yok: önceki çıktı döner
+        unchanged = metric_runner.run_incremental_snyk_code_scan(project, "demo")
+        assert fake_snyk_scan.scanned == []
+        assert _result_keys(unchanged) == _result_keys(first)
+
+        # Sadece silme: result'lar atılır, tarama yapılmaz
+        os.remove(os.path.join(project, "old.py"))
+        deleted = metric_runner.run_incremental_snyk_code_scan(project, "demo")
+        assert fake_snyk_scan.scanned == []
+        assert _result_keys(deleted) == _result_keys(fake_snyk_scan(project))
+        fake_snyk_scan.scanned.clear()
+
+        # Snyk versiyonu değişti: önceki durum kullanılmaz
+        version["value"] = "1.1.0"
+        rescanned = metric_runner.run_incremental_snyk_code_scan(project, "demo")
+        assert fake_snyk_scan.scanned == [["app.py"]]
+        assert _result_keys(rescanned) == _result_keys(deleted)
+
+    _with_fake_snyk(check)
+
+
+if __name__ == "__main__":
+    print("\nINCREMENTAL SNYK CODE TARAMASI TESTLERI\n")
+
+    test_merge_drops_changed_and_deleted_files()
+    print("OK: Değişen/silinen dosyaların sonuçları")
+
+    test_merge_remaps_rule_indexes()
+    print("OK: ruleIndex yeniden hesaplama")
+
+    test_merge_recounts_coverage()
+    print("OK: Coverage birleştirme")
+
+    test_incremental_scan_matches_full_scan()
+    print("OK: Incremental tarama tam taramaya eşit")
+
+    test_incremental_scan_skips_cli_when_possible()
+    print("OK: Gereksiz CLI çağrıları atlanıyor")
+
+    print("\nTest tamamlandi!")
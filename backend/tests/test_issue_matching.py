@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Issue Eşleştirme Test Script'i
+
+Bu script, calculate_defect_detection_accuracy'nin varsayılan eşleştirici
+için kullandığı hash index'li hızlı yolun, eski iç içe döngülü greedy
+eşleştirme ile birebir aynı sonucu verdiğini ve IssueMatchingEngine'in
+satır toleransı, tip uyumu ve optimal atama modlarını test eder.
+
+Test Senaryoları:
+1. Rastgele verilerde hızlı yol ile eski döngü aynı metrikleri üretir
+2. Dosya bilgisi olmayan issue'lar hiçbir şeyle eşleşmez
+3. Özel issue_matching_func verilirse eski davranış korunur
+4. Büyük listelerde (10^5 issue) eşleştirme hızlı tamamlanır
+5. Satır toleransı içinde en yakın ground truth seçilir
+6. match_types açıkken kural/CWE tipi uyumsuz issue'lar eşleşmez
+7. Optimal mod sıradan bağımsızdır ve greedy'den az eşleşme bulmaz
+8. match_types kapalıyken aralık-greedy, Hopcroft–Karp/Hungarian ile aynı
+   sayıda eşleşme bulur ve yoğun dosyalarda (aday sayısı çok büyük) hızlıdır
+
+Kullanım:
+    cd backend/tests
+    python test_issue_matching.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_issue_matching.py
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import metrics.advanced_metrics as advanced_metrics
+from metrics.advanced_metrics import AdvancedMetricsCalculator, IssueMatchingEngine
+
+
+def _random_issues(rng: random.Random, count: int) -> list:
+    """Farklı alan şekillerinde (file/line veya location) rastgele issue'lar"""
+    files = ["app.py", "src/app.py", "lib/utils.py", "utils.py", "", None]
+    issues = []
+    for _ in range(count):
+        file_name = rng.choice(files)
+        line = rng.randint(1, 15)
+        if rng.random() < 0.5:
+            issues.append({"file": file_name, "line": line})
+        else:
+            issues.append({"location": {"file": file_name or "", "line": line}})
+    return issues
+
+
+def _legacy_accuracy(calculator: AdvancedMetricsCalculator, detected: list, truth: list) -> dict:
+    """Varsayılan eşleştiriciyi sarmalayarak eski iç içe döngüyü çalıştırır"""
+    return calculator.calculate_defect_detection_accuracy(
+        detected, truth, lambda d, t: calculator._default_issue_matcher(d, t)
+    )
+
+
+def test_fast_path_matches_legacy_loop():
+    """Hızlı yol, eski greedy döngü ile birebir aynı sonucu vermeli"""
+    calculator = AdvancedMetricsCalculator()
+    rng = random.Random(42)
+
+    for _ in range(200):
+        detected = _random_issues(rng, rng.randint(0, 40))
+        truth = _random_issues(rng, rng.randint(0, 40))
+        assert calculator.calculate_defect_detection_accuracy(detected, truth) == \
+            _legacy_accuracy(calculator, detected, truth)
+
+
+def test_issues_without_file_never_match():
+    """Dosya bilgisi olmayan issue'lar false positive/negative sayılmalı"""
+    calculator = AdvancedMetricsCalculator()
+    result = calculator.calculate_defect_detection_accuracy(
+        [{"line": 3}, {"file": "", "line": 3}, {"file": "a/app.py", "line": 3}],
+        [{"line": 3}, {"file": "b/app.py", "line": 3}, {"file": "app.py", "line": 3}]
+    )
+
+    assert (result["true_positives"], result["false_positives"], result["false_negatives"]) == (1, 2, 2)
+
+
+def test_custom_matcher_keeps_behavior():
+    """Özel eşleştirici verilirse hash index kullanılmamalı"""
+    calculator = AdvancedMetricsCalculator()
+    same_type = lambda detected, truth: detected["type"] == truth["type"]
+    result = calculator.calculate_defect_detection_accuracy(
+        [{"type": "sqli"}, {"type": "sqli"}, {"type": "xss"}],
+        [{"type": "sqli"}, {"type": "csrf"}],
+        same_type
+    )
+
+    assert (result["true_positives"], result["false_positives"], result["false_negatives"]) == (1, 2, 1)
+
+
+def test_large_inputs_are_fast():
+    """10^5 issue'luk listeler saniyeler içinde eşleştirilmeli"""
+    calculator = AdvancedMetricsCalculator()
+    truth = [{"file": f"src/module_{i % 500}.py", "line": i} for i in range(100000)]
+    detected = [{"file": f"module_{i % 500}.py", "line": i} for i in range(0, 200000, 2)]
+
+    started = time.perf_counter()
+    result = calculator.calculate_defect_detection_accuracy(detected, truth)
+    elapsed = time.perf_counter() - started
+
+    assert result["true_positives"] == 50000
+    assert result["false_positives"] == 50000
+    assert elapsed < 5.0
+
+
+def test_line_tolerance_picks_nearest():
+    """Tolerans içindeki adaylardan en yakını, eşitlikte küçük indeksli olan seçilmeli"""
+    truth = [{"file": "app.py", "line": 7}, {"file": "app.py", "line": 13}, {"file": "app.py", "line": 11}]
+    detected = [{"file": "src/app.py", "line": 10}, {"file": "app.py", "line": 12}, {"file": "app.py", "line": 30}]
+
+    pairs = IssueMatchingEngine(line_tolerance=3).match(detected, truth)
+    assert pairs == [(0, 2), (1, 1)]
+
+    # Tolerans 0 iken motor hızlı yol ile aynı sonucu vermeli
+    calculator = AdvancedMetricsCalculator()
+    rng = random.Random(7)
+    for _ in range(50):
+        detected = _random_issues(rng, rng.randint(0, 30))
+        truth = _random_issues(rng, rng.randint(0, 30))
+        assert len(IssueMatchingEngine().match(detected, truth)) == \
+            calculator.calculate_defect_detection_accuracy(detected, truth)["true_positives"]
+
+
+def test_type_compatibility():
+    """match_types açıkken kural/CWE tipleri uyumsuz issue'lar eşleşmemeli"""
+    truth = [
+        {"file": "app.py", "line": 5, "cwe": "CWE-89"},
+        {"file": "app.py", "line": 5, "type": "python/XSS"},
+        {"file": "app.py", "line": 9}
+    ]
+    detected = [
+        {"file": "app.py", "line": 5, "type": "python/xss"},
+        {"file": "app.py", "line": 6, "cwe": [89]},
+        {"file": "app.py", "line": 9, "type": "python/Sqli"}
+    ]
+
+    assert IssueMatchingEngine(line_tolerance=1, match_types=True).match(detected, truth) == [(0, 1), (1, 0), (2, 2)]
+    assert IssueMatchingEngine(line_tolerance=0, match_types=True).match(detected, truth) == [(0, 1), (2, 2)]
+
+
+def test_optimal_mode_is_order_independent():
+    """Optimal mod, greedy'nin kaçırdığı eşleşmeleri bulmalı ve sıradan bağımsız olmalı"""
+    # Greedy ilk issue'yu 10. satıra bağlar ve ikinci issue eşleşmeden kalır
+    truth = [{"file": "a.py", "line": 10}, {"file": "a.py", "line": 8}]
+    detected = [{"file": "a.py", "line": 10}, {"file": "a.py", "line": 11}]
+    calculator = AdvancedMetricsCalculator()
+
+    greedy = calculator.calculate_defect_detection_accuracy(detected, truth, line_tolerance=2)
+    optimal = calculator.calculate_defect_detection_accuracy(
+        detected, truth, line_tolerance=2, matching_mode="optimal"
+    )
+    assert greedy["true_positives"] == 1
+    assert optimal["true_positives"] == 2
+
+    rng = random.Random(3)
+    original_limit = advanced_metrics.HUNGARIAN_COMPONENT_LIMIT
+    try:
+        for limit in (original_limit, 0):
+            # limit 0: tüm bileşenler Hopcroft–Karp ile çözülür
+            advanced_metrics.HUNGARIAN_COMPONENT_LIMIT = limit
+            for _ in range(100):
+                detected = _random_issues(rng, rng.randint(0, 25))
+                truth = _random_issues(rng, rng.randint(0, 25))
+                engine = IssueMatchingEngine(line_tolerance=2, mode="optimal")
+                pairs = engine.match(detected, truth)
+                shuffled = list(reversed(detected))
+
+                assert len(pairs) == len(engine.match(shuffled, truth))
+                assert len(pairs) >= len(IssueMatchingEngine(line_tolerance=2).match(detected, truth))
+                assert len({truth_index for _, truth_index in pairs}) == len(pairs)
+    finally:
+        advanced_metrics.HUNGARIAN_COMPONENT_LIMIT = original_limit
+
+
+def test_tolerance_modes_scale():
+    """10^5 issue'da toleranslı greedy ve optimal modlar saniyeler içinde bitmeli"""
+    rng = random.Random(11)
+    files = [f"src/module_{i}.py" for i in range(500)]
+    truth = [{"file": rng.choice(files), "line": rng.randint(1, 2000), "type": rng.choice("abc")}
+             for _ in range(100000)]
+    detected = [{"file": issue["file"], "line": issue["line"] + rng.randint(-3, 3), "type": issue["type"]}
+                for issue in truth]
+
+    for mode in ("greedy", "optimal"):
+        started = time.perf_counter()
+        pairs = IssueMatchingEngine(line_tolerance=3, match_types=True, mode=mode).match(detected, truth)
+        assert time.perf_counter() - started < 15.0
+        assert len(pairs) > 90000
+
+
+def test_interval_greedy_matches_bipartite_optimum():
+    """Tip kısıtı yokken aralık-greedy, Hungarian/Hopcroft–Karp kadar eşleşme bulmalı"""
+    rng = random.Random(5)
+    for _ in range(200):
+        tolerance = rng.randint(0, 4)
+        detected = _random_issues(rng, rng.randint(0, 30))
+        truth = _random_issues(rng, rng.randint(0, 30))
+
+        pairs = IssueMatchingEngine(line_tolerance=tolerance, mode="optimal").match(detected, truth)
+        # Tip bilgisi olmayan issue'larda match_types=True aynı aday kenarlarını üretir
+        reference = IssueMatchingEngine(line_tolerance=tolerance, match_types=True, mode="optimal").match(detected, truth)
+        assert len(pairs) == len(reference)
+
+        assert len({truth_index for _, truth_index in pairs}) == len(pairs)
+        assert len({detected_index for detected_index, _ in pairs}) == len(pairs)
+        for detected_index, truth_index in pairs:
+            detected_key = IssueMatchingEngine.location_key(detected[detected_index])
+            truth_key = IssueMatchingEngine.location_key(truth[truth_index])
+            assert detected_key[0] == truth_key[0]
+            assert abs(detected_key[1] - truth_key[1]) <= tolerance
+
+
+def test_dense_file_optimal_is_fast():
+    """Tek dosyada yoğun issue'larda (milyonlarca aday kenar) optimal mod hızlı bitmeli"""
+    rng = random.Random(13)
+    truth = [{"file": "app.py", "line": rng.randint(1, 400)} for _ in range(40000)]
+    detected = [{"file": "app.py", "line": rng.randint(1, 400)} for _ in range(40000)]
+
+    started = time.perf_counter()
+    pairs = IssueMatchingEngine(line_tolerance=50, mode="optimal").match(detected, truth)
+    elapsed = time.perf_counter() - started
+
+    assert len(pairs) > 39000
+    assert elapsed < 5.0
+
+
+if __name__ == "__main__":
+    print("\nISSUE ESLESTIRME TESTLERI\n")
+
+    test_fast_path_matches_legacy_loop()
+    print("OK: Hızlı yol ile eski döngü aynı sonuç")
+
+    test_issues_without_file_never_match()
+    print("OK: Dosya bilgisi olmayan issue'lar")
+
+    test_custom_matcher_keeps_behavior()
+    print("OK: Özel eşleştirici")
+
+    test_large_inputs_are_fast()
+    print("OK: Büyük listelerde hız")
+
+    test_line_tolerance_picks_nearest()
+    print("OK: Satır toleransı")
+
+    test_type_compatibility()
+    print("OK: Kural/CWE tip uyumu")
+
+    test_optimal_mode_is_order_independent()
+    print("OK: Optimal eşleştirme")
+
+    test_tolerance_modes_scale()
+    print("OK: Toleranslı modlarda hız")
+
+    test_interval_greedy_matches_bipartite_optimum()
+    print("OK: Aralık-greedy en büyük eşleşme")
+
+    test_dense_file_optimal_is_fast()
+    print("OK: Yoğun dosyada optimal mod hızı")
+
+    print("\nTest tamamlandi!")
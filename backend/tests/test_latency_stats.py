@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Tarama Süresi İstatistikleri (latency_stats) Test Script'i
+
+Bu script, sabit bellekli süre özetinin (Welford + logaritmik histogram)
+doğruluğunu, birleştirilebilirliğini ve worker dosyalarıyla kalıcılığını
+test eder. Kayıtlar geçici bir klasöre yazılır.
+
+Test Senaryoları:
+1. Ortalama/standart sapma tam değerle, yüzdelikler %1 göreli hata ile uyuşur
+2. İki yarının birleştirilmesi, tüm verinin özetiyle aynıdır
+3. Çok geniş aralıkta bile kova sayısı sınırı aşılmaz
+4. Farklı worker'ların dosyaları okurken birleştirilir ve yeniden yüklenir
+5. Bitmiş worker'ların ve aynı pid'li eski process'in dosyaları canlı
+   process'in dosyasına katılır; klasörde dosya birikmez
+
+Kullanım:
+    cd backend/tests
+    python test_latency_stats.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_latency_stats.py
+"""
+
+import math
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from metrics import latency_stats
+from metrics.latency_stats import LatencyRegistry, LatencyStats
+
+
+def _exact_percentile(values, q):
+    ordered = sorted(values)
+    return ordered[math.floor(q / 100 * (len(ordered) - 1))]
+
+
+def test_accuracy():
+    """Welford değerleri tam, yüzdelikler göreli hata sınırında olmalı"""
+    rng = random.Random(5)
+    values = [rng.lognormvariate(2, 1) for _ in range(20000)]
+    stats = LatencyStats()
+    for value in values:
+        stats.record(value)
+
+    summary = stats.summary()
+    assert summary["count"] == len(values)
+    assert math.isclose(summary["mean"], statistics.fmean(values), rel_tol=1e-9)
+    assert math.isclose(summary["stddev"], statistics.stdev(values), rel_tol=1e-6)
+    assert summary["max"] == max(values)
+    for q in (50, 90, 99):
+        exact = _exact_percentile(values, q)
+        assert abs(summary[f"p{q}"] - exact) <= exact * 0.0201
+
+    assert LatencyStats().summary()["p50"] is None
+
+
+def test_merge_equals_whole():
+    """İki yarının birleşimi tüm verinin özetiyle aynı olmalı"""
+    rng = random.Random(9)
+    values = [rng.uniform(0, 30) for _ in range(5000)] + [0.0] * 10
+    whole, left, right = LatencyStats(), LatencyStats(), LatencyStats()
+    for index, value in enumerate(values):
+        whole.record(value)
+        (left if index % 3 else right).record(value)
+
+    merged = left.merge(right)
+    assert merged.count == whole.count
+    assert math.isclose(merged.mean, whole.mean, rel_tol=1e-9)
+    assert math.isclose(merged.variance, whole.variance, rel_tol=1e-9)
+    for q in (0, 50, 90, 99, 100):
+        assert merged.percentile(q) == whole.percentile(q)
+
+    restored = LatencyStats.from_dict(merged.to_dict())
+    assert restored.summary() == merged.summary()
+
+
+def test_bucket_count_is_bounded():
+    """Çok geniş değer aralığında kova sayısı sınırı aşılmamalı"""
+    original = latency_stats.LATENCY_MAX_BUCKETS
+    latency_stats.LATENCY_MAX_BUCKETS = 100
+    try:
+        stats = LatencyStats()
+        for exponent in range(-5000, 5000):
+            stats.record(10 ** (exponent / 1000))
+        assert len(stats._buckets) <= 100
+        # Üst yüzdelikler kova birleştirmesinden etkilenmemeli
+        assert abs(stats.percentile(99) - 10 ** 4.9) <= 10 ** 4.9 * 0.0201
+    finally:
+        latency_stats.LATENCY_MAX_BUCKETS = original
+
+
+def test_registry_merges_worker_files():
+    """Farklı worker dosyaları birleştirilmeli ve yeni registry'de geri okunmalı"""
+    with tempfile.TemporaryDirectory() as directory:
+        worker_a = LatencyRegistry(directory)
+        worker_b = LatencyRegistry(directory)
+        worker_b.file_name = "other-host-1.json"
+
+        for duration in (1.0, 2.0, 3.0):
+            worker_a.record("snyk_code", "flask_demo", duration)
+        worker_b.record("snyk_code", "flask_demo", 10.0)
+        worker_b.record("deepsource", "flask_demo", 5.0)
+
+        assert worker_a.stats(tool="snyk_code").count == 4
+        assert worker_a.stats(tool="snyk_code").max == 10.0
+        assert worker_a.stats(project="flask_demo").count == 5
+        assert set(worker_b.entries()) == {("snyk_code", "flask_demo"), ("deepsource", "flask_demo")}
+
+        # Yeniden başlatılan process önceki dosyaları okur
+        restarted = LatencyRegistry(directory)
+        restarted.file_name = "restarted.json"
+        assert math.isclose(restarted.stats(tool="snyk_code").mean, 4.0)
+
+
+def test_stale_worker_files_are_compacted():
+    """Süreci bitmiş worker dosyaları canlı process'in dosyasına katılıp silinmeli"""
+    host = socket.gethostname()
+    with tempfile.TemporaryDirectory() as directory:
+        # Süreci bitmiş worker'lar (pid'leri artık yok)
+        for duration in (1.0, 2.0, 3.0):
+            process = subprocess.Popen([sys.executable, "-c", "pass"])
+            process.wait()
+            worker = LatencyRegistry(directory)
+            worker.file_name = f"{host}-{process.pid}.json"
+            worker.record("snyk_code", "flask_demo", duration)
+
+        # Aynı pid ile çalışmış önceki process (container yeniden başlatıldı)
+        previous = LatencyRegistry(directory)
+        previous.record("deepsource", "flask_demo", 5.0)
+
+        # Başka makinenin worker'ı: canlılığı bilinemez, dokunulmaz
+        remote = LatencyRegistry(directory)
+        remote.file_name = "other-host-1.json"
+        remote.record("snyk_code", "flask_demo", 10.0)
+
+        registry = LatencyRegistry(directory)
+        assert registry.stats(tool="snyk_code").count == 4
+        assert registry.stats(tool="deepsource").count == 1
+        assert sorted(os.listdir(directory)) == sorted([registry.file_name, "other-host-1.json"])
+
+        # Katılan özetler bu process'in dosyasıyla kalıcıdır ve iki kez sayılmaz
+        registry.record("snyk_code", "flask_demo", 4.0)
+        restarted = LatencyRegistry(directory)
+        restarted.file_name = "restarted.json"
+        assert restarted.stats(tool="snyk_code").count == 5
+        assert math.isclose(restarted.stats(tool="snyk_code").mean, 4.0)
+        assert restarted.stats().count == 6
+
+
+if __name__ == "__main__":
+    print("\nTARAMA SURESI ISTATISTIKLERI TESTLERI\n")
+
+    test_accuracy()
+    print("OK: Ortalama, sapma ve yüzdelikler")
+
+    test_merge_equals_whole()
+    print("OK: Birleştirme")
+
+    test_bucket_count_is_bounded()
+    print("OK: Sınırlı kova sayısı")
+
+    test_registry_merges_worker_files()
+    print("OK: Worker dosyalarının birleştirilmesi")
+
+    test_stale_worker_files_are_compacted()
+    print("OK: Bitmiş worker dosyalarının katılması")
+
+    print("\nTest tamamlandi!")
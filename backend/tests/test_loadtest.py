@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Yük Testi Düzeneği Test Script'i
+
+Bu script, sahte Snyk CLI'ın ve stub DeepSource GraphQL sunucusunun
+runner'ların beklediği çıktıları ayarlanabilir gecikme, boyut ve hata
+oranıyla ürettiğini, yük sürücüsünün throughput, yüzdelik ve hata
+sayılarını doğru raporladığını ve --start-stack ile başlatılan API'nin
+sahte araçlara bağlandığını test eder. Gerçek araçlara veya ağa ihtiyaç
+duymaz.
+
+Test Senaryoları:
+1. Sahte Snyk: --version, istenen sayıda result'lı SARIF, simüle edilen hata
+2. Stub DeepSource: tüm sayfalar runner ile alınır; hata oranında 503 döner
+3. Sürücü: eşzamanlı istekler, durum kodu bazında hatalar ve yüzdelikler
+4. --start-stack: tüm default endpoint'ler (code, deepsource, latest) sahte araçlarla hatasız döner
+
+Kullanım:
+    cd backend/tests
+    python test_loadtest.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_loadtest.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import deepsource_runner
+from loadtest.driver import ENDPOINTS, Endpoint, run_level, start_stack
+from loadtest.stub_deepsource import StubDeepSourceServer
+from metrics.deepsource_metrics import DeepSourceMetrics
+from metrics.snyk_metrics import SnykMetrics
+
+FAKE_SNYK = Path(__file__).parent.parent / "loadtest" / "fake_snyk.py"
+
+
+def _run_fake_snyk(args: list, **env) -> subprocess.CompletedProcess:
+    environment = dict(os.environ, FAKE_SNYK_LATENCY="0", **env)
+    return subprocess.run(
+        [sys.executable, str(FAKE_SNYK)] + args,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=environment, timeout=60
+    )
+
+
+def test_fake_snyk():
+    """Sahte Snyk CLI gerçek CLI'ın çıktı ve çıkış kodu davranışını taklit etmeli"""
+    version = _run_fake_snyk(["--version"], FAKE_SNYK_VERSION="9.9.9")
+    assert version.returncode == 0 and version.stdout.strip() == "9.9.9"
+
+    scan = _run_fake_snyk(["code", "test", ".", "--json"], FAKE_SNYK_ISSUES="40")
+    # Issue bulunduğunda gerçek CLI gibi 1 ile çıkar; runner stdout'u kullanır
+    assert scan.returncode == 1
+    assert SnykMetrics().calculate(json.loads(scan.stdout)).total_issues == 40
+
+    failed = _run_fake_snyk(["code", "test", ".", "--json"], FAKE_SNYK_ERROR_RATE="1")
+    assert failed.returncode == 2 and failed.stdout == "" and "simulated" in failed.stderr
+
+
+def test_stub_deepsource_pagination_and_errors():
+    """Stub sunucu runner'ın sayfalama sorgusunu yanıtlamalı; hata oranında 503 dönmeli"""
+    original_url = deepsource_runner.DEEPSOURCE_API_URL
+    try:
+        with StubDeepSourceServer(issues=250, latency=0) as stub:
+            deepsource_runner.DEEPSOURCE_API_URL = stub.url
+            pages = list(deepsource_runner.iter_deepsource_issue_pages("elif1624", "kalite", "GITHUB"))
+            assert len(pages) == 3 and stub.requests == 3
+            assert DeepSourceMetrics().calculate_from_pages(pages).total_issues == 250
+
+        with StubDeepSourceServer(issues=10, latency=0, error_rate=1) as stub:
+            deepsource_runner.DEEPSOURCE_API_URL = stub.url
+            try:
+                list(deepsource_runner.iter_deepsource_issue_pages("elif1624", "kalite", "GITHUB"))
+                raise AssertionError("503 hata olarak görülmeli")
+            except RuntimeError as e:
+                assert "503" in str(e)
+            assert stub.errors == 1
+    finally:
+        deepsource_runner.DEEPSOURCE_API_URL = original_url
+
+
+class _AlternatingHandler(BaseHTTPRequestHandler):
+    """Her üçüncü isteğe 500, diğerlerine 200 döner"""
+
+    protocol_version = "HTTP/1.1"
+    counter = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with _AlternatingHandler.lock:
+            _AlternatingHandler.counter += 1
+            status = 500 if _AlternatingHandler.counter % 3 == 0 else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_driver_reports_throughput_and_errors():
+    """Sürücü tüm istekleri saymalı; hataları durum koduna göre ayırmalı"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _AlternatingHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        result = run_level(base_url, Endpoint("probe", "GET", "/probe"), concurrency=4, duration=0.5)
+
+        assert result.requests == _AlternatingHandler.counter > 10
+        assert result.statuses["200"] + result.statuses["500"] == result.requests
+        assert result.errors == result.statuses["500"] > 0
+        assert result.throughput_per_second > 0
+        assert 0 < result.latency["p50"] <= result.latency["p99"] <= result.latency["max"]
+
+        # Bağlantı hataları da hata sayılır
+        refused = run_level("http://127.0.0.1:9", Endpoint("down", "GET", "/"), concurrency=1, duration=0.2)
+        assert refused.requests > 0 and refused.errors == refused.requests
+        assert "ConnectionError" in refused.statuses
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_start_stack_uses_fake_tools():
+    """--start-stack ile başlatılan API sahte Snyk ve stub DeepSource ile taramalı; tüm default endpoint'ler hatasız olmalı"""
+    snyk_options = {"FAKE_SNYK_LATENCY": "0.05", "FAKE_SNYK_ISSUES": "25"}
+    with start_stack(snyk_options=snyk_options, deepsource_options={"issues": 120, "latency": 0}) as base_url:
+        # Default sıra: tarama endpoint'leri sonuç dosyası üretir, latest onu sunar
+        for name in ENDPOINTS:
+            result = run_level(base_url, ENDPOINTS[name], concurrency=2, duration=0.5)
+            assert result.requests >= 2 and result.errors == 0, result
+
+        code = requests.post(f"{base_url}/scan/code", json={"project": "flask_demo", "wait": True},
+                             timeout=60).json()
+        assert code["metrics"]["total_issues"] == 25
+        assert code["cached"] is True  # force'suz istek cache'ten döner
+
+        deepsource = requests.post(f"{base_url}/scan/deepsource", json={"project": "flask_demo", "wait": True},
+                                   timeout=60).json()
+        assert deepsource["metrics"]["total_issues"] == 120
+
+
+if __name__ == "__main__":
+    print("\nYUK TESTI DUZENEGI TESTLERI\n")
+
+    test_fake_snyk()
+    print("OK: Sahte Snyk CLI")
+
+    test_stub_deepsource_pagination_and_errors()
+    print("OK: Stub DeepSource GraphQL sunucusu")
+
+    test_driver_reports_throughput_and_errors()
+    print("OK: Sürücü throughput ve hata sayıları")
+
+    test_start_stack_uses_fake_tools()
+    print("OK: --start-stack")
+
+    print("\nTest tamamlandi!")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Process Ağacı Profili (process_profiler) Test Script'i
+
+Bu script, CLI'ların profil altında çalıştırılmasını test eder. Gerçek
+Snyk/DeepSource CLI yerine, alt process başlatıp CPU ve bellek harcayan
+küçük bir Python komutu kullanılır.
+
+Test Senaryoları:
+1. profiled_run, subprocess.run ile aynı çıktıyı döner
+2. Alt process'lerin (torunlar dahil) CPU süresi ve bellek zirvesi ölçülür
+3. Zaman aşımında process öldürülür ve TimeoutExpired fırlatılır
+4. calculate_operational_efficiency, verilen ResourceUsage'ı kullanır
+
+Kullanım:
+    cd backend/tests
+    python test_process_profiler.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_process_profiler.py
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from process_profiler import ProcessTreeProfiler, ResourceUsage, profiled_run
+from metrics.advanced_metrics import AdvancedMetricsCalculator
+
+# Torun process: ~64 MB ayırır ve ~0.8 saniye CPU harcar
+GRANDCHILD = (
+    "import time\n"
+    "block = bytearray(64 * 1024 * 1024)\n"
+    "end = time.process_time() + 0.8\n"
+    "while time.process_time() < end:\n"
+    "    pass\n"
+)
+
+# Çocuk process: torunu başlatır, bekler ve JSON çıktı yazar
+CHILD = (
+    "import subprocess, sys\n"
+    f"subprocess.run([sys.executable, '-c', {GRANDCHILD!r}])\n"
+    "print('{\"ok\": true}')\n"
+)
+
+
+def test_profiled_run_measures_child_tree():
+    """Çıktı aynen dönmeli, torun process'in CPU ve belleği ölçülmeli"""
+    completed, usage = profiled_run([sys.executable, "-c", CHILD])
+
+    assert completed.returncode == 0
+    assert completed.stdout.strip() == '{"ok": true}'
+    assert isinstance(usage, ResourceUsage)
+    assert usage.peak_processes >= 2
+    assert usage.cpu_seconds >= 0.4
+    assert usage.peak_rss_mb >= 60
+    assert usage.samples >= 2
+    assert usage.to_dict()["cpu_seconds"] == usage.cpu_seconds
+
+
+def test_timeout_kills_process():
+    """Zaman aşımında process öldürülmeli ve TimeoutExpired fırlatılmalı"""
+    started = time.perf_counter()
+    try:
+        profiled_run([sys.executable, "-c", "import time; time.sleep(30)"], timeout=0.5)
+    except subprocess.TimeoutExpired:
+        pass
+    else:
+        raise AssertionError("TimeoutExpired bekleniyordu")
+    assert time.perf_counter() - started < 10
+
+
+def test_profiler_stops_when_process_exits():
+    """Kök process bittiğinde örnekleme kendiliğinden durmalı"""
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    profiler = ProcessTreeProfiler(process.pid, interval=0.01).start()
+    process.wait()
+    profiler._thread.join(timeout=5)
+
+    assert not profiler._thread.is_alive()
+    assert profiler.stop().wall_seconds > 0
+
+
+def test_operational_efficiency_uses_resource_usage():
+    """Kaynak kaydı verilirse CPU/bellek aracın kendisinden alınmalı"""
+    usage = ResourceUsage(wall_seconds=4.0, cpu_user_seconds=5.0, cpu_system_seconds=1.0, peak_rss_mb=512.0)
+    calculator = AdvancedMetricsCalculator()
+    calculator.record_scan_time(4.0)
+
+    for value in (usage, usage.to_dict()):
+        efficiency = calculator.calculate_operational_efficiency(value)
+        assert (efficiency["average_scan_time"], efficiency["cpu_usage_percent"], efficiency["memory_usage_mb"]) == \
+            (4.0, 150.0, 512.0)
+
+
+if __name__ == "__main__":
+    print("\nPROCESS AGACI PROFILI TESTLERI\n")
+
+    test_profiled_run_measures_child_tree()
+    print("OK: Alt process ağacının ölçümü")
+
+    test_timeout_kills_process()
+    print("OK: Zaman aşımı")
+
+    test_profiler_stops_when_process_exits()
+    print("OK: Process bitince örneklemenin durması")
+
+    test_operational_efficiency_uses_resource_usage()
+    print("OK: Operasyonel verimlilikte kaynak kaydı")
+
+    print("\nTest tamamlandi!")
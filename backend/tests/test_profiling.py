@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Opt-in Kod Profili (profiling) Test Script'i
+
+Bu script, cProfile ve örnekleme profil oturumlarını, flamegraph'a hazır
+collapsed stack çıktısının sonuç dosyasının yanına yazılmasını,
+BaseMetric.calculate implementasyonlarının profil bölümü olarak
+ölçülmesini ve /scan/<tool>?profile= parametresini test eder. Taramalar
+sahte bir runner ile yapılır.
+
+Test Senaryoları:
+1. ?profile= değerleri (1, cprofile, sample, 0) ve geçersiz mod
+2. cprofile modu: çağrı grafiği collapsed stack'e çevrilir, .prof yazılır
+3. sample modu: stack'ler oturumu açan fonksiyondan başlar
+4. SnykMetrics.calculate oturum içinde bölüm olarak sayılır; oturum dışında
+   (PROFILING_MODE açık olsa bile) kendi oturumunu açmaz; metrics paketi
+   profiling'i import etmez
+5. PROFILING_MODE açıkken @profiled_scan runner'ı profiller; iç içe oturum açılmaz
+6. POST /scan/<tool>?profile=cprofile profil özetini ve dosyalarını döner;
+   /scan/<tool>/all ve /scan/all her taramayı ayrı profiller
+
+Kullanım:
+    cd backend/tests
+    python test_profiling.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_profiling.py
+"""
+
+import os
+import pstats
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import profiling
+from metrics.snyk_metrics import SnykMetrics
+from profiling import ProfileSession, current_session, profiled_scan, resolve_mode, run_profiled
+
+SARIF_OUTPUT = {"runs": [{"results": [{"ruleId": "python/Sqli", "level": "error"}] * 200}]}
+
+FAKE_TOOL_MODULE = textwrap.dedent('''
+    import os
+    from metrics.snyk_metrics import SnykMetrics
+
+    RESULTS_DIR = None
+
+
+    def run_fake_scan_and_save(project_name, force=False):
+        file_path = os.path.join(RESULTS_DIR, f"fake_{project_name}.json")
+        with open(file_path, "w") as f:
+            f.write("{}")
+        metric_result = SnykMetrics().calculate({"runs": [{"results": [{"level": "error"}]}]})
+        return {
+            "success": True,
+            "project": project_name,
+            "file_path": file_path,
+            "metric_result": {"tool_name": "Fake", "total_issues": metric_result.total_issues},
+            "error": None
+        }
+''')
+
+
+def _busy(iterations: int) -> int:
+    return sum(number * number for number in range(iterations))
+
+
+def _workload():
+    for _ in range(20):
+        _busy(20000)
+    return SnykMetrics().calculate(SARIF_OUTPUT)
+
+
+def test_resolve_mode():
+    """?profile= değerleri profil moduna çevrilmeli"""
+    assert resolve_mode(None) is None
+    assert resolve_mode("0") is None and resolve_mode(False) is None
+    assert resolve_mode("1") == profiling.PROFILING_DEFAULT_MODE
+    assert resolve_mode(True) == profiling.PROFILING_DEFAULT_MODE
+    assert resolve_mode("cProfile") == "cprofile"
+    assert resolve_mode("sample") == "sample"
+    try:
+        resolve_mode("perf")
+        raise AssertionError("Geçersiz mod kabul edilmemeli")
+    except ValueError:
+        pass
+
+
+def test_cprofile_folded_and_pstats():
+    """cprofile modu collapsed stack ve .prof dosyası üretmeli"""
+    with tempfile.TemporaryDirectory() as directory:
+        result_path = os.path.join(directory, "snyk_code_flask_demo_2026-01-02_15-30-45.rstore")
+
+        def runner(project_name):
+            _workload()
+            return {"success": True, "project": project_name, "file_path": result_path}
+
+        result = run_profiled("snyk_code", "cprofile", runner, "flask_demo")
+        profile = result["profile"]
+        assert profile["mode"] == "cprofile"
+        assert profile["files"]["folded"].startswith(result_path + ".profile-")
+        assert os.path.dirname(profile["files"]["pstats"]) == directory
+
+        folded = Path(profile["files"]["folded"]).read_text(encoding="utf-8").splitlines()
+        busy_stacks = [line for line in folded if "_busy (test_profiling.py" in line]
+        assert busy_stacks
+        # Yollar kökten yaprağa: runner -> _workload -> _busy
+        assert all(line.index("runner (") < line.index("_workload (") < line.index("_busy (")
+                   for line in busy_stacks)
+        assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in folded)
+
+        stats = pstats.Stats(profile["files"]["pstats"])
+        assert any(name == "_busy" for (_, _, name) in stats.stats)
+        assert profile["top_functions"][0]["self_seconds"] > 0
+
+
+def test_sample_mode_stacks_start_at_session():
+    """sample modunda stack'ler oturumu açan fonksiyondan başlamalı"""
+    session = ProfileSession("sample", interval=0.002)
+    with session:
+        deadline = time.perf_counter() + 0.2
+        while time.perf_counter() < deadline:
+            _busy(5000)
+
+    folded = session.folded()
+    assert session.summary()["samples"] > 10
+    assert any("_busy (test_profiling.py" in stack for stack in folded)
+    roots = {stack.split(";", 1)[0] for stack in folded}
+    assert roots == {f"test_sample_mode_stacks_start_at_session (test_profiling.py:"
+                     f"{test_sample_mode_stacks_start_at_session.__code__.co_firstlineno})"}
+    assert current_session() is None
+
+
+def test_metric_calculate_is_a_section():
+    """BaseMetric.calculate implementasyonları oturum içinde bölüm olarak sayılmalı"""
+    with ProfileSession("sample") as session:
+        SnykMetrics().calculate(SARIF_OUTPUT)
+        SnykMetrics().calculate(SARIF_OUTPUT)
+    section = session.summary()["sections"]["SnykMetrics.calculate"]
+    assert section["calls"] == 2 and section["seconds"] > 0
+    assert SnykMetrics.calculate.__profile_section__ == "SnykMetrics.calculate"
+
+    # Oturumdan sonra tanımlanan metrik sınıfları da bir sonraki oturumda sarılır
+    class LateMetrics(SnykMetrics):
+        def calculate(self, raw_data):
+            return super().calculate(raw_data)
+
+    with ProfileSession("sample") as session:
+        LateMetrics().calculate(SARIF_OUTPUT)
+    assert session.summary()["sections"]["LateMetrics.calculate"]["calls"] == 1
+    assert session.summary()["sections"]["SnykMetrics.calculate"]["calls"] == 1
+
+    # Oturum dışında sonuç aynı, kayıt yok; PROFILING_MODE açık olsa bile
+    # calculate kendi oturumunu açmaz (profil runner/istek seviyesindedir)
+    original = profiling.PROFILING_MODE, profiling.PROFILING_OUTPUT_DIR
+    with tempfile.TemporaryDirectory() as directory:
+        profiling.PROFILING_MODE = "cprofile"
+        profiling.PROFILING_OUTPUT_DIR = directory
+        try:
+            assert SnykMetrics().calculate(SARIF_OUTPUT).total_issues == 200
+            assert os.listdir(directory) == []
+        finally:
+            profiling.PROFILING_MODE, profiling.PROFILING_OUTPUT_DIR = original
+
+
+def test_metrics_package_does_not_import_profiling():
+    """metrics paketi üst katmandaki profiling modülüne bağımlı olmamalı"""
+    completed = subprocess.run(
+        [sys.executable, "-c",
+         "import sys, metrics.snyk_metrics, metrics.deepsource_metrics; print('profiling' in sys.modules)"],
+        cwd=str(Path(__file__).parent.parent), stdout=subprocess.PIPE, text=True, timeout=60
+    )
+    assert completed.stdout.strip() == "False"
+
+
+def test_profiled_scan_uses_process_mode():
+    """PROFILING_MODE açıkken @profiled_scan runner'ı profillemeli"""
+    with tempfile.TemporaryDirectory() as directory:
+        result_path = os.path.join(directory, "deepsource_flask_demo.json")
+
+        @profiled_scan("deepsource")
+        def runner(project_name):
+            _workload()
+            return {"success": True, "project": project_name, "file_path": result_path}
+
+        # Kapalıyken sonuç değişmez
+        assert "profile" not in runner("flask_demo")
+
+        original = profiling.PROFILING_MODE
+        profiling.PROFILING_MODE = "cprofile"
+        try:
+            profile = runner("flask_demo")["profile"]
+            assert profile["mode"] == "cprofile"
+            assert profile["sections"]["SnykMetrics.calculate"]["calls"] == 1
+            assert os.path.isfile(profile["files"]["folded"])
+
+            # ?profile= ile açılmış bir oturumun içinde ikinci oturum açılmaz
+            outer = run_profiled("deepsource", "sample", runner, "flask_demo")
+            assert outer["profile"]["mode"] == "sample"
+            assert len(os.listdir(directory)) == 3
+        finally:
+            profiling.PROFILING_MODE = original
+
+
+def test_scan_endpoint_profile_parameter():
+    """?profile=cprofile /scan/<tool> ve /all endpoint'lerinde profil özetini dönmeli"""
+    import app as app_module
+    from project_catalog import ProjectCatalog
+    from tool_registry import ToolAdapter, ToolRegistry
+
+    with tempfile.TemporaryDirectory() as directory:
+        module_name = "fake_profiled_tool"
+        Path(directory, f"{module_name}.py").write_text(FAKE_TOOL_MODULE, encoding="utf-8")
+        sys.path.insert(0, directory)
+        os.makedirs(os.path.join(directory, "projects", "flask_demo"))
+
+        registry = ToolRegistry(config_path="", enabled="", builtins=[])
+        registry.register(ToolAdapter(
+            name="fake_tool",
+            display_name="Fake Tool",
+            runner_ref=f"{module_name}:run_fake_scan_and_save",
+            metric_ref="metrics.snyk_metrics:SnykMetrics",
+            route="fake"
+        ))
+        original = app_module.tool_registry, app_module.project_catalog
+        app_module.tool_registry = registry
+        app_module.project_catalog = ProjectCatalog(root=os.path.join(directory, "projects"))
+        try:
+            __import__(module_name).RESULTS_DIR = directory
+            client = app_module.app.test_client()
+
+            response = client.post("/scan/fake?profile=cprofile", json={"project": "flask_demo", "wait": True})
+            assert response.status_code == 200, response.get_json()
+            profile = response.get_json()["profile"]
+            assert profile["mode"] == "cprofile"
+            assert profile["sections"]["SnykMetrics.calculate"]["calls"] == 1
+            for path in profile["files"].values():
+                assert os.path.isfile(path)
+                assert Path(path).name.startswith("fake_flask_demo.json.profile-")
+
+            # Profil istenmezse alan null
+            body = client.post("/scan/fake", json={"project": "flask_demo", "wait": True}).get_json()
+            assert body["profile"] is None
+
+            response = client.post("/scan/fake?profile=perf", json={"project": "flask_demo", "wait": True})
+            assert response.status_code == 400
+
+            # /all endpoint'lerinde her tarama ayrı profillenir
+            for url in ("/scan/fake/all?profile=cprofile", "/scan/all?profile=cprofile"):
+                response = client.post(url)
+                assert response.status_code == 200, response.get_json()
+                [result] = response.get_json()["results"]
+                assert result["profile"]["mode"] == "cprofile"
+                assert result["profile"]["sections"]["SnykMetrics.calculate"]["calls"] == 1
+
+                assert client.post(url.replace("cprofile", "perf")).status_code == 400
+
+            [result] = client.post("/scan/fake/all").get_json()["results"]
+            assert "profile" not in result
+        finally:
+            app_module.tool_registry, app_module.project_catalog = original
+            sys.path.remove(directory)
+            sys.modules.pop(module_name, None)
+
+
+if __name__ == "__main__":
+    print("\nPROFIL TESTLERI\n")
+
+    test_resolve_mode()
+    print("OK: ?profile= değerleri")
+
+    test_cprofile_folded_and_pstats()
+    print("OK: cprofile collapsed stack ve .prof")
+
+    test_sample_mode_stacks_start_at_session()
+    print("OK: Örnekleme stack'leri oturumdan başlıyor")
+
+    test_metric_calculate_is_a_section()
+    print("OK: calculate profil bölümü olarak sayılıyor")
+
+    test_metrics_package_does_not_import_profiling()
+    print("OK: metrics paketi profiling'i import etmiyor")
+
+    test_profiled_scan_uses_process_mode()
+    print("OK: PROFILING_MODE ile @profiled_scan")
+
+    test_scan_endpoint_profile_parameter()
+    print("OK: /scan/<tool>?profile= ve /all endpoint'leri")
+
+    print("\nTest tamamlandi!")
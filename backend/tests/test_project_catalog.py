@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Proje Kataloğu (project_catalog) Test Script'i
+
+Bu script, projelerin kök klasörden keşfedilmesini, metadata'nın (dil
+dağılımı, dosya/satır sayısı, ağaç hash'i) artımlı yenilenmesini ve
+/projects endpoint'inin sayfalama/filtrelemesini test eder. Projeler geçici
+bir klasörde oluşturulur.
+
+Test Senaryoları:
+1. Projeler ve metadata doğru hesaplanır
+2. Yenilemede sadece değişen dosyalar yeniden okunur; yeni projeler bulunur
+3. Dil/isim filtresi, sıralama ve sayfalama
+4. /projects endpoint'i katalogdan sayfalanmış liste döner
+
+Kullanım:
+    cd backend/tests
+    python test_project_catalog.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_project_catalog.py
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import project_catalog
+from project_catalog import ProjectCatalog
+from project_tree import compute_tree_hash
+
+
+def _write(root: str, relative_path: str, content: str):
+    path = Path(root, relative_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def _create_projects(root: str):
+    _write(root, "flask_demo/app.py", "import flask\n\napp = flask.Flask(__name__)\n")
+    _write(root, "flask_demo/templates/index.html", "<html>\n</html>")
+    _write(root, "flask_demo/Dockerfile", "FROM python:3.12\n")
+    _write(root, "flask_demo/__pycache__/app.cpython-312.pyc", "ignored\n")
+    _write(root, "nodejs-goof/index.js", "const a = 1;\nconst b = 2;\nconst c = 3;\nconst d = 4;\n")
+    _write(root, "nodejs-goof/package.json", "{}\n")
+    Path(root, "nodejs-goof/logo.bin").write_bytes(b"\x89PNG\0\0\0")
+    _write(root, ".hidden/app.py", "x = 1\n")
+
+
+def test_discovery_and_metadata():
+    """Projeler keşfedilmeli, metadata doğru hesaplanmalı"""
+    with tempfile.TemporaryDirectory() as root:
+        _create_projects(root)
+        catalog = ProjectCatalog(root=root)
+
+        assert catalog.names() == ["flask_demo", "nodejs-goof"]
+        flask_demo = catalog.get("flask_demo")
+        assert flask_demo.file_count == 3
+        assert flask_demo.total_lines == 3 + 2 + 1
+        assert flask_demo.languages["Python"] == {"files": 1, "lines": 3}
+        assert flask_demo.languages["Dockerfile"] == {"files": 1, "lines": 1}
+        assert flask_demo.primary_language == "Python"
+        assert flask_demo.tree_hash == compute_tree_hash(os.path.join(root, "flask_demo"))
+
+        goof = catalog.get("nodejs-goof")
+        assert goof.languages["Other"] == {"files": 1, "lines": 0}
+        assert goof.primary_language == "JavaScript"
+        assert catalog.get("missing") is None
+        assert catalog.get(".hidden") is None
+
+
+def test_incremental_refresh():
+    """Sadece değişen dosyalar yeniden sayılmalı; yeni projeler hemen bulunmalı"""
+    with tempfile.TemporaryDirectory() as root:
+        _create_projects(root)
+        catalog = ProjectCatalog(root=root, refresh_interval=3600)
+        first = catalog.get("flask_demo")
+
+        counted = []
+        original_count_lines = project_catalog.count_lines
+
+        def counting(path, size=None):
+            counted.append(Path(path).name)
+            return original_count_lines(path, size)
+
+        project_catalog.count_lines = counting
+        try:
+            assert catalog.refresh() == 0
+            assert catalog.get("flask_demo") is first
+            assert counted == []
+
+            _write(root, "flask_demo/app.py", "import flask\n")
+            os.utime(os.path.join(root, "flask_demo/app.py"), ns=(1, 1))
+            assert catalog.refresh() == 1
+            assert counted == ["app.py"]
+            updated = catalog.get("flask_demo")
+            assert updated.total_lines == 1 + 2 + 1
+            assert updated.tree_hash != first.tree_hash
+
+            # Süre dolmadan da yeni klasör get() ile bulunur; sadece o proje okunur
+            refreshed_at = catalog._refreshed_at
+            counted.clear()
+            _write(root, "new_project/main.go", "package main\n")
+            assert catalog.get("new_project").languages == {"Go": {"files": 1, "lines": 1}}
+            assert counted == ["main.go"]
+            assert catalog._refreshed_at == refreshed_at
+            assert catalog.get("flask_demo") is updated
+            assert catalog.names() == sorted(catalog.names())
+            assert "new_project" in catalog.names()
+        finally:
+            project_catalog.count_lines = original_count_lines
+
+
+def test_query_filters_and_pagination():
+    """Dil/isim filtresi, sıralama ve sayfalama"""
+    with tempfile.TemporaryDirectory() as root:
+        _create_projects(root)
+        for number in range(5):
+            _write(root, f"py_{number}/main.py", "x = 1\n" * (number + 1))
+        catalog = ProjectCatalog(root=root)
+
+        total, page = catalog.query(language="python", sort="lines", offset=1, limit=2)
+        assert total == 6
+        assert [info.name for info in page] == ["py_4", "py_3"]
+
+        total, page = catalog.query(search="GOOF")
+        assert total == 1 and page[0].name == "nodejs-goof"
+
+        try:
+            catalog.query(sort="size")
+            raise AssertionError("Geçersiz sort kabul edilmemeli")
+        except ValueError:
+            pass
+
+
+def test_projects_endpoint():
+    """/projects katalogdan sayfalanmış ve filtrelenmiş liste dönmeli"""
+    import app as app_module
+
+    with tempfile.TemporaryDirectory() as root:
+        _create_projects(root)
+        original = app_module.project_catalog
+        app_module.project_catalog = ProjectCatalog(root=root)
+        try:
+            client = app_module.app.test_client()
+
+            body = client.get("/projects?limit=1&offset=1").get_json()
+            assert body["total"] == 2
+            assert body["available_projects"] == ["nodejs-goof"]
+            assert body["projects"][0]["primary_language"] == "JavaScript"
+
+            body = client.get("/projects?language=Dockerfile").get_json()
+            assert body["available_projects"] == ["flask_demo"]
+            assert body["projects"][0]["exists"] is True
+
+            assert client.get("/projects?offset=-1").status_code == 400
+            assert client.get("/projects?sort=size").status_code == 400
+
+            response = client.post("/scan/code", json={"project": "missing"})
+            assert response.status_code == 400
+            assert response.get_json()["available_projects"] == ["flask_demo", "nodejs-goof"]
+        finally:
+            app_module.project_catalog = original
+
+
+if __name__ == "__main__":
+    print("\nPROJE KATALOGU TESTLERI\n")
+
+    test_discovery_and_metadata()
+    print("OK: Proje keşfi ve metadata")
+
+    test_incremental_refresh()
+    print("OK: Artımlı yenileme")
+
+    test_query_filters_and_pagination()
+    print("OK: Filtreleme ve sayfalama")
+
+    test_projects_endpoint()
+    print("OK: /projects endpoint'i")
+
+    print("\nTest tamamlandi!")
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Arka Plan Kaynak Örnekleyici (resource_sampler) Test Script'i
+
+Bu script, CPU/RSS örneklerini ring buffer'da tutan paylaşılan
+örnekleyiciyi ve AdvancedMetricsCalculator'ın bu örnekleri bloklamadan
+kullandığını test eder.
+
+Test Senaryoları:
+1. Pencere istatistikleri (ortalama, p95, maksimum) doğru hesaplanır
+2. Ring buffer boyutu aşılınca en eski örnekler atılır
+3. Örnekleyici thread'i başlar, örnek toplar ve hızla durur
+4. calculate_all_advanced_metrics beklemeden çalışır ve pencere alanlarını doldurur
+
+Kullanım:
+    cd backend/tests
+    python test_resource_sampler.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_resource_sampler.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from metrics.resource_sampler import ResourceSampler, get_resource_sampler
+from metrics.advanced_metrics import AdvancedMetricsCalculator
+
+
+def _sampler_with(values) -> ResourceSampler:
+    """Verilen (cpu, rss) değerleriyle doldurulmuş, thread'i çalışmayan örnekleyici"""
+    sampler = ResourceSampler(buffer_size=100)
+    now = time.monotonic()
+    for cpu, rss in values:
+        sampler._samples.append((now, cpu, rss))
+    return sampler
+
+
+def test_window_stats():
+    """Ortalama, p95 ve maksimum doğru hesaplanmalı; eski örnekler pencere dışında kalmalı"""
+    sampler = _sampler_with([(float(i), 100.0 + i) for i in range(1, 21)])
+    sampler._samples.appendleft((time.monotonic() - 3600, 999.0, 999.0))
+
+    stats = sampler.window_stats(window_seconds=60)
+    assert stats["samples"] == 20
+    assert stats["cpu_percent"] == {"mean": 10.5, "p95": 19.0, "max": 20.0}
+    assert stats["memory_mb"]["max"] == 120.0
+    assert sampler.window_stats(window_seconds=7200)["cpu_percent"]["max"] == 999.0
+
+    empty = ResourceSampler().window_stats()
+    assert empty["samples"] == 0 and empty["cpu_percent"]["mean"] is None
+
+
+def test_ring_buffer_is_bounded():
+    """Buffer boyutu aşılınca en eski örnekler atılmalı"""
+    sampler = ResourceSampler(buffer_size=5)
+    for _ in range(12):
+        sampler.sample()
+
+    assert len(sampler.samples()) == 5
+
+
+def test_thread_collects_and_stops():
+    """Thread örnek toplamalı ve stop() ile hemen durmalı"""
+    sampler = ResourceSampler(interval=0.01).start()
+    assert sampler.start() is sampler
+    time.sleep(0.2)
+
+    started = time.perf_counter()
+    sampler.stop()
+    assert time.perf_counter() - started < 1.0
+    assert not sampler.running
+    assert len(sampler.samples()) >= 3
+    assert get_resource_sampler() is get_resource_sampler()
+
+
+def test_calculator_does_not_block():
+    """Hesaplama beklemeden yapılmalı ve pencere istatistikleri sonuca yazılmalı"""
+    calculator = AdvancedMetricsCalculator(sampler=_sampler_with([(10.0, 50.0), (30.0, 70.0)]))
+
+    started = time.perf_counter()
+    for _ in range(200):
+        result = calculator.calculate_all_advanced_metrics(raw_data={}, detected_issues=[], scan_duration=1.0)
+    assert time.perf_counter() - started < 2.0
+
+    assert result.cpu_usage_percent == 20.0
+    assert (result.cpu_usage_p95, result.cpu_usage_max) == (30.0, 30.0)
+    assert (result.memory_usage_mb, result.memory_usage_max_mb) == (60.0, 70.0)
+
+    # Örnek yoksa anlık RSS kullanılmalı
+    fresh = AdvancedMetricsCalculator(sampler=ResourceSampler()).calculate_operational_efficiency()
+    assert fresh["memory_usage_mb"] > 0 and fresh["cpu_usage_p95"] is None
+
+
+if __name__ == "__main__":
+    print("\nARKA PLAN KAYNAK ORNEKLEYICI TESTLERI\n")
+
+    test_window_stats()
+    print("OK: Pencere istatistikleri")
+
+    test_ring_buffer_is_bounded()
+    print("OK: Ring buffer sınırı")
+
+    test_thread_collects_and_stops()
+    print("OK: Thread başlatma/durdurma")
+
+    test_calculator_does_not_block()
+    print("OK: Bloklamayan hesaplama")
+
+    print("\nTest tamamlandi!")
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Sonuç Saklama (result_store) Test Script'i
+
+Bu script, kompakt .rstore formatının kaydedilen dokümanı birebir geri
+verdiğini, kural kataloğunun tekilleştirildiğini ve eski .json dosyalarının
+aynı API ile okunabildiğini test eder. Dosyalar geçici bir klasöre yazılır.
+
+Test Senaryoları:
+1. SARIF ve DeepSource çıktıları .rstore olarak kaydedilip birebir geri okunur
+2. Aynı araç versiyonundaki kurallar katalogda bir kez saklanır
+3. Issue'lar frame frame okunur (küçük frame boyutu ile birden fazla frame)
+4. list_scan_results .rstore ve .json dosyalarını birlikte listeler
+
+Kullanım:
+    cd backend/tests
+    python test_result_store.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_result_store.py
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from result_store import (
+    ResultStoreReader, ResultStoreWriter, iter_scan_items,
+    list_scan_results, load_scan_result, save_scan_result
+)
+
+
+def _sample_sarif(result_count: int = 3) -> dict:
+    rules = [
+        {"id": f"python/Rule{i}", "help": {"markdown": "Uzun açıklama metni 🎉 " * 200}}
+        for i in range(2)
+    ]
+    return {
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {"driver": {"name": "SnykCode", "version": "1.0.0", "rules": rules}},
+            "results": [
+                {
+                    "ruleId": f"python/Rule{i % 2}",
+                    "ruleIndex": i % 2,
+                    "level": "error",
+                    "message": {"text": f"Issue {i}"},
+                    "locations": [{"physicalLocation": {
+                        "artifactLocation": {"uri": "app.py"},
+                        "region": {"startLine": i + 1}
+                    }}],
+                    "properties": {"priorityScore": 700 + i}
+                }
+                for i in range(result_count)
+            ],
+            "properties": {"coverage": [{"files": 1, "isSupported": True, "lang": ".py"}]}
+        }]
+    }
+
+
+def _sample_deepsource() -> dict:
+    return {"data": {"repository": {"name": "kalite", "issues": {
+        "totalCount": 2,
+        "edges": [
+            {"node": {"issue": {"shortcode": "PY-W0611", "severity": "MINOR"}}},
+            {"node": {"issue": {"shortcode": "PY-S0001", "severity": "CRITICAL"}}}
+        ]
+    }}}}
+
+
+def test_roundtrip_and_rule_catalog():
+    """Kaydedilen doküman birebir geri okunmalı, kurallar katalogda bir kez saklanmalı"""
+    with tempfile.TemporaryDirectory() as results_dir:
+        sarif = _sample_sarif()
+        first = save_scan_result(sarif, "snyk_code", "flask_demo", "1.0.0", results_dir)
+        second = save_scan_result(sarif, "snyk_code", "flask_demo", "1.0.0", results_dir)
+        deepsource = save_scan_result(_sample_deepsource(), "deepsource", "flask_demo", "mock", results_dir)
+
+        assert first != second
+        assert load_scan_result(first) == sarif
+        assert load_scan_result(second) == sarif
+        assert load_scan_result(deepsource) == _sample_deepsource()
+
+        catalog = Path(results_dir) / "catalog" / "snyk_code" / "1.0.0"
+        assert len(list(catalog.glob("*.json.gz"))) == 2
+        # Kural metni sonuç dosyasına yazılmamalı
+        assert os.path.getsize(first) < 2000
+        # Yarım kalmış geçici dosya bırakılmamalı
+        assert not list(Path(results_dir).rglob("*.tmp"))
+
+
+def test_items_are_read_frame_by_frame():
+    """Küçük frame boyutuyla yazılan issue'lar sırasıyla ve eksiksiz okunmalı"""
+    with tempfile.TemporaryDirectory() as results_dir:
+        sarif = _sample_sarif(result_count=50)
+        path = os.path.join(results_dir, "snyk_code_demo_2026-01-02_15-30-45.rstore")
+
+        writer = ResultStoreWriter(path, "snyk_code", "1.0.0", frame_bytes=1024)
+        for result in sarif["runs"][0]["results"]:
+            writer.add_item(("runs", 0, "results"), result)
+        document = {**sarif, "runs": [{**sarif["runs"][0], "results": []}]}
+        writer.commit(document)
+
+        with ResultStoreReader(path) as reader:
+            frames = reader.index["collections"][0]["frames"]
+            assert len(frames) > 1
+            assert reader.count() == 50
+            items = [item for _, item in reader.iter_items(("runs", 0, "results"))]
+
+        assert items == sarif["runs"][0]["results"]
+        assert load_scan_result(path) == sarif
+
+
+def test_list_includes_legacy_json():
+    """list_scan_results hem .rstore hem eski .json dosyalarını listelemeli"""
+    with tempfile.TemporaryDirectory() as results_dir:
+        legacy = save_scan_result(
+            _sample_sarif(), "snyk_code", "flask_demo", results_dir=results_dir, file_format="json"
+        )
+        Path(results_dir, "snyk_advanced_metrics_x_2026-01-02_15-30-45.json").write_text("{}")
+        compact = save_scan_result(_sample_sarif(), "snyk_code", "nodejs-goof", results_dir=results_dir)
+        save_scan_result(_sample_deepsource(), "deepsource", "flask_demo", results_dir=results_dir)
+
+        entries = list_scan_results(results_dir, tool="snyk_code")
+        assert {entry["path"] for entry in entries} == {legacy, compact}
+        assert {entry["project"] for entry in entries} == {"flask_demo", "nodejs-goof"}
+        assert {entry["format"] for entry in entries} == {"json", "compact"}
+
+        assert load_scan_result(legacy) == _sample_sarif()
+        assert sum(1 for _ in iter_scan_items(legacy)) == 3
+        assert len(list_scan_results(results_dir, project="flask_demo")) == 2
+
+
+if __name__ == "__main__":
+    print("\nSONUC SAKLAMA (RESULT STORE) TESTLERI\n")
+
+    test_roundtrip_and_rule_catalog()
+    print("OK: Kaydet/oku ve kural kataloğu")
+
+    test_items_are_read_frame_by_frame()
+    print("OK: Frame frame okuma")
+
+    test_list_includes_legacy_json()
+    print("OK: Eski .json dosyalarıyla birlikte listeleme")
+
+    print("\nTest tamamlandi!")
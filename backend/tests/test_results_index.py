@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Sonuç Index'i (results_index) Test Script'i
+
+Bu script, SQLite tabanlı sonuç index'inin son tarama, zaman aralığı ve
+critical sayısına göre proje sıralama sorgularını test eder. Index geçici
+bir klasörde oluşturulur.
+
+Test Senaryoları:
+1. Araç/proje bazında son tarama doğru döner
+2. Zaman aralığı sorgusu sınırlara uyar
+3. Top-projects her proje için sadece son taramayı dikkate alır
+4. Index results/ klasöründeki dosyalardan yeniden oluşturulabilir
+
+Kullanım:
+    cd backend/tests
+    python test_results_index.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_results_index.py
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from metrics.result_model import MetricResult
+from result_store import save_scan_result
+from results_index import ResultsIndex
+
+
+def _metric(critical: int, tool_name: str = "Snyk Code") -> MetricResult:
+    return MetricResult(
+        tool_name=tool_name, critical=critical, high=1, medium=0, low=0,
+        total_issues=critical + 1, scan_duration=1.5
+    )
+
+
+def _populated_index(directory: str) -> ResultsIndex:
+    index = ResultsIndex(os.path.join(directory, "index.sqlite3"))
+    runs = [
+        ("snyk_code", "flask_demo", datetime(2026, 1, 1, 10), 5),
+        ("snyk_code", "flask_demo", datetime(2026, 1, 2, 10), 1),
+        ("snyk_code", "nodejs-goof", datetime(2026, 1, 1, 12), 3),
+        ("deepsource", "flask_demo", datetime(2026, 1, 3, 9), 7),
+    ]
+    for number, (tool, project, created_at, critical) in enumerate(runs):
+        index.record(tool, project, f"results/{number}.rstore", _metric(critical), created_at, "1.0.0")
+    return index
+
+
+def test_latest_by_tool_and_project():
+    """Son tarama araç ve proje filtresine göre dönmeli"""
+    with tempfile.TemporaryDirectory() as directory:
+        index = _populated_index(directory)
+
+        assert index.latest()["tool"] == "deepsource"
+        assert index.latest(tool="snyk_code")["created_at"].startswith("2026-01-02T10")
+        assert index.latest(tool="snyk_code", project="nodejs-goof")["metrics"]["critical"] == 3
+        assert index.latest(project="flask_demo")["tool"] == "deepsource"
+        assert index.latest(tool="snyk_code", project="missing") is None
+        index.close()
+
+
+def test_runs_in_range():
+    """Aralık sorgusu start dahil, end hariç olmalı ve en yeniden eskiye dönmeli"""
+    with tempfile.TemporaryDirectory() as directory:
+        index = _populated_index(directory)
+
+        runs = index.runs_in_range(start=datetime(2026, 1, 1, 12), end=datetime(2026, 1, 3, 9))
+        assert [run["file_path"] for run in runs] == ["results/1.rstore", "results/2.rstore"]
+        assert len(index.runs_in_range(tool="snyk_code", limit=2)) == 2
+        index.close()
+
+
+def test_top_projects_use_latest_run():
+    """Top-projects her (araç, proje) için sadece son taramayı saymalı"""
+    with tempfile.TemporaryDirectory() as directory:
+        index = _populated_index(directory)
+        # Daha eski bir taramanın sonradan kaydedilmesi son taramayı değiştirmemeli
+        index.record("snyk_code", "flask_demo", "results/old.rstore", _metric(99), datetime(2025, 1, 1))
+
+        top = index.top_projects_by_critical(tool="snyk_code")
+        assert [(row["project"], row["metrics"]["critical"]) for row in top] == [
+            ("nodejs-goof", 3), ("flask_demo", 1)
+        ]
+        assert index.top_projects_by_critical(limit=1)[0]["tool"] == "deepsource"
+        index.close()
+
+
+def test_rebuild_from_results_dir():
+    """Index sonuç dosyalarından metrikler yeniden hesaplanarak oluşturulmalı"""
+    with tempfile.TemporaryDirectory() as directory:
+        sarif = {"runs": [{"results": [
+            {"ruleId": "a", "level": "error", "properties": {"priorityScore": 950}},
+            {"ruleId": "b", "level": "warning"}
+        ]}]}
+        path = save_scan_result(sarif, "snyk_code", "flask_demo", results_dir=directory)
+
+        index = ResultsIndex(os.path.join(directory, "index.sqlite3"))
+        assert index.rebuild(directory) == 1
+        latest = index.latest(tool="snyk_code", project="flask_demo")
+        assert latest["file_path"] == path
+        assert (latest["metrics"]["critical"], latest["metrics"]["medium"]) == (1, 1)
+        index.close()
+
+
+if __name__ == "__main__":
+    print("\nSONUC INDEX TESTLERI\n")
+
+    test_latest_by_tool_and_project()
+    print("OK: Araç/proje bazında son tarama")
+
+    test_runs_in_range()
+    print("OK: Zaman aralığı sorgusu")
+
+    test_top_projects_use_latest_run()
+    print("OK: Critical sayısına göre projeler")
+
+    test_rebuild_from_results_dir()
+    print("OK: Index'in yeniden oluşturulması")
+
+    print("\nTest tamamlandi!")
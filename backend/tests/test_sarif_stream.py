@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Streaming SARIF Parser Test Script'i
+
+Bu script, sarif_stream modülünün SARIF dokümanını parça parça okurken
+json.load ile aynı result'ları döndürdüğünü ve SnykMetrics sayaçlarının
+tam doküman ile aynı sonucu verdiğini test eder.
+
+Test Senaryoları:
+1. Farklı chunk boyutlarında (1 byte dahil) result'lar birebir aynı döner
+2. Kaçış dizileri ve unicode karakterler chunk sınırında bölünse de doğru okunur
+3. SARIF olmayan (eski vulnerabilities formatı) dokümanda saw_runs False olur
+4. Akış halinde hesaplanan metrik, calculate() ile aynıdır ve ham çıktı birebir yazılır
+5. Chunk sınırında bölünen sayılar (12.75, -2.5e-3) capture modunda kesilmeden okunur
+
+Kullanım:
+    cd backend/tests
+    python test_sarif_stream.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_sarif_stream.py
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import sarif_stream
+from sarif_stream import SarifResultStream, TeeReader, iter_sarif_results
+from metrics.snyk_metrics import SnykMetrics
+
+
+def _sample_sarif() -> dict:
+    """Zor durumları içeren (kaçış, unicode, birden fazla run) SARIF dokümanı"""
+    return {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {"driver": {"name": "SnykCode", "rules": [
+                    {"id": "python/Sqli", "help": {"markdown": 'a \\" ] } { [ ' + "\\" * 7 + '"'}}
+                ]}},
+                "results": [
+                    {
+                        "ruleId": "python/Sqli",
+                        "level": "error",
+                        "message": {"text": 'Unsanitized "input" — ünïcode 🎉 \\'},
+                        "locations": [{"physicalLocation": {
+                            "artifactLocation": {"uri": "app.py"},
+                            "region": {"startLine": 12}
+                        }}],
+                        "properties": {"priorityScore": 950}
+                    },
+                    {"ruleId": "python/XSS", "level": "warning", "properties": {"priorityScore": 0}},
+                    {"ruleId": "python/Info", "level": "note", "properties": {"priorityScore": 650}}
+                ],
+                "properties": {"coverage": [{"files": 1, "isSupported": True, "lang": ".py"}]}
+            },
+            {"results": [{"ruleId": "other", "nested": [1, 2.5e3, True, None, {"x": "]}"}]}], "count": 12345678}
+        ]
+    }
+
+
+def _expected_results(data: dict) -> list:
+    return [
+        (run_index, result)
+        for run_index, run in enumerate(data["runs"])
+        for result in run.get("results", [])
+    ]
+
+
+def test_results_match_json_load_for_all_chunk_sizes():
+    """Her chunk boyutunda result'lar json.load ile aynı olmalı"""
+    data = _sample_sarif()
+    expected = _expected_results(data)
+
+    for indent, ensure_ascii in ((None, True), (2, False)):
+        raw = json.dumps(data, indent=indent, ensure_ascii=ensure_ascii).encode("utf-8")
+        for chunk_size in (1, 2, 3, 7, 64, 65536):
+            assert list(iter_sarif_results(io.BytesIO(raw), chunk_size)) == expected
+
+
+def test_numbers_split_at_chunk_boundary():
+    """Her chunk boyutunda sayılar (ondalık, üslü, negatif) kesilmeden okunmalı"""
+    documents = [
+        {"runs": [{"results": [{"a": 1}], "x": 12.75}]},
+        {"runs": [{"results": [{"score": -2.5e-3, "n": [10, 0.5, -7, 1E+2]}], "coverage": 3.14159}],
+         "version": 2.0},
+        {"runs": [{"x": 100, "results": [{"priorityScore": 987.654321}]}], "tail": -0.0001}
+    ]
+    for data in documents:
+        for raw in (json.dumps(data).encode("utf-8"), json.dumps(data, indent=1).encode("utf-8")):
+            for chunk_size in range(1, len(raw) + 1):
+                stream = SarifResultStream(io.BytesIO(raw), chunk_size, capture=True)
+                assert list(stream) == _expected_results(data), chunk_size
+                skeleton = json.loads(raw)
+                for run in skeleton["runs"]:
+                    run["results"] = []
+                assert stream.document == skeleton, chunk_size
+
+
+def test_large_values_are_skipped_structurally():
+    """SKIP_DECODE_LIMIT'i aşan değerler parse edilmeden atlanmalı"""
+    data = _sample_sarif()
+    raw = json.dumps(data).encode("utf-8")
+
+    original_limit = sarif_stream.SKIP_DECODE_LIMIT
+    sarif_stream.SKIP_DECODE_LIMIT = 16
+    try:
+        for chunk_size in (1, 5, 65536):
+            assert list(iter_sarif_results(io.BytesIO(raw), chunk_size)) == _expected_results(data)
+    finally:
+        sarif_stream.SKIP_DECODE_LIMIT = original_limit
+
+
+def test_non_sarif_document():
+    """Eski vulnerabilities formatında result dönmemeli ve saw_runs False olmalı"""
+    raw = json.dumps({"vulnerabilities": [{"severity": "high"}], "ok": True}).encode("utf-8")
+    stream = SarifResultStream(io.BytesIO(raw), chunk_size=4)
+
+    assert list(stream) == []
+    assert stream.saw_runs is False
+
+
+def test_streamed_metrics_match_full_document():
+    """Akış halinde sayılan metrik calculate() ile aynı olmalı, ham çıktı birebir yazılmalı"""
+    data = _sample_sarif()
+    raw = json.dumps(data, indent=2).encode("utf-8")
+    sink = io.BytesIO()
+
+    stream = SarifResultStream(TeeReader(io.BytesIO(raw), sink), chunk_size=16)
+    streamed = SnykMetrics().calculate_from_results(
+        result for run_index, result in stream if run_index == 0
+    )
+
+    assert streamed == SnykMetrics().calculate(data)
+    assert (streamed.critical, streamed.high, streamed.medium, streamed.low) == (1, 0, 2, 0)
+    assert stream.run_count == 2
+    assert sink.getvalue() == raw
+
+    issue = SnykMetrics.sarif_result_to_issue(data["runs"][0]["results"][0])
+    assert issue == {
+        "file": "app.py",
+        "line": 12,
+        "type": "python/Sqli",
+        "severity": "error",
+        "description": data["runs"][0]["results"][0]["message"]["text"]
+    }
+
+
+if __name__ == "__main__":
+    print("\nSTREAMING SARIF PARSER TESTLERI\n")
+
+    test_results_match_json_load_for_all_chunk_sizes()
+    print("OK: Chunk boyutlarından bağımsız parse")
+
+    test_numbers_split_at_chunk_boundary()
+    print("OK: Chunk sınırında bölünen sayılar")
+
+    test_large_values_are_skipped_structurally()
+    print("OK: Büyük değerlerin yapısal atlanması")
+
+    test_non_sarif_document()
+    print("OK: SARIF olmayan doküman")
+
+    test_streamed_metrics_match_full_document()
+    print("OK: Akış halinde metrik hesaplama")
+
+    print("\nTest tamamlandi!")
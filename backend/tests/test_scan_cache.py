@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Tarama Sonucu Cache'i Test Script'i
+
+Bu script, proje ağacı hash'ine göre çalışan tarama sonucu cache'inin
+(scan_cache) hit/miss davranışını, yaş ve boyut sınırına göre girdi
+silmeyi, runner'ların force=True ile cache'i atlamasını ve ağaç hash'i
+için kullanılan dosya hash cache'inin (project_tree) sınırlı kaldığını
+test eder. Snyk CLI yerine sahte bir tarama fonksiyonu kullanılır.
+
+Test Senaryoları:
+1. Aynı anahtar hit, farklı anahtar miss; girdiler yeni instance'ta da okunur;
+   get(max_age_seconds=) daha kısa yaş sınırı uygular
+2. Yaşı dolan girdi okunurken ve yeni girdi yazılırken silinir
+3. Toplam boyut sınırı aşılınca en eski girdiler silinir
+4. Runner: aynı ağaç cache'ten döner, dosya değişince veya force=True ile yeniden taranır
+5. Dosya hash cache'i: değişen dosyanın girdisi üzerine yazılır, LRU sınırı uygulanır
+
+Kullanım:
+    cd backend/tests
+    python test_scan_cache.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_scan_cache.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import project_tree
+from metrics.result_model import MetricResult
+from scan_cache import ScanCache, make_cache_key
+from tests.runner_patches import patched_runner
+
+SARIF_OUTPUT = {"runs": [{"results": [
+    {"ruleId": "python/Eval", "level": "error", "message": {"text": "eval"}}
+]}]}
+
+
+def _metric_result(total: int = 1) -> MetricResult:
+    return MetricResult(
+        tool_name="Snyk Code", total_issues=total,
+        critical=0, high=total, medium=0, low=0, scan_duration=0.5
+    )
+
+
+def test_cache_hits_and_misses():
+    """Aynı anahtar hit vermeli; girdiler diskten yeniden yüklenebilmeli"""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ScanCache(cache_dir=directory)
+        key = make_cache_key("snyk_code", "1.0.0", "tree-a")
+        assert key != make_cache_key("snyk_code", "1.0.1", "tree-a")
+        assert key != make_cache_key("snyk_code", "1.0.0", "tree-b")
+
+        assert cache.get(key) is None
+        cache.put(key, SARIF_OUTPUT, _metric_result(), "results/a.json", meta={"project": "demo"})
+
+        cached = cache.get(key)
+        assert cached["raw_output"] == SARIF_OUTPUT
+        assert cached["metric_result"] == _metric_result()
+        assert cached["file_path"] == "results/a.json"
+        assert cache.get(make_cache_key("snyk_code", "1.0.0", "tree-b")) is None
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 1)
+        assert stats["hit_ratio"] == 1 / 3
+
+        # Çağıranın verdiği daha kısa yaş sınırı girdiyi silmeden miss sayar
+        assert cache.get(key, max_age_seconds=0) is None
+        assert cache.get(key, max_age_seconds=60) is not None
+        assert cache.stats()["entries"] == 1
+
+        # Yeni bir process (instance) girdileri diskten okur
+        reloaded = ScanCache(cache_dir=directory)
+        assert reloaded.get(key)["metric_result"].total_issues == 1
+
+        # Ham çıktı verilmeyen (akış halinde kaydedilen) girdi
+        cache.put("streamed", None, _metric_result(2), "results/b.rstore")
+        assert cache.get("streamed")["raw_output"] is None
+
+
+def test_eviction_by_age():
+    """Yaşı dolan girdi okunurken ve yeni yazımda silinmeli"""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ScanCache(cache_dir=directory, max_age_seconds=0.2)
+        cache.put("old", SARIF_OUTPUT, _metric_result())
+        assert cache.get("old") is not None
+
+        time.sleep(0.3)
+        assert cache.get("old") is None
+        assert not os.path.exists(os.path.join(directory, "old.json"))
+
+        cache.put("first", SARIF_OUTPUT, _metric_result())
+        time.sleep(0.3)
+        cache.put("second", SARIF_OUTPUT, _metric_result())
+        assert not os.path.exists(os.path.join(directory, "first.json"))
+        assert cache.stats()["entries"] == 1 and cache.stats()["evictions"] == 1
+
+
+def test_eviction_by_size():
+    """Boyut sınırı aşılınca en eski girdiler silinmeli"""
+    with tempfile.TemporaryDirectory() as directory:
+        probe = ScanCache(cache_dir=os.path.join(directory, "probe"))
+        probe.put("probe", SARIF_OUTPUT, _metric_result())
+        entry_size = probe.stats()["total_bytes"]
+
+        # İki girdi sığar, üçüncüsü en eskiyi siler
+        cache = ScanCache(cache_dir=os.path.join(directory, "cache"), max_bytes=entry_size * 2 + entry_size // 2)
+        for key in ("aaaaa", "bbbbb", "ccccc"):
+            cache.put(key, SARIF_OUTPUT, _metric_result())
+            time.sleep(0.01)
+
+        assert cache.get("aaaaa") is None
+        assert cache.get("bbbbb") is not None and cache.get("ccccc") is not None
+        stats = cache.stats()
+        assert stats["entries"] == 2 and stats["evictions"] == 1
+        assert stats["total_bytes"] <= cache.max_bytes
+
+
+def test_runner_uses_cache_unless_forced():
+    """Runner aynı ağaç için cache'ten dönmeli; dosya değişince veya force=True ile taramalı"""
+    import metric_runner
+
+    scans = []
+
+    def fake_cli(target_path, on_resource_usage=None):
+        scans.append(target_path)
+        return SARIF_OUTPUT
+
+    with tempfile.TemporaryDirectory() as directory:
+        with patched_runner(
+            metric_runner, directory, run_snyk_code_scan=fake_cli, get_snyk_version=lambda: "1.0.0"
+        ) as patches:
+            first = metric_runner.run_code_scan_and_save("flask_demo", stream=False)
+            assert first["success"] and first["cached"] is False
+
+            cached = metric_runner.run_code_scan_and_save("flask_demo", stream=False)
+            assert cached["cached"] is True and cached["file_path"] == first["file_path"]
+            assert len(scans) == 1
+
+            forced = metric_runner.run_code_scan_and_save("flask_demo", force=True, stream=False)
+            assert forced["success"] and forced["cached"] is False
+            assert len(scans) == 2
+
+            # Dosya değişti: ağaç hash'i ve cache anahtarı değişir
+            project = os.path.join(patches["PROJECTS_ROOT"], "flask_demo")
+            Path(project, "app.py").write_text("import flask\nimport os\n", encoding="utf-8")
+            changed = metric_runner.run_code_scan_and_save("flask_demo", stream=False)
+            assert changed["cached"] is False
+            assert len(scans) == 3
+
+
+def test_file_hash_cache_is_bounded():
+    """Dosya hash cache'i yola göre tutulmalı ve LRU sınırını aşmamalı"""
+    original_limit = project_tree.PROJECT_HASH_CACHE_MAX_FILES
+    with tempfile.TemporaryDirectory() as directory:
+        project_tree._file_hash_cache.clear()
+        project_tree.PROJECT_HASH_CACHE_MAX_FILES = 3
+        try:
+            path = os.path.join(directory, "app.py")
+            hashes = set()
+            for version in range(5):
+                Path(path).write_text("x = 1\n" * (version + 1), encoding="utf-8")
+                hashes.add(project_tree.hash_file(path))
+            # Her sürüm için yeni hash, ama tek girdi
+            assert len(hashes) == 5
+            assert list(project_tree._file_hash_cache) == [os.path.abspath(path)]
+
+            # Değişmeyen dosya yeniden okunmaz (cache'teki hash döner)
+            stat = os.stat(path)
+            project_tree._file_hash_cache[os.path.abspath(path)] = (stat.st_size, stat.st_mtime_ns, "cached")
+            assert project_tree.hash_file(path) == "cached"
+
+            paths = []
+            for number in range(4):
+                paths.append(os.path.join(directory, f"module_{number}.py"))
+                Path(paths[-1]).write_text(f"value = {number}\n", encoding="utf-8")
+                project_tree.hash_file(paths[-1])
+            # En uzun süredir kullanılmayan girdiler (app.py, module_0.py) silinir
+            assert list(project_tree._file_hash_cache) == [os.path.abspath(p) for p in paths[1:]]
+
+            # Ağaç hash'i sınırdan bağımsız olarak doğru kalır
+            project_tree.PROJECT_HASH_CACHE_MAX_FILES = original_limit
+            project_tree._file_hash_cache.clear()
+            expected = project_tree.compute_tree_hash(directory)
+            project_tree.PROJECT_HASH_CACHE_MAX_FILES = 1
+            project_tree._file_hash_cache.clear()
+            assert project_tree.compute_tree_hash(directory) == expected
+            assert len(project_tree._file_hash_cache) == 1
+        finally:
+            project_tree.PROJECT_HASH_CACHE_MAX_FILES = original_limit
+            project_tree._file_hash_cache.clear()
+
+
+if __name__ == "__main__":
+    print("\nTARAMA SONUCU CACHE TESTLERI\n")
+
+    test_cache_hits_and_misses()
+    print("OK: Hit/miss")
+
+    test_eviction_by_age()
+    print("OK: Yaşa göre silme")
+
+    test_eviction_by_size()
+    print("OK: Boyuta göre silme")
+
+    test_runner_uses_cache_unless_forced()
+    print("OK: Runner cache ve force=True")
+
+    test_file_hash_cache_is_bounded()
+    print("OK: Sınırlı dosya hash cache'i")
+
+    print("\nTest tamamlandi!")
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Paralel Tarama (Fan-out) Zaman Aşımı Test Script'i
+
+Bu script, run_parallel_scans'in tarama başına zaman aşımını uyguladığını,
+sürenin runner'a iletildiğini ve Snyk CLI'ın süre dolunca öldürüldüğünü
+test eder. Snyk CLI yerine, proje adı "slow" ile başlıyorsa uzun süre
+bekleyen küçük bir script kullanılır.
+
+Test Senaryoları:
+1. scan_deadline / remaining_scan_seconds: iç içe kullanımda erken biten süre geçerli
+2. Zaman aşımına uğrayan tarama başarısız döner, CLI öldürülür ve thread biter
+   (hem run_snyk_code_scan hem stream_snyk_code_scan için)
+3. Sonuçlar görev sırasıyla döner; timing bloğu zaman aşımını süre olarak sayar
+4. Araç slotundan fazla görev varken slot beklenen süre zaman aşımına sayılmaz
+
+Kullanım:
+    cd backend/tests
+    python test_scan_fanout.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_scan_fanout.py
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import metric_runner
+from metrics.snyk_metrics import SnykMetrics
+from scan_fanout import (
+    ScanTask, run_parallel_scans, scan_deadline, paused_scan_deadline, remaining_scan_seconds
+)
+from single_flight import ToolConcurrencyLimiter
+
+# "slow" ile başlayan projelerde zaman aşımından çok daha uzun bekleyen sahte Snyk CLI
+SLEEPY_SNYK = '''#!{python}
+import json, os, sys, time
+target = sys.argv[3]
+if os.path.basename(target).startswith("slow"):
+    time.sleep(60)
+json.dump({{"runs": [{{"results": [{{"ruleId": "python/Eval", "level": "error"}}]}}]}}, sys.stdout)
+'''
+
+TIMEOUT = 1.0
+
+
+def test_scan_deadline_nesting():
+    """İç içe zaman aşımlarında daha erken biten geçerli olmalı"""
+    assert remaining_scan_seconds() is None
+
+    with scan_deadline(10):
+        assert 9 < remaining_scan_seconds() <= 10
+        with scan_deadline(2):
+            assert remaining_scan_seconds() <= 2
+        with scan_deadline(60):
+            assert remaining_scan_seconds() <= 10
+        with scan_deadline(None):
+            assert remaining_scan_seconds() <= 10
+
+    assert remaining_scan_seconds() is None
+
+    # Durdurulan saat beklenen süreyi saymaz
+    with scan_deadline(1) as clock:
+        with paused_scan_deadline():
+            assert clock.paused
+            time.sleep(0.3)
+        assert not clock.paused
+        assert clock.elapsed() < 0.2
+        assert remaining_scan_seconds() > 0.8
+
+
+def test_timeout_kills_cli_and_keeps_order():
+    """Zaman aşımında CLI öldürülmeli; sonuçlar görev sırasıyla ve timing bloğuyla dönmeli"""
+    original_path = metric_runner.SNYK_PATH
+    with tempfile.TemporaryDirectory() as directory:
+        snyk = Path(directory, "snyk")
+        snyk.write_text(SLEEPY_SNYK.format(python=sys.executable), encoding="utf-8")
+        snyk.chmod(0o755)
+        metric_runner.SNYK_PATH = str(snyk)
+
+        finished = {}
+        errors = {}
+
+        def runner(project):
+            """Proje adına göre tam çıktılı veya akış halinde tarama yapar"""
+            target = os.path.join(directory, project)
+            os.makedirs(target, exist_ok=True)
+            try:
+                if project.endswith("stream"):
+                    output = os.path.join(directory, "results", f"{project}.json")
+                    metric_result = metric_runner.stream_snyk_code_scan(target, output)
+                else:
+                    metric_result = SnykMetrics().calculate(metric_runner.run_snyk_code_scan(target))
+                return {"success": True, "project": project, "total_issues": metric_result.total_issues}
+            except RuntimeError as e:
+                errors[project] = str(e)
+                raise
+            finally:
+                finished[project] = time.monotonic()
+
+        projects = ["fast_a", "slow_b", "slow_stream", "fast_stream"]
+        tasks = [ScanTask("snyk_code", project, runner) for project in projects]
+        try:
+            start = time.monotonic()
+            summary = run_parallel_scans(tasks, max_concurrency=4, timeout=TIMEOUT)
+
+            # Runner thread'leri CLI öldürüldüğü için kısa sürede bitmeli
+            deadline = time.monotonic() + 10
+            while len(finished) < len(projects) and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            metric_runner.SNYK_PATH = original_path
+
+        assert sorted(finished) == sorted(projects)
+        assert max(finished.values()) - start < 10
+        assert set(errors) == {"slow_b", "slow_stream"}
+        assert all("timeout" in error for error in errors.values())
+        # Yarım kalan akış dosyası bırakılmaz
+        assert not os.path.exists(os.path.join(directory, "results", "slow_stream.json"))
+
+        results = summary["results"]
+        assert [result["project"] for result in results] == projects
+        assert [result["success"] for result in results] == [True, False, False, True]
+        assert all(result["tool"] == "snyk_code" for result in results)
+        assert results[0]["total_issues"] == results[3]["total_issues"] == 1
+        assert results[1]["error"] == f"Scan timeout (exceeded {TIMEOUT:g} seconds)"
+        assert results[1]["scan_seconds"] == results[2]["scan_seconds"] == TIMEOUT
+        assert results[0]["scan_seconds"] < TIMEOUT
+
+        timing = summary["timing"]
+        assert timing["timeout_seconds"] == TIMEOUT and timing["max_concurrency"] == 4
+        assert timing["summed_scan_seconds"] == sum(result["scan_seconds"] for result in results)
+        assert TIMEOUT <= timing["wall_clock_seconds"] < 10
+        assert timing["speedup"] == timing["summed_scan_seconds"] / timing["wall_clock_seconds"]
+
+
+def test_no_deadline_outside_fanout():
+    """Fan-out dışında (tekil tarama) CLI zaman aşımsız çalışmalı"""
+    seen = []
+
+    def runner(project):
+        seen.append(remaining_scan_seconds())
+        return {"success": True, "project": project}
+
+    run_parallel_scans([ScanTask("fake", "demo", runner)], timeout=30)
+    thread = threading.Thread(target=lambda: seen.append(remaining_scan_seconds()))
+    thread.start()
+    thread.join()
+
+    assert 29 < seen[0] <= 30
+    assert seen[1] is None
+
+
+def test_tool_slot_wait_is_not_counted():
+    """Araç slotu sayısından fazla görevde, slot beklenen süre zaman aşımına sayılmamalı"""
+    limiter = ToolConcurrencyLimiter({"fake": 2})
+
+    def runner(project):
+        with limiter.limit("fake"):
+            time.sleep(0.6)
+        return {"success": True, "project": project}
+
+    tasks = [ScanTask("fake", f"project_{number}", runner) for number in range(4)]
+    summary = run_parallel_scans(tasks, max_concurrency=4, timeout=1)
+
+    results = summary["results"]
+    assert [result["success"] for result in results] == [True] * 4, results
+    assert all(result["scan_seconds"] < 1 for result in results)
+    # İki slot: ikinci dalga ilk dalga bittikten sonra başlar
+    assert summary["timing"]["wall_clock_seconds"] >= 1.2
+
+
+if __name__ == "__main__":
+    print("\nPARALEL TARAMA ZAMAN ASIMI TESTLERI\n")
+
+    test_scan_deadline_nesting()
+    print("OK: scan_deadline")
+
+    test_timeout_kills_cli_and_keeps_order()
+    print("OK: Zaman aşımında CLI öldürülüyor, sıra ve timing")
+
+    test_no_deadline_outside_fanout()
+    print("OK: Fan-out dışında zaman aşımı yok")
+
+    test_tool_slot_wait_is_not_counted()
+    print("OK: Araç slotu beklemesi zaman aşımına sayılmıyor")
+
+    print("\nTest tamamlandi!")
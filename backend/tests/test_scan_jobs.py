@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Tarama Job Kuyruğu Test Script'i
+
+Bu script, ScanJobQueue'nun job durum geçişlerini, bekleyen job sınırını ve
+bitmiş job geçmişinin kırpılmasını, ayrıca /scan/<tool> ve /jobs
+endpoint'lerinin kuyrukla birlikte çalışmasını test eder. Taramalar, bir
+Event ile bekletilebilen sahte bir runner ile yapılır.
+
+Test Senaryoları:
+1. queued -> running -> done ve queued -> running -> failed geçişleri
+   (runner exception fırlatırsa da failed)
+2. done/failed görülen job'da result, error ve finished_at doludur
+3. Bekleyen job sınırı aşılınca QueueFullError / HTTP 503
+4. Geçmiş, history_limit kadar bitmiş job tutacak şekilde kırpılır
+5. /jobs limit parametresi doğrulanır (geçersizse 400)
+
+Kullanım:
+    cd backend/tests
+    python test_scan_jobs.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_scan_jobs.py
+"""
+
+import os
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from project_catalog import ProjectCatalog
+from scan_jobs import (
+    ScanJobQueue, QueueFullError, JOB_QUEUED, JOB_RUNNING, JOB_DONE, JOB_FAILED
+)
+from tool_registry import ToolAdapter, ToolRegistry
+
+FAKE_TOOL_MODULE = textwrap.dedent('''
+    import threading
+
+    RELEASE = threading.Event()
+
+
+    def run_gated_scan_and_save(project_name, force=False):
+        RELEASE.wait(10)
+        return {
+            "success": True,
+            "project": project_name,
+            "file_path": f"results/fake_{project_name}.json",
+            "metric_result": {"tool_name": "Fake", "total_issues": 1},
+            "error": None
+        }
+''')
+
+
+def _gated_runner(release: threading.Event, started: threading.Event = None):
+    def run(project):
+        if started is not None:
+            started.set()
+        release.wait(10)
+        if project == "crash":
+            raise RuntimeError("CLI crashed")
+        if project == "broken":
+            return {"success": False, "project": project, "error": "Snyk failed"}
+        return {"success": True, "project": project, "file_path": "results/x.json",
+                "metric_result": {"total_issues": 3}}
+    return run
+
+
+def _wait_for(predicate, timeout: float = 10):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def test_job_status_transitions():
+    """Job'lar queued -> running -> done/failed geçişlerini yapmalı"""
+    queue = ScanJobQueue(max_workers=1, max_pending=10)
+    release = threading.Event()
+    started = threading.Event()
+    try:
+        first = queue.submit("fake", "demo", _gated_runner(release, started))
+        second = queue.submit("fake", "broken", _gated_runner(release))
+        third = queue.submit("fake", "crash", _gated_runner(release))
+
+        assert started.wait(5)
+        assert queue.get(first.job_id).status == JOB_RUNNING
+        assert second.status == third.status == JOB_QUEUED
+        assert queue.stats() == {JOB_QUEUED: 2, JOB_RUNNING: 1, JOB_DONE: 0, JOB_FAILED: 0}
+
+        running = first.to_dict()
+        assert running["timings"]["started_at"] is not None
+        assert running["timings"]["finished_at"] is None and "metrics" not in running
+
+        release.set()
+        _wait_for(lambda: queue.stats()[JOB_DONE] + queue.stats()[JOB_FAILED] == 3)
+
+        done = first.to_dict()
+        assert done["status"] == JOB_DONE
+        assert done["metrics"] == {"total_issues": 3} and done["file_path"] == "results/x.json"
+        assert done["timings"]["run_seconds"] >= 0 and done["timings"]["queue_seconds"] >= 0
+
+        assert second.status == JOB_FAILED and second.error == "Snyk failed"
+        assert third.status == JOB_FAILED and third.error == "CLI crashed"
+        assert [job.job_id for job in queue.list(status=JOB_FAILED)] == [third.job_id, second.job_id]
+    finally:
+        release.set()
+        queue.shutdown()
+
+
+def test_finished_job_fields_are_visible_with_status():
+    """status done/failed görüldüğünde result, error ve finished_at dolu olmalı"""
+    queue = ScanJobQueue(max_workers=4, max_pending=1000)
+    release = threading.Event()
+    release.set()
+    stop = threading.Event()
+    inconsistent = []
+    jobs = []
+
+    def reader():
+        while not stop.is_set():
+            for job in list(jobs):
+                data = job.to_dict()
+                if data["status"] in (JOB_DONE, JOB_FAILED) and data["timings"]["finished_at"] is None:
+                    inconsistent.append(data)
+                if data["status"] == JOB_DONE and "metrics" not in data:
+                    inconsistent.append(data)
+                if data["status"] == JOB_FAILED and "error" not in data:
+                    inconsistent.append(data)
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    try:
+        for number in range(200):
+            project = "broken" if number % 2 else f"demo_{number}"
+            jobs.append(queue.submit("fake", project, _gated_runner(release)))
+        _wait_for(lambda: queue.stats()[JOB_DONE] + queue.stats()[JOB_FAILED] == 200)
+    finally:
+        stop.set()
+        thread.join()
+        queue.shutdown()
+
+    assert inconsistent == []
+
+
+def test_queue_full():
+    """Bekleyen job sınırı aşılınca QueueFullError fırlatılmalı"""
+    queue = ScanJobQueue(max_workers=1, max_pending=2)
+    release = threading.Event()
+    try:
+        queue.submit("fake", "a", _gated_runner(release))
+        queue.submit("fake", "b", _gated_runner(release))
+        try:
+            queue.submit("fake", "c", _gated_runner(release))
+            raise AssertionError("QueueFullError bekleniyordu")
+        except QueueFullError as e:
+            assert "2 pending jobs" in str(e)
+
+        # Job'lar bitince yeniden kabul edilir
+        release.set()
+        _wait_for(lambda: queue.stats()[JOB_DONE] == 2)
+        queue.submit("fake", "c", _gated_runner(release))
+    finally:
+        release.set()
+        queue.shutdown()
+
+
+def test_history_is_trimmed():
+    """Sadece history_limit kadar bitmiş job tutulmalı; bekleyenler silinmemeli"""
+    queue = ScanJobQueue(max_workers=2, max_pending=10, history_limit=2)
+    release = threading.Event()
+    release.set()
+    try:
+        finished = [queue.submit("fake", f"project_{number}", _gated_runner(release)) for number in range(4)]
+        # Geçmiş yeni job eklenirken kırpılır; erken bitenler sonraki submit'lerde silinebilir
+        _wait_for(lambda: all(job.status == JOB_DONE for job in finished))
+
+        blocked = threading.Event()
+        pending = queue.submit("fake", "pending", _gated_runner(blocked))
+
+        remaining = [job.job_id for job in queue.list()]
+        assert remaining[0] == pending.job_id
+        assert len(remaining) == 3
+        assert queue.get(finished[0].job_id) is None and queue.get(finished[1].job_id) is None
+        assert queue.list(limit=1)[0].job_id == pending.job_id
+        blocked.set()
+    finally:
+        queue.shutdown()
+
+
+def _with_fake_app(test, max_pending: int = 1):
+    """Bekletilebilen sahte aracı ve küçük bir job kuyruğunu app'e bağlayıp test'i çalıştırır"""
+    import app as app_module
+
+    with tempfile.TemporaryDirectory() as directory:
+        module_name = "fake_job_tool"
+        Path(directory, f"{module_name}.py").write_text(FAKE_TOOL_MODULE, encoding="utf-8")
+        sys.path.insert(0, directory)
+
+        registry = ToolRegistry(config_path="", enabled="", builtins=[])
+        registry.register(ToolAdapter(
+            name="fake_tool",
+            display_name="Fake Tool",
+            runner_ref=f"{module_name}:run_gated_scan_and_save",
+            metric_ref="metrics.snyk_metrics:SnykMetrics",
+            route="fake"
+        ))
+        projects_root = os.path.join(directory, "projects")
+        os.makedirs(os.path.join(projects_root, "flask_demo"))
+
+        original = app_module.tool_registry, app_module.project_catalog, app_module.job_queue
+        app_module.tool_registry = registry
+        app_module.project_catalog = ProjectCatalog(root=projects_root)
+        app_module.job_queue = ScanJobQueue(max_workers=1, max_pending=max_pending)
+        fake_module = __import__(module_name)
+        try:
+            test(app_module.app.test_client(), fake_module)
+        finally:
+            fake_module.RELEASE.set()
+            app_module.job_queue.shutdown()
+            app_module.tool_registry, app_module.project_catalog, app_module.job_queue = original
+            sys.path.remove(directory)
+            sys.modules.pop(module_name, None)
+
+
+def test_scan_endpoint_returns_503_when_queue_is_full():
+    """Kuyruk doluyken /scan/<tool> 503 dönmeli; job bitince durum done olmalı"""
+    def check(client, fake_module):
+        queued = client.post("/scan/fake", json={"project": "flask_demo"})
+        assert queued.status_code == 202
+        job_id = queued.get_json()["job_id"]
+
+        full = client.post("/scan/fake", json={"project": "flask_demo"})
+        assert full.status_code == 503
+        assert "queue is full" in full.get_json()["error"]
+
+        fake_module.RELEASE.set()
+        _wait_for(lambda: client.get(f"/jobs/{job_id}").get_json()["status"] == JOB_DONE)
+        job = client.get(f"/jobs/{job_id}").get_json()
+        assert job["metrics"]["total_issues"] == 1
+
+    _with_fake_app(check)
+
+
+def test_jobs_endpoint_limit():
+    """/jobs limit parametresi _parse_limit ile doğrulanmalı"""
+    def check(client, fake_module):
+        fake_module.RELEASE.set()
+        for _ in range(3):
+            assert client.post("/scan/fake", json={"project": "flask_demo"}).status_code == 202
+
+        body = client.get("/jobs?limit=2").get_json()
+        assert len(body["jobs"]) == 2
+        assert sum(body["counts"].values()) == 3
+
+        for value in ("abc", "0", "-1"):
+            response = client.get(f"/jobs?limit={value}")
+            assert response.status_code == 400
+            assert "limit" in response.get_json()["error"]
+
+    _with_fake_app(check, max_pending=10)
+
+
+if __name__ == "__main__":
+    print("\nTARAMA JOB KUYRUGU TESTLERI\n")
+
+    test_job_status_transitions()
+    print("OK: Durum geçişleri")
+
+    test_finished_job_fields_are_visible_with_status()
+    print("OK: Bitmiş job alanları status ile birlikte görünüyor")
+
+    test_queue_full()
+    print("OK: Kuyruk dolu")
+
+    test_history_is_trimmed()
+    print("OK: Geçmiş kırpma")
+
+    test_scan_endpoint_returns_503_when_queue_is_full()
+    print("OK: /scan/<tool> 503")
+
+    test_jobs_endpoint_limit()
+    print("OK: /jobs limit doğrulama")
+
+    print("\nTest tamamlandi!")
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Akış Halinde Toplu Tarama (NDJSON / SSE) Test Script'i
+
+Bu script, paralel taramaların olaylarını oluştukça üreten
+iter_parallel_scans'i ve /scan/<tool>/all endpoint'inin ?format=ndjson /
+?format=sse ile sonuçları proje bittikçe göndermesini test eder. Taramalar
+sahte bir araçla yapılır; yavaş proje bir Event ile bekletilir.
+
+Test Senaryoları:
+1. Olaylar start, result (bitme sırasıyla), progress ve done olarak üretilir
+2. run_parallel_scans sonuçları eskisi gibi görev sırasıyla döner
+3. Generator kapatılınca başlamamış taramalar iptal edilir
+4. NDJSON akışında ilk sonuç, yavaş proje bitmeden gelir
+5. SSE formatı, Accept header'ı ile seçim ve geçersiz format
+
+Kullanım:
+    cd backend/tests
+    python test_scan_streaming.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_scan_streaming.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from project_catalog import ProjectCatalog
+from scan_fanout import ScanTask, iter_parallel_scans, run_parallel_scans
+from tool_registry import ToolAdapter, ToolRegistry
+
+FAKE_TOOL_MODULE = textwrap.dedent('''
+    import threading
+
+    RELEASE_SLOW = threading.Event()
+
+
+    def run_fake_scan_and_save(project_name, force=False):
+        if project_name.startswith("slow"):
+            RELEASE_SLOW.wait(10)
+        return {
+            "success": True,
+            "project": project_name,
+            "file_path": f"results/fake_{project_name}.json",
+            "metric_result": {"tool_name": "Fake", "total_issues": 1},
+            "error": None
+        }
+''')
+
+
+def _slow_runner(release: threading.Event):
+    def run(project):
+        if project.startswith("slow"):
+            release.wait(10)
+        if project == "broken":
+            raise RuntimeError("CLI crashed")
+        return {"success": True, "project": project}
+    return run
+
+
+def test_events_in_completion_order():
+    """Sonuçlar bitme sırasıyla gelmeli; beklerken progress olayları üretilmeli"""
+    release = threading.Event()
+    runner = _slow_runner(release)
+    tasks = [ScanTask("fake", name, runner) for name in ("slow_a", "fast_b", "broken")]
+
+    events = []
+    for event in iter_parallel_scans(tasks, max_concurrency=3, timeout=30, heartbeat=0.05):
+        events.append(event)
+        # Hızlı taramalar bitip birkaç progress olayı geldikten sonra yavaş taramayı bırak
+        if sum(1 for e in events if e["event"] == "progress") == 2:
+            release.set()
+
+    kinds = [event["event"] for event in events]
+    assert kinds[0] == "start" and kinds[-1] == "done"
+    assert events[0]["total"] == 3
+
+    results = [event for event in events if event["event"] == "result"]
+    assert [event["result"]["project"] for event in results][-1] == "slow_a"
+    assert sorted(event["index"] for event in results) == [0, 1, 2]
+    assert [event["completed"] for event in results] == [1, 2, 3]
+    broken = next(event["result"] for event in results if event["result"]["project"] == "broken")
+    assert broken["success"] is False and broken["error"] == "CLI crashed"
+
+    progress = [event for event in events if event["event"] == "progress"]
+    assert progress[0]["completed"] == 2 and progress[0]["running"] == 1 and progress[0]["queued"] == 0
+
+    done = events[-1]
+    assert (done["succeeded"], done["failed"]) == (2, 1)
+    assert done["timing"]["max_concurrency"] == 3
+
+
+def test_run_parallel_scans_keeps_task_order():
+    """Toplu çağrı sonuçları görev sırasıyla dönmeli"""
+    release = threading.Event()
+    release.set()
+    tasks = [ScanTask("fake", name, _slow_runner(release)) for name in ("slow_a", "fast_b")]
+    summary = run_parallel_scans(tasks, max_concurrency=2, timeout=30)
+    assert [result["project"] for result in summary["results"]] == ["slow_a", "fast_b"]
+    assert all(result["tool"] == "fake" for result in summary["results"])
+    assert summary["timing"]["timeout_seconds"] == 30
+
+
+def test_closing_stream_cancels_queued_scans():
+    """İstemci akışı kapatınca kuyruktaki taramalar başlamamalı"""
+    started = []
+
+    def runner(project):
+        started.append(project)
+        time.sleep(0.05)
+        return {"success": True, "project": project}
+
+    tasks = [ScanTask("fake", f"project_{number}", runner) for number in range(5)]
+    events = iter_parallel_scans(tasks, max_concurrency=1, timeout=30, heartbeat=0)
+    for event in events:
+        if event["event"] == "result":
+            break
+    events.close()
+
+    time.sleep(0.2)
+    assert len(started) <= 2, started
+
+
+def _with_fake_app(test):
+    """Sahte aracı ve geçici proje kataloğunu app'e bağlayıp test'i çalıştırır"""
+    import app as app_module
+
+    with tempfile.TemporaryDirectory() as directory:
+        module_name = "fake_streaming_tool"
+        Path(directory, f"{module_name}.py").write_text(FAKE_TOOL_MODULE, encoding="utf-8")
+        sys.path.insert(0, directory)
+
+        registry = ToolRegistry(config_path="", enabled="", builtins=[])
+        registry.register(ToolAdapter(
+            name="fake_tool",
+            display_name="Fake Tool",
+            runner_ref=f"{module_name}:run_fake_scan_and_save",
+            metric_ref="metrics.snyk_metrics:SnykMetrics",
+            route="fake"
+        ))
+        projects_root = os.path.join(directory, "projects")
+        for project in ("fast_project", "slow_project"):
+            os.makedirs(os.path.join(projects_root, project))
+
+        original = app_module.tool_registry, app_module.project_catalog
+        app_module.tool_registry = registry
+        app_module.project_catalog = ProjectCatalog(root=projects_root)
+        try:
+            fake_module = __import__(module_name)
+            fake_module.RELEASE_SLOW.clear()
+            test(app_module.app.test_client(), fake_module)
+        finally:
+            app_module.tool_registry, app_module.project_catalog = original
+            sys.path.remove(directory)
+            sys.modules.pop(module_name, None)
+
+
+def test_ndjson_first_result_before_batch_finishes():
+    """NDJSON akışında hızlı projenin sonucu yavaş proje bitmeden gelmeli"""
+    def check(client, fake_module):
+        response = client.post("/scan/fake/all?format=ndjson", buffered=False)
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+
+        lines = response.iter_encoded()
+        start = json.loads(next(lines))
+        assert start["event"] == "start" and start["total"] == 2
+
+        first = json.loads(next(lines))
+        assert first["event"] == "result"
+        assert first["result"]["project"] == "fast_project"
+        assert not fake_module.RELEASE_SLOW.is_set()
+
+        fake_module.RELEASE_SLOW.set()
+        rest = [json.loads(line) for line in lines]
+        response.close()
+
+        results = [event for event in rest if event["event"] == "result"]
+        assert results[0]["result"]["project"] == "slow_project"
+        assert rest[-1]["event"] == "done"
+        assert rest[-1]["message"] == "Fake Tool scanned 2/2 projects"
+
+    _with_fake_app(check)
+
+
+def test_sse_and_format_selection():
+    """SSE formatı, Accept header'ı ile seçim ve geçersiz format"""
+    def check(client, fake_module):
+        fake_module.RELEASE_SLOW.set()
+
+        response = client.post("/scan/fake/all", headers={"Accept": "text/event-stream"})
+        assert response.mimetype == "text/event-stream"
+        assert response.headers["Cache-Control"] == "no-cache"
+        messages = [block for block in response.get_data(as_text=True).split("\n\n") if block]
+        assert messages[0].startswith("event: start\ndata: {")
+        assert messages[-1].startswith("event: done\n")
+        done = json.loads(messages[-1].split("data: ", 1)[1])
+        assert done["succeeded"] == 2
+
+        # Varsayılan (Accept: */*) tek JSON response
+        response = client.post("/scan/fake/all", headers={"Accept": "*/*"})
+        assert response.mimetype == "application/json"
+        assert len(response.get_json()["results"]) == 2
+
+        response = client.post("/scan/fake/all", json={"format": "ndjson"})
+        assert response.mimetype == "application/x-ndjson"
+
+        assert client.post("/scan/fake/all?format=xml").status_code == 400
+
+    _with_fake_app(check)
+
+
+if __name__ == "__main__":
+    print("\nAKIS HALINDE TOPLU TARAMA TESTLERI\n")
+
+    test_events_in_completion_order()
+    print("OK: Olaylar bitme sırasıyla üretiliyor")
+
+    test_run_parallel_scans_keeps_task_order()
+    print("OK: Toplu sonuçlar görev sırasıyla")
+
+    test_closing_stream_cancels_queued_scans()
+    print("OK: Akış kapatılınca kuyruktaki taramalar iptal ediliyor")
+
+    test_ndjson_first_result_before_batch_finishes()
+    print("OK: NDJSON ilk sonucu toplu tarama bitmeden gönderiyor")
+
+    test_sse_and_format_selection()
+    print("OK: SSE ve format seçimi")
+
+    print("\nTest tamamlandi!")
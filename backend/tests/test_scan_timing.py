@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Tarama Süresi Ölçümü (scan_timing) Test Script'i
+
+Bu script, taramanın fazlara (spawn, tool, parse, normalize, persist)
+ayrılarak ölçülmesini, iç içe fazlarda sadece kendi süresinin sayılmasını ve
+runner'ların ölçülen süreyi MetricResult.scan_duration / timings alanlarına
+yazmasını test eder. Araçlar sahte fonksiyonlarla değiştirilir; sonuçlar
+geçici klasörlere yazılır.
+
+Test Senaryoları:
+1. İç içe fazlar sadece kendi süresini alır; aynı faz toplanır
+2. Aktif ölçüm yokken scan_phase hiçbir şey yapmaz; ölçüm thread'e özeldir
+3. profiled_run aktif ölçümde spawn ve tool fazlarını ölçer
+4. Snyk Code runner'ı scan_duration ve timings'i doldurur; cache'ten aynısı döner
+5. DeepSource runner'ı scan_duration'ı 0.0 yerine ölçülen süreyle doldurur
+
+Kullanım:
+    cd backend/tests
+    python test_scan_timing.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_scan_timing.py
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from process_profiler import profiled_run
+from scan_timing import ScanTimer, current_timer, scan_phase
+from tests.runner_patches import patched_runner
+
+SARIF_OUTPUT = {
+    "runs": [{
+        "tool": {"driver": {"name": "SnykCode", "rules": []}},
+        "results": [
+            {"ruleId": "python/Sqli", "level": "error", "message": {"text": "SQL injection"},
+             "properties": {"priorityScore": 750}}
+        ]
+    }]
+}
+
+DEEPSOURCE_OUTPUT = {
+    "data": {"repository": {"name": "kalite", "issues": {"totalCount": 1, "edges": [
+        {"node": {"issue": {"shortcode": "PYL-W0612", "title": "Unused variable", "severity": "MINOR"}}}
+    ]}}}
+}
+
+
+class FakeClock:
+    """Elle ilerletilen saat"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_nested_phases_use_self_time():
+    """İç içe fazların süresi dış fazdan düşülmeli; aynı faz toplanmalı"""
+    clock = FakeClock()
+    timer = ScanTimer(clock=clock)
+
+    with timer.phase("tool"):
+        clock.now += 1.0
+        with timer.phase("spawn"):
+            clock.now += 0.25
+        with timer.phase("parse"):
+            clock.now += 0.5
+        clock.now += 2.0
+    with timer.phase("persist"):
+        clock.now += 0.125
+    timer.add("persist", 0.125)
+
+    timings = timer.to_dict()
+    assert timings["phases"] == {"spawn": 0.25, "parse": 0.5, "tool": 3.0, "persist": 0.25}
+    assert timings["tool_seconds"] == 3.25
+    assert timings["pipeline_seconds"] == 0.75
+    assert timings["total_seconds"] == 3.875
+
+
+def test_scan_phase_without_active_timer():
+    """Aktif ölçüm yokken no-op olmalı; ölçüm başka thread'lere geçmemeli"""
+    with scan_phase("tool"):
+        pass
+    assert current_timer() is None
+
+    timer = ScanTimer()
+    seen_in_thread = []
+    with timer.activate():
+        assert current_timer() is timer
+        with scan_phase("normalize"):
+            thread = threading.Thread(target=lambda: seen_in_thread.append(current_timer()))
+            thread.start()
+            thread.join()
+    assert current_timer() is None
+    assert seen_in_thread == [None]
+    assert list(timer.to_dict()["phases"]) == ["normalize"]
+
+
+def test_profiled_run_records_spawn_and_tool():
+    """profiled_run, CLI'ın başlatılmasını ve çalışmasını ayrı fazlara yazmalı"""
+    timer = ScanTimer()
+    with timer.activate():
+        with scan_phase("tool"):
+            completed, _ = profiled_run([sys.executable, "-c", "import time; time.sleep(0.2); print('ok')"])
+    assert completed.stdout.strip() == "ok"
+
+    phases = timer.to_dict()["phases"]
+    assert set(phases) == {"spawn", "tool"}
+    assert phases["spawn"] > 0
+    assert phases["tool"] >= 0.2
+    assert timer.tool_seconds() <= timer.total_seconds()
+
+
+def test_snyk_runner_fills_scan_duration_and_timings():
+    """Snyk Code runner'ı ölçülen süreyi MetricResult'a yazmalı"""
+    import metric_runner
+
+    def fake_cli(target_path, on_resource_usage=None):
+        time.sleep(0.1)
+        with scan_phase("parse"):
+            return SARIF_OUTPUT
+
+    with tempfile.TemporaryDirectory() as directory:
+        with patched_runner(
+            metric_runner, directory, run_snyk_code_scan=fake_cli, get_snyk_version=lambda: "1.0.0"
+        ):
+            result = metric_runner.run_code_scan_and_save("flask_demo", stream=False)
+            assert result["success"], result
+            metrics = result["metric_result"]
+            timings = metrics["timings"]
+
+            assert set(timings["phases"]) == {"tool", "parse", "normalize", "persist"}
+            assert timings["phases"]["tool"] >= 0.1
+            assert metrics["scan_duration"] == timings["tool_seconds"]
+            assert timings["total_seconds"] >= timings["tool_seconds"] + timings["pipeline_seconds"]
+
+            # Index'teki süre de ölçülen süredir
+            latest = metric_runner.results_index.latest("snyk_code", "flask_demo")
+            assert latest["metrics"]["scan_duration"] == metrics["scan_duration"]
+
+            # Cache'ten gelen sonuç, onu üreten taramanın süresini taşır
+            cached = metric_runner.run_code_scan_and_save("flask_demo", stream=False)
+            assert cached["cached"] is True
+            assert cached["metric_result"]["timings"] == timings
+
+
+def test_deepsource_runner_fills_scan_duration():
+    """DeepSource runner'ı scan_duration'ı 0.0 bırakmamalı"""
+    import deepsource_runner
+
+    def fake_scan(target_path, on_resource_usage=None):
+        time.sleep(0.05)
+        return DEEPSOURCE_OUTPUT
+
+    with tempfile.TemporaryDirectory() as directory:
+        with patched_runner(
+            deepsource_runner, directory,
+            run_deepsource_scan=fake_scan, get_deepsource_version=lambda: "mock"
+        ):
+            result = deepsource_runner.run_deepsource_scan_and_save("flask_demo")
+            assert result["success"], result
+            metrics = result["metric_result"]
+            assert metrics["total_issues"] == 1
+            assert metrics["scan_duration"] >= 0.05
+            assert set(metrics["timings"]["phases"]) == {"tool", "normalize", "persist"}
+
+
+if __name__ == "__main__":
+    print("\nTARAMA SURESI OLCUMU TESTLERI\n")
+
+    test_nested_phases_use_self_time()
+    print("OK: İç içe fazlar kendi süresini alıyor")
+
+    test_scan_phase_without_active_timer()
+    print("OK: Aktif ölçüm yokken scan_phase etkisiz")
+
+    test_profiled_run_records_spawn_and_tool()
+    print("OK: profiled_run spawn ve tool fazlarını ölçüyor")
+
+    test_snyk_runner_fills_scan_duration_and_timings()
+    print("OK: Snyk Code runner'ı süreyi MetricResult'a yazıyor")
+
+    test_deepsource_runner_fills_scan_duration()
+    print("OK: DeepSource runner'ı süreyi MetricResult'a yazıyor")
+
+    print("\nTest tamamlandi!")
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Tarama Birleştirme (single_flight) Test Script'i
+
+Bu script, aynı anahtarla eşzamanlı gelen işlerin tek çalıştırmada
+birleştirilmesini, araç bazında eşzamanlılık sınırını ve Snyk Code
+runner'ının eşzamanlı özdeş taramalarda tek CLI çalıştırıp tek sonuç dosyası
+yazmasını test eder. Snyk CLI sahte bir fonksiyonla değiştirilir; sonuçlar
+geçici klasörlere yazılır.
+
+Test Senaryoları:
+1. Aynı anahtarlı eşzamanlı çağrılar tek çalıştırmayı paylaşır; hata tüm bekleyenlere iletilir
+2. Farklı anahtarlar birbirini beklemez
+3. Araç eşzamanlılık sınırı aşılmaz; 0 sınırsızdır
+4. Eşzamanlı iki POST /scan/code isteği tek CLI çalıştırır ve aynı sonucu alır
+5. Aynı saniyede istenen sonuç dosyası yolları çakışmaz; başarısız yazmada
+   ayrılan yol serbest bırakılır
+
+Kullanım:
+    cd backend/tests
+    python test_single_flight.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_single_flight.py
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import result_store
+from single_flight import SingleFlight, ToolConcurrencyLimiter, parse_tool_limits
+from tests.runner_patches import patched, patched_runner
+
+SARIF_OUTPUT = {
+    "runs": [{
+        "tool": {"driver": {"name": "SnykCode", "rules": []}},
+        "results": [
+            {"ruleId": "python/Sqli", "level": "error", "message": {"text": "SQL injection"},
+             "properties": {"priorityScore": 750}}
+        ]
+    }]
+}
+
+
+def test_concurrent_calls_share_one_execution():
+    """Aynı anahtarlı eşzamanlı çağrılar fn'i bir kez çalıştırmalı"""
+    flights = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def work():
+        calls.append(1)
+        release.wait(5)
+        return {"value": 42}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(flights.run, "key", work) for _ in range(8)]
+        # Tüm çağrılar lideri beklemeye başlayana kadar bekle
+        deadline = time.monotonic() + 5
+        while flights.stats()["waiting"] < 7 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        outcomes = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert all(result is outcomes[0][0] for result, _ in outcomes)
+    assert sorted(shared for _, shared in outcomes) == [False] + [True] * 7
+    assert flights.stats() == {"in_flight": 0, "waiting": 0, "executions": 1, "shared": 7}
+
+    # İş bittikten sonra aynı anahtar yeniden çalıştırılır (sonuç saklanmaz)
+    assert flights.run("key", lambda: "again") == ("again", False)
+
+
+def test_errors_propagate_and_keys_are_independent():
+    """Liderin hatası bekleyenlere iletilmeli; farklı anahtarlar beklememeli"""
+    flights = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise RuntimeError("snyk failed")
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        leader = executor.submit(flights.run, "a", failing)
+        started.wait(5)
+        follower = executor.submit(flights.run, "a", lambda: "not called")
+        # Farklı anahtar, süren "a" işini beklemeden çalışır
+        assert flights.run("b", lambda: "b") == ("b", False)
+        while flights.stats()["waiting"] < 1:
+            time.sleep(0.01)
+        release.set()
+
+        for future in (leader, follower):
+            try:
+                future.result()
+                raise AssertionError("Hata iletilmeli")
+            except RuntimeError as e:
+                assert str(e) == "snyk failed"
+
+    assert flights.in_flight() == 0
+
+
+def test_tool_concurrency_limit():
+    """Aynı anda çalışan tarama sayısı aracın sınırını aşmamalı"""
+    limiter = ToolConcurrencyLimiter(limits={"snyk_code": 2, "unlimited": 0}, default_limit=1)
+    lock = threading.Lock()
+
+    # Sınır ölçümü: her araç için ayrı ayrı
+    for tool, limit in (("snyk_code", 2), ("other", 1), ("unlimited", 6)):
+        counter = {"active": 0, "peak": 0}
+
+        def measured():
+            with limiter.limit(tool):
+                with lock:
+                    counter["active"] += 1
+                    counter["peak"] = max(counter["peak"], counter["active"])
+                time.sleep(0.05)
+                with lock:
+                    counter["active"] -= 1
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            for _ in range(6):
+                executor.submit(measured)
+        assert counter["peak"] == limit, (tool, counter)
+
+    stats = limiter.stats()
+    assert stats["snyk_code"] == {"limit": 2, "active": 0, "waiting": 0}
+    assert stats["unlimited"]["limit"] == 0
+
+    assert parse_tool_limits(" snyk_code=3, deepsource=0 ") == {"snyk_code": 3, "deepsource": 0}
+    for invalid in ("snyk_code", "snyk_code=-1", "=2"):
+        try:
+            parse_tool_limits(invalid)
+            raise AssertionError(f"Geçersiz değer kabul edilmemeli: {invalid}")
+        except ValueError:
+            pass
+
+
+def test_concurrent_identical_scans_run_cli_once():
+    """Eşzamanlı iki /scan/code isteği tek CLI çalıştırıp aynı sonucu almalı"""
+    import app as app_module
+    import metric_runner
+    from project_catalog import ProjectCatalog
+
+    cli_calls = []
+    release = threading.Event()
+
+    def fake_cli(target_path, on_resource_usage=None):
+        cli_calls.append(target_path)
+        release.wait(5)
+        return SARIF_OUTPUT
+
+    with tempfile.TemporaryDirectory() as directory:
+        with patched_runner(
+            metric_runner, directory, run_snyk_code_scan=fake_cli, get_snyk_version=lambda: "1.0.0"
+        ) as patches:
+            catalog = ProjectCatalog(root=patches["PROJECTS_ROOT"])
+            with patched(app_module, {"project_catalog": catalog}):
+                client = app_module.app.test_client()
+
+                def post():
+                    return client.post("/scan/code", json={
+                        "project": "flask_demo", "wait": True, "stream": False
+                    })
+
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    futures = [executor.submit(post) for _ in range(2)]
+                    deadline = time.monotonic() + 5
+                    while metric_runner.scan_flights.stats()["waiting"] < 1 and time.monotonic() < deadline:
+                        time.sleep(0.01)
+                    release.set()
+                    responses = [future.result() for future in futures]
+
+                assert len(cli_calls) == 1
+                bodies = [response.get_json() for response in responses]
+                assert all(response.status_code == 200 for response in responses), bodies
+                assert bodies[0]["file_path"] == bodies[1]["file_path"]
+                assert sorted(body["coalesced"] for body in bodies) == [False, True]
+                assert len(os.listdir(os.path.join(directory, "results"))) == 1
+
+                # Tarama bittikten sonra gelen istek cache'ten döner
+                body = post().get_json()
+                assert body["cached"] is True and len(cli_calls) == 1
+
+
+def test_result_paths_do_not_collide():
+    """Aynı saniyede eşzamanlı istenen sonuç dosyası yolları farklı olmalı"""
+    with tempfile.TemporaryDirectory() as directory:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            paths = list(executor.map(
+                lambda _: result_store.result_file_path(directory, "snyk_code", "flask_demo"),
+                range(8)
+            ))
+        assert len(set(paths)) == 8
+        for path in paths:
+            result_store.release_result_path(path)
+
+
+def test_failed_scans_release_result_paths():
+    """Yazılamayan sonuç dosyasının ayrılmış yolu serbest bırakılmalı"""
+    with tempfile.TemporaryDirectory() as directory:
+        try:
+            with result_store.reserve_result_path(directory, "snyk_code", "flask_demo") as path:
+                assert path in result_store._reserved_paths
+                raise RuntimeError("Snyk CLI failed")
+        except RuntimeError:
+            pass
+        assert path not in result_store._reserved_paths
+
+        # Serileştirilemeyen çıktı: dosya yazılmaz, ayrılan yol da kalmaz
+        before = set(result_store._reserved_paths)
+        for file_format in ("json", "compact"):
+            try:
+                result_store.save_scan_result(
+                    {"runs": [{"results": [object()]}]}, "snyk_code", "flask_demo",
+                    results_dir=directory, file_format=file_format
+                )
+            except TypeError:
+                pass
+            else:
+                raise AssertionError("TypeError bekleniyordu")
+        assert result_store._reserved_paths == before
+        assert [name for name in os.listdir(directory) if name != "catalog"] == []
+
+
+if __name__ == "__main__":
+    print("\nTARAMA BIRLESTIRME TESTLERI\n")
+
+    test_concurrent_calls_share_one_execution()
+    print("OK: Eşzamanlı çağrılar tek çalıştırmayı paylaşıyor")
+
+    test_errors_propagate_and_keys_are_independent()
+    print("OK: Hatalar iletiliyor, anahtarlar bağımsız")
+
+    test_tool_concurrency_limit()
+    print("OK: Araç eşzamanlılık sınırı")
+
+    test_concurrent_identical_scans_run_cli_once()
+    print("OK: Eşzamanlı özdeş /scan/code istekleri tek CLI çalıştırıyor")
+
+    test_result_paths_do_not_collide()
+    print("OK: Sonuç dosyası yolları çakışmıyor")
+
+    test_failed_scans_release_result_paths()
+    print("OK: Başarısız yazma ayrılan yolu bırakıyor")
+
+    print("\nTest tamamlandi!")
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Kaynak Kod Sayımı (source_census) Test Script'i
+
+Bu script, proje dosya/satır sayımının ignore kurallarını uygulamasını,
+dil ve uzantı bazında doğru sayım yapmasını, ağaç hash'ine göre cache'lenmesini
+ve kod kapsama oranının bu sayımla hesaplanmasını test eder. Projeler geçici
+bir klasörde oluşturulur.
+
+Test Senaryoları:
+1. .gitignore / .dcignore ve IGNORED_DIRS kuralları uygulanır
+2. Dil ve uzantı bazında dosya/satır sayıları; binary dosyalar
+3. Değişmemiş ağaç için sayım cache'ten gelir, değişince yeniden yapılır;
+   cache dosyası yazılamazsa geçici dosya kalmaz
+4. Paralel sayım tek thread'li sayımla aynı sonucu verir
+5. calculate_code_coverage gerçek bir yüzde ve lines_analyzed döner;
+   metrics paketi source_census'u import etmez (sayımı çağıran verir)
+6. Binlerce dosyalı proje makul sürede sayılır
+
+Kullanım:
+    cd backend/tests
+    python test_source_census.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_source_census.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import source_census
+from metrics.advanced_metrics import AdvancedMetricsCalculator
+from source_census import (
+    SOURCE_CENSUS_CHUNK_SIZE,
+    IgnoreRules,
+    SourceCensusCache,
+    census_project,
+    count_lines,
+    list_source_files
+)
+
+
+def _write(root: str, relative_path: str, content: str):
+    path = Path(root, relative_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def _create_project(root: str):
+    _write(root, "app.py", "import flask\n\napp = flask.Flask(__name__)\n")
+    _write(root, "utils/helpers.py", "def helper():\n    return 1")
+    _write(root, "static/main.js", "const a = 1;\nconst b = 2;\n")
+    _write(root, "templates/index.html", "<html>\n</html>\n")
+    _write(root, "config.yml", "debug: true\n")
+    _write(root, "build/generated.py", "x = 1\n" * 50)
+    _write(root, "vendor/lib.js", "var x;\n" * 20)
+    _write(root, "node_modules/pkg/index.js", "module.exports = 1;\n")
+    _write(root, "debug.log", "log line\n")
+    _write(root, ".gitignore", "# build ciktilari\n/build/\n*.log\n!keep.log\n")
+    _write(root, ".dcignore", "vendor/\n")
+    Path(root, "logo.png").write_bytes(b"\x89PNG\r\n\0\0\n\n")
+
+
+def test_ignore_rules():
+    """Ignore dosyaları ve IGNORED_DIRS ile dışlanan dosyalar sayılmamalı"""
+    with tempfile.TemporaryDirectory() as root:
+        _create_project(root)
+        paths = sorted(relative_path for relative_path, _, _ in list_source_files(root))
+        assert paths == [
+            ".dcignore", ".gitignore", "app.py", "config.yml", "logo.png",
+            "static/main.js", "templates/index.html", "utils/helpers.py"
+        ]
+
+    rules = IgnoreRules(["/docs/*.md", "**/fixtures", "tmp/"])
+    assert rules.matches("docs/readme.md", False)
+    assert not rules.matches("src/docs/readme.md", False)
+    assert rules.matches("fixtures", True) and rules.matches("tests/fixtures", True)
+    assert rules.matches("a/tmp", True) and not rules.matches("tmp", False)
+
+
+def test_counts_per_language_and_extension():
+    """Dil/uzantı bazında sayılar doğru olmalı; binary dosyanın satırı sayılmamalı"""
+    with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as cache_dir:
+        _create_project(root)
+        census = census_project(root, cache=SourceCensusCache(cache_dir))
+
+        assert census.languages["Python"] == {"files": 2, "lines": 5}
+        assert census.languages["JavaScript"] == {"files": 1, "lines": 2}
+        assert census.extensions[".png"] == {"files": 1, "lines": 0}
+        assert census.total_files == 8
+        # Kaynak kod: Python, JavaScript, HTML (YAML, ignore dosyaları ve binary hariç)
+        assert census.source_files == 4
+        assert census.source_lines == 5 + 2 + 2
+        assert census.lines_for_extensions([".py", ".PY", ".js"]) == 7
+        assert not census.cached
+
+    with tempfile.TemporaryDirectory() as root:
+        big_file = os.path.join(root, "big.py")
+        line = b"x = 1\n"
+        repeat = SOURCE_CENSUS_CHUNK_SIZE // len(line) * 3 + 1
+        Path(big_file).write_bytes(line * repeat + b"last")
+        assert count_lines(big_file) == repeat + 1
+        assert count_lines(big_file, os.path.getsize(big_file)) == repeat + 1
+
+
+def test_cache_by_tree_hash():
+    """Değişmeyen ağaç cache'ten gelmeli; dosya değişince yeniden sayılmalı"""
+    with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as cache_dir:
+        _create_project(root)
+        cache = SourceCensusCache(cache_dir)
+        first = census_project(root, cache=cache)
+
+        counted = []
+        original_count_lines = source_census.count_lines
+
+        def counting(path, size=None):
+            counted.append(path)
+            return original_count_lines(path, size)
+
+        source_census.count_lines = counting
+        try:
+            again = census_project(root, cache=cache)
+            assert again.cached and counted == []
+            assert again.source_lines == first.source_lines
+
+            # Yeni process: bellek boş, sonuç diskten okunur
+            from_disk = census_project(root, cache=SourceCensusCache(cache_dir))
+            assert from_disk.cached and from_disk.languages == first.languages
+
+            _write(root, "app.py", "import flask\n")
+            changed = census_project(root, cache=cache)
+            assert not changed.cached and counted
+            assert changed.tree_hash != first.tree_hash
+            assert changed.languages["Python"]["lines"] == 3
+        finally:
+            source_census.count_lines = original_count_lines
+
+
+def test_failed_cache_write_leaves_no_temp_file():
+    """Cache dosyası yazılamazsa geçici dosya silinmeli, sayım yine dönmeli"""
+    with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as cache_dir:
+        _create_project(root)
+        cache = SourceCensusCache(cache_dir)
+        original_dump = source_census.json.dump
+
+        def failing_dump(data, f):
+            f.write("{")
+            raise OSError("No space left on device")
+
+        source_census.json.dump = failing_dump
+        try:
+            census = census_project(root, cache=cache)
+        finally:
+            source_census.json.dump = original_dump
+
+        assert census.source_files > 0
+        assert os.listdir(cache_dir) == []
+        # Bellek cache'i yine dolu
+        assert cache.get(census.tree_hash).source_lines == census.source_lines
+
+
+def test_parallel_matches_serial():
+    """Paralel sayım tek thread'li sayımla aynı sonucu vermeli"""
+    with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as cache_dir:
+        for number in range(300):
+            _write(root, f"pkg_{number % 7}/module_{number}.py", "x = 1\n" * (number % 13 + 1))
+        cache = SourceCensusCache(cache_dir)
+        serial = census_project(root, max_workers=1, cache=cache, use_cache=False)
+        parallel = census_project(root, max_workers=8, cache=cache, use_cache=False)
+
+        assert serial.source_files == parallel.source_files == 300
+        assert serial.languages == parallel.languages
+        assert serial.extensions == parallel.extensions
+
+
+def test_code_coverage_uses_census():
+    """Kod kapsama oranı projedeki kaynak dosyalara göre hesaplanmalı"""
+    raw_data = {"runs": [{"properties": {"coverage": [
+        {"files": 2, "isSupported": True, "lang": ".py", "type": "SUPPORTED"},
+        {"files": 1, "isSupported": True, "lang": ".js", "type": "SUPPORTED"},
+        {"files": 1, "isSupported": False, "lang": ".yml", "type": "UNSUPPORTED"}
+    ]}}]}
+    calculator = AdvancedMetricsCalculator()
+
+    # Sayım olmadan eski davranış
+    legacy = calculator.calculate_code_coverage(raw_data)
+    assert legacy == {"code_coverage": 100.0, "files_analyzed": 3, "lines_analyzed": 0}
+
+    with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as cache_dir:
+        _create_project(root)
+        census = census_project(root, cache=SourceCensusCache(cache_dir))
+
+        coverage = calculator.calculate_code_coverage(raw_data, source_census=census)
+        assert coverage["files_analyzed"] == 3
+        assert coverage["code_coverage"] == 75.0
+        assert coverage["lines_analyzed"] == 7
+
+        result = calculator.calculate_all_advanced_metrics(
+            raw_data=raw_data, detected_issues=[], scan_duration=1.0, source_census=census
+        )
+        assert result.code_coverage == 75.0
+        assert result.lines_analyzed == 7
+
+    # Sayımı çağıran yapar; metrics paketi source_census'a bağımlı değildir
+    completed = subprocess.run(
+        [sys.executable, "-c",
+         "import sys; from metrics.advanced_metrics import AdvancedMetricsCalculator; "
+         "AdvancedMetricsCalculator().calculate_all_advanced_metrics(raw_data={}, detected_issues=[]); "
+         "print('source_census' in sys.modules)"],
+        cwd=str(Path(__file__).parent.parent), stdout=subprocess.PIPE, text=True, timeout=60
+    )
+    assert completed.stdout.strip() == "False"
+
+
+def test_large_project_performance():
+    """Binlerce dosyalı proje makul sürede sayılmalı"""
+    with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as cache_dir:
+        content = "def function():\n    return 1\n" * 20
+        for number in range(3000):
+            _write(root, f"src/pkg_{number % 30}/module_{number}.py", content)
+
+        started = time.perf_counter()
+        census = census_project(root, cache=SourceCensusCache(cache_dir), use_cache=False)
+        duration = time.perf_counter() - started
+
+        assert census.source_files == 3000
+        assert census.source_lines == 3000 * 40
+        assert duration < 10, f"Sayım çok yavaş: {duration:.2f}s"
+
+
+if __name__ == "__main__":
+    print("\nKAYNAK KOD SAYIMI TESTLERI\n")
+
+    test_ignore_rules()
+    print("OK: Ignore kuralları")
+
+    test_counts_per_language_and_extension()
+    print("OK: Dil ve uzantı bazında sayım")
+
+    test_cache_by_tree_hash()
+    print("OK: Ağaç hash'ine göre cache")
+
+    test_failed_cache_write_leaves_no_temp_file()
+    print("OK: Yazılamayan cache geçici dosya bırakmıyor")
+
+    test_parallel_matches_serial()
+    print("OK: Paralel sayım = tek thread'li sayım")
+
+    test_code_coverage_uses_census()
+    print("OK: Kod kapsama oranı sayımı kullanıyor")
+
+    test_large_project_performance()
+    print("OK: Büyük proje performansı")
+
+    print("\nTest tamamlandi!")
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Operasyonel Telemetri (telemetry, /metrics) Test Script'i
+
+Bu script, metrik registry'sinin Prometheus text exposition formatını,
+thread başına hücrelerle tutulan sayaçların eşzamanlı yazmalarda değer
+kaybetmemesini, sıcak yol maliyetini ve /metrics endpoint'ini test eder.
+
+Test Senaryoları:
+1. Counter ve Histogram doğru formatta üretilir (kümülatif kovalar, le dahil, etiket escape)
+2. Eşzamanlı thread'lerden yazmalar kaybolmaz; ölen thread'lerin hücreleri birleştirilir
+3. observe() ve inc() mikrosaniyeler içinde biter
+4. Hata veren callback scrape'i bozmaz
+5. /metrics: route şablonu bazında istek süresi, job kuyruğu ve tarama metrikleri
+
+Kullanım:
+    cd backend/tests
+    python test_telemetry.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_telemetry.py
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from process_profiler import ResourceUsage
+from telemetry import MetricsRegistry, record_scan, telemetry
+
+
+def _sample_lines(text: str, name: str) -> dict:
+    """Verilen adla başlayan örnek satırlarını {seri: değer} olarak döner"""
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith(name):
+            series, value = line.rsplit(" ", 1)
+            samples[series] = float(value)
+    return samples
+
+
+def test_exposition_format():
+    """Counter ve Histogram Prometheus text formatında üretilmeli"""
+    registry = MetricsRegistry(prefix="test_")
+    requests = registry.counter("requests", "İstek sayısı", ("route",))
+    latency = registry.histogram("latency_seconds", "Süre", ("route",), buckets=(0.1, 1.0))
+
+    requests.labels('/a"b').inc()
+    requests.labels('/a"b').inc(2)
+    requests.labels('/a"b').inc(-5)   # yok sayılır
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.labels("/scan").observe(value)
+
+    text = registry.render()
+    assert "# TYPE test_requests_total counter" in text
+    assert 'test_requests_total{route="/a\\"b"} 3.0' in text
+
+    assert "# TYPE test_latency_seconds histogram" in text
+    buckets = _sample_lines(text, "test_latency_seconds_bucket")
+    assert buckets == {
+        'test_latency_seconds_bucket{route="/scan",le="0.1"}': 2.0,
+        'test_latency_seconds_bucket{route="/scan",le="1.0"}': 3.0,
+        'test_latency_seconds_bucket{route="/scan",le="+Inf"}': 4.0
+    }
+    assert _sample_lines(text, "test_latency_seconds_sum") == {'test_latency_seconds_sum{route="/scan"}': 3.65}
+    assert _sample_lines(text, "test_latency_seconds_count") == {'test_latency_seconds_count{route="/scan"}': 4.0}
+
+    try:
+        requests.labels("a", "b")
+        raise AssertionError("Yanlış etiket sayısı kabul edilmemeli")
+    except ValueError:
+        pass
+    try:
+        registry.counter("requests", "Tekrar")
+        raise AssertionError("Aynı ad iki kez kaydedilmemeli")
+    except ValueError:
+        pass
+
+
+def test_concurrent_writes_are_not_lost():
+    """Eşzamanlı thread'lerin yazmaları kaybolmamalı; ölen thread hücreleri birleştirilmeli"""
+    registry = MetricsRegistry(prefix="test_")
+    counter = registry.counter("events", "Olay sayısı").labels()
+    histogram = registry.histogram("durations_seconds", "Süre").labels()
+
+    def work():
+        for _ in range(2000):
+            counter.inc()
+            histogram.observe(0.002)
+
+    # Çok sayıda kısa ömürlü thread (istek başına thread açan sunucu gibi)
+    for _ in range(10):
+        threads = [threading.Thread(target=work) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert counter.value() == 200000
+    _, total, count = histogram.snapshot()
+    assert count == 200000
+    assert abs(total - 400.0) < 1e-6
+    # Ölen thread'lerin hücreleri tek hücrede toplanır
+    assert len(counter._cells._cells) == 0
+
+
+def test_hot_path_cost():
+    """observe() ve inc() birkaç mikrosaniyede bitmeli"""
+    registry = MetricsRegistry(prefix="test_")
+    histogram = registry.histogram("hot_seconds", "Süre", ("route",))
+    counter = registry.counter("hot", "Sayaç", ("route",))
+
+    calls = 20000
+    started = time.perf_counter()
+    for _ in range(calls):
+        histogram.labels("/scan/<tool>").observe(0.003)
+        counter.labels("/scan/<tool>").inc()
+    per_call = (time.perf_counter() - started) / calls
+
+    # Tipik değer ~1-2 µs; yavaş CI makineleri için geniş sınır
+    assert per_call < 50e-6, f"{per_call * 1e6:.1f} µs"
+
+
+def test_failing_callback_is_skipped():
+    """Hata veren callback metriği atlanmalı, diğerleri üretilmeli"""
+    registry = MetricsRegistry(prefix="test_")
+    registry.callback("broken", "Hatalı", (), lambda: 1 / 0)
+    registry.callback("depth", "Kuyruk", ("status",), lambda: [(("queued",), 3)])
+
+    text = registry.render()
+    assert "test_broken" not in text
+    assert 'test_depth{status="queued"} 3.0' in text
+
+
+def test_metrics_endpoint():
+    """/metrics, route şablonu bazında istek süresi ve tarama metriklerini dönmeli"""
+    import app as app_module
+
+    client = app_module.app.test_client()
+    client.get("/jobs/missing-job")
+    client.get("/jobs/another-missing-job")
+
+    record_scan(
+        "telemetry_test_tool", "flask_demo",
+        {"phases": {"spawn": 0.01, "tool": 2.0, "parse": 0.2}, "tool_seconds": 2.01,
+         "pipeline_seconds": 0.2, "total_seconds": 2.3},
+        [ResourceUsage(cpu_user_seconds=1.5, cpu_system_seconds=0.25)]
+    )
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.content_type == "text/plain; version=0.0.4; charset=utf-8"
+    text = response.get_data(as_text=True)
+
+    # Farklı job id'leri tek route serisinde toplanır
+    prefix = telemetry.prefix
+    counts = _sample_lines(text, f"{prefix}http_request_duration_seconds_count")
+    assert counts[f'{prefix}http_request_duration_seconds_count{{method="GET",route="/jobs/<job_id>",status="404"}}'] >= 2
+
+    scan_counts = _sample_lines(text, f"{prefix}scan_duration_seconds_count")
+    assert scan_counts[f'{prefix}scan_duration_seconds_count{{tool="telemetry_test_tool",project="flask_demo"}}'] == 1
+    assert f'{prefix}scan_phase_duration_seconds_count{{tool="telemetry_test_tool",phase="tool"}} 1.0' in text
+    assert f'{prefix}json_duration_seconds_count{{operation="parse",tool="telemetry_test_tool"}} 1.0' in text
+    assert f'{prefix}scan_subprocess_cpu_seconds_total{{tool="telemetry_test_tool",mode="user"}} 1.5' in text
+
+    # Scrape anında okunan kuyruk, cache ve eşzamanlılık metrikleri
+    assert f'{prefix}scan_jobs{{status="queued"}}' in text
+    assert f"{prefix}scan_cache_hit_ratio " in text
+    assert f"{prefix}scans_in_flight 0.0" in text
+    assert f'{prefix}scan_tool_slots{{tool="snyk_code",state="active"}}' in text
+
+
+if __name__ == "__main__":
+    print("\nTELEMETRI TESTLERI\n")
+
+    test_exposition_format()
+    print("OK: Prometheus text formatı")
+
+    test_concurrent_writes_are_not_lost()
+    print("OK: Eşzamanlı yazmalar kaybolmuyor")
+
+    test_hot_path_cost()
+    print("OK: Sıcak yol maliyeti")
+
+    test_failing_callback_is_skipped()
+    print("OK: Hatalı callback atlanıyor")
+
+    test_metrics_endpoint()
+    print("OK: /metrics endpoint'i")
+
+    print("\nTest tamamlandi!")
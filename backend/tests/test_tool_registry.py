@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Tarama Aracı Registry'si (tool_registry) Test Script'i
+
+Bu script, araç registry'sinin tanımları tembel (lazy) yüklemesini, config
+dosyasından araç eklenmesini ve app.py'nin /scan/<tool> endpoint'lerini
+registry'den üretmesini test eder. Sahte araç geçici bir modül olarak yazılır.
+
+Test Senaryoları:
+1. Uygulama açılışında hiçbir runner (ve requests) import edilmez
+2. Config dosyasıyla eklenen araç app.py'de değişiklik olmadan taranabilir
+3. ENABLED_TOOLS filtresi ve URL adı (route) ile araç bulma
+4. Geçersiz tanımlar ve bilinmeyen araçlar reddedilir
+
+Kullanım:
+    cd backend/tests
+    python test_tool_registry.py
+
+    veya backend/ klasöründen:
+    python -m pytest tests/test_tool_registry.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+
+# Backend klasörünü Python path'ine ekle
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from project_catalog import ProjectCatalog
+from tool_registry import ToolAdapter, ToolRegistry, ToolRegistryError
+
+FAKE_TOOL_MODULE = textwrap.dedent('''
+    from metrics.base_metric import BaseMetric
+    from metrics.result_model import MetricResult
+
+    CALLS = []
+
+
+    class FakeMetrics(BaseMetric):
+        def calculate(self, raw_data):
+            return MetricResult("Fake", 0, 0, 0, len(raw_data.get("issues", [])), 0, 0.0)
+
+
+    def run_fake_scan_and_save(project_name, force=False, deep=None):
+        CALLS.append((project_name, force, deep))
+        return {
+            "success": True,
+            "project": project_name,
+            "file_path": f"results/fake_tool_{project_name}.json",
+            "metric_result": {"tool_name": "Fake", "total_issues": 0},
+            "error": None
+        }
+''')
+
+
+def _write_fake_tool(directory: str, module_name: str) -> str:
+    """Sahte araç modülünü ve onu tanımlayan config dosyasını yazar"""
+    Path(directory, f"{module_name}.py").write_text(FAKE_TOOL_MODULE, encoding="utf-8")
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+
+    config_path = os.path.join(directory, "tools.json")
+    with open(config_path, "w", encoding="utf-8") as f:
+        json.dump({"tools": [{
+            "name": "fake_tool",
+            "display_name": "Fake Tool",
+            "runner": f"{module_name}:run_fake_scan_and_save",
+            "metric": f"{module_name}:FakeMetrics",
+            "route": "fake",
+            "options": ["deep"]
+        }]}, f)
+    return config_path
+
+
+def test_startup_imports_no_runner():
+    """app.py import edildiğinde runner'lar ve requests yüklenmemeli"""
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(os.environ, RESULTS_INDEX_PATH=os.path.join(directory, "index.sqlite3"))
+        code = (
+            "import sys, app; "
+            "print(sorted(m for m in ('metric_runner', 'deepsource_runner', 'requests') if m in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=str(BACKEND_DIR), env=env,
+            capture_output=True, text=True, check=True
+        ).stdout
+        assert output.strip() == "[]", output
+
+
+def test_config_tool_served_by_generic_routes():
+    """Config ile eklenen araç /scan/<route> ve /scan/<route>/all ile taranmalı"""
+    import app as app_module
+
+    with tempfile.TemporaryDirectory() as directory:
+        config_path = _write_fake_tool(directory, "fake_registry_tool")
+        registry = ToolRegistry(config_path=config_path, enabled="", builtins=[])
+        adapter = registry.get("fake")
+        assert adapter.name == "fake_tool" and not adapter.loaded
+
+        projects_root = os.path.join(directory, "projects")
+        for project in ("flask_demo", "other_demo"):
+            os.makedirs(os.path.join(projects_root, project))
+        catalog = ProjectCatalog(root=projects_root)
+
+        original = app_module.tool_registry, app_module.project_catalog
+        app_module.tool_registry, app_module.project_catalog = registry, catalog
+        try:
+            client = app_module.app.test_client()
+            tools = client.get("/tools").get_json()["tools"]
+            assert [tool["name"] for tool in tools] == ["fake_tool"]
+
+            response = client.post("/scan/fake", json={"project": "flask_demo", "wait": True, "deep": True})
+            assert response.status_code == 200
+            assert response.get_json()["message"] == "fake scan completed"
+            assert adapter.loaded
+
+            response = client.post("/scan/fake_tool/all?force=true")
+            assert response.status_code == 200
+            body = response.get_json()
+            assert len(body["results"]) == 2
+            assert all(result["tool"] == "fake_tool" for result in body["results"])
+
+            calls = sys.modules["fake_registry_tool"].CALLS
+            assert calls[0] == ("flask_demo", False, True)
+            assert sorted(calls[1:]) == [("flask_demo", True, None), ("other_demo", True, None)]
+        finally:
+            app_module.tool_registry, app_module.project_catalog = original
+
+        assert adapter.metric().calculate({"issues": [1, 2]}).low == 2
+
+
+def test_enabled_tools_and_routes():
+    """ENABLED_TOOLS dışındaki araçlar yüklenmemeli; araçlar route ile de bulunmalı"""
+    registry = ToolRegistry(config_path="", enabled="deepsource")
+    assert registry.names() == ["deepsource"]
+    assert registry.get("code") is None
+
+    registry = ToolRegistry(config_path="", enabled="")
+    assert registry.get("code").name == "snyk_code"
+    assert registry.get("snyk_code") is registry.get("code")
+    assert registry.get("code").options == ("incremental", "stream")
+
+
+def test_invalid_definitions():
+    """Eksik alanlı tanımlar, bozuk referanslar ve bilinmeyen araçlar reddedilmeli"""
+    try:
+        ToolAdapter.from_dict({"name": "broken", "runner": "x:y"})
+        raise AssertionError("Eksik metric alanı kabul edilmemeli")
+    except ToolRegistryError:
+        pass
+
+    adapter = ToolAdapter.from_dict({"name": "broken", "runner": "no_such_module:run", "metric": "x:y"})
+    try:
+        adapter.runner
+        raise AssertionError("Import edilemeyen runner hata vermeli")
+    except ToolRegistryError:
+        pass
+
+    import app as app_module
+    client = app_module.app.test_client()
+    assert client.post("/scan/unknown").status_code == 404
+    assert client.post("/scan/unknown/all").status_code == 404
+
+
+if __name__ == "__main__":
+    print("\nTARAMA ARACI REGISTRY TESTLERI\n")
+
+    test_startup_imports_no_runner()
+    print("OK: Açılışta runner import edilmiyor")
+
+    test_config_tool_served_by_generic_routes()
+    print("OK: Config ile eklenen araç generic endpoint'lerle taranıyor")
+
+    test_enabled_tools_and_routes()
+    print("OK: ENABLED_TOOLS ve route ile araç bulma")
+
+    test_invalid_definitions()
+    print("OK: Geçersiz tanımlar ve bilinmeyen araçlar")
+
+    print("\nTest tamamlandi!")
@@ -0,0 +1,269 @@
+"""
+Tarama Aracı Registry Modülü
+
+Bu modül, tarama araçlarını (BaseMetric + runner çifti) tek bir registry'de
+toplar. app.py her araç için ayrı import ve endpoint yazmak yerine
+/scan/<tool> ve /scan/<tool>/all endpoint'lerini bu registry'den üretir.
+
+Araçlar "modül:isim" referanslarıyla tanımlanır ve ilk kullanımda import
+edilir. Böylece sadece Snyk Code kullanan bir process, DeepSource runner'ını
+(ve onun import ettiği requests'i) hiç yüklemez.
+
+Araç Kaynakları (sırayla, aynı isim sonrakiyle ezilir):
+1. Yerleşik araçlar: snyk_code, deepsource
+2. Entry point'ler: "smarttestai.tools" grubundaki her entry point bir
+   tanım dict'i (veya onu dönen fonksiyon) olmalıdır
+3. Config dosyası: TOOL_REGISTRY_CONFIG ile verilen JSON dosyası
+   {"tools": [{"name": ..., "runner": "modül:fonksiyon", ...}, ...]}
+
+Tanım Alanları:
+    name: Araç adı (results/ dosya adlarında ve job'larda kullanılır)
+    display_name: Görünen ad (örn. "Snyk Code")
+    runner: run_<araç>_scan_and_save(project_name, force=..., **options) referansı
+    metric: BaseMetric alt sınıfı referansı
+    route: URL'deki adı (default: name); /scan/<route>
+    options: Runner'ın kabul ettiği ek bool parametreler (örn. ["incremental", "stream"])
+    enabled: false ise registry'ye eklenmez
+
+Proje Yapısı İçindeki Yeri:
+- backend/tool_registry.py: Bu dosya
+- backend/app.py: /scan/<tool>, /scan/<tool>/all ve /scan/all endpoint'leri
+- backend/metric_runner.py, backend/deepsource_runner.py: Yerleşik runner'lar
+
+Kullanım:
+    from tool_registry import tool_registry
+    adapter = tool_registry.get("deepsource")    # Henüz import yapılmaz
+    result = adapter.runner("flask_demo", force=True)   # İlk kullanımda import
+
+Environment Variables:
+    TOOL_REGISTRY_CONFIG: Ek araç tanımlarının JSON dosyası (opsiyonel)
+    ENABLED_TOOLS: Virgülle ayrılmış araç adları; verilirse sadece bunlar kullanılır
+"""
+
+import importlib
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from importlib import metadata
+from typing import Callable, Dict, List, Optional, Tuple
+
+TOOL_REGISTRY_CONFIG = os.getenv("TOOL_REGISTRY_CONFIG", "")
+ENABLED_TOOLS = os.getenv("ENABLED_TOOLS", "")
+
+# Entry point grubu
+ENTRY_POINT_GROUP = "smarttestai.tools"
+
+BUILTIN_TOOLS = [
+    {
+        "name": "snyk_code",
+        "display_name": "Snyk Code",
+        "runner": "metric_runner:run_code_scan_and_save",
+        "metric": "metrics.snyk_metrics:SnykMetrics",
+        "route": "code",
+        "options": ["incremental", "stream"]
+    },
+    {
+        "name": "deepsource",
+        "display_name": "DeepSource",
+        "runner": "deepsource_runner:run_deepsource_scan_and_save",
+        "metric": "metrics.deepsource_metrics:DeepSourceMetrics"
+    }
+]
+
+
+class ToolRegistryError(Exception):
+    """Araç tanımı geçersizse veya referans import edilemiyorsa"""
+
+
+def _resolve(reference: str):
+    """"modül:isim" referansını import edip nesneyi döner"""
+    module_name, _, attribute = reference.partition(":")
+    if not module_name or not attribute:
+        raise ToolRegistryError(f"Invalid reference '{reference}', expected 'module:name'")
+
+    try:
+        value = importlib.import_module(module_name)
+        for part in attribute.split("."):
+            value = getattr(value, part)
+    except (ImportError, AttributeError) as e:
+        raise ToolRegistryError(f"Cannot load '{reference}': {e}") from e
+    return value
+
+
+@dataclass
+class ToolAdapter:
+    """
+    Bir tarama aracının tanımı; runner ve metrik sınıfı ilk erişimde yüklenir
+
+    Attributes:
+        name: Araç adı (örn. "snyk_code")
+        display_name: Görünen ad (örn. "Snyk Code")
+        runner_ref: Runner fonksiyonunun "modül:isim" referansı
+        metric_ref: BaseMetric alt sınıfının "modül:isim" referansı
+        route: URL'deki adı (/scan/<route>)
+        options: Runner'ın kabul ettiği ek parametreler
+    """
+    name: str
+    display_name: str
+    runner_ref: str
+    metric_ref: str
+    route: str = ""
+    options: Tuple[str, ...] = ()
+    _runner: Optional[Callable] = field(default=None, init=False, repr=False)
+    _metric_class: Optional[type] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self):
+        self.route = self.route or self.name
+        self.options = tuple(self.options)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ToolAdapter":
+        """
+        Tanım dict'inden adapter oluşturur
+
+        Raises:
+            ToolRegistryError: Zorunlu alanlar (name, runner, metric) eksikse
+        """
+        missing = [key for key in ("name", "runner", "metric") if not data.get(key)]
+        if missing:
+            raise ToolRegistryError(f"Tool definition is missing {', '.join(missing)}: {data}")
+
+        return cls(
+            name=data["name"],
+            display_name=data.get("display_name", data["name"]),
+            runner_ref=data["runner"],
+            metric_ref=data["metric"],
+            route=data.get("route", ""),
+            options=data.get("options", ())
+        )
+
+    @property
+    def loaded(self) -> bool:
+        """Runner import edildi mi?"""
+        return self._runner is not None
+
+    @property
+    def runner(self) -> Callable:
+        """run_*_scan_and_save(project_name, force=..., **options) fonksiyonu"""
+        if self._runner is None:
+            with self._lock:
+                if self._runner is None:
+                    self._runner = _resolve(self.runner_ref)
+        return self._runner
+
+    @property
+    def metric_class(self) -> type:
+        if self._metric_class is None:
+            with self._lock:
+                if self._metric_class is None:
+                    self._metric_class = _resolve(self.metric_ref)
+        return self._metric_class
+
+    def metric(self):
+        """Aracın BaseMetric örneği"""
+        return self.metric_class()
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "display_name": self.display_name,
+            "route": self.route,
+            "options": list(self.options),
+            "loaded": self.loaded
+        }
+
+
+class ToolRegistry:
+    """
+    Araç adı ve URL adı ile erişilen adapter registry'si
+
+    Kaynaklar ilk erişimde bir kez okunur (yerleşik araçlar, entry point'ler,
+    config dosyası); register() ile sonradan araç eklenebilir.
+    """
+
+    def __init__(self, config_path: str = None, enabled: str = None, builtins: List[dict] = None):
+        self.config_path = TOOL_REGISTRY_CONFIG if config_path is None else config_path
+        enabled = ENABLED_TOOLS if enabled is None else enabled
+        self.enabled = {name.strip() for name in enabled.split(",") if name.strip()}
+        self._builtins = BUILTIN_TOOLS if builtins is None else builtins
+        self._tools = None   # isim -> ToolAdapter (yükleme sırası korunur)
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, ToolAdapter]:
+        if self._tools is None:
+            with self._lock:
+                if self._tools is None:
+                    tools = {}
+                    for definition in self._definitions():
+                        if definition.get("enabled", True) is False:
+                            tools.pop(definition.get("name"), None)
+                            continue
+                        adapter = ToolAdapter.from_dict(definition)
+                        if self.enabled and adapter.name not in self.enabled:
+                            continue
+                        tools[adapter.name] = adapter
+                    self._tools = tools
+        return self._tools
+
+    def _definitions(self) -> List[dict]:
+        definitions = list(self._builtins)
+        definitions.extend(self._entry_point_definitions())
+        if self.config_path:
+            definitions.extend(self._config_definitions(self.config_path))
+        return definitions
+
+    @staticmethod
+    def _entry_point_definitions() -> List[dict]:
+        definitions = []
+        for entry_point in metadata.entry_points(group=ENTRY_POINT_GROUP):
+            try:
+                definition = entry_point.load()
+                if callable(definition):
+                    definition = definition()
+            except Exception as e:
+                # Kurulu bir eklentinin hatası uygulamayı başlatmayı engellememeli
+                print(f"WARNING: Tool entry point '{entry_point.name}' yüklenemedi: {e}")
+                continue
+            definitions.append(dict(definition, name=definition.get("name", entry_point.name)))
+        return definitions
+
+    @staticmethod
+    def _config_definitions(config_path: str) -> List[dict]:
+        try:
+            with open(config_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ToolRegistryError(f"Cannot read tool registry config '{config_path}': {e}") from e
+
+        tools = data.get("tools") if isinstance(data, dict) else data
+        if not isinstance(tools, list):
+            raise ToolRegistryError(f"Tool registry config must contain a 'tools' list: {config_path}")
+        return tools
+
+    def register(self, adapter: ToolAdapter) -> ToolAdapter:
+        """Aracı ekler (aynı isimli araç varsa değiştirir)"""
+        tools = self._load()
+        with self._lock:
+            tools[adapter.name] = adapter
+        return adapter
+
+    def get(self, name: str) -> Optional[ToolAdapter]:
+        """Aracı adı veya URL adı (route) ile bulur; yoksa None"""
+        tools = self._load()
+        adapter = tools.get(name)
+        if adapter is not None:
+            return adapter
+        return next((tool for tool in tools.values() if tool.route == name), None)
+
+    def all(self) -> List[ToolAdapter]:
+        """Kayıtlı araçlar (kayıt sırasıyla)"""
+        return list(self._load().values())
+
+    def names(self) -> List[str]:
+        return list(self._load())
+
+
+# Uygulama genelinde kullanılan registry
+tool_registry = ToolRegistry()